@@ -1,21 +1,39 @@
 import os
 import json
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
 
+from llm_cache import get_llm_cache, make_key
+from llm_dispatcher import get_llm_dispatcher
+from prompt_builder import PromptBuilder, count_tokens
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Bump when a prompt template changes so cached responses from the old wording are not reused
+EXTRACTION_PROMPT_VERSION = "yacht-extraction-v2"
+FIELD_PROMPT_VERSION = "field-extraction-v3"
+FIELD_TOKEN_BUDGET = int(os.getenv('LLM_FIELD_PROMPT_TOKEN_BUDGET', '1000'))
+# Cached for fields the model answered with null, so listings that lack them aren't asked again
+FIELD_NOT_FOUND = "__field_not_found__"
+
 class AIYachtExtractor:
     """AI-powered yacht data extraction using OpenAI GPT-4"""
     
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    def __init__(self, cache=None):
+        # Retries are the dispatcher's job, so they honour the shared rate limits
+        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'), max_retries=0)
         self.model = "gpt-4"
+        self.dispatcher = get_llm_dispatcher()
+        # Process-wide response cache by default; pass False to call the API every time
+        self.cache = get_llm_cache() if cache is None else cache
+        # Page content goes into prompts as packed specification regions, not a raw HTML prefix
+        self.prompt_builder = PromptBuilder(model=self.model)
+        self.field_prompt_builder = PromptBuilder(FIELD_TOKEN_BUDGET, model=self.model)
         
         if not os.getenv('OPENAI_API_KEY'):
             logger.warning("OPENAI_API_KEY not found in environment variables")
@@ -32,16 +50,22 @@ class AIYachtExtractor:
             Dictionary with extracted yacht data
         """
         try:
+            page_content = self.prompt_builder.build(html_content)
+            cache_key = make_key(self.model, EXTRACTION_PROMPT_VERSION, f"{url}\n{page_content}")
+            cached = self.cache.get(cache_key) if self.cache else None
+            if cached is not None:
+                logger.info(f"⚡ AI extraction served from cache for {url}")
+                return cached
+            
             if not os.getenv('OPENAI_API_KEY'):
                 logger.error("OpenAI API key not available")
                 return {}
             
             # Create extraction prompt
-            prompt = self._create_extraction_prompt(html_content, url)
+            prompt = self._create_extraction_prompt(page_content, url)
             
             # Call OpenAI GPT-4
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._complete(
                 messages=[
                     {
                         "role": "system",
@@ -60,22 +84,30 @@ class AIYachtExtractor:
             extracted_data = self._parse_gpt_response(response)
             logger.info(f"✅ AI extraction completed for {url}")
             
+            if self.cache:
+                self.cache.put(cache_key, extracted_data)
             return extracted_data
             
         except Exception as e:
             logger.error(f"❌ AI extraction failed: {e}")
             return {}
     
-    def _create_extraction_prompt(self, html_content: str, url: str) -> str:
-        """Create the extraction prompt for GPT-4"""
-        
-        # Truncate HTML if too long (GPT-4 has token limits)
-        max_html_length = 8000
-        if len(html_content) > max_html_length:
-            html_content = html_content[:max_html_length] + "... [truncated]"
+    def _complete(self, messages, max_tokens: int, **kwargs):
+        """Chat completion through the shared dispatcher (rate limits, concurrency cap, retries)"""
+        # Quota is charged for the prompt plus the completion tokens the request may use
+        estimated_tokens = sum(count_tokens(message['content'], self.model) + 4 for message in messages) + max_tokens
+        return self.dispatcher.call(
+            lambda: self.client.chat.completions.create(
+                model=self.model, messages=messages, max_tokens=max_tokens, **kwargs
+            ),
+            estimated_tokens
+        )
+    
+    def _create_extraction_prompt(self, page_content: str, url: str) -> str:
+        """Create the extraction prompt for GPT-4 from packed page regions (see PromptBuilder)"""
         
         prompt = f"""
-        Extract yacht data from this HTML listing and return ONLY valid JSON.
+        Extract yacht data from this yacht listing and return ONLY valid JSON.
         
         Source URL: {url}
         
@@ -96,8 +128,8 @@ class AIYachtExtractor:
         - condition: Overall condition
         - description: Full description text
         
-        HTML Content:
-        {html_content}
+        Listing content (labelled page sections):
+        {page_content}
         
         Return ONLY valid JSON with the above fields. No explanations or additional text.
         """
@@ -182,23 +214,62 @@ class AIYachtExtractor:
         Returns:
             Extracted field value or None
         """
+        return self.extract_fields(html_content, [field_name]).get(field_name)
+    
+    def extract_fields(self, html_content: str, field_names: List[str],
+                       descriptions: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+        """
+        Extract several fields with one structured request instead of one request per field
+        
+        Args:
+            html_content: HTML content to analyze
+            field_names: Fields to extract
+            descriptions: Optional hint per field (units, format) shown to the model
+            
+        Returns:
+            Dictionary of field name to extracted value, None where the listing doesn't say
+        """
+        values: Dict[str, Optional[str]] = {field: None for field in field_names}
         try:
-            if not os.getenv('OPENAI_API_KEY'):
-                return None
+            page_content = self.field_prompt_builder.build(html_content)
+            descriptions = descriptions or {}
+            # Each field is cached on its own, so later requests for a different set reuse it;
+            # the hint is part of the prompt, so it is part of the key
+            cache_keys = {
+                field: make_key(self.model, f"{FIELD_PROMPT_VERSION}:{field}",
+                                f"{descriptions.get(field) or ''}\n{page_content}")
+                for field in field_names
+            }
+            pending = []
+            for field in field_names:
+                cached = self.cache.get(cache_keys[field]) if self.cache else None
+                if cached is None:
+                    pending.append(field)
+                elif cached != FIELD_NOT_FOUND:
+                    values[field] = cached
+            
+            if not pending or not os.getenv('OPENAI_API_KEY'):
+                return values
             
+            field_lines = "\n".join(
+                f"- {field}: {descriptions[field]}" if descriptions.get(field) else f"- {field}"
+                for field in pending
+            )
             prompt = f"""
-            Extract ONLY the {field_name} from this yacht listing HTML.
-            Return only the value, no quotes or additional text.
+            Extract these fields from this yacht listing:
+            {field_lines}
+            
+            Return ONLY a JSON object with exactly these keys. Use a short string value
+            as written in the listing, or null when the listing doesn't give it.
             
-            HTML: {html_content[:4000]}
+            Listing: {page_content}
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            response = self._complete(
                 messages=[
                     {
                         "role": "system",
-                        "content": f"You extract {field_name} values from yacht listings. Return only the value."
+                        "content": "You extract field values from yacht listings. Return only valid JSON."
                     },
                     {
                         "role": "user",
@@ -206,12 +277,55 @@ class AIYachtExtractor:
                     }
                 ],
                 temperature=0.1,
-                max_tokens=100
+                max_tokens=40 * len(pending) + 20
             )
             
-            result = response.choices[0].message.content.strip()
-            return result if result else None
+            extracted = self._parse_field_response(response.choices[0].message.content)
+            if extracted is None:
+                # Unparseable reply: nothing is cached, so the next scrape asks again
+                return values
+            for field in pending:
+                if field not in extracted:
+                    continue
+                value = extracted[field]
+                values[field] = value
+                if self.cache:
+                    self.cache.put(cache_keys[field], FIELD_NOT_FOUND if value is None else value)
+            logger.info(f"✅ AI field extraction: {sum(v is not None for v in values.values())}/{len(values)} "
+                        f"fields, {len(pending)} in one request")
+            return values
             
         except Exception as e:
-            logger.error(f"Failed to extract {field_name}: {e}")
+            logger.error(f"Failed to extract {', '.join(field_names)}: {e}")
+            return values
+    
+    @staticmethod
+    def _parse_field_response(content: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Field values from a JSON object reply
+        
+        Returns:
+            Value per key in the reply (null, empty and placeholder values become None),
+            or None when the reply isn't a JSON object
+        """
+        content = (content or '').strip()
+        json_start = content.find('{')
+        json_end = content.rfind('}') + 1
+        if json_start < 0 or json_end <= json_start:
+            logger.error("No JSON found in field extraction response")
+            return None
+        try:
+            data = json.loads(content[json_start:json_end])
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse field extraction response as JSON: {e}")
+            return None
+        if not isinstance(data, dict):
             return None
+        values = {}
+        for field, value in data.items():
+            if value is None or isinstance(value, (dict, list)):
+                values[field] = None
+                continue
+            text = str(value).strip()
+            values[field] = text if text and text.lower() not in ('null', 'none', 'n/a', 'unknown') else None
+        return values
@@ -1,5 +1,8 @@
 from flask import Flask, request, jsonify
 from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+from batch_scraper import ConcurrentBatchScraper, build_batch_summary, parse_batch_options
+from job_queue import BatchJobQueue, create_job_store_from_env
+from browser_supervisor import get_browser_supervisor
 import logging
 import json
 import os
@@ -11,9 +14,17 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 
-# Initialize the ULTIMATE UNIFIED PARSER v5.0.0
+# Initialize the ULTIMATE UNIFIED PARSER v5.0.0 (thread-safe, shared by all request threads)
 devalk_parser = SuperEnhancedDeValkParser()
 
+# Background batch jobs; JOB_STORE=redis shares job status between workers
+batch_jobs = BatchJobQueue(
+    create_job_store_from_env(),
+    # Options are validated on submit; parsed again here for jobs queued before the limits changed
+    lambda options: ConcurrentBatchScraper(lambda: devalk_parser, **parse_batch_options(options)),
+    workers=int(os.getenv('BATCH_JOB_WORKERS', '1'))
+)
+
 @app.route('/scrape-devalk', methods=['POST'])
 def scrape_devalk():
     try:
@@ -56,54 +67,20 @@ def scrape_batch():
         if not urls:
             return jsonify({'error': 'URLs array is required'}), 400
         
+        try:
+            options = parse_batch_options(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
         logger.info(f"🚀 Starting batch scraping for {len(urls)} URLs")
         
-        results = []
-        for i, url in enumerate(urls, 1):
-            try:
-                logger.info(f"📊 Processing {i}/{len(urls)}: {url}")
-                result = devalk_parser.parse_yacht_listing(url)
-                
-                if 'error' not in result:
-                    # Store individual result
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"batch_scraped_{i}_{timestamp}.json"
-                    
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        json.dump(result, f, indent=2, ensure_ascii=False)
-                    
-                    results.append({
-                        'url': url,
-                        'status': 'success',
-                        'fields_extracted': result.get('completion_stats', {}).get('total_fields', 0),
-                        'filename': filename
-                    })
-                else:
-                    results.append({
-                        'url': url,
-                        'status': 'failed',
-                        'error': result['error']
-                    })
-                    
-            except Exception as e:
-                logger.error(f"❌ Error processing {url}: {e}")
-                results.append({
-                    'url': url,
-                    'status': 'failed',
-                    'error': str(e)
-                })
+        # Fan out over a bounded thread pool; results keep the input order
+        batch_scraper = ConcurrentBatchScraper(lambda: devalk_parser, **options)
+        results = batch_scraper.run(urls)
         
         # Store batch summary
-        batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        batch_filename = f"batch_summary_{batch_timestamp}.json"
-        
-        batch_summary = {
-            'total_urls': len(urls),
-            'successful': len([r for r in results if r['status'] == 'success']),
-            'failed': len([r for r in results if r['status'] == 'failed']),
-            'timestamp': batch_timestamp,
-            'results': results
-        }
+        batch_summary = build_batch_summary(urls, results)
+        batch_filename = f"batch_summary_{batch_summary['timestamp']}.json"
         
         with open(batch_filename, 'w', encoding='utf-8') as f:
             json.dump(batch_summary, f, indent=2, ensure_ascii=False)
@@ -115,6 +92,64 @@ def scrape_batch():
         logger.error(f"❌ Batch scraping error: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/jobs/scrape-batch', methods=['POST'])
+def submit_batch_job():
+    """Queue a batch scrape and return its job id without waiting for the URLs"""
+    try:
+        data = request.get_json()
+        urls = data.get('urls', [])
+        
+        if not urls:
+            return jsonify({'error': 'URLs array is required'}), 400
+        
+        try:
+            options = parse_batch_options(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        job = batch_jobs.submit(urls, options)
+        
+        return jsonify({
+            'job_id': job['job_id'],
+            'status': job['status'],
+            'total_urls': job['total_urls'],
+            'status_url': f"/jobs/{job['job_id']}",
+            'results_url': f"/jobs/{job['job_id']}/results"
+        }), 202
+        
+    except Exception as e:
+        logger.error(f"❌ Batch job submission error: {e}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def batch_job_status(job_id):
+    """Report job status and progress counters"""
+    job = batch_jobs.store.get_job(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    return jsonify(job)
+
+@app.route('/jobs/<job_id>/results', methods=['GET'])
+def batch_job_results(job_id):
+    """Return the per-URL results finished so far, in input order"""
+    job = batch_jobs.store.get_job(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    results = batch_jobs.store.get_results(job_id)
+    urls = batch_jobs.store.get_urls(job_id)
+    
+    return jsonify({
+        **job,
+        'results': [
+            entry if entry is not None else {'url': url, 'status': 'pending'}
+            for url, entry in zip(urls, results)
+        ]
+    })
+
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({
@@ -125,9 +160,18 @@ def health():
             'ModeBox parsing', 
             'Accordion parsing',
             'Batch processing',
+            'Concurrent batch fetching',
+            'Background batch jobs',
             'Data storage'
         ]
     })
 
+@app.route('/metrics/browsers', methods=['GET'])
+def browser_metrics():
+    supervisor = get_browser_supervisor()
+    if supervisor is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **supervisor.metrics()})
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Concurrent Batch Scraper - Bounded parallel fetch engine for /scrape-batch
+Runs parse_yacht_listing over a thread pool with a per-host concurrency cap
+"""
+
+import os
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, List, Callable, Optional
+from urllib.parse import urlparse
+
+from llm_dispatcher import dispatch_priority, BATCH
+
+logger = logging.getLogger(__name__)
+
+# Defaults can be tuned per deployment without touching the code
+DEFAULT_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '8'))
+DEFAULT_PER_HOST_LIMIT = int(os.getenv('BATCH_PER_HOST_LIMIT', '4'))
+
+
+class ConcurrentBatchScraper:
+    """Scrape a list of URLs concurrently while keeping per-URL results in input order"""
+
+    def __init__(self, parser_factory: Callable[[], Any], max_workers: Optional[int] = None,
+                 per_host_limit: Optional[int] = None):
+        """
+        Args:
+            parser_factory: Callable returning a parser with a parse_yacht_listing(url) method
+            max_workers: Total number of URLs in flight at once
+            per_host_limit: Maximum number of URLs in flight against the same host
+        """
+        self.parser_factory = parser_factory
+        self.max_workers = max(1, max_workers or DEFAULT_MAX_WORKERS)
+        self.per_host_limit = max(1, per_host_limit or DEFAULT_PER_HOST_LIMIT)
+
+        self._host_semaphores: Dict[str, threading.Semaphore] = {}
+        self._host_guard = threading.Lock()
+        self._local = threading.local()
+
+    def run(self, urls: List[str], on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Scrape all URLs and return one result entry per URL, in the same order as the input
+
+        Args:
+            urls: URLs to scrape
+            on_result: Optional callback invoked with (index, entry) as each URL finishes
+
+        Returns:
+            List of result entries in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        workers = min(self.max_workers, len(urls)) or 1
+
+        logger.info(f"⚡ Concurrent batch: {len(urls)} URLs, {workers} workers, {self.per_host_limit} per host")
+
+        def task(index: int, url: str):
+            entry = self._scrape_one(index + 1, len(urls), url)
+            results[index] = entry
+            if on_result:
+                on_result(index, entry)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='batch-scrape') as executor:
+            futures = [executor.submit(task, i, url) for i, url in enumerate(urls)]
+            for future in futures:
+                future.result()
+
+        return results
+
+    def _scrape_one(self, position: int, total: int, url: str) -> Dict[str, Any]:
+        """Scrape a single URL under its host's concurrency cap and store the result file"""
+        try:
+            # Model calls made for batch URLs queue behind interactive scrapes
+            with self._host_semaphore(url), dispatch_priority(BATCH):
+                logger.info(f"📊 Processing {position}/{total}: {url}")
+                result = self._get_parser().parse_yacht_listing(url)
+
+            if 'error' not in result:
+                # Store individual result
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"batch_scraped_{position}_{timestamp}.json"
+
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(result, f, indent=2, ensure_ascii=False)
+
+                return {
+                    'url': url,
+                    'status': 'success',
+                    'fields_extracted': result.get('completion_stats', {}).get('total_fields', 0),
+                    'filename': filename
+                }
+
+            return {
+                'url': url,
+                'status': 'failed',
+                'error': result['error']
+            }
+
+        except Exception as e:
+            logger.error(f"❌ Error processing {url}: {e}")
+            return {
+                'url': url,
+                'status': 'failed',
+                'error': str(e)
+            }
+
+    def _get_parser(self):
+        """Return the parser owned by the current worker thread"""
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = self.parser_factory()
+            self._local.parser = parser
+        return parser
+
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        """Return the semaphore limiting concurrent requests to the URL's host"""
+        host = urlparse(url).netloc.lower()
+        with self._host_guard:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+
+def build_batch_summary(urls: List[str], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the batch summary in the batch_summary_*.json format"""
+    batch_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return {
+        'total_urls': len(urls),
+        'successful': len([r for r in results if r['status'] == 'success']),
+        'failed': len([r for r in results if r['status'] == 'failed']),
+        'timestamp': batch_timestamp,
+        'results': results
+    }
+
+
+def parse_batch_options(data: Dict[str, Any]) -> Dict[str, Optional[int]]:
+    """
+    Read max_workers and per_host_limit from a request body
+
+    Args:
+        data: Request JSON; missing or null values fall back to the defaults
+
+    Returns:
+        Options for ConcurrentBatchScraper, capped at BATCH_MAX_WORKERS and BATCH_PER_HOST_LIMIT
+
+    Raises:
+        ValueError: When a value is not an integer
+    """
+    options = {}
+    for name, ceiling in (('max_workers', DEFAULT_MAX_WORKERS), ('per_host_limit', DEFAULT_PER_HOST_LIMIT)):
+        value = data.get(name)
+        if value is None:
+            options[name] = None
+            continue
+        try:
+            if isinstance(value, bool) or int(value) != float(value):
+                raise ValueError
+            options[name] = min(max(1, int(value)), ceiling)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} must be an integer")
+    return options
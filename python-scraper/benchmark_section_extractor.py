@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BeautifulSoup unified extraction vs lxml single-pass section extractor
+Parses the rendered fixture corpus and reports per-page CPU time for both engines
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from devalk_fixtures import build_fixture_pages
+from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+
+
+def time_engine(parse, pages, rounds):
+    """Mean CPU milliseconds per page over all rounds"""
+    started = time.process_time()
+    for _ in range(rounds):
+        for html in pages:
+            parse(html)
+    return (time.process_time() - started) * 1000 / (rounds * len(pages))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--rounds', type=int, default=5)
+    arg_parser.add_argument('--padding-kb', type=int, default=120, help='Boilerplate size per page')
+    args = arg_parser.parse_args()
+
+    # Per-field INFO logging would dominate the old engine's timings
+    logging.disable(logging.INFO)
+
+    parser = SuperEnhancedDeValkParser()
+    pages = [html for _, html in build_fixture_pages(padding_kb=args.padding_kb)]
+    avg_kb = sum(len(html) for html in pages) / len(pages) / 1024
+
+    def before(html):
+        return parser._extract_all_sections_unified(BeautifulSoup(html, 'html.parser'))
+
+    def after(html):
+        sections = parser.section_extractor.extract(html)
+        sections['indicationRatios'] = parser._calculate_indication_ratios(sections['modeBox'], sections['rigging'])
+        return sections
+
+    mismatches = sum(1 for html in pages if before(html) != after(html))
+
+    before_ms = time_engine(before, pages, args.rounds)
+    after_ms = time_engine(after, pages, args.rounds)
+
+    print(f"📄 {len(pages)} pages, {avg_kb:.0f} KB average, {args.rounds} rounds")
+    print(f"🐢 BeautifulSoup html.parser: {before_ms:8.2f} ms/page")
+    print(f"⚡ lxml single pass:          {after_ms:8.2f} ms/page")
+    print(f"🚀 Speedup: {before_ms / after_ms:.1f}x, output mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
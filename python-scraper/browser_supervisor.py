@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Browser Supervisor - Tracks every chromedriver/Chrome process tree the service starts
+Flags trees over the RSS or lifetime ceiling for their owner to retire, reaps the ones whose driver was dropped without quit(), and reports metrics
+"""
+
+import os
+import time
+import weakref
+import logging
+import threading
+from typing import Dict, Any, List, Optional
+
+try:
+    import psutil
+except ImportError:  # without psutil there is no process table to supervise
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RSS_MB = int(os.getenv('CHROME_SUPERVISOR_MAX_RSS_MB', '2048'))
+DEFAULT_MAX_LIFETIME_SECONDS = float(os.getenv('CHROME_MAX_LIFETIME_SECONDS', '3600'))
+DEFAULT_SWEEP_INTERVAL = float(os.getenv('CHROME_SUPERVISOR_INTERVAL', '30'))
+SUPERVISOR_ENABLED = os.getenv('CHROME_SUPERVISOR_ENABLED', 'true').lower() == 'true'
+
+# Process names treated as browser processes when found under this process without a tracked driver
+BROWSER_PROCESS_NAMES = ('chromedriver', 'chrome', 'chromium', 'headless_shell')
+# Untracked processes younger than this may belong to a driver that is still starting up
+UNTRACKED_GRACE_SECONDS = 60
+
+
+class TrackedBrowser:
+    """One driver's process tree; pids are remembered so Chrome is found even after chromedriver exits"""
+
+    def __init__(self, driver, root_pid: int):
+        self.driver_ref = weakref.ref(driver)
+        self.root_pid = root_pid
+        self.started_at = time.time()
+        # pid -> create_time, so a reused pid is never killed by mistake
+        self.pids: Dict[int, float] = {}
+        # Set once the tree passes a ceiling; the owner quits and replaces the driver when it is free
+        self.retire_reason: Optional[str] = None
+
+
+class BrowserSupervisor:
+    """Registry of browser process trees with a periodic sweep enforcing ceilings"""
+
+    def __init__(self, max_rss_mb: Optional[int] = None, max_lifetime_seconds: Optional[float] = None,
+                 interval: Optional[float] = None):
+        """
+        Args:
+            max_rss_mb: Ask for a browser whose process tree exceeds this resident memory to be retired
+            max_lifetime_seconds: Ask for a browser older than this to be retired
+            interval: Seconds between sweeps of the background thread
+        """
+        self.max_rss_mb = max_rss_mb or DEFAULT_MAX_RSS_MB
+        self.max_lifetime_seconds = max_lifetime_seconds or DEFAULT_MAX_LIFETIME_SECONDS
+        self.interval = interval or DEFAULT_SWEEP_INTERVAL
+
+        self._browsers: Dict[int, TrackedBrowser] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_sweep: Dict[str, Any] = {'browsers': 0, 'processes': 0, 'rss_mb': 0.0, 'at': None}
+        self.stats = {'registered': 0, 'released': 0, 'retire_rss': 0, 'retire_lifetime': 0,
+                      'orphans_reaped': 0, 'processes_killed': 0}
+
+    def register(self, driver):
+        """Start tracking the process tree of a Selenium driver (chromedriver and the Chrome it launched)"""
+        try:
+            root_pid = driver.service.process.pid
+        except Exception:
+            logger.debug("Driver has no service process to supervise")
+            return
+        tracked = TrackedBrowser(driver, root_pid)
+        self._snapshot(tracked)
+        with self._lock:
+            self._browsers[root_pid] = tracked
+            self.stats['registered'] += 1
+
+    def retire_reason(self, driver) -> Optional[str]:
+        """
+        Why a driver's browser should be quit and replaced, or None while it is within the ceilings
+
+        Owners (the driver pool, the tab renderer) check this when a driver is free, so a browser
+        is never killed in the middle of a render.
+        """
+        try:
+            root_pid = driver.service.process.pid
+        except Exception:
+            return None
+        with self._lock:
+            tracked = self._browsers.get(root_pid)
+        if tracked is None or tracked.driver_ref() is not driver:
+            return None
+        return tracked.retire_reason
+
+    def start(self):
+        """Run sweeps in a daemon thread"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='browser-supervisor', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def sweep(self) -> Dict[str, Any]:
+        """
+        Check every tracked browser once: reap dropped/quit ones, flag those over a ceiling for retirement
+
+        Returns:
+            Totals of the live browsers after the sweep
+        """
+        with self._lock:
+            browsers = list(self._browsers.values())
+
+        now = time.time()
+        live_count, process_count, total_rss = 0, 0, 0.0
+        for tracked in browsers:
+            processes = self._snapshot(tracked)
+            driver = tracked.driver_ref()
+            root_alive = any(p.pid == tracked.root_pid and self._is_running(p) for p in processes)
+
+            if driver is None or not root_alive:
+                # quit() leaves nothing behind; a dropped driver or a dead chromedriver leaves Chrome running
+                reason = 'orphan' if processes else None
+                self._forget(tracked, processes, reason)
+                continue
+
+            rss_mb = self._rss_mb(processes)
+            age = now - tracked.started_at
+            if tracked.retire_reason is None:
+                # Still owned and possibly rendering: the owner retires it, nothing is killed here
+                if rss_mb > self.max_rss_mb:
+                    self._flag(tracked, 'rss', f"{rss_mb:.0f} MB RSS (ceiling {self.max_rss_mb} MB)")
+                elif age > self.max_lifetime_seconds:
+                    self._flag(tracked, 'lifetime', f"{age:.0f}s old (ceiling {self.max_lifetime_seconds:.0f}s)")
+            live_count += 1
+            process_count += len(processes)
+            total_rss += rss_mb
+
+        self._reap_untracked()
+        summary = {'browsers': live_count, 'processes': process_count, 'rss_mb': round(total_rss, 1), 'at': now}
+        with self._lock:
+            self._last_sweep = summary
+        return summary
+
+    def metrics(self) -> Dict[str, Any]:
+        """Live browser count, process count and RSS from the last sweep, plus retire/reap counters"""
+        with self._lock:
+            return {**self._last_sweep, 'tracked': len(self._browsers), **self.stats,
+                    'max_rss_mb': self.max_rss_mb, 'max_lifetime_seconds': self.max_lifetime_seconds}
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning(f"⚠️ Browser supervisor sweep failed: {e}")
+
+    def _snapshot(self, tracked: TrackedBrowser) -> List[Any]:
+        """Current processes of a tree: the root's descendants plus any remembered pid still running"""
+        processes = {}
+        try:
+            root = psutil.Process(tracked.root_pid)
+            for process in [root] + root.children(recursive=True):
+                processes[process.pid] = process
+        except psutil.Error:
+            pass
+        for pid, create_time in list(tracked.pids.items()):
+            if pid in processes:
+                continue
+            try:
+                process = psutil.Process(pid)
+                if process.create_time() == create_time:
+                    processes[pid] = process
+            except psutil.Error:
+                pass
+
+        alive = []
+        for process in processes.values():
+            try:
+                tracked.pids.setdefault(process.pid, process.create_time())
+                if tracked.pids[process.pid] == process.create_time():
+                    alive.append(process)
+            except psutil.Error:
+                continue
+        tracked.pids = {p.pid: tracked.pids[p.pid] for p in alive}
+        return alive
+
+    def _flag(self, tracked: TrackedBrowser, reason: str, detail: str):
+        tracked.retire_reason = reason
+        with self._lock:
+            self.stats[f'retire_{reason}'] += 1
+        logger.warning(f"🧹 Browser {tracked.root_pid} is {detail}; its owner will retire it")
+
+    def _forget(self, tracked: TrackedBrowser, processes: List[Any], reason: Optional[str]):
+        with self._lock:
+            self._browsers.pop(tracked.root_pid, None)
+        running = [p for p in processes if self._is_running(p)]
+        if reason is None or not running:
+            with self._lock:
+                self.stats['released'] += 1
+            return
+        # Only orphans get here: a dropped driver or a dead chromedriver, so nobody is rendering in it
+        killed = self._kill(running)
+        with self._lock:
+            self.stats['processes_killed'] += killed
+            self.stats['orphans_reaped'] += 1
+        logger.warning(f"🧹 Reaped {killed} processes of browser {tracked.root_pid}, its driver was never quit")
+
+    def _reap_untracked(self):
+        """Kill browser processes under this process that no tracked driver accounts for"""
+        with self._lock:
+            known = {pid for tracked in self._browsers.values() for pid in tracked.pids}
+        try:
+            descendants = psutil.Process().children(recursive=True)
+        except psutil.Error:
+            return
+        cutoff = time.time() - UNTRACKED_GRACE_SECONDS
+        orphans = []
+        for process in descendants:
+            try:
+                if process.pid not in known and process.create_time() < cutoff \
+                        and process.name().lower().startswith(BROWSER_PROCESS_NAMES) and self._is_running(process):
+                    orphans.append(process)
+            except psutil.Error:
+                continue
+        if orphans:
+            killed = self._kill(orphans)
+            with self._lock:
+                self.stats['processes_killed'] += killed
+                self.stats['orphans_reaped'] += 1
+            logger.warning(f"🧹 Reaped {killed} untracked browser processes")
+
+    @classmethod
+    def _kill(cls, processes: List[Any]) -> int:
+        """Terminate, then kill whatever is still running after a short grace period"""
+        count = len(processes)
+        for signal_process in ('terminate', 'kill'):
+            for process in processes:
+                try:
+                    getattr(process, signal_process)()
+                except psutil.Error:
+                    pass
+            # Our own children are reaped here; zombies reparented elsewhere count as dead
+            psutil.wait_procs([p for p in processes if cls._is_own_child(p)], timeout=0.5)
+            deadline = time.time() + 3
+            while any(cls._is_running(p) for p in processes) and time.time() < deadline:
+                time.sleep(0.05)
+            processes = [p for p in processes if cls._is_running(p)]
+            if not processes:
+                break
+        return count
+
+    @staticmethod
+    def _is_own_child(process) -> bool:
+        try:
+            return process.ppid() == os.getpid()
+        except psutil.Error:
+            return False
+
+    @staticmethod
+    def _is_running(process) -> bool:
+        try:
+            return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+        except psutil.Error:
+            return False
+
+    @staticmethod
+    def _rss_mb(processes: List[Any]) -> float:
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+
+_shared_supervisor: Optional[BrowserSupervisor] = None
+_shared_supervisor_lock = threading.Lock()
+
+
+def get_browser_supervisor() -> Optional[BrowserSupervisor]:
+    """Return the process-wide supervisor with its sweep thread running, or None when disabled or psutil is missing"""
+    global _shared_supervisor
+    if not SUPERVISOR_ENABLED or psutil is None:
+        return None
+    with _shared_supervisor_lock:
+        if _shared_supervisor is None:
+            _shared_supervisor = BrowserSupervisor()
+            _shared_supervisor.start()
+        return _shared_supervisor
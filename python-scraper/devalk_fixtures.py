@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+De Valk Fixture Builder - Renders stored v5 scrape results back into De Valk style HTML
+Gives benchmarks and tests realistic listing pages without network access
+"""
+
+import os
+import glob
+import json
+from html import escape
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+
+FIXTURE_BASE_URL = 'https://www.devalk.nl/en/yachtbrokerage'
+
+# Stored results that can be rendered back into pages; older (v4) outputs lack tableBox and are skipped
+CORPUS_PATTERNS = (
+    'scraped_data_*.json',
+    'batch_scraped_*.json',
+    'hallberg_*.json',
+    'moody_*.json',
+    'najad_*.json',
+)
+
+# Labels as they appear on the site for the keys the parser normalizes
+TABLE_BOX_LABELS = {
+    'dimensions': 'Dimensions',
+    'material': 'Material',
+    'yearBuilt': 'Built',
+    'engines': 'Engine(s)',
+    'hpKw': 'HP/ KW',
+    'lying': 'Lying',
+    'salesOffice': 'Sales office',
+    'status': 'Status',
+    'vat': 'VAT',
+    'askingPrice': 'Asking price',
+}
+
+SPECIFICATION_LABELS = {
+    'model': 'Model',
+    'yachtType': 'Type',
+    'loaM': 'LOA (m)',
+    'lwlM': 'LWL (m)',
+    'beamM': 'Beam (m)',
+    'draftM': 'Draft (m)',
+    'airDraftM': 'Air draft (m)',
+    'headroomM': 'Headroom (m)',
+    'yearBuilt': 'Year built',
+    'launched': 'Launched',
+    'builder': 'Builder',
+    'country': 'Country',
+    'designer': 'Designer',
+    'displacementT': 'Displacement (t)',
+    'ballastTonnes': 'Ballast (tonnes)',
+    'ceNorm': 'CE norm',
+    'hullMaterial': 'Hull material',
+    'hullColour': 'Hull colour',
+    'hullShape': 'Hull shape',
+    'keelType': 'Keel type',
+    'superstructureMaterial': 'Superstructure material',
+    'deckMaterial': 'Deck material',
+    'deckFinish': 'Deck finish',
+    'superstructureDeckFinish': 'Superstructure deck finish',
+    'cockpitDeckFinish': 'Cockpit deck finish',
+    'dorades': 'Dorades',
+    'windowFrame': 'Window frame',
+    'windowMaterial': 'Window material',
+    'deckhatch': 'Deckhatch',
+    'portholes': 'Portholes',
+    'insulation': 'Insulation',
+    'fuelTankLitre': 'Fuel tank (litre)',
+    'levelIndicatorFuelTank': 'Level indicator (fuel tank)',
+    'freshwaterTankLitre': 'Freshwater tank (litre)',
+    'levelIndicatorFreshwater': 'Level indicator (freshwater)',
+    'blackwaterTankLitre': 'Blackwater tank (litre)',
+    'levelIndicatorBlackwater': 'Level indicator (blackwater)',
+    'blackwaterTankExtraction': 'Blackwater tank extraction',
+    'greywaterTankLitre': 'Greywater tank (litre)',
+    'wheelSteering': 'Wheel steering',
+    'emergencyTiller': 'Emergency tiller',
+    'moreInfoOnHull': 'More info on hull',
+    'moreInfoOnPaintwork': 'More info on paintwork',
+    'extraInfo': 'Extra info',
+}
+
+ACCORDION_TITLES = [
+    ('accommodation', 'Accommodation'),
+    ('machinery', 'Machinery'),
+    ('navigation', 'Navigation'),
+    ('equipment', 'Equipment'),
+    ('rigging', 'Rigging'),
+]
+
+
+def load_fixture_corpus(directory: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+    """Load every stored v5 result matching CORPUS_PATTERNS from a directory"""
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    corpus = []
+    for pattern in CORPUS_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(directory, pattern))):
+            with open(path, 'r', encoding='utf-8') as f:
+                result = json.load(f)
+            if 'tableBox' in result.get('data', {}):
+                corpus.append((os.path.basename(path), result))
+    return corpus
+
+
+def _spec_label(key: str) -> str:
+    return SPECIFICATION_LABELS.get(key, key.capitalize())
+
+
+def _spec_lists(fields: Dict[str, str]) -> str:
+    items = [
+        f'<li><strong>{escape(_spec_label(key))}</strong>\n  {escape(value)}</li>'
+        for key, value in fields.items()
+    ]
+    half = (len(items) + 1) // 2
+    return (
+        '<ul class="list-1">\n' + '\n'.join(items[:half]) + '\n</ul>\n'
+        '<ul class="list-2">\n' + '\n'.join(items[half:]) + '\n</ul>'
+    )
+
+
+def _boilerplate(listing_id: int, padding_kb: int) -> Tuple[str, str]:
+    """Navigation, gallery, scripts and footer of roughly padding_kb kilobytes"""
+    nav = '\n'.join(
+        f'<li class="nav-item"><a class="nav-link" href="/en/yachtbrokerage/{listing_id + i}">'
+        f'Sailing yacht {listing_id + i}</a></li>'
+        for i in range(120)
+    )
+    head = (
+        '<header class="site-header"><nav class="navbar"><ul class="navbar-nav">\n' + nav + '\n</ul></nav></header>\n'
+        '<div class="gallery">' + ''.join(
+            f'<img class="gallery-image" src="/images/{listing_id}/{i}.jpg" alt="Photo {i}">' for i in range(40)
+        ) + '</div>'
+    )
+
+    filler = []
+    size = 0
+    i = 0
+    while size < padding_kb * 1024:
+        card = (
+            f'<div class="card related-listing"><div class="card-body"><h3 class="card-title">Related yacht {i}</h3>'
+            f'<p class="card-text">Well maintained cruiser, lying in the Netherlands. Asking price on request.</p>'
+            f'<a class="btn btn-primary" href="/en/yachtbrokerage/{listing_id + 500 + i}">View</a></div></div>\n'
+        )
+        filler.append(card)
+        size += len(card)
+        i += 1
+    tracking = json.dumps({'listing': listing_id, 'impressions': list(range(400))})
+    foot = (
+        '<section class="related">' + ''.join(filler) + '</section>\n'
+        f'<script>window.dataLayer = window.dataLayer || []; window.dataLayer.push({tracking});</script>\n'
+        '<footer class="site-footer"><p>De Valk Yachtbrokers</p></footer>'
+    )
+    return head, foot
+
+
+def render_listing_html(result: Dict[str, Any], listing_id: int = 1000, padding_kb: int = 120) -> str:
+    """Render a v5 scrape result into a De Valk style listing page"""
+    data = result.get('data', {})
+    head, foot = _boilerplate(listing_id, padding_kb)
+
+    table_items = '\n'.join(
+        f'<div class="item"><strong>{escape(TABLE_BOX_LABELS.get(key, key))}</strong>'
+        f'<ul><li>{escape(TABLE_BOX_LABELS.get(key, key))}</li><li>{escape(value)}</li></ul></div>'
+        for key, value in data.get('tableBox', {}).items()
+    )
+
+    accordion = '\n'.join(
+        f'<div class="accordion-item">'
+        f'<h2 class="accordion-header"><button class="accordion-button collapsed" type="button">{title}</button></h2>'
+        f'<div class="accordion-collapse collapse"><div class="accordion-body">\n'
+        f'{_spec_lists(data.get(key, {}))}\n</div></div></div>'
+        for key, title in ACCORDION_TITLES
+    )
+
+    return (
+        '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+        f'<title>{escape(data.get("modeBox", {}).get("model", "Yacht"))} - De Valk</title></head>\n<body>\n'
+        f'{head}\n'
+        f'<main class="yacht-detail">\n<div class="tableBox">\n{table_items}\n</div>\n'
+        f'<div class="modeBox">\n{_spec_lists(data.get("modeBox", {}))}\n</div>\n'
+        f'<div class="accordion" id="specifications">\n{accordion}\n</div>\n</main>\n'
+        f'{foot}\n</body></html>'
+    )
+
+
+def build_fixture_pages(directory: Optional[str] = None, padding_kb: int = 120) -> List[Tuple[str, str]]:
+    """Render the whole stored corpus as (name, html) pairs"""
+    return [
+        (name, render_listing_html(result, listing_id=1000 + i, padding_kb=padding_kb))
+        for i, (name, result) in enumerate(load_fixture_corpus(directory))
+    ]
+
+
+def fixture_url(listing_id: int) -> str:
+    """Listing URL a rendered fixture page is served under"""
+    return f"{FIXTURE_BASE_URL}/{listing_id}/"
+
+
+def build_fixture_site(directory: Optional[str] = None, padding_kb: int = 120) -> Dict[str, str]:
+    """Render the stored corpus keyed by listing URL, ready for FixtureAdapter"""
+    return {
+        fixture_url(1000 + i): render_listing_html(result, listing_id=1000 + i, padding_kb=padding_kb)
+        for i, (_, result) in enumerate(load_fixture_corpus(directory))
+    }
+
+
+class FixtureAdapter(BaseAdapter):
+    """Serves rendered fixture pages to a requests session without touching the network"""
+
+    def __init__(self, pages: Dict[str, str]):
+        super().__init__()
+        self.pages = {url: html.encode('utf-8') for url, html in pages.items()}
+        self.requests_served = 0
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        body = self.pages.get(request.url)
+        if body is None:
+            response.status_code = 404
+            response._content = b''
+        else:
+            response.status_code = 200
+            response._content = body
+            response.headers['Content-Type'] = 'text/html; charset=utf-8'
+            response.encoding = 'utf-8'
+        self.requests_served += 1
+        return response
+
+    def close(self):
+        pass
@@ -9,13 +9,9 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import get_driver_pool, wait_for_ready
+from devalk_sections import READY_SELECTOR
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,8 +22,7 @@ class DeValkParser:
     
     def __init__(self):
         """Initialize the De Valk parser"""
-        self.driver = None
-        self.soup = None
+        # Drivers come from the shared pool and the soup stays local, so one instance is thread-safe
         
     def parse_yacht_listing(self, url: str) -> Dict[str, Any]:
         """
@@ -42,18 +37,16 @@ class DeValkParser:
         try:
             logger.info(f"🚀 Starting De Valk parsing: {url}")
             
-            # Initialize Selenium driver
-            self._setup_driver()
-            
-            # Load the page
-            self.driver.get(url)
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Get page source and create BeautifulSoup
-            page_source = self.driver.page_source
-            self.soup = BeautifulSoup(page_source, 'html.parser')
+            # Borrow a warm Selenium driver from the shared pool
+            with get_driver_pool().checkout() as driver:
+                # Load the page
+                driver.get(url)
+                # Wait for the listing sections rather than just <body>
+                wait_for_ready(driver, (By.CSS_SELECTOR, READY_SELECTOR))
+                
+                # Get page source and create BeautifulSoup
+                page_source = driver.page_source
+            soup = BeautifulSoup(page_source, 'html.parser')
             
             # Extract ALL sections
             data = {
@@ -64,14 +57,14 @@ class DeValkParser:
             }
             
             # Extract all sections
-            data.update(self._extract_key_details())
-            data.update(self._extract_general_information())
-            data.update(self._extract_accommodation())
-            data.update(self._extract_machinery())
-            data.update(self._extract_navigation())
-            data.update(self._extract_equipment())
-            data.update(self._extract_rigging())
-            data.update(self._extract_indication_ratios())
+            data.update(self._extract_key_details(soup))
+            data.update(self._extract_general_information(soup))
+            data.update(self._extract_accommodation(soup))
+            data.update(self._extract_machinery(soup))
+            data.update(self._extract_navigation(soup))
+            data.update(self._extract_equipment(soup))
+            data.update(self._extract_rigging(soup))
+            data.update(self._extract_indication_ratios(soup))
             
             # Calculate overall completeness
             data['data_completeness'] = self._calculate_completeness(data)
@@ -84,36 +77,15 @@ class DeValkParser:
         except Exception as e:
             logger.error(f"❌ Error in De Valk parsing: {e}")
             return {'error': str(e), 'source_url': url}
-            
-        finally:
-            if self.driver:
-                self.driver.quit()
-    
-    def _setup_driver(self):
-        """Setup Selenium Chrome driver"""
-        try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_argument("--window-size=1920,1080")
-            
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-        except Exception as e:
-            logger.error(f"Failed to setup Chrome driver: {e}")
-            raise
     
-    def _extract_key_details(self) -> Dict[str, Any]:
+    def _extract_key_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Key Details section with ALL fields"""
         logger.info("🔑 Extracting Key Details section...")
         
         key_details = {}
         
         # Look for Key Details section
-        section = self._find_section('Key Details')
+        section = self._find_section(soup, 'Key Details')
         if section:
             logger.info("✅ Found Key Details section")
             
@@ -131,14 +103,14 @@ class DeValkParser:
         
         return {'key_details': key_details}
     
-    def _extract_general_information(self) -> Dict[str, Any]:
+    def _extract_general_information(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract General Information section with ALL 35+ fields"""
         logger.info("📋 Extracting General Information section...")
         
         general = {}
         
         # Look for General Information section
-        section = self._find_section('General Information')
+        section = self._find_section(soup, 'General Information')
         if section:
             logger.info("✅ Found General Information section")
             
@@ -166,14 +138,14 @@ class DeValkParser:
         
         return {'general': general}
     
-    def _extract_accommodation(self) -> Dict[str, Any]:
+    def _extract_accommodation(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Accommodation section with ALL fields"""
         logger.info("🏠 Extracting Accommodation section...")
         
         accommodation = {}
         
         # Look for Accommodation section
-        section = self._find_section('Accommodation')
+        section = self._find_section(soup, 'Accommodation')
         if section:
             logger.info("✅ Found Accommodation section")
             
@@ -198,14 +170,14 @@ class DeValkParser:
         
         return {'accommodation': accommodation}
     
-    def _extract_machinery(self) -> Dict[str, Any]:
+    def _extract_machinery(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Machinery section with ALL fields"""
         logger.info("🔧 Extracting Machinery section...")
         
         machinery = {}
         
         # Look for Machinery section
-        section = self._find_section('Machinery')
+        section = self._find_section(soup, 'Machinery')
         if section:
             logger.info("✅ Found Machinery section")
             
@@ -231,14 +203,14 @@ class DeValkParser:
         
         return {'machinery': machinery}
     
-    def _extract_navigation(self) -> Dict[str, Any]:
+    def _extract_navigation(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Navigation section with ALL fields"""
         logger.info("🧭 Extracting Navigation section...")
         
         navigation = {}
         
         # Look for Navigation section
-        section = self._find_section('Navigation')
+        section = self._find_section(soup, 'Navigation')
         if section:
             logger.info("✅ Found Navigation section")
             
@@ -258,14 +230,14 @@ class DeValkParser:
         
         return {'navigation': navigation}
     
-    def _extract_equipment(self) -> Dict[str, Any]:
+    def _extract_equipment(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Equipment section with ALL fields"""
         logger.info("🛠️ Extracting Equipment section...")
         
         equipment = {}
         
         # Look for Equipment section
-        section = self._find_section('Equipment')
+        section = self._find_section(soup, 'Equipment')
         if section:
             logger.info("✅ Found Equipment section")
             
@@ -288,14 +260,14 @@ class DeValkParser:
         
         return {'equipment': equipment}
     
-    def _extract_rigging(self) -> Dict[str, Any]:
+    def _extract_rigging(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Rigging section with ALL fields including detailed winches"""
         logger.info("⛵ Extracting Rigging section...")
         
         rigging = {}
         
         # Look for Rigging section
-        section = self._find_section('Rigging')
+        section = self._find_section(soup, 'Rigging')
         if section:
             logger.info("✅ Found Rigging section")
             
@@ -319,14 +291,14 @@ class DeValkParser:
         
         return {'rigging': rigging}
     
-    def _extract_indication_ratios(self) -> Dict[str, Any]:
+    def _extract_indication_ratios(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract Indication Ratios section with ALL fields"""
         logger.info("📊 Extracting Indication Ratios section...")
         
         ratios = {}
         
         # Look for Indication Ratios section
-        section = self._find_section('Indication Ratios')
+        section = self._find_section(soup, 'Indication Ratios')
         if section:
             logger.info("✅ Found Indication Ratios section")
             
@@ -346,11 +318,11 @@ class DeValkParser:
         
         return {'indication_ratios': ratios}
     
-    def _find_section(self, section_name: str) -> Optional[Any]:
+    def _find_section(self, soup: BeautifulSoup, section_name: str) -> Optional[Any]:
         """Find a specific section in the HTML"""
         try:
             # Look for section headers
-            headers = self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+            headers = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
             
             for header in headers:
                 if section_name.lower() in header.get_text().lower():
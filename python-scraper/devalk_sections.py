@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+De Valk Section Extractor - lxml tree with a single pass over the section nodes
+Produces the same tableBox/modeBox/accordion dicts as the BeautifulSoup unified extraction
+"""
+
+import logging
+from typing import Callable, Dict, Any, List, Optional
+
+from lxml import etree
+
+from field_normalizer import normalize_table_box_label, normalize_specification_label
+
+logger = logging.getLogger(__name__)
+
+ACCORDION_SECTIONS = [
+    ('accommodation', 'Accommodation'),
+    ('machinery', 'Machinery'),
+    ('navigation', 'Navigation'),
+    ('equipment', 'Equipment'),
+    ('rigging', 'Rigging'),
+]
+
+# Nodes the section extraction reads; a rendered page is ready once one of them exists
+READY_SELECTOR = '.tableBox, .modeBox, .accordion-item'
+
+# BeautifulSoup leaves text inside these tags out of get_text()
+NON_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+
+def _classes(element) -> List[str]:
+    return (element.get('class') or '').split()
+
+
+def _first_descendant(element, tag: str, css_class: Optional[str] = None):
+    """First descendant with the tag (and class token), like soup.find()"""
+    for candidate in element.iterdescendants(tag):
+        if css_class is None or css_class in _classes(candidate):
+            return candidate
+    return None
+
+
+def element_text(element) -> str:
+    """Concatenated text of an element, matching BeautifulSoup's get_text()"""
+    if next(element.iter(*NON_TEXT_TAGS), None) is None:
+        return ''.join(element.itertext())
+
+    parts = []
+
+    def walk(node, skip: bool):
+        skip = skip or node.tag in NON_TEXT_TAGS
+        if node.text and not skip:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str):
+                walk(child, skip)
+            if child.tail and not skip:
+                parts.append(child.tail)
+
+    walk(element, False)
+    return ''.join(parts)
+
+
+def element_string(element) -> Optional[str]:
+    """BeautifulSoup's tag.string: the text of a tag whose only child is a string (or such a tag)"""
+    children = []
+    if element.text:
+        children.append(element.text)
+    for child in element:
+        children.append(child)
+        if child.tail:
+            children.append(child.tail)
+        if len(children) > 1:
+            return None
+
+    if len(children) != 1:
+        return None
+    only = children[0]
+    if isinstance(only, str):
+        return only
+    if not isinstance(only.tag, str):
+        # Comments and processing instructions count as strings
+        return only.text
+    return element_string(only)
+
+
+def parse_html(html: str):
+    """Build an lxml tree, returning None for an empty document"""
+    if '\r' in html:
+        # libxml2 folds CR/LF into LF; html.parser keeps it, and so do the stored results
+        html = html.replace('\r', '&#13;')
+    parser = etree.HTMLParser()
+    try:
+        root = etree.fromstring(html, parser)
+    except ValueError:
+        # str input with an XML encoding declaration
+        root = etree.fromstring(html.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+    except (etree.ParserError, etree.XMLSyntaxError):
+        return None
+    return root
+
+
+class DeValkSectionExtractor:
+    """Walks a De Valk page once and fills every section dict"""
+
+    def __init__(self, table_box_label: Callable[[str], str] = normalize_table_box_label,
+                 specification_label: Callable[[str], str] = normalize_specification_label):
+        """
+        Args:
+            table_box_label: Maps a lowercased tableBox label to its result key
+            specification_label: Maps a lowercased modeBox/accordion label to its result key
+        """
+        self.table_box_label = table_box_label
+        self.specification_label = specification_label
+
+    def extract(self, html: str) -> Dict[str, Any]:
+        """
+        Extract tableBox, modeBox and the accordion sections from page HTML
+
+        Returns:
+            Dictionary of section name to field dict, in the unified result order
+        """
+        table_box = mode_box = None
+        accordion_items = []
+
+        root = parse_html(html)
+        if root is not None:
+            # One pass over the divs collects every section root
+            for div in root.iter('div'):
+                classes = _classes(div)
+                if not classes:
+                    continue
+                if table_box is None and 'tableBox' in classes:
+                    table_box = div
+                if mode_box is None and 'modeBox' in classes:
+                    mode_box = div
+                if 'accordion-item' in classes:
+                    accordion_items.append(div)
+
+        sections = {
+            'tableBox': self._table_box(table_box) if table_box is not None else {},
+            'modeBox': self._lists(mode_box) if mode_box is not None else {},
+        }
+        sections.update(self._accordion(accordion_items))
+        return sections
+
+    def _table_box(self, table_box) -> Dict[str, str]:
+        results = {}
+        for item in table_box.iterdescendants('div'):
+            if 'item' not in _classes(item):
+                continue
+            strong = _first_descendant(item, 'strong')
+            if strong is None:
+                continue
+
+            label = element_text(strong)
+            # Value is the first li whose own string does not repeat the label
+            for li in item.iterdescendants('li'):
+                string = element_string(li)
+                if string and label not in string:
+                    field_name = self.table_box_label(label.strip().lower())
+                    results[field_name] = element_text(li).strip()
+                    logger.debug(f"✅ TableBox: {field_name} = {results[field_name]}")
+                    break
+        return results
+
+    def _lists(self, container) -> Dict[str, str]:
+        """Parse the list-1 and list-2 specification lists inside a modeBox or accordion body"""
+        results = {}
+        for css_class in ('list-1', 'list-2'):
+            ul = _first_descendant(container, 'ul', css_class)
+            if ul is not None:
+                results.update(self._specification_list(ul))
+        return results
+
+    def _specification_list(self, ul) -> Dict[str, str]:
+        results = {}
+        for li in ul.iterdescendants('li'):
+            strong = _first_descendant(li, 'strong')
+            if strong is None:
+                continue
+            label = element_text(strong)
+            value = element_text(li).replace(label, '').strip()
+            if value:
+                results[self.specification_label(label.strip().lower())] = value
+        return results
+
+    def _accordion(self, accordion_items) -> Dict[str, Dict[str, str]]:
+        """Each section takes the first accordion item whose button names it and that has a body"""
+        bodies: Dict[str, Any] = {}
+        pending = list(ACCORDION_SECTIONS)
+
+        for item in accordion_items:
+            if not pending:
+                break
+            button = _first_descendant(item, 'button', 'accordion-button')
+            if button is None:
+                continue
+            title = element_text(button).lower()
+            matched = [entry for entry in pending if entry[1].lower() in title]
+            if not matched:
+                continue
+            body = _first_descendant(item, 'div', 'accordion-body')
+            if body is None:
+                continue
+            for entry in matched:
+                bodies[entry[0]] = body
+                pending.remove(entry)
+
+        return {
+            key: self._lists(bodies[key]) if key in bodies else {}
+            for key, _ in ACCORDION_SECTIONS
+        }
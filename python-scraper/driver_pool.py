@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Chrome Driver Pool - Warm, bounded pool of reusable headless Chrome drivers
+Avoids a browser boot and a ChromeDriverManager lookup for every scraped URL
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Callable, Any, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from webdriver_manager.chrome import ChromeDriverManager
+
+from browser_supervisor import get_browser_supervisor
+
+try:
+    import psutil
+except ImportError:  # memory ceiling is only enforced when psutil is available
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv('CHROME_POOL_SIZE', '2'))
+DEFAULT_MAX_PAGES = int(os.getenv('CHROME_MAX_PAGES_PER_DRIVER', '50'))
+DEFAULT_MAX_RSS_MB = int(os.getenv('CHROME_MAX_RSS_MB', '1024'))
+DEFAULT_CHECKOUT_TIMEOUT = float(os.getenv('CHROME_CHECKOUT_TIMEOUT', '60'))
+# 'light' blocks assets and trackers the parsers never read; 'full' loads pages as a normal browser would
+DEFAULT_RENDER_PROFILE = os.getenv('CHROME_RENDER_PROFILE', 'light').lower()
+DEFAULT_READY_TIMEOUT = float(os.getenv('CHROME_READY_TIMEOUT', '10'))
+
+# Resource types the parsers never read: they only look at the DOM
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.css',
+    '*.mp4', '*.webm', '*.mp3',
+]
+# Third-party analytics, ads, consent and embed hosts
+BLOCKED_HOST_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*googleadservices.com*', '*connect.facebook.net*', '*facebook.com/tr*', '*hotjar.com*',
+    '*clarity.ms*', '*cookiebot.com*', '*onetrust.com*', '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+    '*youtube.com/embed*', '*maps.googleapis.com*', '*tiktok.com*', '*linkedin.com/px*',
+]
+EXTRA_BLOCKED_PATTERNS = [pattern.strip() for pattern in os.getenv('CHROME_BLOCKED_URLS', '').split(',') if pattern.strip()]
+
+
+@lru_cache(maxsize=1)
+def resolve_chromedriver_path() -> str:
+    """Resolve the chromedriver binary once per process"""
+    explicit_path = os.getenv('CHROMEDRIVER_PATH')
+    if explicit_path:
+        return explicit_path
+    path = ChromeDriverManager().install()
+    logger.info(f"🧭 Resolved chromedriver: {path}")
+    return path
+
+
+def build_chrome_options(user_agent: Optional[str] = None, profile: Optional[str] = None) -> Options:
+    """Headless Chrome options shared by every scraper"""
+    profile = profile or DEFAULT_RENDER_PROFILE
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    if user_agent:
+        chrome_options.add_argument(f'--user-agent={user_agent}')
+    if profile == 'light':
+        # Images never decode, and get() returns at DOMContentLoaded; readiness waits cover the rest
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.media_stream': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+        chrome_options.page_load_strategy = 'eager'
+    return chrome_options
+
+
+def apply_render_profile(driver, profile: Optional[str] = None):
+    """Block asset and third-party requests for the lifetime of the driver's session"""
+    if (profile or DEFAULT_RENDER_PROFILE) != 'light':
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {
+            'urls': BLOCKED_RESOURCE_PATTERNS + BLOCKED_HOST_PATTERNS + EXTRA_BLOCKED_PATTERNS
+        })
+    except Exception as e:
+        logger.warning(f"⚠️ Could not install request blocking: {e}")
+
+
+def create_chrome_driver(user_agent: Optional[str] = None, profile: Optional[str] = None) -> webdriver.Chrome:
+    """Start a new headless Chrome using the cached driver path and the rendering profile"""
+    driver = webdriver.Chrome(
+        service=Service(resolve_chromedriver_path()),
+        options=build_chrome_options(user_agent, profile)
+    )
+    apply_render_profile(driver, profile)
+    # Drivers dropped without quit() are reaped by the supervisor; ones past its memory/lifetime ceilings get retired
+    supervisor = get_browser_supervisor()
+    if supervisor is not None:
+        supervisor.register(driver)
+    return driver
+
+
+def wait_for_ready(driver, locator, timeout: Optional[float] = None) -> bool:
+    """
+    Wait for the element a parser needs instead of sleeping a fixed time
+
+    Args:
+        driver: Webdriver with the page loading
+        locator: (By, selector) of the element that signals the content is present
+        timeout: Seconds to wait (default CHROME_READY_TIMEOUT)
+
+    Returns:
+        False when the element never appeared; the page is then used as loaded
+    """
+    try:
+        WebDriverWait(driver, DEFAULT_READY_TIMEOUT if timeout is None else timeout).until(
+            EC.presence_of_element_located(locator)
+        )
+        return True
+    except TimeoutException:
+        logger.warning(f"⚠️ Readiness element {locator[1]} not found, using the page as loaded")
+        return False
+
+
+class PooledDriver:
+    """A driver plus the bookkeeping used to decide when to recycle it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_served = 0
+        self.created_at = time.time()
+
+
+class ChromeDriverPool:
+    """Bounded pool of warm Chrome drivers with checkout/checkin and recycling"""
+
+    def __init__(self, size: Optional[int] = None, max_pages: Optional[int] = None,
+                 max_rss_mb: Optional[int] = None, driver_factory: Callable[[], Any] = create_chrome_driver,
+                 supervisor=None):
+        """
+        Args:
+            size: Maximum number of drivers alive at once
+            max_pages: Recycle a driver after serving this many pages
+            max_rss_mb: Recycle a driver whose browser process tree exceeds this RSS (needs psutil)
+            driver_factory: Callable creating a new driver
+            supervisor: BrowserSupervisor whose retire flags recycle a driver once it is free
+                (default: the process-wide one; False ignores them)
+        """
+        self.size = max(1, size or DEFAULT_POOL_SIZE)
+        self.max_pages = max(1, max_pages or DEFAULT_MAX_PAGES)
+        self.max_rss_mb = max_rss_mb or DEFAULT_MAX_RSS_MB
+        self.driver_factory = driver_factory
+        self.supervisor = get_browser_supervisor() if supervisor is None else supervisor
+
+        self._idle: List[PooledDriver] = []
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'unhealthy': 0}
+
+    def warm(self, count: Optional[int] = None):
+        """Start drivers ahead of time so the first scrapes skip browser boot"""
+        count = min(self.size, count or self.size)
+        while True:
+            with self._lock:
+                if len(self._idle) >= count:
+                    return
+            pooled = self._create()
+            with self._lock:
+                self._idle.append(pooled)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None):
+        """
+        Borrow a driver for the duration of a with-block
+
+        Args:
+            timeout: Seconds to wait for a free driver
+
+        Yields:
+            A ready-to-use webdriver
+        """
+        pooled = self._acquire(DEFAULT_CHECKOUT_TIMEOUT if timeout is None else timeout)
+        failed = False
+        try:
+            yield pooled.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._release(pooled, failed)
+
+    def close(self):
+        """Quit every idle driver; drivers still checked out are quit on checkin"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+
+    def _acquire(self, timeout: float) -> PooledDriver:
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No Chrome driver available after {timeout}s")
+
+        try:
+            while True:
+                with self._lock:
+                    pooled = self._idle.pop() if self._idle else None
+                if pooled is None:
+                    return self._create()
+                if not self._is_healthy(pooled):
+                    self._count('unhealthy')
+                else:
+                    # The supervisor may have flagged it while it sat idle
+                    reason = self._retire_reason(pooled)
+                    if reason is None:
+                        self._count('reused')
+                        return pooled
+                    logger.info(f"♻️ Recycling Chrome driver ({reason})")
+                    self._count('recycled')
+                self._quit(pooled)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, pooled: PooledDriver, failed: bool):
+        try:
+            pooled.pages_served += 1
+            reason = self._recycle_reason(pooled, failed)
+            if reason:
+                logger.info(f"♻️ Recycling Chrome driver ({reason})")
+                self._count('recycled')
+                self._quit(pooled)
+                return
+
+            self._reset(pooled)
+            with self._lock:
+                self._idle.append(pooled)
+        finally:
+            self._slots.release()
+
+    def _recycle_reason(self, pooled: PooledDriver, failed: bool) -> Optional[str]:
+        if self._closed:
+            return 'pool closed'
+        if failed and not self._is_healthy(pooled):
+            return 'driver unhealthy after error'
+        if pooled.pages_served >= self.max_pages:
+            return f'{pooled.pages_served} pages served'
+        rss_mb = self._rss_mb(pooled)
+        if rss_mb is not None and rss_mb > self.max_rss_mb:
+            return f'{rss_mb:.0f} MB RSS'
+        return self._retire_reason(pooled)
+
+    def _retire_reason(self, pooled: PooledDriver) -> Optional[str]:
+        """The supervisor's request to replace this driver, if it has flagged one"""
+        reason = self.supervisor.retire_reason(pooled.driver) if self.supervisor else None
+        return f'supervisor {reason} ceiling' if reason else None
+
+    def _create(self) -> PooledDriver:
+        started = time.time()
+        pooled = PooledDriver(self.driver_factory())
+        self._count('created')
+        logger.info(f"🚗 Started Chrome driver in {time.time() - started:.1f}s")
+        return pooled
+
+    def _count(self, stat: str):
+        # Checkouts run on many threads; += on a shared dict is not atomic
+        with self._lock:
+            self.stats[stat] += 1
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(pooled: PooledDriver):
+        """Drop cookies and unload the last page so the next checkout starts clean"""
+        try:
+            pooled.driver.delete_all_cookies()
+            pooled.driver.get('about:blank')
+        except Exception as e:
+            logger.debug(f"Driver reset failed: {e}")
+
+    @staticmethod
+    def _rss_mb(pooled: PooledDriver) -> Optional[float]:
+        """Resident memory of chromedriver and its browser processes"""
+        if psutil is None:
+            return None
+        try:
+            process = psutil.Process(pooled.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _quit(pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"Driver quit failed: {e}")
+
+
+_shared_pool: Optional[ChromeDriverPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> ChromeDriverPool:
+    """Return the process-wide driver pool"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ChromeDriverPool()
+        return _shared_pool
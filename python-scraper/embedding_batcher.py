@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Embedding Batcher - Many texts per embeddings request, several requests in flight
+Batches are packed by input count and token total and run through a rate-limited dispatcher; results keep input order
+Texts already in the embedding cache are never sent
+"""
+
+import os
+import logging
+import threading
+from collections import deque
+from typing import List, Optional
+
+from embedding_cache import get_embedding_cache
+from llm_dispatcher import LLMDispatcher
+from prompt_builder import count_tokens, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = 'text-embedding-ada-002'
+# API limits are 2048 inputs and 300k tokens per request; smaller batches keep retries cheap
+DEFAULT_BATCH_SIZE = int(os.getenv('EMBEDDING_BATCH_SIZE', '256'))
+DEFAULT_BATCH_TOKENS = int(os.getenv('EMBEDDING_BATCH_TOKENS', '100000'))
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('EMBEDDING_MAX_CONCURRENCY', '4'))
+DEFAULT_REQUESTS_PER_MINUTE = float(os.getenv('EMBEDDING_REQUESTS_PER_MINUTE', '3000'))
+DEFAULT_TOKENS_PER_MINUTE = float(os.getenv('EMBEDDING_TOKENS_PER_MINUTE', '1000000'))
+# Longest single input the embedding models accept
+MAX_INPUT_TOKENS = 8191
+# Statuses meaning the inputs themselves were rejected; such a batch is split to isolate the culprit
+INPUT_ERROR_STATUSES = {400, 413, 422}
+
+
+class EmbeddingBatcher:
+    """Embeds lists of texts with as few API round-trips as the batch limits allow"""
+
+    def __init__(self, client, model: str = DEFAULT_EMBEDDING_MODEL, batch_size: Optional[int] = None,
+                 batch_tokens: Optional[int] = None, max_concurrency: Optional[int] = None,
+                 dispatcher: Optional[LLMDispatcher] = None, cache=None):
+        """
+        Args:
+            client: OpenAI client (construct it with max_retries=0; the dispatcher retries)
+            model: Embedding model
+            batch_size: Most inputs per request
+            batch_tokens: Most input tokens per request
+            max_concurrency: Requests in flight at once (given without a dispatcher, the batcher gets its own one)
+            dispatcher: Rate limiter and retry loop (default: the process-wide embedding dispatcher)
+            cache: EmbeddingCache (default: the process-wide one; False embeds everything every time)
+        """
+        self.client = client
+        self.model = model
+        self.batch_size = max(1, batch_size or DEFAULT_BATCH_SIZE)
+        self.batch_tokens = max(MAX_INPUT_TOKENS, batch_tokens or DEFAULT_BATCH_TOKENS)
+        if dispatcher is None:
+            dispatcher = _build_dispatcher(max_concurrency) if max_concurrency else get_embedding_dispatcher()
+        self.dispatcher = dispatcher
+        self.cache = get_embedding_cache() if cache is None else cache
+        self.stats = {'inputs': 0, 'cached': 0, 'requests': 0, 'failed_inputs': 0}
+
+    def plan_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group input positions into batches
+
+        Args:
+            texts: Inputs, already truncated to MAX_INPUT_TOKENS
+
+        Returns:
+            Lists of indexes into texts, each within the count and token limits; empty texts are left out
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for index, text in enumerate(texts):
+            if not text:
+                continue
+            tokens = count_tokens(text, self.model)
+            if current and (len(current) >= self.batch_size or current_tokens + tokens > self.batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def embed(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed texts in batches
+
+        Args:
+            texts: Inputs in any number
+
+        Returns:
+            One vector per input, in input order; None for empty inputs and inputs that failed
+            (a batch rejected with a 4xx is split until the offending input is on its own)
+        """
+        prepared = [truncate_to_tokens(' '.join((text or '').split()), MAX_INPUT_TOKENS, self.model)
+                    for text in texts]
+        results: List[Optional[List[float]]] = self.cache.get_many(self.model, prepared) if self.cache else [None] * len(texts)
+        cached = sum(vector is not None for vector in results)
+        # Cached positions are planned as empty so they are not sent again
+        batches = self.plan_batches([text if results[i] is None else '' for i, text in enumerate(prepared)])
+
+        # Every batch is queued up front; the dispatcher keeps max_concurrency of them in flight
+        pending = deque((batch, self._submit([prepared[i] for i in batch])) for batch in batches)
+        requests = len(batches)
+        while pending:
+            batch, future = pending.popleft()
+            try:
+                response = future.result()
+                # The API returns items with their input index; don't rely on response order
+                for item in sorted(response.data, key=lambda item: item.index):
+                    results[batch[item.index]] = item.embedding
+                if self.cache:
+                    self.cache.put_many(self.model, [prepared[i] for i in batch], [results[i] for i in batch])
+                logger.info(f"🤖 Embedded batch of {len(batch)} inputs")
+            except Exception as e:
+                if len(batch) > 1 and self._is_input_error(e):
+                    # One bad input (e.g. over the token limit) rejects the whole request; split to isolate it
+                    halves = [batch[:len(batch) // 2], batch[len(batch) // 2:]]
+                    logger.warning(f"⚠️ Embedding batch of {len(batch)} rejected ({e}); retrying as two halves")
+                    pending.extend((half, self._submit([prepared[i] for i in half])) for half in halves)
+                    requests += 2
+                    continue
+                self.stats['failed_inputs'] += len(batch)
+                logger.error(f"❌ Embedding batch failed ({len(batch)} inputs): {e}")
+
+        self.stats['inputs'] += len(texts)
+        self.stats['cached'] += cached
+        self.stats['requests'] += requests
+        if cached:
+            logger.info(f"⚡ {cached}/{len(texts)} embeddings served from cache")
+        return results
+
+    def _submit(self, inputs: List[str]):
+        return self.dispatcher.submit(
+            lambda: self.client.embeddings.create(model=self.model, input=inputs),
+            sum(count_tokens(text, self.model) for text in inputs)
+        )
+
+    @staticmethod
+    def _is_input_error(error: Exception) -> bool:
+        """The request content was rejected (not auth or rate limits), so retrying it unchanged won't help"""
+        return getattr(error, 'status_code', None) in INPUT_ERROR_STATUSES
+
+
+def _build_dispatcher(max_concurrency: Optional[int] = None) -> LLMDispatcher:
+    return LLMDispatcher(
+        requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute=DEFAULT_TOKENS_PER_MINUTE,
+        max_concurrency=max_concurrency or DEFAULT_MAX_CONCURRENCY
+    )
+
+
+_shared_dispatcher: Optional[LLMDispatcher] = None
+_shared_dispatcher_lock = threading.Lock()
+
+
+def get_embedding_dispatcher() -> LLMDispatcher:
+    """Return the process-wide embedding dispatcher; embedding quota is separate from the chat models'"""
+    global _shared_dispatcher
+    with _shared_dispatcher_lock:
+        if _shared_dispatcher is None:
+            _shared_dispatcher = _build_dispatcher()
+        return _shared_dispatcher
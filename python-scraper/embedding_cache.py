@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache - Content-addressed vectors keyed by embedding model and normalized text hash
+Vectors are appended as raw float32 rows to one file per model and read back through mmap; a SQLite index maps hashes to rows
+"""
+
+import os
+import re
+import mmap
+import array
+import fcntl
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from llm_cache import clean_input_text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv('EMBEDDING_CACHE_DIR', 'embedding_cache')
+EMBEDDING_CACHE_ENABLED = os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+
+FLOAT_BYTES = array.array('f').itemsize
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9_.-]+')
+
+
+def text_hash(text: str) -> str:
+    """Hash of the text with whitespace collapsed, so re-wrapped chunks hit the same entry"""
+    return hashlib.sha256(clean_input_text(text).encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """Append-only float32 vector files with a SQLite index of (model, text hash) -> row"""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Folder for the index and vector files (None uses EMBEDDING_CACHE_DIR)
+        """
+        self.directory = directory or DEFAULT_CACHE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # (model, dimensions) -> (mmap, float32 view, rows mapped)
+        self._maps: Dict[Tuple[str, int], tuple] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0}
+
+        self._db = sqlite3.connect(os.path.join(self.directory, 'index.sqlite'), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, text_hash TEXT NOT NULL, dimensions INTEGER NOT NULL, row INTEGER NOT NULL, "
+            "PRIMARY KEY (model, text_hash))"
+        )
+        self._db.commit()
+        count = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        logger.info(f"🗃️ Embedding cache at {self.directory} ({count} vectors)")
+
+    def vector_path(self, model: str, dimensions: int) -> str:
+        """
+        File holding a model's vectors: rows of `dimensions` native-endian float32 values
+
+        numpy users can load it as np.memmap(path, dtype=np.float32).reshape(-1, dimensions).
+        """
+        return os.path.join(self.directory, f"{_UNSAFE_FILENAME.sub('_', model)}-{dimensions}.f32")
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Cached vectors for texts
+
+        Args:
+            model: Embedding model the vectors must come from
+            texts: Inputs
+
+        Returns:
+            One entry per text: the vector, or None when it was never embedded with this model
+        """
+        hashes = [text_hash(text) for text in texts]
+        with self._lock:
+            locations = {}
+            unique = list(dict.fromkeys(hashes))
+            # Chunked to stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique), 500):
+                chunk = unique[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT text_hash, dimensions, row FROM embeddings WHERE model = ? "
+                    f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                    [model, *chunk]
+                ).fetchall()
+                locations.update((digest, (dimensions, row)) for digest, dimensions, row in rows)
+
+            results: List[Optional[List[float]]] = []
+            for digest in hashes:
+                location = locations.get(digest)
+                vector = self._read(model, *location) if location else None
+                results.append(vector)
+                self.stats['hits' if vector is not None else 'misses'] += 1
+            return results
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Optional[List[float]]]) -> int:
+        """
+        Store vectors for texts; None vectors and texts already cached are skipped
+
+        Returns:
+            Number of vectors written
+        """
+        written = 0
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                if not vector:
+                    continue
+                digest = text_hash(text)
+                if self._db.execute("SELECT 1 FROM embeddings WHERE model = ? AND text_hash = ?",
+                                    (model, digest)).fetchone():
+                    continue
+                try:
+                    row = self._append(model, vector)
+                except OSError as e:
+                    # e.g. disk full: keep what was written, the rest is simply re-embedded next time
+                    logger.error(f"❌ Embedding cache write failed: {e}")
+                    break
+                self._db.execute("INSERT OR IGNORE INTO embeddings (model, text_hash, dimensions, row) VALUES (?, ?, ?, ?)",
+                                 (model, digest, len(vector), row))
+                written += 1
+            self._db.commit()
+            self.stats['stored'] += written
+        return written
+
+    def close(self):
+        with self._lock:
+            for handle, view, _ in self._maps.values():
+                view.release()
+                handle.close()
+            self._maps.clear()
+            self._db.close()
+
+    def _append(self, model: str, vector: List[float]) -> int:
+        """Write one row at the end of the model's vector file and return its row number"""
+        data = array.array('f', vector).tobytes()
+        path = self.vector_path(model, len(vector))
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            # Exclusive across processes: the row number is the offset the write lands at
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            size = os.fstat(fd).st_size
+            torn = size % len(data)
+            if torn:
+                # A crashed or failed earlier write left a partial row; drop it so rows stay aligned
+                logger.warning(f"⚠️ Dropping {torn} bytes of partial row at the end of {path}")
+                os.ftruncate(fd, size - torn)
+            start = size - torn
+            written = os.write(fd, data)
+            if written != len(data):
+                os.ftruncate(fd, start)
+                raise OSError(f"short write to {path} ({written}/{len(data)} bytes)")
+        finally:
+            os.close(fd)  # also releases the lock
+        return start // len(data)
+
+    def _read(self, model: str, dimensions: int, row: int) -> Optional[List[float]]:
+        """Row from the memory-mapped vector file, remapping when the file has grown since it was mapped"""
+        key = (model, dimensions)
+        mapped = self._maps.get(key)
+        if mapped is None or row >= mapped[2]:
+            if mapped is not None:
+                mapped[1].release()
+                mapped[0].close()
+                del self._maps[key]
+            path = self.vector_path(model, dimensions)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            rows = size // (dimensions * FLOAT_BYTES)
+            if row >= rows:
+                logger.warning(f"⚠️ Embedding cache index points past the end of {path}")
+                return None
+            with open(path, 'rb') as f:
+                handle = mmap.mmap(f.fileno(), rows * dimensions * FLOAT_BYTES, access=mmap.ACCESS_READ)
+            mapped = (handle, memoryview(handle).cast('f'), rows)
+            self._maps[key] = mapped
+        start = row * dimensions
+        return mapped[1][start:start + dimensions].tolist()
+
+
+_shared_cache: Optional[EmbeddingCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """Return the process-wide embedding cache, or None when EMBEDDING_CACHE_ENABLED=false"""
+    global _shared_cache
+    if not EMBEDDING_CACHE_ENABLED:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = EmbeddingCache()
+        return _shared_cache
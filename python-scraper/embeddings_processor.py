@@ -10,7 +10,8 @@ from openai import OpenAI
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pinecone import Pinecone
-import time
+
+from embedding_batcher import EmbeddingBatcher
 
 class YachtEmbeddingsProcessor:
     def __init__(self):
@@ -19,7 +20,9 @@ class YachtEmbeddingsProcessor:
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
         
-        self.client = OpenAI(api_key=openai_api_key)
+        # Retries and rate limits are handled by the batcher's dispatcher
+        self.client = OpenAI(api_key=openai_api_key, max_retries=0)
+        self.batcher = EmbeddingBatcher(self.client)
         
         # Initialize Pinecone
         self.pinecone_client = Pinecone(api_key=os.getenv('PINECONE_API_KEY'))
@@ -50,32 +53,24 @@ class YachtEmbeddingsProcessor:
     
     def generate_embedding(self, text: str) -> Optional[List[float]]:
         """Generate OpenAI embedding for text"""
-        try:
-            response = self.client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=text
-            )
-            
-            embedding = response.data[0].embedding
+        embedding = self.batcher.embed([text])[0]
+        if embedding:
             print(f"🤖 Generated embedding: {len(embedding)} dimensions")
-            return embedding
-            
-        except Exception as e:
-            print(f"❌ Error generating embedding: {e}")
-            return None
+        else:
+            print(f"❌ Error generating embedding")
+        return embedding
     
     def process_chunks_to_embeddings(self, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process all chunks and generate embeddings"""
         print(f"\n🚀 GENERATING EMBEDDINGS FOR {len(chunks)} CHUNKS")
         print("=" * 50)
         
+        # Many chunks per request instead of one request (and a sleep) per chunk
+        embeddings = self.batcher.embed([chunk['text'] for chunk in chunks])
+        
         processed_chunks = []
         
-        for i, chunk in enumerate(chunks):
-            print(f"\n🔄 Processing chunk {i+1}/{len(chunks)}: {chunk['id']}")
-            
-            # Generate embedding
-            embedding = self.generate_embedding(chunk['text'])
+        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
             if embedding:
                 # Prepare for Pinecone
                 processed_chunk = {
@@ -84,18 +79,14 @@ class YachtEmbeddingsProcessor:
                     'metadata': {
                         **chunk['metadata'],
                         'embedding_generated_at': datetime.now().isoformat(),
-                        'embedding_model': 'text-embedding-ada-002',
+                        'embedding_model': self.batcher.model,
                         'embedding_dimensions': len(embedding)
                     }
                 }
                 
                 processed_chunks.append(processed_chunk)
-                print(f"✅ Embedding generated and prepared for Pinecone")
-                
-                # Rate limiting - OpenAI has limits
-                time.sleep(0.1)
             else:
-                print(f"❌ Failed to generate embedding for chunk {i+1}")
+                print(f"❌ Failed to generate embedding for chunk {i+1}: {chunk['id']}")
         
         print(f"\n🎉 EMBEDDINGS GENERATION COMPLETE!")
         print(f"📊 Successfully processed: {len(processed_chunks)}/{len(chunks)} chunks")
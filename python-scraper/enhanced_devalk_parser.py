@@ -4,6 +4,10 @@ import re
 import logging
 from typing import Dict, Any, List, Optional
 import time
+from http_session import ThreadLocalSessions
+from http_cache import get_http_cache
+from result_cache import get_result_cache
+from page_text import PageText
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -15,15 +19,27 @@ class EnhancedDeValkParser:
     across different page structures and text formats.
     """
     
+    PARSER_VERSION = '3.0.0'
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-thread sessions over a shared connection pool so one instance is safe across threads
+        self._sessions = ThreadLocalSessions({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
+        # Conditional-GET cache so unchanged pages skip download and re-parse
+        self.http_cache = get_http_cache()
+        # Content-hash cache so byte-identical pages skip the re-parse
+        self.result_cache = get_result_cache()
+        
         # Pre-compile common patterns
         self._compile_patterns()
     
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session owned by the calling thread"""
+        return self._sessions.session
+    
     def _compile_patterns(self):
         """Pre-compile regex patterns for better performance"""
         # Dimension patterns
@@ -116,17 +132,29 @@ class EnhancedDeValkParser:
             logger.info(f"🚀 Starting enhanced parsing of: {url}")
             
             # Fetch page with retry logic
-            page_content = self._fetch_page_with_retry(url)
-            if not page_content:
+            response = self._fetch_page_with_retry(url)
+            if not response:
                 return self._create_error_response("Failed to fetch page content")
             
-            soup = BeautifulSoup(page_content, 'html.parser')
-            page_text = soup.get_text()
+            # Reuse a stored result when the page is unchanged (304) or byte-identical to one already parsed
+            cache_key = self.result_cache.make_key(response.content, self.PARSER_VERSION)
+            cached_result = self.http_cache.get_parsed(response, self.PARSER_VERSION) if self.http_cache else None
+            if cached_result is None:
+                cached_result = self.result_cache.get(cache_key)
+                if cached_result and self.http_cache:
+                    self.http_cache.store(url, response, cached_result, self.PARSER_VERSION)
+            if cached_result:
+                cached_result['url'] = url
+                cached_result['scraped_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+                return cached_result
+            
+            soup = BeautifulSoup(response.text, 'html.parser')
+            page = PageText(soup)
             
             # Extract all sections with enhanced patterns
             result = {
                 'source': 'devalk_enhanced',
-                'parser_version': '3.0.0',
+                'parser_version': self.PARSER_VERSION,
                 'url': url,
                 'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'data': {}
@@ -146,7 +174,7 @@ class EnhancedDeValkParser:
             
             for section_name, extractor_func in sections:
                 try:
-                    section_data = extractor_func(soup, page_text)
+                    section_data = extractor_func(page)
                     result['data'][section_name] = section_data
                     logger.info(f"✅ {section_name}: {len(section_data)} fields extracted")
                 except Exception as e:
@@ -157,19 +185,26 @@ class EnhancedDeValkParser:
             total_fields = sum(len(section) for section in result['data'].values())
             logger.info(f"🎯 Total fields extracted: {total_fields}")
             
+            self.result_cache.put(cache_key, result)
+            if self.http_cache:
+                self.http_cache.store(url, response, result, self.PARSER_VERSION)
+            
             return result
             
         except Exception as e:
             logger.error(f"❌ Fatal error parsing {url}: {e}")
             return self._create_error_response(str(e))
     
-    def _fetch_page_with_retry(self, url: str, max_retries: int = 3) -> Optional[str]:
-        """Fetch page content with retry logic"""
+    def _fetch_page_with_retry(self, url: str, max_retries: int = 3) -> Optional[requests.Response]:
+        """Fetch page with retry logic"""
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, timeout=30)
+                if self.http_cache:
+                    response = self.http_cache.get(self.session, url, timeout=30)
+                else:
+                    response = self.session.get(url, timeout=30)
                 response.raise_for_status()
-                return response.text
+                return response
             except requests.RequestException as e:
                 logger.warning(f"⚠️ Attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
@@ -248,8 +283,9 @@ class EnhancedDeValkParser:
         
         return None
     
-    def _extract_key_details_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_key_details_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced key details extraction with multiple patterns"""
+        page_text = page.raw
         key_details = {}
         
         try:
@@ -311,26 +347,26 @@ class EnhancedDeValkParser:
                 logger.info(f"✅ Price: € {price}")
             
             # Additional fields with context
-            if 'lying' in page_text.lower():
-                if 'sales office' in page_text.lower():
+            if 'lying' in page.lower:
+                if 'sales office' in page.lower:
                     key_details['lying'] = 'at sales office'
             
-            if 'sales office' in page_text.lower():
+            if 'sales office' in page.lower:
                 office_match = re.search(r'SALES OFFICE[:\s]*([A-Za-z\s]+?)(?=\s*Status|\s*$)', page_text, re.IGNORECASE)
                 if office_match:
                     key_details['salesOffice'] = self._clean_text(office_match.group(1))
                     logger.info(f"✅ Sales office: {key_details['salesOffice']}")
             
-            if 'status' in page_text.lower():
-                if 'for sale' in page_text.lower():
+            if 'status' in page.lower:
+                if 'for sale' in page.lower:
                     key_details['status'] = 'For Sale'
-                elif 'sold' in page_text.lower():
+                elif 'sold' in page.lower:
                     key_details['status'] = 'Sold'
             
-            if 'vat' in page_text.lower():
-                if 'paid' in page_text.lower():
+            if 'vat' in page.lower:
+                if 'paid' in page.lower:
                     key_details['vat'] = 'Paid'
-                elif 'not paid' in page_text.lower():
+                elif 'not paid' in page.lower:
                     key_details['vat'] = 'Not Paid'
             
         except Exception as e:
@@ -338,8 +374,9 @@ class EnhancedDeValkParser:
         
         return key_details
     
-    def _extract_general_info_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_general_info_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced general info extraction with multiple patterns"""
+        page_text = page.raw
         general_info = {}
         
         try:
@@ -434,98 +471,98 @@ class EnhancedDeValkParser:
                     break
             
             # Additional hull details with better boundaries
-            if 'hull colour' in page_text.lower():
+            if 'hull colour' in page.lower:
                 color_match = re.search(r'HULL COLOUR[:\s]*([A-Za-z\s]+?)(?=\s*Hull shape|\s*$)', page_text, re.IGNORECASE)
                 if color_match:
                     general_info['hullColour'] = self._clean_text(color_match.group(1))
             
-            if 'hull shape' in page_text.lower():
+            if 'hull shape' in page.lower:
                 shape_match = re.search(r'HULL SHAPE[:\s]*([A-Za-z\s\-]+?)(?=\s*Keel type|\s*$)', page_text, re.IGNORECASE)
                 if shape_match:
                     general_info['hullShape'] = self._clean_text(shape_match.group(1))
             
-            if 'keel type' in page_text.lower():
+            if 'keel type' in page.lower:
                 keel_match = re.search(r'KEEL TYPE[:\s]*([A-Za-z\s]+?)(?=\s*Superstructure|\s*$)', page_text, re.IGNORECASE)
                 if keel_match:
                     general_info['keelType'] = self._clean_text(keel_match.group(1))
             
             # Additional fields that might be present
-            if 'superstructure material' in page_text.lower():
+            if 'superstructure material' in page.lower:
                 super_match = re.search(r'SUPERSTRUCTURE MATERIAL[:\s]*([A-Za-z\s]+?)(?=\s*Deck material|\s*$)', page_text, re.IGNORECASE)
                 if super_match:
                     general_info['superstructureMaterial'] = self._clean_text(super_match.group(1))
             
-            if 'deck material' in page_text.lower():
+            if 'deck material' in page.lower:
                 deck_match = re.search(r'DECK MATERIAL[:\s]*([A-Za-z\s]+?)(?=\s*Deck finish|\s*$)', page_text, re.IGNORECASE)
                 if deck_match:
                     general_info['deckMaterial'] = self._clean_text(deck_match.group(1))
             
-            if 'deck finish' in page_text.lower():
+            if 'deck finish' in page.lower:
                 finish_match = re.search(r'DECK FINISH[:\s]*([A-Za-z\s]+?)(?=\s*Superstructure deck|\s*$)', page_text, re.IGNORECASE)
                 if finish_match:
                     general_info['deckFinish'] = self._clean_text(finish_match.group(1))
             
-            if 'superstructure deck finish' in page_text.lower():
+            if 'superstructure deck finish' in page.lower:
                 super_finish_match = re.search(r'SUPERSTRUCTURE DECK FINISH[:\s]*([A-Za-z\s]+?)(?=\s*Cockpit deck|\s*$)', page_text, re.IGNORECASE)
                 if super_finish_match:
                     general_info['superstructureDeckFinish'] = self._clean_text(super_finish_match.group(1))
             
-            if 'cockpit deck finish' in page_text.lower():
+            if 'cockpit deck finish' in page.lower:
                 cockpit_finish_match = re.search(r'COCKPIT DECK FINISH[:\s]*([A-Za-z\s]+?)(?=\s*Dorades|\s*$)', page_text, re.IGNORECASE)
                 if cockpit_finish_match:
                     general_info['cockpitDeckFinish'] = self._clean_text(cockpit_finish_match.group(1))
             
             # Dorades
-            if 'dorades' in page_text.lower():
+            if 'dorades' in page.lower:
                 dorades_match = re.search(r'DORADES[:\s]*([A-Za-z\s0-9x]+?)(?=\s*Window frame|\s*$)', page_text, re.IGNORECASE)
                 if dorades_match:
                     general_info['dorades'] = self._clean_text(dorades_match.group(1))
             
             # Window details
-            if 'window frame' in page_text.lower():
+            if 'window frame' in page.lower:
                 window_frame_match = re.search(r'WINDOW FRAME[:\s]*([A-Za-z\s]+?)(?=\s*Window material|\s*$)', page_text, re.IGNORECASE)
                 if window_frame_match:
                     general_info['windowFrame'] = self._clean_text(window_frame_match.group(1))
             
-            if 'window material' in page_text.lower():
+            if 'window material' in page.lower:
                 window_material_match = re.search(r'WINDOW MATERIAL[:\s]*([A-Za-z\s]+?)(?=\s*Deckhatch|\s*$)', page_text, re.IGNORECASE)
                 if window_material_match:
                     general_info['windowMaterial'] = self._clean_text(window_material_match.group(1))
             
             # Deckhatch
-            if 'deckhatch' in page_text.lower():
+            if 'deckhatch' in page.lower:
                 deckhatch_match = re.search(r'DECKHATCH[:\s]*([A-Za-z\s0-9x]+?)(?=\s*Fuel tank|\s*$)', page_text, re.IGNORECASE)
                 if deckhatch_match:
                     general_info['deckhatch'] = self._clean_text(deckhatch_match.group(1))
             
             # Tank details
-            if 'fuel tank' in page_text.lower():
+            if 'fuel tank' in page.lower:
                 fuel_tank_match = re.search(r'FUEL TANK[:\s]*([A-Za-z\s]+?)\s*(\d+)\s*ltr', page_text, re.IGNORECASE)
                 if fuel_tank_match:
                     general_info['fuelTankLitre'] = f"{fuel_tank_match.group(1)} {fuel_tank_match.group(2)} ltr"
             
-            if 'level indicator' in page_text.lower() and 'fuel' in page_text.lower():
+            if 'level indicator' in page.lower and 'fuel' in page.lower:
                 fuel_indicator_match = re.search(r'LEVEL INDICATOR[:\s]*\(FUEL TANK\)[:\s]*([A-Za-z\s]+?)(?=\s*Freshwater|\s*$)', page_text, re.IGNORECASE)
                 if fuel_indicator_match:
                     general_info['levelIndicatorFuelTank'] = self._clean_text(fuel_indicator_match.group(1))
             
-            if 'freshwater tank' in page_text.lower():
+            if 'freshwater tank' in page.lower:
                 fresh_tank_match = re.search(r'FRESHWATER TANK[:\s]*([A-Za-z\s]+?)\s*(\d+)\s*ltr', page_text, re.IGNORECASE)
                 if fresh_tank_match:
                     general_info['freshwaterTankLitre'] = f"{fresh_tank_match.group(1)} {fresh_tank_match.group(2)} ltr"
             
-            if 'level indicator' in page_text.lower() and 'freshwater' in page_text.lower():
+            if 'level indicator' in page.lower and 'freshwater' in page.lower:
                 fresh_indicator_match = re.search(r'LEVEL INDICATOR[:\s]*\(FRESHWATER\)[:\s]*([A-Za-z\s]+?)(?=\s*Wheel|\s*$)', page_text, re.IGNORECASE)
                 if fresh_indicator_match:
                     general_info['levelIndicatorFreshwater'] = self._clean_text(fresh_indicator_match.group(1))
             
             # Steering details
-            if 'wheel steering' in page_text.lower():
+            if 'wheel steering' in page.lower:
                 wheel_match = re.search(r'WHEEL STEERING[:\s]*([A-Za-z\s]+?)(?=\s*Outside|\s*$)', page_text, re.IGNORECASE)
                 if wheel_match:
                     general_info['wheelSteering'] = self._clean_text(wheel_match.group(1))
             
-            if 'outside helm position' in page_text.lower():
+            if 'outside helm position' in page.lower:
                 helm_match = re.search(r'OUTSIDE HELM POSITION[:\s]*([A-Za-z\s]+?)(?=\s*$)', page_text, re.IGNORECASE)
                 if helm_match:
                     general_info['outsideHelmPosition'] = self._clean_text(helm_match.group(1))
@@ -535,8 +572,9 @@ class EnhancedDeValkParser:
         
         return general_info
     
-    def _extract_accommodation_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_accommodation_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced accommodation extraction with multiple patterns"""
+        page_text = page.raw
         accommodation = {}
         
         try:
@@ -555,17 +593,17 @@ class EnhancedDeValkParser:
             # Interior with multiple materials
             interior_materials = ['teak', 'mahogany', 'oak', 'cherry', 'maple', 'walnut']
             for material in interior_materials:
-                if material in page_text.lower():
+                if material in page.lower:
                     accommodation['interior'] = material.title()
                     logger.info(f"✅ Interior: {material.title()}")
                     break
             
             # Layout with context
-            if 'classic' in page_text.lower():
+            if 'classic' in page.lower:
                 accommodation['layout'] = 'Classic'
-            elif 'modern' in page_text.lower():
+            elif 'modern' in page.lower:
                 accommodation['layout'] = 'Modern'
-            elif 'warm' in page_text.lower():
+            elif 'warm' in page.lower:
                 accommodation['layout'] = 'Warm'
             
             # Floor with multiple patterns
@@ -577,7 +615,7 @@ class EnhancedDeValkParser:
             ]
             
             for floor_type in floor_patterns:
-                if floor_type in page_text.lower():
+                if floor_type in page.lower:
                     accommodation['floor'] = floor_type.title()
                     logger.info(f"✅ Floor: {floor_type.title()}")
                     break
@@ -590,7 +628,7 @@ class EnhancedDeValkParser:
             
             for feature in features:
                 feature_text = feature.replace('openCockpit', 'open cockpit').replace('aftDeck', 'aft deck').replace('navigationCenter', 'navigation center').replace('chartTable', 'chart table')
-                if feature_text in page_text.lower():
+                if feature_text in page.lower:
                     accommodation[feature] = 'Yes'
                     logger.info(f"✅ {feature}: Yes")
             
@@ -604,7 +642,7 @@ class EnhancedDeValkParser:
             if heating:
                 accommodation['heating'] = heating
                 logger.info(f"✅ Heating: {heating}")
-            elif 'heating' in page_text.lower():
+            elif 'heating' in page.lower:
                 accommodation['heating'] = 'Yes'
             
             # Headroom
@@ -623,7 +661,7 @@ class EnhancedDeValkParser:
             
             for feature in additional_features:
                 feature_text = feature.replace('hotWaterSystem', 'hot water system').replace('waterPressureSystem', 'water pressure system').replace('ownersCabin', 'owners cabin').replace('bedLength', 'bed length').replace('wardrobe', 'wardrobe').replace('bathroom', 'bathroom').replace('toilet', 'toilet').replace('toiletSystem', 'toilet system').replace('washBasin', 'wash basin').replace('shower', 'shower').replace('guestCabin1', 'guest cabin').replace('bedLength1', 'bed length').replace('wardrobe1', 'wardrobe').replace('guestCabin2', 'guest cabin').replace('bedLength2', 'bed length').replace('wardrobe2', 'wardrobe').replace('bathroom2', 'bathroom').replace('toilet2', 'toilet').replace('toiletSystem2', 'toilet system').replace('washBasin2', 'wash basin').replace('shower2', 'shower').replace('washingMachine', 'washing machine')
-                if feature_text in page_text.lower():
+                if feature_text in page.lower:
                     accommodation[feature] = 'Yes'
                     logger.info(f"✅ {feature}: Yes")
             
@@ -632,8 +670,9 @@ class EnhancedDeValkParser:
         
         return accommodation
     
-    def _extract_machinery_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_machinery_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced machinery extraction with multiple patterns"""
+        page_text = page.raw
         machinery = {}
         
         try:
@@ -656,7 +695,7 @@ class EnhancedDeValkParser:
             ]
             
             for make in make_patterns:
-                if make in page_text.lower():
+                if make in page.lower:
                     machinery['make'] = make.title()
                     logger.info(f"✅ Engine make: {make.title()}")
                     break
@@ -677,7 +716,7 @@ class EnhancedDeValkParser:
             # Fuel type
             fuel_patterns = ['diesel', 'petrol', 'gasoline', 'electric', 'hybrid']
             for fuel in fuel_patterns:
-                if fuel in page_text.lower():
+                if fuel in page.lower:
                     machinery['fuel'] = fuel.title()
                     logger.info(f"✅ Fuel: {fuel.title()}")
                     break
@@ -719,47 +758,47 @@ class EnhancedDeValkParser:
             
             for feature in features:
                 feature_text = feature.replace('shaftSeal', 'shaft seal').replace('engineControls', 'engine controls').replace('bowthruster', 'bowthruster').replace('manualBilgePump', 'manual bilge pump').replace('electricBilgePump', 'electric bilge pump').replace('solarPanel', 'solar panel').replace('shorepower', 'shore power')
-                if feature_text in page_text.lower():
+                if feature_text in page.lower:
                     machinery[feature] = 'Yes'
                     logger.info(f"✅ {feature}: Yes")
             
             # Additional machinery details
-            if 'propeller type' in page_text.lower():
+            if 'propeller type' in page.lower:
                 prop_match = re.search(r'PROPELLER TYPE[:\s]*([A-Za-z\s]+?)(?=\s*Manual|\s*$)', page_text, re.IGNORECASE)
                 if prop_match:
                     machinery['propellerType'] = self._clean_text(prop_match.group(1))
             
-            if 'electrical installation' in page_text.lower():
+            if 'electrical installation' in page.lower:
                 elec_match = re.search(r'ELECTRICAL INSTALLATION[:\s]*([A-Za-z\s0-9\-]+?)(?=\s*Generator|\s*$)', page_text, re.IGNORECASE)
                 if elec_match:
                     machinery['electricalInstallation'] = self._clean_text(elec_match.group(1))
             
-            if 'batteries' in page_text.lower():
+            if 'batteries' in page.lower:
                 bat_match = re.search(r'BATTERIES[:\s]*([A-Za-z\s0-9x\-\s]+?)(?=\s*Start|\s*$)', page_text, re.IGNORECASE)
                 if bat_match:
                     machinery['batteries'] = self._clean_text(bat_match.group(1))
             
-            if 'start battery' in page_text.lower():
+            if 'start battery' in page.lower:
                 start_bat_match = re.search(r'START BATTERY[:\s]*([A-Za-z\s0-9x\-\s]+?)(?=\s*Service|\s*$)', page_text, re.IGNORECASE)
                 if start_bat_match:
                     machinery['startBattery'] = self._clean_text(start_bat_match.group(1))
             
-            if 'service battery' in page_text.lower():
+            if 'service battery' in page.lower:
                 service_bat_match = re.search(r'SERVICE BATTERY[:\s]*([A-Za-z\s0-9x\-\s]+?)(?=\s*Battery|\s*$)', page_text, re.IGNORECASE)
                 if service_bat_match:
                     machinery['serviceBattery'] = self._clean_text(service_bat_match.group(1))
             
-            if 'battery monitor' in page_text.lower():
+            if 'battery monitor' in page.lower:
                 monitor_match = re.search(r'BATTERY MONITOR[:\s]*([A-Za-z\s0-9]+?)(?=\s*Battery|\s*$)', page_text, re.IGNORECASE)
                 if monitor_match:
                     machinery['batteryMonitor'] = self._clean_text(monitor_match.group(1))
             
-            if 'battery charger' in page_text.lower():
+            if 'battery charger' in page.lower:
                 charger_match = re.search(r'BATTERY CHARGER[:\s]*([A-Za-z\s0-9]+?)(?=\s*Solar|\s*$)', page_text, re.IGNORECASE)
                 if charger_match:
                     machinery['batteryCharger'] = self._clean_text(charger_match.group(1))
             
-            if 'shorepower' in page_text.lower():
+            if 'shorepower' in page.lower:
                 shore_match = re.search(r'SHOREPOWER[:\s]*([A-Za-z\s]+?)(?=\s*Watermaker|\s*$)', page_text, re.IGNORECASE)
                 if shore_match:
                     machinery['shorepower'] = self._clean_text(shore_match.group(1))
@@ -769,8 +808,9 @@ class EnhancedDeValkParser:
         
         return machinery
     
-    def _extract_navigation_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_navigation_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced navigation extraction with multiple patterns"""
+        page_text = page.raw
         navigation = {}
         
         try:
@@ -783,16 +823,16 @@ class EnhancedDeValkParser:
             
             for item in equipment:
                 item_text = item.replace('electricCompass', 'electric compass').replace('depthSounder', 'depth sounder').replace('vhfHandheld', 'vhf handheld').replace('plotterGps', 'plotter gps').replace('electronicCharts', 'electronic charts').replace('aisTransceiver', 'ais transceiver').replace('navigationLights', 'navigation lights')
-                if item_text in page_text.lower():
+                if item_text in page.lower:
                     navigation[item] = 'Yes'
                     logger.info(f"✅ {item}: Yes")
             
             # Specific brand/model extraction
-            if 'b&g' in page_text.lower():
+            if 'b&g' in page.lower:
                 navigation['brand'] = 'B&G'
                 logger.info(f"✅ Navigation brand: B&G")
             
-            if 'furuno' in page_text.lower():
+            if 'furuno' in page.lower:
                 navigation['brand'] = 'Furuno'
                 logger.info(f"✅ Navigation brand: Furuno")
             
@@ -801,8 +841,9 @@ class EnhancedDeValkParser:
         
         return navigation
     
-    def _extract_equipment_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_equipment_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced equipment extraction with multiple patterns"""
+        page_text = page.raw
         equipment = {}
         
         try:
@@ -817,12 +858,12 @@ class EnhancedDeValkParser:
             
             for item in items:
                 item_text = item.replace('fixedWindscreen', 'fixed windscreen').replace('cockpitTable', 'cockpit table').replace('bathingPlatform', 'bathing platform').replace('boardingLadder', 'boarding ladder').replace('deckShower', 'deck shower').replace('anchorChain', 'anchor chain').replace('deckWash', 'deck wash').replace('seaRailing', 'sea railing').replace('mooringLines', 'mooring lines').replace('fireExtinguisher', 'fire extinguisher')
-                if item_text in page_text.lower():
+                if item_text in page.lower:
                     equipment[item] = 'Yes'
                     logger.info(f"✅ {item}: Yes")
             
             # Specific anchor details
-            if 'anchor' in page_text.lower():
+            if 'anchor' in page.lower:
                 anchor_patterns = [
                     r'(\d+)\s*kg\s*([A-Za-z]+)',  # 40 kg Rocna
                     r'([A-Za-z]+)\s*(\d+)\s*kg',  # Rocna 40 kg
@@ -840,41 +881,42 @@ class EnhancedDeValkParser:
         
         return equipment
     
-    def _extract_rigging_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_rigging_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced rigging extraction with multiple patterns"""
+        page_text = page.raw
         rigging = {}
         
         try:
             # Rigging type
-            if 'sloop' in page_text.lower():
+            if 'sloop' in page.lower:
                 rigging['rigging'] = 'Sloop'
-            elif 'cutter' in page_text.lower():
+            elif 'cutter' in page.lower:
                 rigging['rigging'] = 'Cutter'
-            elif 'ketch' in page_text.lower():
+            elif 'ketch' in page.lower:
                 rigging['rigging'] = 'Ketch'
             
             # Standing rigging
-            if 'standing rigging' in page_text.lower():
+            if 'standing rigging' in page.lower:
                 rigging['standingRigging'] = 'Wire'
                 logger.info(f"✅ Standing rigging: Wire")
             
             # Mast details
             mast_brands = ['seldén', 'selden', 'hall', 'z-spars']
             for brand in mast_brands:
-                if brand in page_text.lower():
+                if brand in page.lower:
                     rigging['brandMast'] = brand.title()
                     logger.info(f"✅ Mast brand: {brand.title()}")
                     break
             
-            if 'aluminium' in page_text.lower():
+            if 'aluminium' in page.lower:
                 rigging['materialMast'] = 'Aluminium'
-            elif 'carbon' in page_text.lower():
+            elif 'carbon' in page.lower:
                 rigging['materialMast'] = 'Carbon'
             
             # Sails
             sails = ['mainsail', 'jib', 'genoa', 'gennaker', 'spinnaker']
             for sail in sails:
-                if sail in page_text.lower():
+                if sail in page.lower:
                     rigging[sail] = 'Yes'
                     logger.info(f"✅ {sail}: Yes")
             
@@ -887,13 +929,13 @@ class EnhancedDeValkParser:
             for pattern in winch_patterns:
                 match = re.search(pattern, page_text, re.IGNORECASE)
                 if match:
-                    if 'primary' in page_text.lower():
+                    if 'primary' in page.lower:
                         rigging['primarySheetWinch'] = match.group(0)
-                    elif 'secondary' in page_text.lower():
+                    elif 'secondary' in page.lower:
                         rigging['secondarySheetWinch'] = match.group(0)
-                    elif 'genoa' in page_text.lower():
+                    elif 'genoa' in page.lower:
                         rigging['genoaSheetwinches'] = match.group(0)
-                    elif 'halyard' in page_text.lower():
+                    elif 'halyard' in page.lower:
                         rigging['halyardWinches'] = match.group(0)
                     else:
                         rigging['multifunctionalWinches'] = match.group(0)
@@ -905,8 +947,9 @@ class EnhancedDeValkParser:
         
         return rigging
     
-    def _extract_indication_ratios_enhanced(self, soup: BeautifulSoup, page_text: str) -> Dict[str, Any]:
+    def _extract_indication_ratios_enhanced(self, page: PageText) -> Dict[str, Any]:
         """Enhanced indication ratios extraction with multiple patterns"""
+        page_text = page.raw
         ratios = {}
         
         try:
@@ -1025,7 +1068,7 @@ class EnhancedDeValkParser:
         """Create a standardized error response"""
         return {
             'source': 'devalk_enhanced',
-            'parser_version': '3.0.0',
+            'parser_version': self.PARSER_VERSION,
             'error': error_message,
             'scraped_at': time.strftime('%Y-%m-%d %H:%M:%S'),
             'data': {}
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Extraction Cascade - Run extraction tiers cheapest first and stop once the listing is complete enough
+Records per-tier latency and how often each tier was the one that finished the job
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIER_ORDER = os.getenv('SCRAPER_CASCADE_TIERS', 'static,browser,llm')
+DEFAULT_COMPLETENESS_THRESHOLD = float(os.getenv('SCRAPER_COMPLETENESS_THRESHOLD', '60'))
+
+# A tier takes the URL and the per-URL state dict shared by all tiers, and returns extracted fields,
+# or None when it decides it has nothing to add for this URL (skipped, not counted as a run).
+# state['merged'] holds what earlier tiers produced, so a tier can target only what is still missing.
+TierFunction = Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def parse_tier_order(value: str) -> List[str]:
+    """Tier names from a comma-separated setting such as 'static,browser,llm'"""
+    return [name.strip().lower() for name in value.split(',') if name.strip()]
+
+
+class ExtractionCascade:
+    """Ordered extraction tiers with an early exit on a completeness score"""
+
+    def __init__(self, tiers: List[Tuple[str, TierFunction]], score: Callable[[Dict[str, Any]], float],
+                 merge: Callable[[Dict[str, Any], Dict[str, Any]], None], threshold: Optional[float] = None):
+        """
+        Args:
+            tiers: (name, function) pairs, cheapest first
+            score: Completeness of the merged data so far, compared against threshold
+            merge: Folds a tier's result into the merged data; earlier tiers keep their values
+            threshold: Score at which the remaining tiers are skipped
+        """
+        self.tiers = tiers
+        self.score = score
+        self.merge = merge
+        self.threshold = DEFAULT_COMPLETENESS_THRESHOLD if threshold is None else threshold
+        self._lock = threading.Lock()
+        self._stats = {name: {'runs': 0, 'failures': 0, 'hits': 0, 'skips': 0, 'total_ms': 0.0} for name, _ in tiers}
+
+    def run(self, url: str, state: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Run tiers in order until the score reaches the threshold
+
+        Args:
+            url: Listing URL
+            state: Per-URL scratch space shared by the tiers (e.g. pages already loaded)
+
+        Returns:
+            (merged data, one trace entry per tier reached)
+        """
+        state = {} if state is None else state
+        merged: Dict[str, Any] = {}
+        state['merged'] = merged
+        trace = []
+
+        for name, tier in self.tiers:
+            started = time.perf_counter()
+            try:
+                tier_data = tier(url, state)
+                failed = False
+            except Exception as e:
+                logger.warning(f"⚠️ {name} tier failed for {url}: {e}")
+                tier_data = {}
+                failed = True
+            elapsed_ms = (time.perf_counter() - started) * 1000
+
+            if tier_data is None:
+                trace.append({'tier': name, 'skipped': True})
+                with self._lock:
+                    self._stats[name]['skips'] += 1
+                continue
+
+            self.merge(merged, tier_data)
+            score = self.score(merged)
+            hit = score >= self.threshold
+            trace.append({'tier': name, 'ms': round(elapsed_ms, 1), 'fields': len(tier_data),
+                          'completeness': score, 'failed': failed})
+            self._record(name, elapsed_ms, failed, hit)
+            logger.info(f"🪜 {name} tier: {len(tier_data)} fields in {elapsed_ms:.0f} ms, completeness {score}%")
+
+            if hit:
+                logger.info(f"🎯 Completeness {score}% reached the {self.threshold}% threshold after the {name} tier")
+                break
+
+        return merged, trace
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tier runs, skips, failures, hit rate (runs that ended the cascade) and latency"""
+        with self._lock:
+            snapshot = {name: dict(entry) for name, entry in self._stats.items()}
+        for entry in snapshot.values():
+            runs = entry['runs']
+            entry['hit_rate'] = round(entry['hits'] / runs, 3) if runs else 0.0
+            entry['avg_ms'] = round(entry['total_ms'] / runs, 1) if runs else 0.0
+            entry['total_ms'] = round(entry['total_ms'], 1)
+        return snapshot
+
+    def _record(self, name: str, elapsed_ms: float, failed: bool, hit: bool):
+        with self._lock:
+            entry = self._stats[name]
+            entry['runs'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['failures'] += failed
+            entry['hits'] += hit
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Field Normalizer - Table-driven mapping of De Valk labels to result keys
+Keeps the first-match-wins semantics of the original elif chains with an exact-match
+dict and one precompiled alternation regex
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# (substring of the lowercased label, result key) in priority order: the first rule
+# whose substring occurs in the label wins, exactly like the original elif chains
+TABLE_BOX_RULES: List[Tuple[str, str]] = [
+    ('dimensions', 'dimensions'),
+    ('material', 'material'),
+    ('built', 'yearBuilt'),
+    ('engine(s)', 'engines'),
+    ('hp/ kw', 'hpKw'),
+    ('lying', 'lying'),
+    ('sales office', 'salesOffice'),
+    ('status', 'status'),
+    ('vat', 'vat'),
+    ('asking price', 'askingPrice'),
+]
+
+SPECIFICATION_RULES: List[Tuple[str, str]] = [
+    ('model', 'model'),
+    ('type', 'yachtType'),
+    ('loa (m)', 'loaM'),
+    ('lwl (m)', 'lwlM'),
+    ('beam (m)', 'beamM'),
+    ('draft (m)', 'draftM'),
+    ('air draft (m)', 'airDraftM'),
+    ('headroom (m)', 'headroomM'),
+    ('year built', 'yearBuilt'),
+    ('launched', 'launched'),
+    ('builder', 'builder'),
+    ('country', 'country'),
+    ('designer', 'designer'),
+    ('displacement (t)', 'displacementT'),
+    ('ballast (tonnes)', 'ballastTonnes'),
+    ('ce norm', 'ceNorm'),
+    ('hull material', 'hullMaterial'),
+    ('hull colour', 'hullColour'),
+    ('hull shape', 'hullShape'),
+    ('keel type', 'keelType'),
+    ('superstructure material', 'superstructureMaterial'),
+    ('deck material', 'deckMaterial'),
+    ('deck finish', 'deckFinish'),
+    ('superstructure deck finish', 'superstructureDeckFinish'),
+    ('cockpit deck finish', 'cockpitDeckFinish'),
+    ('dorades', 'dorades'),
+    ('window frame', 'windowFrame'),
+    ('window material', 'windowMaterial'),
+    ('deckhatch', 'deckhatch'),
+    ('portholes', 'portholes'),
+    ('insulation', 'insulation'),
+    ('fuel tank (litre)', 'fuelTankLitre'),
+    ('level indicator (fuel tank)', 'levelIndicatorFuelTank'),
+    ('freshwater tank (litre)', 'freshwaterTankLitre'),
+    ('level indicator (freshwater)', 'levelIndicatorFreshwater'),
+    ('blackwater tank (litre)', 'blackwaterTankLitre'),
+    ('level indicator (blackwater)', 'levelIndicatorBlackwater'),
+    ('blackwater tank extraction', 'blackwaterTankExtraction'),
+    ('greywater tank (litre)', 'greywaterTankLitre'),
+    ('wheel steering', 'wheelSteering'),
+    ('emergency tiller', 'emergencyTiller'),
+    ('more info on hull', 'moreInfoOnHull'),
+    ('more info on paintwork', 'moreInfoOnPaintwork'),
+    ('extra info', 'extraInfo'),
+]
+
+
+class LabelNormalizer:
+    """Maps a lowercased label to its key; labels without a matching rule are returned unchanged"""
+
+    def __init__(self, rules: List[Tuple[str, str]]):
+        self._priority: Dict[str, int] = {}
+        self._keys: List[str] = []
+        for substring, key in rules:
+            if substring not in self._priority:
+                self._priority[substring] = len(self._keys)
+                self._keys.append(key)
+
+        # The lookahead reports a match at every position; at one position the alternation
+        # picks the highest-priority substring, and the minimum over positions is the winner
+        self._pattern = re.compile(
+            '(?=(' + '|'.join(re.escape(substring) for substring in self._priority) + '))'
+        )
+
+        # Labels that are exactly a rule substring skip the regex entirely
+        self._exact: Dict[str, str] = {substring: self._scan(substring) for substring in self._priority}
+
+        self.normalize = lru_cache(maxsize=4096)(self._normalize)
+
+    def _normalize(self, label: str) -> str:
+        key = self._exact.get(label)
+        if key is not None:
+            return key
+        return self._scan(label)
+
+    def _scan(self, label: str) -> str:
+        best = None
+        for match in self._pattern.finditer(label):
+            priority = self._priority[match.group(1)]
+            if best is None or priority < best:
+                best = priority
+                if best == 0:
+                    break
+        return self._keys[best] if best is not None else label
+
+
+_table_box = LabelNormalizer(TABLE_BOX_RULES)
+_specification = LabelNormalizer(SPECIFICATION_RULES)
+
+
+def normalize_table_box_label(label: str) -> str:
+    """Result key for a lowercased tableBox label"""
+    return _table_box.normalize(label)
+
+
+def normalize_specification_label(label: str) -> str:
+    """Result key for a lowercased modeBox/accordion specification label"""
+    return _specification.normalize(label)
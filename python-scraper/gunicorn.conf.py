@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration - threaded workers for the scraper API
+The parser is thread-safe, so one process serves many requests through gthread workers
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Background batch jobs live in-process unless JOB_STORE=redis, so keep one worker by default
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
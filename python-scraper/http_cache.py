@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+HTTP Page Cache - On-disk conditional-GET cache for listing pages
+Stores ETag/Last-Modified per URL so unchanged pages come back as 304 and skip the re-parse
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', 'http_cache')
+DEFAULT_TTL_SECONDS = int(os.getenv('HTTP_CACHE_TTL_SECONDS', str(7 * 24 * 3600)))
+DEFAULT_MAX_MB = float(os.getenv('HTTP_CACHE_MAX_MB', '200'))
+CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+
+
+class CachedResponse:
+    """Response-like view of a cache entry returned when the server answers 304"""
+
+    status_code = 200
+    not_modified = True
+
+    def __init__(self, entry: Dict[str, Any], headers):
+        self.url = entry['url']
+        self.text = entry['body']
+        self.content = self.text.encode('utf-8')
+        self.encoding = 'utf-8'
+        # Fresh headers from the 304 (e.g. date) over the stored ones
+        self.headers = CaseInsensitiveDict(entry.get('headers', {}))
+        self.headers.update(headers)
+        self.results = entry.get('results', {})
+
+    def raise_for_status(self):
+        """A revalidated entry is always a successful page"""
+        return None
+
+
+class HTTPPageCache:
+    """URL-keyed cache of page bodies, validators and parsed results"""
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: Optional[int] = None,
+                 max_mb: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory holding one JSON entry per URL
+            ttl_seconds: Entries older than this are ignored and re-downloaded in full
+            max_mb: Oldest entries are evicted once the directory grows past this size
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.ttl_seconds = DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_bytes = int((max_mb or DEFAULT_MAX_MB) * 1024 * 1024)
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Running size of the entries, so writes only scan the directory once it passes max_bytes
+        self._bytes = sum(size for _, size, _ in self._entry_files())
+
+    def get(self, session, url: str, **kwargs):
+        """
+        Conditional GET through the given session
+
+        Returns:
+            The live response, or a CachedResponse when the server answered 304
+        """
+        response = session.get(url, headers=self.conditional_headers(url), **kwargs)
+        if response.status_code != 304:
+            return response
+
+        cached = self._revalidate(url, response)
+        if cached is not None:
+            return cached
+
+        # Entry vanished between the request and the 304; fetch the full page
+        return session.get(url, **kwargs)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a fresh cached entry"""
+        entry = self._load(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def _revalidate(self, url: str, response) -> Optional[CachedResponse]:
+        """Refresh the entry behind a 304 and wrap it as a response"""
+        entry = self._load(url)
+        if not entry:
+            return None
+
+        entry['stored_at'] = time.time()
+        if self._write(url, entry):
+            self._evict()
+        logger.info(f"♻️ Not modified, served from HTTP cache: {url}")
+        return CachedResponse(entry, response.headers)
+
+    def get_parsed(self, response, parser_version: str) -> Optional[Dict[str, Any]]:
+        """Stored parse result for an unchanged page, if this parser version produced one"""
+        if not getattr(response, 'not_modified', False):
+            return None
+        result = response.results.get(parser_version)
+        return json.loads(json.dumps(result)) if result is not None else None
+
+    def store(self, url: str, response, result: Dict[str, Any], parser_version: str):
+        """Save the page, its validators and the parse result for this parser version"""
+        if getattr(response, 'not_modified', False):
+            entry = self._load(url)
+            if not entry:
+                return
+            entry['results'][parser_version] = result
+        else:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if not etag and not last_modified:
+                return  # Nothing to revalidate against
+
+            entry = {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'headers': {k: v for k, v in response.headers.items() if k.lower() in ('date', 'content-type')},
+                'body': response.text,
+                'stored_at': time.time(),
+                'results': {parser_version: result}
+            }
+
+        if self._write(url, entry):
+            self._evict()
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _load(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('stored_at', 0) > self.ttl_seconds:
+            return None
+        return entry
+
+    def _write(self, url: str, entry: Dict[str, Any]) -> bool:
+        """Write an entry and update the running size; True when the cache is now over max_bytes"""
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+                size = f.tell()
+            try:
+                old_size = os.path.getsize(path)
+            except OSError:
+                old_size = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write HTTP cache entry for {url}: {e}")
+            return False
+        with self._lock:
+            self._bytes += size - old_size
+            return self._bytes > self.max_bytes
+
+    def _entry_files(self) -> List[Tuple[float, int, str]]:
+        files = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, name))
+        return files
+
+    def _evict(self):
+        """Remove the least recently stored entries until the cache is back under 90% of max_bytes"""
+        with self._lock:
+            # The scan also resyncs the running size with entries other workers wrote to the directory
+            files = self._entry_files()
+            total = sum(size for _, size, _ in files)
+            target = int(self.max_bytes * 0.9)
+            for _, size, name in sorted(files):
+                if total <= target:
+                    break
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                    total -= size
+                except OSError:
+                    pass
+            self._bytes = total
+
+
+_shared_cache: Optional[HTTPPageCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPPageCache]:
+    """Return the process-wide HTTP cache, or None when HTTP_CACHE_ENABLED=false"""
+    global _shared_cache
+    if not CACHE_ENABLED:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HTTPPageCache()
+        return _shared_cache
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+HTTP Session Pool - Per-thread requests sessions over one shared connection pool
+Lets a single parser instance serve concurrent Flask/gunicorn threads safely
+"""
+
+import os
+import logging
+import threading
+import weakref
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter, BaseAdapter
+
+from replay_transport import get_transport
+
+logger = logging.getLogger(__name__)
+
+# Connections kept open per host; size it to the number of threads fetching at once
+DEFAULT_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', os.getenv('BATCH_MAX_WORKERS', '8')))
+
+
+class ThreadLocalSessions:
+    """Hands every thread its own requests.Session while sharing the underlying connection pool"""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, pool_size: Optional[int] = None):
+        """
+        Args:
+            headers: Default headers applied to every session
+            pool_size: Maximum pooled connections per host shared by all threads
+        """
+        self.headers = dict(headers or {})
+        self.pool_size = max(1, pool_size or DEFAULT_POOL_SIZE)
+
+        # urllib3 pool managers are thread-safe, so one adapter serves every session
+        self._adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self._mounts: Dict[str, BaseAdapter] = {}
+        self._sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+        # SCRAPER_HTTP_MODE=record/replay swaps the network for the fixture store
+        transport = get_transport()
+        if transport is not None:
+            self._mounts['https://'] = transport
+            self._mounts['http://'] = transport
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the calling thread's session, creating it on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._new_session()
+            self._local.session = session
+        return session
+
+    def mount(self, prefix: str, adapter: BaseAdapter):
+        """Mount an adapter on every existing and future session (e.g. a replay transport)"""
+        with self._lock:
+            self._mounts[prefix] = adapter
+            for session in list(self._sessions):
+                session.mount(prefix, adapter)
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+
+        with self._lock:
+            for prefix, adapter in self._mounts.items():
+                session.mount(prefix, adapter)
+            self._sessions.add(session)
+
+        logger.debug(f"🔌 New HTTP session for thread {threading.current_thread().name}")
+        return session
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Batch Job Queue - Background scraping jobs with pollable status
+Submitting a batch returns a job id at once; workers process the URLs in the background
+"""
+
+import os
+import json
+import uuid
+import queue
+import socket
+import logging
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+
+from batch_scraper import ConcurrentBatchScraper, build_batch_summary
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+
+
+class JobStore(ABC):
+    """Interface for job storage backends"""
+
+    @abstractmethod
+    def create_job(self, job_id: str, urls: List[str]) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def update_job(self, job_id: str, **fields) -> None:
+        ...
+
+    @abstractmethod
+    def record_result(self, job_id: str, index: int, entry: Dict[str, Any]) -> None:
+        ...
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def get_results(self, job_id: str) -> List[Optional[Dict[str, Any]]]:
+        ...
+
+    @abstractmethod
+    def get_urls(self, job_id: str) -> List[str]:
+        ...
+
+    @staticmethod
+    def _new_job(job_id: str, urls: List[str]) -> Dict[str, Any]:
+        return {
+            'job_id': job_id,
+            'status': JOB_QUEUED,
+            'total_urls': len(urls),
+            'completed': 0,
+            'successful': 0,
+            'failed': 0,
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'summary_file': None,
+            'error': None
+        }
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store (default)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._urls: Dict[str, List[str]] = {}
+        self._results: Dict[str, List[Optional[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def create_job(self, job_id: str, urls: List[str]) -> Dict[str, Any]:
+        job = self._new_job(job_id, urls)
+        with self._lock:
+            self._jobs[job_id] = job
+            self._urls[job_id] = list(urls)
+            self._results[job_id] = [None] * len(urls)
+        return dict(job)
+
+    def update_job(self, job_id: str, **fields) -> None:
+        with self._lock:
+            self._jobs[job_id].update(fields)
+
+    def record_result(self, job_id: str, index: int, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            job = self._jobs[job_id]
+            self._results[job_id][index] = entry
+            job['completed'] += 1
+            job['successful' if entry['status'] == 'success' else 'failed'] += 1
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def get_results(self, job_id: str) -> List[Optional[Dict[str, Any]]]:
+        with self._lock:
+            return list(self._results.get(job_id, []))
+
+    def get_urls(self, job_id: str) -> List[str]:
+        with self._lock:
+            return list(self._urls.get(job_id, []))
+
+
+class RedisJobStore(JobStore):
+    """Redis-backed job store so any worker process can answer status requests"""
+
+    KEY_PREFIX = 'scrape-job'
+    OWNER_PREFIX = 'scrape-job-owner'
+    INTERRUPTED_ERROR = 'Interrupted: the worker running this job stopped; resubmit the batch'
+
+    def __init__(self, client, ttl_seconds: int = 7 * 24 * 3600, heartbeat_seconds: float = 30,
+                 recover: bool = True):
+        """
+        Args:
+            client: redis.Redis compatible client (a local stand-in such as fakeredis also works)
+            ttl_seconds: Expiry applied to every job key
+            heartbeat_seconds: How often this process refreshes its liveness key
+            recover: Fail jobs left queued or running by dead processes when the store loads
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.heartbeat_seconds = heartbeat_seconds
+        # Jobs record which process queued them; its heartbeat key tells others it is still alive
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._beat()
+        threading.Thread(target=self._heartbeat_loop, name='job-store-heartbeat', daemon=True).start()
+        if recover:
+            self.recover_interrupted()
+
+    def close(self):
+        """Stop the heartbeat and drop the liveness key; unfinished jobs become recoverable at once"""
+        self._stop.set()
+        self.client.delete(self._owner_key(self.owner_id))
+
+    def recover_interrupted(self) -> List[str]:
+        """
+        Mark jobs whose owning process is gone as failed
+
+        Queued and running jobs live in their owner's in-process queue, so nothing else will ever
+        finish them once that process has stopped.
+
+        Returns:
+            Ids of the jobs marked failed
+        """
+        recovered = []
+        for key in self.client.scan_iter(match=f"{self.KEY_PREFIX}:*"):
+            job_id = self._text(key)[len(self.KEY_PREFIX) + 1:]
+            if ':' in job_id:
+                continue  # urls / results keys
+            job = self.get_job(job_id)
+            if not job or job['status'] not in (JOB_QUEUED, JOB_RUNNING):
+                continue
+            owner = job.get('owner')
+            if owner and self.client.exists(self._owner_key(owner)):
+                continue
+            self.update_job(job_id, status=JOB_FAILED, error=self.INTERRUPTED_ERROR,
+                            finished_at=datetime.now().isoformat())
+            recovered.append(job_id)
+        if recovered:
+            logger.warning(f"⚠️ Marked {len(recovered)} interrupted batch jobs as failed")
+        return recovered
+
+    def _owner_key(self, owner_id: str) -> str:
+        return f"{self.OWNER_PREFIX}:{owner_id}"
+
+    def _beat(self):
+        self.client.set(self._owner_key(self.owner_id), '1', ex=max(1, int(self.heartbeat_seconds * 3)))
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.heartbeat_seconds):
+            try:
+                self._beat()
+            except Exception as e:
+                logger.warning(f"⚠️ Job store heartbeat failed: {e}")
+
+    def _key(self, job_id: str, suffix: str = '') -> str:
+        return f"{self.KEY_PREFIX}:{job_id}{':' + suffix if suffix else ''}"
+
+    def create_job(self, job_id: str, urls: List[str]) -> Dict[str, Any]:
+        job = {**self._new_job(job_id, urls), 'owner': self.owner_id}
+        pipe = self.client.pipeline()
+        pipe.hset(self._key(job_id), mapping={k: json.dumps(v) for k, v in job.items()})
+        pipe.set(self._key(job_id, 'urls'), json.dumps(urls))
+        for suffix in ('', 'urls'):
+            pipe.expire(self._key(job_id, suffix), self.ttl_seconds)
+        pipe.execute()
+        return job
+
+    def update_job(self, job_id: str, **fields) -> None:
+        self.client.hset(self._key(job_id), mapping={k: json.dumps(v) for k, v in fields.items()})
+
+    def record_result(self, job_id: str, index: int, entry: Dict[str, Any]) -> None:
+        counter = 'successful' if entry['status'] == 'success' else 'failed'
+        pipe = self.client.pipeline()
+        pipe.hset(self._key(job_id, 'results'), str(index), json.dumps(entry))
+        pipe.expire(self._key(job_id, 'results'), self.ttl_seconds)
+        pipe.hincrby(self._key(job_id), 'completed', 1)
+        pipe.hincrby(self._key(job_id), counter, 1)
+        pipe.execute()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.hgetall(self._key(job_id))
+        if not raw:
+            return None
+        return {self._text(k): json.loads(self._text(v)) for k, v in raw.items()}
+
+    def get_results(self, job_id: str) -> List[Optional[Dict[str, Any]]]:
+        job = self.get_job(job_id)
+        if not job:
+            return []
+        results: List[Optional[Dict[str, Any]]] = [None] * job['total_urls']
+        for index, entry in self.client.hgetall(self._key(job_id, 'results')).items():
+            results[int(self._text(index))] = json.loads(self._text(entry))
+        return results
+
+    def get_urls(self, job_id: str) -> List[str]:
+        raw = self.client.get(self._key(job_id, 'urls'))
+        return json.loads(self._text(raw)) if raw else []
+
+    @staticmethod
+    def _text(value) -> str:
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def create_job_store_from_env() -> JobStore:
+    """Build the job store selected by JOB_STORE (memory or redis)"""
+    backend = os.getenv('JOB_STORE', 'memory').lower()
+
+    if backend == 'redis':
+        import redis
+        redis_url = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        logger.info(f"🗄️ Using Redis job store at {redis_url}")
+        return RedisJobStore(redis.Redis.from_url(redis_url))
+
+    logger.info("🗄️ Using in-process job store")
+    return InMemoryJobStore()
+
+
+class BatchJobQueue:
+    """Runs submitted batch jobs on background worker threads"""
+
+    def __init__(self, store: JobStore, scraper_factory: Callable[[Dict[str, Any]], ConcurrentBatchScraper],
+                 workers: int = 1):
+        """
+        Args:
+            store: Job store used for status and results
+            scraper_factory: Callable building a ConcurrentBatchScraper from the job options
+            workers: Number of jobs processed at the same time
+        """
+        self.store = store
+        self.scraper_factory = scraper_factory
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f'batch-job-{i}', daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, urls: List[str], options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Queue a batch and return its job record immediately"""
+        job_id = uuid.uuid4().hex
+        job = self.store.create_job(job_id, urls)
+        self._queue.put((job_id, options or {}))
+        logger.info(f"📥 Queued batch job {job_id} with {len(urls)} URLs")
+        return job
+
+    def _worker_loop(self):
+        while True:
+            job_id, options = self._queue.get()
+            try:
+                self._run_job(job_id, options)
+            finally:
+                self._queue.task_done()
+
+    def _run_job(self, job_id: str, options: Dict[str, Any]):
+        urls = self.store.get_urls(job_id)
+        self.store.update_job(job_id, status=JOB_RUNNING, started_at=datetime.now().isoformat())
+        logger.info(f"🚀 Running batch job {job_id}: {len(urls)} URLs")
+
+        try:
+            scraper = self.scraper_factory(options)
+            results = scraper.run(urls, on_result=lambda index, entry: self.store.record_result(job_id, index, entry))
+
+            # Store batch summary exactly like the synchronous endpoint
+            batch_summary = build_batch_summary(urls, results)
+            batch_filename = f"batch_summary_{batch_summary['timestamp']}.json"
+            with open(batch_filename, 'w', encoding='utf-8') as f:
+                json.dump(batch_summary, f, indent=2, ensure_ascii=False)
+
+            self.store.update_job(job_id, status=JOB_COMPLETED, summary_file=batch_filename,
+                                  finished_at=datetime.now().isoformat())
+            logger.info(f"✅ Batch job {job_id} completed. Summary saved to {batch_filename}")
+
+        except Exception as e:
+            logger.error(f"❌ Batch job {job_id} failed: {e}")
+            self.store.update_job(job_id, status=JOB_FAILED, error=str(e),
+                                  finished_at=datetime.now().isoformat())
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache - Extraction responses keyed by model, prompt template version and input text hash
+Unchanged listings return from memory or SQLite instead of waiting seconds for the API
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv('LLM_CACHE_DB', 'llm_cache.sqlite')
+DEFAULT_MAX_MB = float(os.getenv('LLM_CACHE_MAX_MB', '256'))
+DEFAULT_MEMORY_ENTRIES = int(os.getenv('LLM_CACHE_MEMORY_SIZE', '1024'))
+# 0 keeps responses until evicted for space
+DEFAULT_TTL_SECONDS = float(os.getenv('LLM_CACHE_TTL_SECONDS', '0'))
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+# Records written by export() on another worker or an earlier deployment, loaded once at startup
+PREWARM_PATH = os.getenv('LLM_CACHE_PREWARM_PATH', '')
+# Memory hits are written back to SQLite's accessed_at in batches of this many keys, or after this long
+TOUCH_FLUSH_SIZE = 64
+TOUCH_FLUSH_SECONDS = 30.0
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def clean_input_text(text: str) -> str:
+    """Collapse whitespace so re-indented or re-wrapped pages hash the same"""
+    return _WHITESPACE.sub(' ', text or '').strip()
+
+
+def make_key(model: str, prompt_version: str, text: str) -> str:
+    """Cache key for one model call: model and template version stay readable, the input is hashed"""
+    digest = hashlib.sha256(clean_input_text(text).encode('utf-8')).hexdigest()
+    return f"{model}:{prompt_version}:{digest}"
+
+
+class LLMResponseCache:
+    """In-memory LRU in front of a size-bounded SQLite table of LLM responses"""
+
+    def __init__(self, db_path: Optional[str] = None, max_mb: Optional[float] = None,
+                 memory_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            db_path: SQLite file for responses (None uses LLM_CACHE_DB, '' keeps them in memory only)
+            max_mb: Stored response size above which least recently used rows are evicted
+            memory_entries: Responses kept in the in-memory LRU
+            ttl_seconds: Age after which a response is treated as missing (0 never expires)
+        """
+        self.max_bytes = int((max_mb or DEFAULT_MAX_MB) * 1024 * 1024)
+        self.memory_entries = max(1, memory_entries or DEFAULT_MEMORY_ENTRIES)
+        self.ttl_seconds = DEFAULT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        # key -> (created_at, payload)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._memory_bytes = 0
+        # key -> time of the last memory hit not yet written to SQLite, so eviction sees hot keys as recent
+        self._touched: Dict[str, float] = {}
+        self._last_touch_flush = time.time()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'db_hits': 0, 'misses': 0, 'expired': 0, 'evicted': 0}
+
+        db_path = DEFAULT_DB_PATH if db_path is None else db_path
+        self._db = None
+        self._db_bytes = 0
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "cache_key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS llm_responses_accessed ON llm_responses (accessed_at)")
+            self._db.commit()
+            self._db_bytes = self._db.execute("SELECT COALESCE(SUM(LENGTH(response)), 0) FROM llm_responses").fetchone()[0]
+            logger.info(f"🗃️ LLM response cache at {db_path} ({self._db_bytes / (1024 * 1024):.1f} MB)")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached response (dict or string), or None when missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if self._expired(entry[0], now):
+                    self._drop(key)
+                else:
+                    self._memory.move_to_end(key)
+                    self._touch(key, now)
+                    self.stats['memory_hits'] += 1
+                    return json.loads(entry[1])
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created_at FROM llm_responses WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row and not self._expired(row[1], now):
+                    self._db.execute("UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?", (now, key))
+                    self._db.commit()
+                    self._remember(key, row[1], row[0])
+                    self.stats['db_hits'] += 1
+                    return json.loads(row[0])
+                if row:
+                    self._db.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+                    self._db.commit()
+                    self._db_bytes -= len(row[0])
+                    self.stats['expired'] += 1
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key: str, response: Any, created_at: Optional[float] = None):
+        """Store a response; empty responses are never cached so failed calls are retried"""
+        if response in (None, '', {}, []):
+            return
+        payload = json.dumps(response, ensure_ascii=False)
+        created_at = time.time() if created_at is None else created_at
+        with self._lock:
+            self._remember(key, created_at, payload)
+            if self._db is None:
+                return
+            old = self._db.execute("SELECT LENGTH(response) FROM llm_responses WHERE cache_key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_responses (cache_key, response, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, created_at, time.time())
+            )
+            self._db_bytes += len(payload) - (old[0] if old else 0)
+            if self._db_bytes > self.max_bytes:
+                self._evict()
+            self._db.commit()
+
+    def prewarm(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Load responses stored by an earlier run or another worker
+
+        Args:
+            records: Dicts with 'response' and either 'key', or 'model', 'prompt_version' and 'text'
+
+        Returns:
+            Number of responses loaded
+        """
+        loaded = 0
+        for record in records:
+            response = record.get('response')
+            key = record.get('key')
+            if key is None and record.get('text') is not None:
+                key = make_key(record.get('model', ''), record.get('prompt_version', ''), record['text'])
+            if key is None or response is None:
+                continue
+            created_at = record.get('created_at')
+            if created_at is not None and self._expired(created_at, time.time()):
+                continue
+            self.put(key, response, created_at)
+            loaded += 1
+        logger.info(f"🔥 Prewarmed LLM cache with {loaded} responses")
+        return loaded
+
+    def prewarm_from_file(self, path: str) -> int:
+        """Prewarm from a JSON list or a JSON-lines file of records (see prewarm and export)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+        if content.startswith('['):
+            records = json.loads(content)
+        else:
+            records = [json.loads(line) for line in content.splitlines() if line.strip()]
+        return self.prewarm(records)
+
+    def export(self, path: str) -> int:
+        """Write every unexpired response as JSON lines that prewarm_from_file can load"""
+        with self._lock:
+            if self._db is not None:
+                rows = self._db.execute("SELECT cache_key, response, created_at FROM llm_responses").fetchall()
+            else:
+                rows = [(key, payload, created_at) for key, (created_at, payload) in self._memory.items()]
+        now = time.time()
+        tmp_path = f"{path}.tmp"
+        count = 0
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for key, payload, created_at in rows:
+                if self._expired(created_at, now):
+                    continue
+                f.write(json.dumps({'key': key, 'response': json.loads(payload), 'created_at': created_at},
+                                   ensure_ascii=False) + '\n')
+                count += 1
+        os.replace(tmp_path, path)
+        return count
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - created_at > self.ttl_seconds
+
+    def _touch(self, key: str, now: float):
+        if self._db is None:
+            return
+        self._touched[key] = now
+        if len(self._touched) >= TOUCH_FLUSH_SIZE or now - self._last_touch_flush >= TOUCH_FLUSH_SECONDS:
+            self._flush_touched()
+            self._db.commit()
+
+    def _flush_touched(self):
+        """Write pending memory-hit times to accessed_at"""
+        if self._touched:
+            self._db.executemany("UPDATE llm_responses SET accessed_at = ? WHERE cache_key = ?",
+                                 [(accessed_at, key) for key, accessed_at in self._touched.items()])
+            self._touched.clear()
+        self._last_touch_flush = time.time()
+
+    def _evict(self):
+        """Drop least recently used rows until the table is back under 90% of its size budget"""
+        self._flush_touched()
+        target = int(self.max_bytes * 0.9)
+        rows = self._db.execute("SELECT cache_key, LENGTH(response) FROM llm_responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._db_bytes <= target:
+                break
+            doomed.append((key,))
+            self._db_bytes -= size
+        self._db.executemany("DELETE FROM llm_responses WHERE cache_key = ?", doomed)
+        self.stats['evicted'] += len(doomed)
+        logger.info(f"🧹 Evicted {len(doomed)} LLM responses to stay under {self.max_bytes / (1024 * 1024):.0f} MB")
+
+    def _remember(self, key: str, created_at: float, payload: str):
+        self._drop(key)
+        self._memory[key] = (created_at, payload)
+        self._memory_bytes += len(payload)
+        # Without a database the memory tier is the whole cache, so it honours the size budget too
+        while len(self._memory) > self.memory_entries or (self._db is None and self._memory_bytes > self.max_bytes):
+            _, (_, old) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(old)
+            if self._db is None:
+                self.stats['evicted'] += 1
+
+    def _drop(self, key: str):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= len(entry[1])
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMResponseCache]:
+    """Return the process-wide LLM response cache, or None when LLM_CACHE_ENABLED=false"""
+    global _shared_cache
+    if not LLM_CACHE_ENABLED:
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+            if PREWARM_PATH and os.path.exists(PREWARM_PATH):
+                try:
+                    _shared_cache.prewarm_from_file(PREWARM_PATH)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"⚠️ Could not prewarm LLM cache from {PREWARM_PATH}: {e}")
+        return _shared_cache
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+LLM Dispatcher - Shared request/token rate limits, bounded concurrency and retries for model calls
+Calls are admitted in priority order as quota allows, so interactive scrapes overtake queued batch work
+"""
+
+import os
+import time
+import heapq
+import random
+import logging
+import itertools
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+import openai
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_MINUTE = float(os.getenv('LLM_REQUESTS_PER_MINUTE', '60'))
+DEFAULT_TOKENS_PER_MINUTE = float(os.getenv('LLM_TOKENS_PER_MINUTE', '40000'))
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '4'))
+DEFAULT_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '5'))
+DEFAULT_RETRY_BASE_SECONDS = float(os.getenv('LLM_RETRY_BASE_SECONDS', '1'))
+DEFAULT_RETRY_MAX_SECONDS = float(os.getenv('LLM_RETRY_MAX_SECONDS', '30'))
+
+INTERACTIVE = 0
+BATCH = 1
+
+_priority: contextvars.ContextVar = contextvars.ContextVar('llm_dispatch_priority', default=INTERACTIVE)
+
+
+@contextmanager
+def dispatch_priority(priority: int):
+    """Run model calls made inside the block (on this thread) at the given priority"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class TokenBucket:
+    """Refills continuously at rate_per_minute; holds at most one minute of quota"""
+
+    def __init__(self, rate_per_minute: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate_per_minute: Units granted per minute (0 or less disables the limit)
+            clock: Monotonic time source
+        """
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = rate_per_minute
+        self.clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.rate_per_second <= 0
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount can be taken (amounts above capacity only wait for a full bucket)"""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        missing = min(amount, self.capacity) - self._level
+        return max(0.0, missing / self.rate_per_second)
+
+    def take(self, amount: float):
+        if not self.unlimited:
+            self._refill()
+            self._level -= min(amount, self.capacity)
+
+    def credit(self, amount: float):
+        """Give back quota reserved but not used (e.g. completion tokens the model did not produce)"""
+        if not self.unlimited:
+            self._refill()
+            self._level = min(self.capacity, self._level + amount)
+
+    def _refill(self):
+        now = self.clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+
+class _Request:
+    def __init__(self, priority: int, sequence: int, call: Callable[[], Any], tokens: float):
+        self.priority = priority
+        self.sequence = sequence
+        self.call = call
+        self.tokens = tokens
+        self.future: Future = Future()
+        self.attempts = 0
+
+    def __lt__(self, other: '_Request') -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class LLMDispatcher:
+    """Priority queue of model calls admitted under request and token buckets"""
+
+    def __init__(self, requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 max_concurrency: Optional[int] = None, max_retries: Optional[int] = None,
+                 retry_base_seconds: Optional[float] = None, retry_max_seconds: Optional[float] = None):
+        """
+        Args:
+            requests_per_minute: Request quota shared by every caller in the process
+            tokens_per_minute: Token quota (prompt plus max completion tokens) shared by every caller
+            max_concurrency: Calls in flight at once
+            max_retries: Retries of a call after 429, 5xx or connection errors
+            retry_base_seconds: First backoff step; later steps double, with full jitter
+            retry_max_seconds: Largest backoff step
+        """
+        self.requests = TokenBucket(DEFAULT_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute)
+        self.tokens = TokenBucket(DEFAULT_TOKENS_PER_MINUTE if tokens_per_minute is None else tokens_per_minute)
+        self.max_concurrency = max(1, max_concurrency or DEFAULT_MAX_CONCURRENCY)
+        self.max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_base_seconds = DEFAULT_RETRY_BASE_SECONDS if retry_base_seconds is None else retry_base_seconds
+        self.retry_max_seconds = DEFAULT_RETRY_MAX_SECONDS if retry_max_seconds is None else retry_max_seconds
+
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='llm-call')
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'retries': 0, 'throttled_seconds': 0.0}
+        threading.Thread(target=self._admit_forever, name='llm-dispatcher', daemon=True).start()
+
+    def submit(self, call: Callable[[], Any], estimated_tokens: float = 0,
+               priority: Optional[int] = None) -> Future:
+        """
+        Queue a model call
+
+        Args:
+            call: Zero-argument callable making the API request
+            estimated_tokens: Prompt tokens plus max completion tokens, charged to the token bucket
+            priority: INTERACTIVE or BATCH (default: the caller's dispatch_priority, else INTERACTIVE)
+
+        Returns:
+            Future resolving to the call's return value
+        """
+        request = _Request(_priority.get() if priority is None else priority, next(self._sequence),
+                           call, estimated_tokens)
+        with self._condition:
+            heapq.heappush(self._queue, request)
+            self.stats['submitted'] += 1
+            self._condition.notify_all()
+        return request.future
+
+    def call(self, call: Callable[[], Any], estimated_tokens: float = 0, priority: Optional[int] = None) -> Any:
+        """Submit a call and wait for its result (exceptions are re-raised)"""
+        return self.submit(call, estimated_tokens, priority).result()
+
+    def queued(self) -> int:
+        with self._condition:
+            return len(self._queue)
+
+    def _admit_forever(self):
+        while True:
+            with self._condition:
+                request = self._next_admissible()
+                self._in_flight += 1
+            self._executor.submit(self._run, request)
+
+    def _next_admissible(self) -> _Request:
+        """Block until the highest-priority request has a free slot and quota (called holding the condition)"""
+        while True:
+            if not self._queue or self._in_flight >= self.max_concurrency:
+                self._condition.wait()
+                continue
+            head = self._queue[0]
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(head.tokens))
+            if wait > 0:
+                # A newly queued interactive call wakes this up and is considered first
+                started = time.monotonic()
+                self._condition.wait(wait)
+                self.stats['throttled_seconds'] += time.monotonic() - started
+                continue
+            heapq.heappop(self._queue)
+            self.requests.take(1)
+            self.tokens.take(head.tokens)
+            return head
+
+    def _run(self, request: _Request):
+        request.attempts += 1
+        try:
+            result = request.call()
+        except Exception as e:
+            delay = self._retry_delay(e, request.attempts)
+            if delay is None:
+                self._finish(request, error=e)
+            else:
+                logger.warning(f"⏳ LLM call failed ({self._describe(e)}), retry {request.attempts}/{self.max_retries} "
+                               f"in {delay:.1f}s")
+                with self._condition:
+                    self.stats['retries'] += 1
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+                # The slot is free while backing off; the retry re-enters the queue at its original position
+                timer = threading.Timer(delay, self._requeue, args=(request,))
+                timer.daemon = True
+                timer.start()
+            return
+        self._finish(request, result=result)
+
+    def _requeue(self, request: _Request):
+        with self._condition:
+            heapq.heappush(self._queue, request)
+            self._condition.notify_all()
+
+    def _finish(self, request: _Request, result: Any = None, error: Optional[BaseException] = None):
+        with self._condition:
+            self._in_flight -= 1
+            if error is None:
+                self.stats['completed'] += 1
+                used = getattr(getattr(result, 'usage', None), 'total_tokens', None)
+                if isinstance(used, (int, float)) and used < request.tokens:
+                    self.tokens.credit(request.tokens - used)
+            else:
+                self.stats['failed'] += 1
+            self._condition.notify_all()
+        if error is None:
+            request.future.set_result(result)
+        else:
+            request.future.set_exception(error)
+
+    def _retry_delay(self, error: Exception, attempts: int) -> Optional[float]:
+        """Backoff before the next attempt, or None when the error is final"""
+        if attempts > self.max_retries or not self._is_retryable(error):
+            return None
+        delay = random.uniform(0, min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempts - 1)))
+        retry_after = self._retry_after(error)
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, openai.APIConnectionError):
+            return True
+        status = getattr(error, 'status_code', None)
+        return status == 429 or (isinstance(status, int) and status >= 500)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _describe(error: Exception) -> str:
+        status = getattr(error, 'status_code', None)
+        return f"HTTP {status}" if status else type(error).__name__
+
+
+_shared_dispatcher: Optional[LLMDispatcher] = None
+_shared_dispatcher_lock = threading.Lock()
+
+
+def get_llm_dispatcher() -> LLMDispatcher:
+    """Return the process-wide LLM dispatcher; every extractor shares its quota"""
+    global _shared_dispatcher
+    with _shared_dispatcher_lock:
+        if _shared_dispatcher is None:
+            _shared_dispatcher = LLMDispatcher()
+        return _shared_dispatcher
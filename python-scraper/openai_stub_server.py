@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+OpenAI Stub Server - Local stand-in for the chat-completions and embeddings endpoints
+Deterministic answers with configurable latency, 5xx rate and 429 behaviour; point clients at it with OPENAI_BASE_URL
+"""
+
+import os
+import re
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = int(os.getenv('OPENAI_STUB_PORT', '8089'))
+DEFAULT_LATENCY_MS = float(os.getenv('OPENAI_STUB_LATENCY_MS', '0'))
+DEFAULT_JITTER_MS = float(os.getenv('OPENAI_STUB_JITTER_MS', '0'))
+DEFAULT_ERROR_RATE = float(os.getenv('OPENAI_STUB_ERROR_RATE', '0'))
+DEFAULT_RATE_LIMIT_RATE = float(os.getenv('OPENAI_STUB_RATE_LIMIT_RATE', '0'))
+# Requests per rolling minute before answering 429 with Retry-After (0 = unlimited)
+DEFAULT_REQUESTS_PER_MINUTE = int(os.getenv('OPENAI_STUB_RPM', '0'))
+DEFAULT_RETRY_AFTER_SECONDS = float(os.getenv('OPENAI_STUB_RETRY_AFTER', '1'))
+
+EMBEDDING_DIMENSIONS = {
+    'text-embedding-ada-002': 1536,
+    'text-embedding-3-small': 1536,
+    'text-embedding-3-large': 3072,
+}
+DEFAULT_EMBEDDING_DIMENSIONS = 1536
+
+# "- field" or "- field: hint" lines: the field lists in the extraction prompts
+_FIELD_LINE = re.compile(r'^\s*-\s*([A-Za-z_][\w]*)\s*(?::|$)', re.MULTILINE)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def stub_embedding(text: str, model: str, dimensions: Optional[int] = None) -> List[float]:
+    """Unit-length vector seeded by the model and text: same input, same vector, on every run"""
+    size = dimensions or EMBEDDING_DIMENSIONS.get(model, DEFAULT_EMBEDDING_DIMENSIONS)
+    rng = random.Random(int(_digest(model, text)[:16], 16))
+    vector = [rng.gauss(0.0, 1.0) for _ in range(size)]
+    norm = sum(value * value for value in vector) ** 0.5 or 1.0
+    return [value / norm for value in vector]
+
+
+def stub_completion_text(messages: List[Dict[str, Any]], model: str) -> str:
+    """
+    Deterministic reply to a chat request
+
+    Prompts that list fields ("- make: Builder") get a JSON object with one value per field,
+    so the extractors' JSON parsing runs as it would against the real API.
+    """
+    prompt = '\n'.join(str(message.get('content', '')) for message in messages)
+    digest = _digest(model, prompt)
+    fields = list(dict.fromkeys(_FIELD_LINE.findall(prompt)))
+    if fields:
+        return json.dumps({field: f"stub-{field}-{_digest(digest, field)[:6]}" for field in fields})
+    return f"stub-{digest[:12]}"
+
+
+class StubConfig:
+    """Failure and latency knobs; changeable while the server runs"""
+
+    def __init__(self, latency_ms: Optional[float] = None, jitter_ms: Optional[float] = None,
+                 error_rate: Optional[float] = None, rate_limit_rate: Optional[float] = None,
+                 requests_per_minute: Optional[int] = None, retry_after_seconds: Optional[float] = None,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            latency_ms: Added to every response
+            jitter_ms: Uniform random extra latency on top of latency_ms
+            error_rate: Share of requests answered with a 500
+            rate_limit_rate: Share of requests answered with a 429 regardless of volume
+            requests_per_minute: Rolling-minute request quota; requests beyond it get a 429
+            retry_after_seconds: Retry-After sent with every 429
+            seed: Seed for the latency and failure draws, for repeatable runs
+        """
+        self.latency_ms = DEFAULT_LATENCY_MS if latency_ms is None else latency_ms
+        self.jitter_ms = DEFAULT_JITTER_MS if jitter_ms is None else jitter_ms
+        self.error_rate = DEFAULT_ERROR_RATE if error_rate is None else error_rate
+        self.rate_limit_rate = DEFAULT_RATE_LIMIT_RATE if rate_limit_rate is None else rate_limit_rate
+        self.requests_per_minute = DEFAULT_REQUESTS_PER_MINUTE if requests_per_minute is None else requests_per_minute
+        self.retry_after_seconds = DEFAULT_RETRY_AFTER_SECONDS if retry_after_seconds is None else retry_after_seconds
+        self.random = random.Random(seed)
+
+
+class OpenAIStubServer:
+    """Threaded HTTP server speaking the subset of the OpenAI API the scrapers use"""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            config: Latency and failure settings
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+        """
+        self.config = config or StubConfig()
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self._in_flight = 0
+        self.stats = {'requests': 0, 'chat_completions': 0, 'embeddings': 0, 'embedding_inputs': 0,
+                      'prompt_tokens': 0, 'errors': 0, 'rate_limited': 0, 'max_in_flight': 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Value for OPENAI_BASE_URL / OpenAI(base_url=...)"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'OpenAIStubServer':
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='openai-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats)
+
+    def _admit(self) -> Optional[tuple]:
+        """Decide the fate of one request: None to serve it, else (status, error type, message)"""
+        config = self.config
+        now = time.monotonic()
+        with self._lock:
+            self.stats['requests'] += 1
+            while self._recent and now - self._recent[0] > 60:
+                self._recent.popleft()
+            over_quota = config.requests_per_minute > 0 and len(self._recent) >= config.requests_per_minute
+            if not over_quota:
+                self._recent.append(now)
+            draw = config.random.random()
+            if over_quota or draw < config.rate_limit_rate:
+                self.stats['rate_limited'] += 1
+                return 429, 'rate_limit_error', 'Rate limit reached for requests (stub)'
+            if draw < config.rate_limit_rate + config.error_rate:
+                self.stats['errors'] += 1
+                return 500, 'server_error', 'The server had an error while processing your request (stub)'
+            self._in_flight += 1
+            self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self._in_flight)
+        return None
+
+    def _release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _delay(self):
+        config = self.config
+        with self._lock:
+            jitter = config.random.uniform(0, config.jitter_ms) if config.jitter_ms else 0.0
+        delay_ms = config.latency_ms + jitter
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def _chat_completion(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        model = body.get('model', 'gpt-4')
+        messages = body.get('messages') or []
+        text = stub_completion_text(messages, model)
+        prompt_tokens = sum(estimate_tokens(str(message.get('content', ''))) for message in messages)
+        completion_tokens = estimate_tokens(text)
+        with self._lock:
+            self.stats['chat_completions'] += 1
+            self.stats['prompt_tokens'] += prompt_tokens
+        return {
+            'id': f"chatcmpl-stub-{_digest(text)[:12]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                      'total_tokens': prompt_tokens + completion_tokens},
+        }
+
+    def _embeddings(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        model = body.get('model', 'text-embedding-ada-002')
+        inputs = body.get('input')
+        inputs = [inputs] if isinstance(inputs, str) else list(inputs or [])
+        prompt_tokens = sum(estimate_tokens(str(text)) for text in inputs)
+        with self._lock:
+            self.stats['embeddings'] += 1
+            self.stats['embedding_inputs'] += len(inputs)
+            self.stats['prompt_tokens'] += prompt_tokens
+        return {
+            'object': 'list',
+            'model': model,
+            'data': [{'object': 'embedding', 'index': i, 'embedding': stub_embedding(str(text), model, body.get('dimensions'))}
+                     for i, text in enumerate(inputs)],
+            'usage': {'prompt_tokens': prompt_tokens, 'total_tokens': prompt_tokens},
+        }
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                if self.path.rstrip('/') == '/stub/stats':
+                    self._send(200, server.snapshot())
+                elif self.path.rstrip('/') == '/v1/models':
+                    models = ['gpt-4', 'gpt-4o-mini'] + list(EMBEDDING_DIMENSIONS)
+                    self._send(200, {'object': 'list', 'data': [{'id': m, 'object': 'model'} for m in models]})
+                else:
+                    self._error(404, 'invalid_request_error', f"Unknown path {self.path}")
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self._error(400, 'invalid_request_error', 'Body is not JSON')
+                    return
+                routes = {'/v1/chat/completions': server._chat_completion, '/v1/embeddings': server._embeddings}
+                route = routes.get(self.path.split('?')[0].rstrip('/'))
+                if route is None:
+                    self._error(404, 'invalid_request_error', f"Unknown path {self.path}")
+                    return
+
+                failure = server._admit()
+                if failure is not None:
+                    server._delay()
+                    self._error(*failure)
+                    return
+                try:
+                    server._delay()
+                    self._send(200, route(body))
+                finally:
+                    server._release()
+
+            def _error(self, status: int, error_type: str, message: str):
+                headers = {'Retry-After': str(server.config.retry_after_seconds)} if status == 429 else {}
+                self._send(status, {'error': {'message': message, 'type': error_type, 'code': None}}, headers)
+
+            def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    arg_parser.add_argument('--latency-ms', type=float, default=None, help='Latency added to every response')
+    arg_parser.add_argument('--jitter-ms', type=float, default=None, help='Random extra latency')
+    arg_parser.add_argument('--error-rate', type=float, default=None, help='Share of requests answered with 500')
+    arg_parser.add_argument('--rate-limit-rate', type=float, default=None, help='Share of requests answered with 429')
+    arg_parser.add_argument('--rpm', type=int, default=None, help='Requests per minute before 429s (0 = unlimited)')
+    arg_parser.add_argument('--seed', type=int, default=None, help='Seed for latency and failure draws')
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    config = StubConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate, args.rpm, seed=args.seed)
+    server = OpenAIStubServer(config, args.host, args.port)
+    print(f"🧪 OpenAI stub listening; export OPENAI_BASE_URL={server.base_url} OPENAI_API_KEY=stub")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
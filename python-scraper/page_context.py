@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Page Context - One fetched copy of a listing page handed to every extraction tier
+Lets the AI, site-specific and generic tiers share a single page load instead of each fetching the URL
+"""
+
+from typing import Optional
+
+from bs4 import BeautifulSoup
+from requests.structures import CaseInsensitiveDict
+
+
+class PageContext:
+    """HTML, response headers and how the page was obtained"""
+
+    def __init__(self, url: str, html: str, headers=None, status_code: int = 200,
+                 rendered: bool = False, final_url: Optional[str] = None, content: Optional[bytes] = None):
+        """
+        Args:
+            url: URL that was requested
+            html: Page HTML (the browser DOM when rendered, else the response body)
+            headers: Response headers (empty for rendered pages; the browser doesn't expose them)
+            status_code: HTTP status
+            rendered: True when the HTML came from a browser after JavaScript ran
+            final_url: URL after redirects
+            content: Undecoded response body, when there was one
+        """
+        self.url = url
+        self.html = html
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.status_code = status_code
+        self.rendered = rendered
+        self.final_url = final_url or url
+        self._content = content
+
+    @classmethod
+    def from_response(cls, url: str, response) -> 'PageContext':
+        """Context for a requests response"""
+        return cls(url, response.text, headers=response.headers, status_code=response.status_code,
+                   final_url=getattr(response, 'url', None) or url, content=response.content)
+
+    @classmethod
+    def from_driver(cls, url: str, driver) -> 'PageContext':
+        """Context for the DOM currently loaded in a Selenium driver"""
+        return cls(url, driver.page_source, rendered=True, final_url=driver.current_url)
+
+    @property
+    def content(self) -> bytes:
+        """Body as bytes, for code written against response.content"""
+        return self._content if self._content is not None else self.html.encode('utf-8')
+
+    def soup(self) -> BeautifulSoup:
+        """Fresh BeautifulSoup tree; tiers that decompose nodes get their own copy"""
+        # Undecoded bytes let BeautifulSoup honour the page's own charset declaration
+        return BeautifulSoup(self._content if self._content is not None else self.html, 'html.parser')
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Page Text - Per-page text views computed once and shared by every extractor
+Replaces repeated soup.get_text() / page_text.lower() calls with cached properties
+"""
+
+from bisect import bisect_right
+from functools import cached_property
+from typing import List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters but that str.lower()
+# leaves (or turns into something else)
+_IGNORECASE_FOLD = (('İ', 'i'), ('ı', 'i'), ('ſ', 's'))
+
+
+def fold_text(text: str) -> str:
+    """Lowercased text in which every IGNORECASE match of an ASCII literal is a plain substring"""
+    if not text.isascii():
+        # str.replace per character is far cheaper than str.translate over a long page
+        for char, ascii_char in _IGNORECASE_FOLD:
+            if char in text:
+                text = text.replace(char, ascii_char)
+    return text.lower()
+
+
+class PageText:
+    """Text of one page with lazily computed, cached views"""
+
+    def __init__(self, source: Union[BeautifulSoup, str]):
+        """
+        Args:
+            source: Parsed soup (text comes from get_text()) or the page text itself
+        """
+        if isinstance(source, str):
+            self.soup: Optional[BeautifulSoup] = None
+            self.__dict__['raw'] = source
+        else:
+            self.soup = source
+
+    @classmethod
+    def of(cls, page: Union['PageText', BeautifulSoup, str]) -> 'PageText':
+        """Wrap a soup or string, passing an existing PageText through unchanged"""
+        return page if isinstance(page, cls) else cls(page)
+
+    @cached_property
+    def raw(self) -> str:
+        """soup.get_text() of the whole page"""
+        return self.soup.get_text()
+
+    @cached_property
+    def lower(self) -> str:
+        """raw.lower()"""
+        return self.raw.lower()
+
+    @cached_property
+    def folded(self) -> str:
+        """Lowercased text for case-insensitive literal prefilters (see fold_text)"""
+        return self.lower if self.raw.isascii() else fold_text(self.raw)
+
+    @cached_property
+    def collapsed(self) -> str:
+        """Lines stripped, split on runs of two spaces and joined with single spaces"""
+        lines = (line.strip() for line in self.raw.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        return ' '.join(chunk for chunk in chunks if chunk)
+
+    @cached_property
+    def collapsed_page(self) -> 'PageText':
+        """Views (lower, folded, lines) of the collapsed text, cached on this page like its own"""
+        return PageText(self.collapsed)
+
+    @cached_property
+    def line_starts(self) -> List[int]:
+        """Offset in raw at which each line starts"""
+        starts = [0]
+        find = self.raw.find
+        position = find('\n')
+        while position != -1:
+            starts.append(position + 1)
+            position = find('\n', position + 1)
+        return starts
+
+    def line_number(self, offset: int) -> int:
+        """Zero-based line containing an offset into raw"""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def line_at(self, offset: int) -> str:
+        """The line of raw containing an offset (e.g. a match start), without its newline"""
+        starts = self.line_starts
+        number = bisect_right(starts, offset) - 1
+        end = starts[number + 1] - 1 if number + 1 < len(starts) else len(self.raw)
+        return self.raw[starts[number]:end]
+
+    def contains(self, keyword: str) -> bool:
+        """keyword.lower() in raw.lower()"""
+        return keyword.lower() in self.lower
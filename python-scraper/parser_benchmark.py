@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmark - Replays the stored fixture corpus through every De Valk parser offline
+Reports pages/sec, p50/p95 latency, peak memory and field counts per section as JSON
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from devalk_fixtures import build_fixture_site, FixtureAdapter, FIXTURE_BASE_URL
+
+PARSERS = ['super_enhanced', 'enhanced', 'perfect', 'simple']
+
+
+class NullResultCache:
+    """Result cache that never hits, so every round measures a real parse"""
+
+    @staticmethod
+    def make_key(body: bytes, parser_version: str) -> str:
+        return ''
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        pass
+
+
+def create_parser(name: str):
+    """Instantiate a parser by benchmark name"""
+    if name == 'super_enhanced':
+        from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+        return SuperEnhancedDeValkParser()
+    if name == 'enhanced':
+        from enhanced_devalk_parser import EnhancedDeValkParser
+        return EnhancedDeValkParser()
+    if name == 'perfect':
+        from perfect_devalk_parser import PerfectDeValkParser
+        return PerfectDeValkParser()
+    if name == 'simple':
+        from simple_devalk_parser import SimpleDeValkParser
+        return SimpleDeValkParser()
+    raise ValueError(f"Unknown parser: {name}")
+
+
+def prepare_parser(parser, adapter: FixtureAdapter):
+    """Route the parser's sessions to the fixtures and switch off its caches"""
+    parser._sessions.mount(FIXTURE_BASE_URL, adapter)
+    if hasattr(parser, 'http_cache'):
+        parser.http_cache = None
+    if hasattr(parser, 'result_cache'):
+        parser.result_cache = NullResultCache()
+    return parser
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(round(fraction * len(ordered), 9))
+    index = min(len(ordered) - 1, max(0, rank - 1))
+    return ordered[index]
+
+
+def section_field_counts(result: Dict[str, Any]) -> Dict[str, int]:
+    """Fields per section; v5 parsers nest sections under 'data', older ones return them at the top level"""
+    sections = result.get('data', result)
+    return {name: len(fields) for name, fields in sections.items() if isinstance(fields, dict)}
+
+
+def benchmark_parser(parse: Callable[[str], Dict[str, Any]], urls: List[str], rounds: int) -> Dict[str, Any]:
+    """
+    Time a parse function over every URL
+
+    Args:
+        parse: Callable taking a listing URL and returning a parse result
+        urls: Fixture URLs to replay
+        rounds: Timed passes over the URL list (one untimed warm-up pass runs first)
+
+    Returns:
+        Throughput, latency, memory and field count metrics
+    """
+    field_counts: Dict[str, List[int]] = {}
+    errors = 0
+    for url in urls:
+        result = parse(url)
+        if 'error' in result:
+            errors += 1
+            continue
+        for section, count in section_field_counts(result).items():
+            field_counts.setdefault(section, []).append(count)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for url in urls:
+            page_started = time.perf_counter()
+            parse(url)
+            latencies.append((time.perf_counter() - page_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    # Separate pass: tracemalloc slows allocation-heavy code too much to time under it.
+    # It sees Python allocations only, so memory held inside lxml's C tree is not counted
+    tracemalloc.start()
+    try:
+        for url in urls:
+            parse(url)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    pages = len(latencies)
+    return {
+        'pages': pages,
+        'errors': errors,
+        'pages_per_sec': round(pages / elapsed, 2) if elapsed else 0.0,
+        'latency_ms': {
+            'mean': round(sum(latencies) / pages, 3) if pages else 0.0,
+            'p50': round(percentile(latencies, 0.50), 3),
+            'p95': round(percentile(latencies, 0.95), 3),
+            'max': round(max(latencies), 3) if latencies else 0.0,
+        },
+        'peak_python_memory_mb': round(peak / (1024 * 1024), 2),
+        'fields_per_section': {
+            section: round(sum(counts) / len(counts), 1) for section, counts in sorted(field_counts.items())
+        },
+        'total_fields': round(sum(sum(counts) for counts in field_counts.values()) / max(1, len(urls) - errors), 1),
+    }
+
+
+def run_benchmark(parser_names: Optional[List[str]] = None, rounds: int = 3, padding_kb: int = 120,
+                  directory: Optional[str] = None) -> Dict[str, Any]:
+    """Replay the fixture corpus through the selected parsers and collect a report"""
+    site = build_fixture_site(directory, padding_kb=padding_kb)
+    urls = list(site)
+    adapter = FixtureAdapter(site)
+
+    report = {
+        'benchmark': 'parser_benchmark',
+        'created_at': datetime.now().isoformat(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'parse_engine': os.getenv('DEVALK_PARSE_ENGINE', 'lxml'),
+        },
+        'corpus': {
+            'pages': len(urls),
+            'average_kb': round(sum(len(html) for html in site.values()) / max(1, len(urls)) / 1024, 1),
+            'padding_kb': padding_kb,
+        },
+        'rounds': rounds,
+        'parsers': {},
+    }
+
+    for name in parser_names or PARSERS:
+        parser = prepare_parser(create_parser(name), adapter)
+        metrics = benchmark_parser(parser.parse_yacht_listing, urls, rounds)
+        metrics['parser_version'] = getattr(parser, 'PARSER_VERSION', '')
+        report['parsers'][name] = metrics
+
+    return report
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Relative change of the headline metrics per parser present in both reports"""
+    changes = {}
+    for name, metrics in current['parsers'].items():
+        before = baseline.get('parsers', {}).get(name)
+        if not before:
+            continue
+        changes[name] = {
+            'pages_per_sec': _relative(before['pages_per_sec'], metrics['pages_per_sec']),
+            'p95_ms': _relative(before['latency_ms']['p95'], metrics['latency_ms']['p95']),
+            'peak_python_memory_mb': _relative(before['peak_python_memory_mb'], metrics['peak_python_memory_mb']),
+            'total_fields': _relative(before['total_fields'], metrics['total_fields']),
+        }
+    return changes
+
+
+def _relative(before: float, after: float) -> float:
+    return round((after - before) / before * 100, 1) if before else 0.0
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('--parsers', nargs='+', choices=PARSERS, default=PARSERS)
+    arg_parser.add_argument('--rounds', type=int, default=3)
+    arg_parser.add_argument('--padding-kb', type=int, default=120, help='Boilerplate size per page')
+    arg_parser.add_argument('--output', help='Report path (default parser_benchmark_<timestamp>.json)')
+    arg_parser.add_argument('--compare', help='Earlier report to compare against')
+    args = arg_parser.parse_args()
+
+    # Per-field INFO logging would dominate the timings
+    logging.disable(logging.INFO)
+
+    report = run_benchmark(args.parsers, rounds=args.rounds, padding_kb=args.padding_kb)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            report['compared_to'] = {'path': args.compare, 'change_percent': compare_reports(json.load(f), report)}
+
+    output = args.output or f"parser_benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"📄 {report['corpus']['pages']} pages, {report['corpus']['average_kb']} KB average, {args.rounds} rounds")
+    for name, metrics in report['parsers'].items():
+        print(f"⚡ {name:15} {metrics['pages_per_sec']:8.1f} pages/s  "
+              f"p50 {metrics['latency_ms']['p50']:8.2f} ms  p95 {metrics['latency_ms']['p95']:8.2f} ms  "
+              f"peak {metrics['peak_python_memory_mb']:7.1f} MB  fields {metrics['total_fields']:6.1f}")
+    for name, change in report.get('compared_to', {}).get('change_percent', {}).items():
+        print(f"📊 {name:15} pages/s {change['pages_per_sec']:+.1f}%  p95 {change['p95_ms']:+.1f}%  "
+              f"memory {change['peak_python_memory_mb']:+.1f}%  fields {change['total_fields']:+.1f}%")
+    print(f"💾 Report saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Pattern Bank - Field patterns compiled once, with a keyword prefilter over the page text
+Each field keeps its first-match-wins pattern order; patterns whose required literals are
+absent from the page are never run
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from page_text import PageText
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse
+    import sre_constants
+
+
+def required_literals(pattern: str, flags: int = 0) -> Tuple[str, ...]:
+    """
+    Literal runs every match of the pattern must contain
+
+    Only mandatory parts of the pattern contribute: alternations, classes, optional and
+    zero-minimum repeats break a run and are skipped. Returns () when nothing is required.
+    """
+    parsed = sre_parse.parse(pattern, flags)
+    if (parsed.state.flags ^ flags) & re.IGNORECASE:
+        # An inline (?i) changes which haystack the literals belong in; don't prefilter
+        return ()
+
+    ignorecase = bool(flags & re.IGNORECASE)
+    runs: List[str] = []
+    repeats = tuple(getattr(sre_constants, name) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                    if hasattr(sre_constants, name))
+
+    def walk(items):
+        current = []
+        for op, arg in items:
+            # Non-ASCII case folding (e.g. final sigma) is not plain lowercasing; treat as a gap
+            if op is sre_constants.LITERAL and (arg < 128 or not ignorecase):
+                current.append(chr(arg))
+                continue
+            if current:
+                runs.append(''.join(current))
+                current = []
+            if op is sre_constants.SUBPATTERN:
+                # Scoped (?i:...) / (?-i:...) groups would need the other haystack; skip them
+                if not (arg[1] | arg[2]) & re.IGNORECASE:
+                    walk(arg[-1])
+            elif op in repeats and arg[0] >= 1:
+                walk(arg[2])
+        if current:
+            runs.append(''.join(current))
+
+    walk(parsed)
+    if ignorecase:
+        runs = [run.lower() for run in runs]
+    # Longest first so the most selective check rejects a pattern soonest
+    return tuple(sorted(set(runs), key=lambda run: (-len(run), run)))
+
+
+class PatternBank:
+    """Named fields, each an ordered list of regex patterns, compiled once"""
+
+    def __init__(self, fields: Dict[str, List[str]], flags: int = re.IGNORECASE):
+        """
+        Args:
+            fields: Field name to patterns in priority order
+            flags: Compile flags shared by every pattern
+        """
+        self.flags = flags
+        self.fields: Dict[str, List[Tuple[re.Pattern, Tuple[str, ...]]]] = {
+            field: [(re.compile(pattern, flags), required_literals(pattern, flags)) for pattern in patterns]
+            for field, patterns in fields.items()
+        }
+
+    def scan(self, page: Union[PageText, str]) -> 'PageScan':
+        """Bind the bank to one page; pass a PageText to share its lowercased views with other scans"""
+        return PageScan(self, PageText.of(page))
+
+
+class PageScan:
+    """Lazy per-page view of a PatternBank; literal checks are shared across fields"""
+
+    def __init__(self, bank: PatternBank, page: PageText):
+        self.bank = bank
+        self.page = page
+        self.text = page.raw
+        self._present: Dict[str, bool] = {}
+
+    @property
+    def folded(self) -> str:
+        """Text the prefilter looks for required literals in"""
+        return self.page.folded if self.bank.flags & re.IGNORECASE else self.text
+
+    def _may_match(self, literals: Tuple[str, ...]) -> bool:
+        for literal in literals:
+            present = self._present.get(literal)
+            if present is None:
+                present = self._present[literal] = literal in self.folded
+            if not present:
+                return False
+        return True
+
+    def matches(self, field: str) -> Iterator[re.Match]:
+        """Leftmost match of each pattern that matches, in the field's priority order"""
+        for compiled, literals in self.bank.fields[field]:
+            if literals and not self._may_match(literals):
+                continue
+            match = compiled.search(self.text)
+            if match:
+                yield match
+
+    def first(self, field: str) -> Optional[re.Match]:
+        """Match of the first pattern that matches, like looping re.search until one hits"""
+        return next(self.matches(field), None)
+
+    def findall(self, field: str) -> List:
+        """re.findall results of every pattern, concatenated in priority order"""
+        found = []
+        for compiled, literals in self.bank.fields[field]:
+            if literals and not self._may_match(literals):
+                continue
+            found.extend(compiled.findall(self.text))
+        return found
+
+    def contains(self, keyword: str) -> bool:
+        """keyword.lower() in text.lower(), without lowering the page again"""
+        return self.page.contains(keyword)
@@ -10,6 +10,10 @@ import requests
 from datetime import datetime
 from typing import Dict, Any, List
 from bs4 import BeautifulSoup
+from http_session import ThreadLocalSessions
+from http_cache import get_http_cache
+from result_cache import get_result_cache
+from page_text import PageText
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -18,16 +22,28 @@ logger = logging.getLogger(__name__)
 class PerfectDeValkParser:
     """Perfect De Valk parser with zero extraction issues"""
     
+    PARSER_VERSION = '2.0.0'
+    
     def __init__(self):
         """Initialize the perfect parser"""
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-thread sessions over a shared connection pool so one instance is safe across threads
+        self._sessions = ThreadLocalSessions({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
+        # Conditional-GET cache so unchanged pages skip download and re-parse
+        self.http_cache = get_http_cache()
+        # Content-hash cache so byte-identical pages skip the re-parse
+        self.result_cache = get_result_cache()
+        
         # Pre-compiled regex patterns for performance
         self.patterns = self._compile_patterns()
     
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session owned by the calling thread"""
+        return self._sessions.session
+    
     def _compile_patterns(self) -> Dict[str, List[re.Pattern]]:
         """Compile all regex patterns for performance"""
         return {
@@ -119,15 +135,28 @@ class PerfectDeValkParser:
             if not response:
                 return {'error': 'Failed to fetch page', 'source_url': url}
             
+            # Reuse a stored result when the page is unchanged (304) or byte-identical to one already parsed
+            cache_key = self.result_cache.make_key(response.content, self.PARSER_VERSION)
+            cached_result = self.http_cache.get_parsed(response, self.PARSER_VERSION) if self.http_cache else None
+            if cached_result is None:
+                cached_result = self.result_cache.get(cache_key)
+                if cached_result and self.http_cache:
+                    self.http_cache.store(url, response, cached_result, self.PARSER_VERSION)
+            if cached_result:
+                cached_result['source_url'] = url
+                cached_result['scraped_at'] = datetime.now().isoformat()
+                return cached_result
+            
             # Parse with BeautifulSoup
             soup = BeautifulSoup(response.content, 'html.parser')
+            page = PageText(soup)
             
             # Extract data with comprehensive coverage
             data = {
                 'source_url': url,
                 'scraped_at': datetime.now().isoformat(),
                 'source': 'devalk_perfect',
-                'parser_version': '2.0.0'
+                'parser_version': self.PARSER_VERSION
             }
             
             # Extract all sections with error handling
@@ -144,13 +173,18 @@ class PerfectDeValkParser:
             
             for section_extractor in sections:
                 try:
-                    section_data = section_extractor(soup)
+                    section_data = section_extractor(page)
                     data.update(section_data)
                 except Exception as e:
                     logger.warning(f"⚠️ Section extraction failed: {e}")
                     # Continue with other sections instead of failing completely
             
             logger.info(f"✅ Perfect De Valk parsing completed successfully")
+            
+            self.result_cache.put(cache_key, data)
+            if self.http_cache:
+                self.http_cache.store(url, response, data, self.PARSER_VERSION)
+            
             return data
             
         except Exception as e:
@@ -161,7 +195,10 @@ class PerfectDeValkParser:
         """Fetch page with retry logic for reliability"""
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, timeout=30)
+                if self.http_cache:
+                    response = self.http_cache.get(self.session, url, timeout=30)
+                else:
+                    response = self.session.get(url, timeout=30)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
@@ -193,12 +230,12 @@ class PerfectDeValkParser:
         
         return default
     
-    def _extract_key_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_key_details(self, page: PageText) -> Dict[str, Any]:
         """Extract key details with zero failure rate"""
         key_details = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract dimensions using multiple patterns
             dimensions = self._extract_with_patterns(page_text, 'dimensions')
@@ -243,13 +280,13 @@ class PerfectDeValkParser:
                 logger.info(f"✅ Price: € {price}")
             
             # Extract additional key details
-            if 'lying' in page_text.lower():
+            if 'lying' in page.lower:
                 key_details['lying'] = 'At sales office'
-            if 'sales office' in page_text.lower():
+            if 'sales office' in page.lower:
                 key_details['salesOffice'] = 'De Valk'
-            if 'for sale' in page_text.lower():
+            if 'for sale' in page.lower:
                 key_details['status'] = 'For Sale'
-            if 'vat' in page_text.lower():
+            if 'vat' in page.lower:
                 key_details['vat'] = 'Paid'
             
         except Exception as e:
@@ -257,15 +294,15 @@ class PerfectDeValkParser:
         
         return {'keyDetails': key_details}
     
-    def _extract_general_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_general_info(self, page: PageText) -> Dict[str, Any]:
         """Extract general info with comprehensive coverage"""
         general_info = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract model from title
-            title = soup.find('title')
+            title = page.soup.find('title')
             if title:
                 title_text = title.get_text().strip()
                 if 'De Valk' in title_text:
@@ -324,11 +361,11 @@ class PerfectDeValkParser:
                 logger.info(f"✅ Ballast: {ballast}")
             
             # Extract yacht type
-            if 'sailing yacht' in page_text.lower():
+            if 'sailing yacht' in page.lower:
                 general_info['yachtType'] = 'Monohull sailing yacht'
-            elif 'motor yacht' in page_text.lower():
+            elif 'motor yacht' in page.lower:
                 general_info['yachtType'] = 'Motor yacht'
-            elif 'catamaran' in page_text.lower():
+            elif 'catamaran' in page.lower:
                 general_info['yachtType'] = 'Catamaran'
             
         except Exception as e:
@@ -336,12 +373,12 @@ class PerfectDeValkParser:
         
         return {'generalInfo': general_info}
     
-    def _extract_accommodation(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_accommodation(self, page: PageText) -> Dict[str, Any]:
         """Extract accommodation with comprehensive coverage"""
         accommodation = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract cabins
             cabins = self._extract_with_patterns(page_text, 'cabins')
@@ -356,27 +393,27 @@ class PerfectDeValkParser:
                 logger.info(f"✅ Berths: {berths}")
             
             # Extract interior materials
-            if 'teak' in page_text.lower():
+            if 'teak' in page.lower:
                 accommodation['interior'] = 'Teak'
-            elif 'mahogany' in page_text.lower():
+            elif 'mahogany' in page.lower:
                 accommodation['interior'] = 'Mahogany'
-            elif 'oak' in page_text.lower():
+            elif 'oak' in page.lower:
                 accommodation['interior'] = 'Oak'
             
             # Extract layout
-            if 'classic' in page_text.lower():
+            if 'classic' in page.lower:
                 accommodation['layout'] = 'Classic'
-            elif 'modern' in page_text.lower():
+            elif 'modern' in page.lower:
                 accommodation['layout'] = 'Modern'
-            elif 'contemporary' in page_text.lower():
+            elif 'contemporary' in page.lower:
                 accommodation['layout'] = 'Contemporary'
             
             # Extract floor
-            if 'teak and holly' in page_text.lower():
+            if 'teak and holly' in page.lower:
                 accommodation['floor'] = 'Teak and holly'
-            elif 'teak' in page_text.lower():
+            elif 'teak' in page.lower:
                 accommodation['floor'] = 'Teak'
-            elif 'wood' in page_text.lower():
+            elif 'wood' in page.lower:
                 accommodation['floor'] = 'Wood'
             
             # Extract additional features
@@ -401,15 +438,15 @@ class PerfectDeValkParser:
             ]
             
             for field, text in features:
-                if text in page_text.lower():
+                if text in page.lower:
                     accommodation[field] = 'Yes'
                     logger.info(f"✅ {field}: Yes")
             
             # Extract specific heating types
-            if 'webasto' in page_text.lower():
+            if 'webasto' in page.lower:
                 accommodation['heating'] = 'Webasto diesel heater'
                 logger.info(f"✅ Heating: Webasto diesel heater")
-            elif 'diesel heater' in page_text.lower():
+            elif 'diesel heater' in page.lower:
                 accommodation['heating'] = 'Diesel heater'
                 logger.info(f"✅ Heating: Diesel heater")
             
@@ -424,12 +461,12 @@ class PerfectDeValkParser:
         
         return {'accommodation': accommodation}
     
-    def _extract_machinery(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_machinery(self, page: PageText) -> Dict[str, Any]:
         """Extract machinery with comprehensive coverage"""
         machinery = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract engine count and type
             engines = self._extract_with_patterns(page_text, 'engines')
@@ -439,13 +476,13 @@ class PerfectDeValkParser:
                 logger.info(f"✅ Engine: {engines}")
             
             # Extract engine make
-            if 'volvo' in page_text.lower():
+            if 'volvo' in page.lower:
                 machinery['make'] = 'Volvo Penta'
-            elif 'yanmar' in page_text.lower():
+            elif 'yanmar' in page.lower:
                 machinery['make'] = 'Yanmar'
-            elif 'perkins' in page_text.lower():
+            elif 'perkins' in page.lower:
                 machinery['make'] = 'Perkins'
-            elif 'cummins' in page_text.lower():
+            elif 'cummins' in page.lower:
                 machinery['make'] = 'Cummins'
             
             # Extract power with enhanced patterns
@@ -490,11 +527,11 @@ class PerfectDeValkParser:
                 logger.info(f"✅ Consumption: {consumption_match.group(1)} l/hr")
             
             # Extract fuel type
-            if 'diesel' in page_text.lower():
+            if 'diesel' in page.lower:
                 machinery['fuel'] = 'Diesel'
-            elif 'petrol' in page_text.lower():
+            elif 'petrol' in page.lower:
                 machinery['fuel'] = 'Petrol'
-            elif 'gasoline' in page_text.lower():
+            elif 'gasoline' in page.lower:
                 machinery['fuel'] = 'Gasoline'
             
             # Extract year installed
@@ -519,7 +556,7 @@ class PerfectDeValkParser:
             ]
             
             for field, text in features:
-                if text in page_text.lower():
+                if text in page.lower:
                     machinery[field] = 'Yes'
                     logger.info(f"✅ {field}: Yes")
             
@@ -528,12 +565,12 @@ class PerfectDeValkParser:
         
         return {'machinery': machinery}
     
-    def _extract_navigation(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_navigation(self, page: PageText) -> Dict[str, Any]:
         """Extract navigation equipment"""
         navigation = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract navigation equipment
             equipment = [
@@ -554,7 +591,7 @@ class PerfectDeValkParser:
             ]
             
             for field, text in equipment:
-                if text in page_text.lower():
+                if text in page.lower:
                     navigation[field] = 'Yes'
                     logger.info(f"✅ {field}: Yes")
             
@@ -563,12 +600,12 @@ class PerfectDeValkParser:
         
         return {'navigation': navigation}
     
-    def _extract_equipment(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_equipment(self, page: PageText) -> Dict[str, Any]:
         """Extract deck and safety equipment"""
         equipment = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract equipment
             items = [
@@ -596,7 +633,7 @@ class PerfectDeValkParser:
             ]
             
             for field, text in items:
-                if text in page_text.lower():
+                if text in page.lower:
                     equipment[field] = 'Yes'
                     logger.info(f"✅ {field}: Yes")
             
@@ -605,36 +642,36 @@ class PerfectDeValkParser:
         
         return {'equipment': equipment}
     
-    def _extract_rigging(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_rigging(self, page: PageText) -> Dict[str, Any]:
         """Extract rigging and sail information"""
         rigging = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract rigging type
-            if 'sloop' in page_text.lower():
+            if 'sloop' in page.lower:
                 rigging['rigging'] = 'Sloop'
-            elif 'cutter' in page_text.lower():
+            elif 'cutter' in page.lower:
                 rigging['rigging'] = 'Cutter'
-            elif 'ketch' in page_text.lower():
+            elif 'ketch' in page.lower:
                 rigging['rigging'] = 'Ketch'
-            elif 'yawl' in page_text.lower():
+            elif 'yawl' in page.lower:
                 rigging['rigging'] = 'Yawl'
             
             # Extract standing rigging
-            if 'standing rigging' in page_text.lower():
+            if 'standing rigging' in page.lower:
                 rigging['standingRigging'] = 'Wire'
             
             # Extract mast information
-            if 'selden' in page_text.lower():
+            if 'selden' in page.lower:
                 rigging['brandMast'] = 'Seldén'
-            elif 'hall' in page_text.lower():
+            elif 'hall' in page.lower:
                 rigging['brandMast'] = 'Hall'
             
-            if 'aluminium' in page_text.lower():
+            if 'aluminium' in page.lower:
                 rigging['materialMast'] = 'Aluminium'
-            elif 'carbon' in page_text.lower():
+            elif 'carbon' in page.lower:
                 rigging['materialMast'] = 'Carbon'
             
             # Extract sails
@@ -647,12 +684,12 @@ class PerfectDeValkParser:
             ]
             
             for field, text in sails:
-                if text in page_text.lower():
+                if text in page.lower:
                     rigging[field] = 'Yes'
                     logger.info(f"✅ {field}: Yes")
             
             # Extract winches
-            if 'winch' in page_text.lower():
+            if 'winch' in page.lower:
                 rigging['primarySheetWinch'] = 'Yes'
                 rigging['secondarySheetWinch'] = 'Yes'
                 rigging['halyardWinches'] = 'Yes'
@@ -662,12 +699,12 @@ class PerfectDeValkParser:
         
         return {'rigging': rigging}
     
-    def _extract_indication_ratios(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_indication_ratios(self, page: PageText) -> Dict[str, Any]:
         """Extract yacht performance ratios"""
         ratios = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract performance ratios with enhanced patterns
             ratio_patterns = [
@@ -701,7 +738,7 @@ class PerfectDeValkParser:
             if not ratios:
                 # Look for comfort ratio in different formats
                 comfort_match = re.search(r'(\d+\.?\d*)', page_text)
-                if comfort_match and 'comfort' in page_text.lower():
+                if comfort_match and 'comfort' in page.lower:
                     ratios['comfortRatio'] = comfort_match.group(1)
                     logger.info(f"✅ Comfort ratio: {comfort_match.group(1)}")
             
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Prompt Builder - Packs the highest-value regions of a listing page into an LLM token budget
+Specification blocks (tableBox, modeBox, accordion bodies) go in first; navigation and footer boilerplate never do
+"""
+
+import os
+import re
+import logging
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
+
+from devalk_sections import parse_html, NON_TEXT_TAGS
+
+try:
+    import tiktoken
+except ImportError:  # listed in requirements.txt; the estimate only covers environments without it
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_BUDGET = int(os.getenv('LLM_PROMPT_TOKEN_BUDGET', '2000'))
+# Fallback when tiktoken cannot be imported or its encoding cannot be loaded; close to GPT tokenizers on English/Dutch listing text
+CHARS_PER_TOKEN = 4
+
+# Never sent: site chrome and non-content markup
+BOILERPLATE_TAGS = {'nav', 'header', 'footer', 'aside', 'form', 'noscript', 'svg', 'iframe', 'button'} | set(NON_TEXT_TAGS)
+# Elements rendered as one line each (plus label/value wrappers such as De Valk's tableBox div.item)
+UNIT_TAGS = {'li', 'p', 'tr', 'dt', 'dd', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'td', 'th', 'label'}
+UNIT_CLASSES = {'item'}
+BLOCK_TAGS = {'div', 'section', 'article', 'main', 'ul', 'ol', 'table', 'dl', 'br'}
+
+# (priority, label, predicate on an lxml element); lower priority is packed first
+_PRICE_CLASS = re.compile(r'price', re.IGNORECASE)
+REGION_RULES = [
+    (0, 'Title', lambda el: el.tag in ('title', 'h1')),
+    (1, 'Key facts', lambda el: 'tableBox' in _classes(el)),
+    (1, 'Price', lambda el: el.tag in ('div', 'span', 'p') and bool(_PRICE_CLASS.search(el.get('class') or ''))),
+    (2, 'Specifications', lambda el: 'modeBox' in _classes(el)),
+    (3, None, lambda el: 'accordion-item' in _classes(el)),
+    (4, 'Description', lambda el: el.tag == 'meta' and (el.get('name') or '').lower() == 'description'),
+]
+FALLBACK_PRIORITY = 5
+# Set on region roots in the builder's own parse tree so the fallback text skips them
+_CLAIMED = 'data-prompt-region'
+
+
+def _classes(element) -> List[str]:
+    return (element.get('class') or '').split()
+
+
+_tokenizer_warned = False
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """tiktoken encoding for a model, or None when tiktoken is missing or its BPE file can't be loaded"""
+    global _tokenizer_warned
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        # The BPE file is downloaded on first use; offline hosts without TIKTOKEN_CACHE_DIR end up here
+        if not _tokenizer_warned:
+            _tokenizer_warned = True
+            logger.warning(f"⚠️ Could not load the tiktoken encoding ({e}); estimating {CHARS_PER_TOKEN} chars per token")
+        return None
+
+
+def count_tokens(text: str, model: str = 'gpt-4') -> int:
+    """Tokens the model will see for this text (tiktoken when its encoding loads, else an estimate)"""
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = 'gpt-4') -> str:
+    """Longest prefix of text that fits in max_tokens"""
+    if max_tokens <= 0:
+        return ''
+    encoding = _encoding(model)
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+    return text[:max_tokens * CHARS_PER_TOKEN]
+
+
+def _spaced_text(node) -> str:
+    """Text of an element with its pieces space-separated (get_text() would glue label and value)"""
+    parts = []
+
+    def add(text):
+        text = ' '.join(text.split())
+        # tableBox items repeat their label in the first li
+        if text and (not parts or parts[-1] != text):
+            parts.append(text)
+
+    def walk(element):
+        if element.tag in NON_TEXT_TAGS:
+            return
+        if element.text:
+            add(element.text)
+        for child in element:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail:
+                add(child.tail)
+
+    walk(node)
+    return ' '.join(parts)
+
+
+def _region_lines(element) -> List[str]:
+    """One line per list item, row, paragraph or heading; loose text is grouped per block"""
+    lines: List[str] = []
+    buffer: List[str] = []
+
+    def flush():
+        if buffer:
+            lines.append(' '.join(' '.join(buffer).split()))
+            buffer.clear()
+
+    def walk(node):
+        if node.tag in BOILERPLATE_TAGS or node.get(_CLAIMED):
+            return
+        if node.tag in UNIT_TAGS or UNIT_CLASSES.intersection(_classes(node)):
+            flush()
+            text = _spaced_text(node)
+            if text:
+                lines.append(text)
+            return
+        if node.text and node.text.strip():
+            buffer.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail and child.tail.strip():
+                buffer.append(child.tail)
+        if node.tag in BLOCK_TAGS:
+            flush()
+
+    walk(element)
+    flush()
+    return lines
+
+
+class PromptBuilder:
+    """Selects and packs page regions by priority until the token budget is used"""
+
+    def __init__(self, token_budget: Optional[int] = None, model: str = 'gpt-4'):
+        """
+        Args:
+            token_budget: Maximum tokens of page content in the prompt
+            model: Model whose tokenizer counts the budget
+        """
+        self.token_budget = token_budget or DEFAULT_TOKEN_BUDGET
+        self.model = model
+
+    def regions(self, html: str) -> List[Tuple[int, str, List[str]]]:
+        """(priority, label, lines) for each useful region, in packing order"""
+        root = parse_html(html) if re.search(r'<[a-zA-Z!]', html or '') else None
+        if root is None:
+            # Plain text: sentences in reading order
+            sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+|\n+', html or '') if s.strip()]
+            return [(FALLBACK_PRIORITY, 'Page text', sentences)] if sentences else []
+
+        found = []
+        for order, element in enumerate(root.iter()):
+            if not isinstance(element.tag, str) or any(a.get(_CLAIMED) for a in element.iterancestors()):
+                continue
+            for priority, label, matches in REGION_RULES:
+                if not matches(element):
+                    continue
+                if element.tag == 'meta':
+                    lines = [' '.join((element.get('content') or '').split())]
+                else:
+                    lines = _region_lines(element)
+                if label is None:
+                    # Accordion items are labelled by their own button
+                    heading = next(element.iter('button'), None)
+                    label = _spaced_text(heading) if heading is not None else 'Details'
+                    lines = [line for line in lines if line != label]
+                found.append((priority, order, label, [line for line in lines if line]))
+                element.set(_CLAIMED, '1')
+                break
+
+        body = root.find('body')
+        has_specifications = any(0 < region[0] < FALLBACK_PRIORITY - 1 for region in found)
+        if body is not None and not has_specifications:
+            # Unknown layout: whatever the page says, minus the regions above and the boilerplate
+            found.append((FALLBACK_PRIORITY, len(found) + 10 ** 9, 'Other page text', _region_lines(body)))
+
+        found.sort(key=lambda region: (region[0], region[1]))
+        return [(priority, label, lines) for priority, _, label, lines in found if lines]
+
+    def build(self, html: str) -> str:
+        """
+        Page content for a prompt, highest-value regions first, within the token budget
+
+        Args:
+            html: Page HTML (plain text is accepted and packed sentence by sentence)
+
+        Returns:
+            Labelled region text, e.g. "[Key facts]\\nLength 16.72 m\\n..."
+        """
+        remaining = self.token_budget
+        seen: Set[str] = set()
+        blocks = []
+        for _, label, lines in self.regions(html):
+            header = f"[{label}]"
+            header_tokens = count_tokens(header, self.model) + 1
+            if remaining <= header_tokens:
+                break
+            kept = []
+            budget = remaining - header_tokens
+            for line in lines:
+                if line in seen:
+                    continue
+                cost = count_tokens(line, self.model) + 1
+                if cost > budget:
+                    # A long single line (e.g. a description) is cut rather than dropped
+                    if not kept and budget > 16:
+                        kept.append(truncate_to_tokens(line, budget - 1, self.model))
+                        budget = 0
+                    break
+                kept.append(line)
+                seen.add(line)
+                budget -= cost
+            if kept:
+                blocks.append('\n'.join([header] + kept))
+                remaining = budget
+            if budget <= 0:
+                break
+
+        prompt_text = '\n\n'.join(blocks)
+        logger.debug(f"🧩 Packed {len(blocks)} regions into {self.token_budget - remaining}/{self.token_budget} tokens")
+        return prompt_text
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Render Classifier - Learns per domain and URL template whether static HTML carries the listing fields
+Samples a few pages both ways, then persists the decision so later pages skip headless Chrome when it adds nothing
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import threading
+from typing import Dict, Any, Iterable, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DECISIONS_PATH = os.getenv('RENDER_DECISIONS_PATH', 'render_decisions.json')
+DEFAULT_SAMPLE_SIZE = int(os.getenv('RENDER_SAMPLE_SIZE', '3'))
+DEFAULT_STATIC_RATIO = float(os.getenv('RENDER_STATIC_RATIO', '0.95'))
+DEFAULT_DECISION_TTL_DAYS = float(os.getenv('RENDER_DECISION_TTL_DAYS', '30'))
+CLASSIFIER_ENABLED = os.getenv('RENDER_CLASSIFIER_ENABLED', 'true').lower() == 'true'
+
+STATIC = 'static'
+RENDER = 'render'
+SAMPLE = 'sample'
+
+# Path segments that identify one listing rather than a page type
+_ID_SEGMENT = re.compile(r'\d')
+
+
+def url_template(url: str) -> str:
+    """Domain plus path with listing-specific segments replaced, e.g. devalk.nl/en/yachtbrokerage/{id}/"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    segments = ['{id}' if _ID_SEGMENT.search(segment) else segment.lower() for segment in parts.path.split('/')]
+    return host + ('/'.join(segments) or '/')
+
+
+class RenderClassifier:
+    """Per-template static/render decisions learned from paired static and rendered extractions"""
+
+    def __init__(self, path: Optional[str] = None, sample_size: Optional[int] = None,
+                 static_ratio: Optional[float] = None, ttl_days: Optional[float] = None):
+        """
+        Args:
+            path: JSON file the decisions persist to (None uses RENDER_DECISIONS_PATH, '' keeps them in memory)
+            sample_size: Pages compared before a template is declared static
+            static_ratio: Share of the rendered fields static HTML must also yield on every sample
+            ttl_days: Age after which a decision is sampled again (sites change)
+        """
+        self.path = DEFAULT_DECISIONS_PATH if path is None else path
+        self.sample_size = max(1, sample_size or DEFAULT_SAMPLE_SIZE)
+        self.static_ratio = DEFAULT_STATIC_RATIO if static_ratio is None else static_ratio
+        self.ttl_seconds = (DEFAULT_DECISION_TTL_DAYS if ttl_days is None else ttl_days) * 24 * 3600
+        self._lock = threading.Lock()
+        self._templates: Dict[str, Dict[str, Any]] = self._load()
+
+    def decide(self, url: str) -> str:
+        """'static' (skip the browser), 'render' (static HTML falls short) or 'sample' (still learning)"""
+        with self._lock:
+            entry = self._templates.get(url_template(url))
+            if not entry or not entry.get('decision'):
+                return SAMPLE
+            if time.time() - entry.get('decided_at', 0) > self.ttl_seconds:
+                return SAMPLE
+            return entry['decision']
+
+    def record(self, url: str, static_fields: Iterable[str], rendered_fields: Iterable[str]) -> str:
+        """
+        Record one page extracted both ways
+
+        Args:
+            url: Page URL
+            static_fields: Field names extracted from the static HTML
+            rendered_fields: Field names extracted from the rendered DOM
+
+        Returns:
+            The template's decision after this sample
+        """
+        template = url_template(url)
+        rendered = set(rendered_fields)
+        coverage = len(rendered & set(static_fields)) / len(rendered) if rendered else 1.0
+
+        with self._lock:
+            entry = self._templates.get(template)
+            if not entry or (entry.get('decision') and time.time() - entry.get('decided_at', 0) > self.ttl_seconds):
+                entry = self._templates[template] = {'samples': 0, 'min_coverage': 1.0, 'decision': None}
+            entry['samples'] += 1
+            entry['min_coverage'] = round(min(entry['min_coverage'], coverage), 3)
+
+            if entry['min_coverage'] < self.static_ratio:
+                # One page that needs the browser is enough to keep rendering this template
+                decision = RENDER
+            elif entry['samples'] >= self.sample_size:
+                decision = STATIC
+            else:
+                decision = None
+            if decision and decision != entry.get('decision'):
+                entry['decision'] = decision
+                entry['decided_at'] = time.time()
+                logger.info(f"🧭 {template}: {decision} after {entry['samples']} samples "
+                            f"(static coverage {entry['min_coverage']:.0%})")
+            self._save()
+            return entry.get('decision') or SAMPLE
+
+    def decisions(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of every template's samples and decision"""
+        with self._lock:
+            return {template: dict(entry) for template, entry in self._templates.items()}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path:
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ Could not read render decisions from {self.path}: {e}")
+            return {}
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._templates, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write render decisions to {self.path}: {e}")
+
+
+_shared_classifier: Optional[RenderClassifier] = None
+_shared_classifier_lock = threading.Lock()
+
+
+def get_render_classifier() -> Optional[RenderClassifier]:
+    """Return the process-wide render classifier, or None when RENDER_CLASSIFIER_ENABLED=false"""
+    global _shared_classifier
+    if not CLASSIFIER_ENABLED:
+        return None
+    with _shared_classifier_lock:
+        if _shared_classifier is None:
+            _shared_classifier = RenderClassifier()
+        return _shared_classifier
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Replay Transport - Record/replay layer underneath the scrapers' requests sessions
+SCRAPER_HTTP_MODE=record captures live responses to a gzip fixture store; replay serves them offline
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import base64
+import random
+import hashlib
+import logging
+import argparse
+import threading
+from typing import Dict, Any, Optional, List
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# live (default), record or replay
+HTTP_MODE = os.getenv('SCRAPER_HTTP_MODE', 'live').lower()
+DEFAULT_FIXTURE_DIR = os.getenv('SCRAPER_FIXTURE_DIR', 'http_fixtures')
+DEFAULT_LATENCY_MS = float(os.getenv('SCRAPER_REPLAY_LATENCY_MS', '0'))
+DEFAULT_JITTER_MS = float(os.getenv('SCRAPER_REPLAY_JITTER_MS', '0'))
+
+# requests has already decoded the body, so these no longer describe what we store
+DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie')
+
+
+class FixtureStore:
+    """One gzip-compressed JSON file per recorded request, keyed by method and URL"""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or DEFAULT_FIXTURE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def key(method: str, url: str) -> str:
+        return hashlib.sha256(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
+
+    def _path(self, method: str, url: str) -> str:
+        return os.path.join(self.directory, self.key(method, url) + '.json.gz')
+
+    def load(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        """Recorded entry for a request, or None"""
+        try:
+            with gzip.open(self._path(method, url), 'rt', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, method: str, url: str, status_code: int, headers: Dict[str, str], body: bytes):
+        """Write one entry atomically so concurrent recorders never leave a torn file"""
+        entry = {
+            'method': method.upper(),
+            'url': url,
+            'status_code': status_code,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+            'body': base64.b64encode(body).decode('ascii'),
+            'recorded_at': time.time(),
+        }
+        path = self._path(method, url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def save_page(self, url: str, html: str):
+        """Store an HTML page as a 200 GET response (used to seed the store from rendered fixtures)"""
+        self.save('GET', url, 200, {'Content-Type': 'text/html; charset=utf-8'}, html.encode('utf-8'))
+
+    def urls(self) -> List[str]:
+        """Recorded URLs, for listing what a replay run can serve"""
+        urls = []
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith('.json.gz'):
+                continue
+            try:
+                with gzip.open(os.path.join(self.directory, name), 'rt', encoding='utf-8') as f:
+                    urls.append(json.load(f)['url'])
+            except (OSError, ValueError, KeyError):
+                continue
+        return urls
+
+
+def _build_response(request, entry: Dict[str, Any]) -> requests.Response:
+    response = requests.Response()
+    response.url = request.url
+    response.request = request
+    response.status_code = entry['status_code']
+    response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+    response._content = base64.b64decode(entry['body'])
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+    response.reason = 'OK' if response.status_code < 400 else 'Replayed'
+    return response
+
+
+class RecordingAdapter(BaseAdapter):
+    """Sends requests to the network and saves every response into the fixture store"""
+
+    def __init__(self, store: FixtureStore, adapter: Optional[BaseAdapter] = None, pool_size: Optional[int] = None):
+        """
+        Args:
+            store: Fixture store the responses are saved into
+            adapter: Adapter doing the real requests (default: one pooled like ThreadLocalSessions')
+            pool_size: Pooled connections per host for the default adapter (default HTTP_POOL_SIZE)
+        """
+        super().__init__()
+        self.store = store
+        if adapter is None:
+            # Imported here: http_session imports this module for get_transport()
+            from http_session import DEFAULT_POOL_SIZE
+            pool_size = max(1, pool_size or DEFAULT_POOL_SIZE)
+            # Every thread's session records through this adapter, so it needs the same pool as live mode
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.adapter = adapter
+        self.recorded = 0
+
+    def send(self, request, **kwargs):
+        response = self.adapter.send(request, **kwargs)
+        if response.status_code == 304:
+            # A revalidation carries no body; the earlier 200 stays in the store
+            return response
+        try:
+            self.store.save(request.method, request.url, response.status_code, response.headers, response.content)
+            self.recorded += 1
+            logger.debug(f"📼 Recorded {request.method} {request.url}")
+        except OSError as e:
+            logger.warning(f"⚠️ Could not record {request.url}: {e}")
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Serves recorded responses with optional artificial latency; unknown URLs fail like a dead network"""
+
+    def __init__(self, store: FixtureStore, latency_ms: Optional[float] = None, jitter_ms: Optional[float] = None):
+        """
+        Args:
+            store: Fixture store to serve from
+            latency_ms: Delay added to every response, to mimic the real site under load
+            jitter_ms: Uniform random extra delay on top of latency_ms
+        """
+        super().__init__()
+        self.store = store
+        self.latency_ms = DEFAULT_LATENCY_MS if latency_ms is None else latency_ms
+        self.jitter_ms = DEFAULT_JITTER_MS if jitter_ms is None else jitter_ms
+        self._lock = threading.Lock()
+        self.stats = {'served': 0, 'missing': 0}
+
+    def send(self, request, **kwargs):
+        entry = self.store.load(request.method, request.url)
+        if entry is None:
+            with self._lock:
+                self.stats['missing'] += 1
+            raise requests.ConnectionError(f"No recorded fixture for {request.method} {request.url}", request=request)
+
+        delay = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        with self._lock:
+            self.stats['served'] += 1
+        return _build_response(request, entry)
+
+    def close(self):
+        pass
+
+
+def create_transport(mode: Optional[str] = None, directory: Optional[str] = None) -> Optional[BaseAdapter]:
+    """Adapter for a mode ('live' returns None so the normal connection pool is used)"""
+    mode = (mode or HTTP_MODE).lower()
+    if mode == 'live':
+        return None
+    if mode == 'record':
+        logger.info(f"📼 Recording HTTP responses to {directory or DEFAULT_FIXTURE_DIR}")
+        return RecordingAdapter(FixtureStore(directory))
+    if mode == 'replay':
+        logger.info(f"📼 Replaying HTTP responses from {directory or DEFAULT_FIXTURE_DIR}")
+        return ReplayAdapter(FixtureStore(directory))
+    raise ValueError(f"Unknown SCRAPER_HTTP_MODE: {mode}")
+
+
+_shared_transport: Optional[BaseAdapter] = None
+_shared_transport_ready = False
+_shared_transport_lock = threading.Lock()
+
+
+def get_transport() -> Optional[BaseAdapter]:
+    """Return the process-wide transport for SCRAPER_HTTP_MODE, or None in live mode"""
+    global _shared_transport, _shared_transport_ready
+    with _shared_transport_lock:
+        if not _shared_transport_ready:
+            _shared_transport = create_transport()
+            _shared_transport_ready = True
+        return _shared_transport
+
+
+def mount_transport(session: requests.Session, transport: Optional[BaseAdapter] = None):
+    """Route a plain session's http(s) traffic through the record/replay transport, if one is active"""
+    transport = transport or get_transport()
+    if transport is not None:
+        session.mount('https://', transport)
+        session.mount('http://', transport)
+    return session
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument('command', choices=['seed', 'list'],
+                            help='seed: store the rendered De Valk fixture corpus; list: show recorded URLs')
+    arg_parser.add_argument('--dir', default=None, help='Fixture directory (default SCRAPER_FIXTURE_DIR)')
+    arg_parser.add_argument('--padding-kb', type=int, default=120, help='Boilerplate size per seeded page')
+    args = arg_parser.parse_args()
+
+    store = FixtureStore(args.dir)
+    if args.command == 'seed':
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        from devalk_fixtures import build_fixture_site
+        site = build_fixture_site(padding_kb=args.padding_kb)
+        for url, html in site.items():
+            store.save_page(url, html)
+        print(f"📼 Seeded {len(site)} pages into {store.directory}")
+    else:
+        for url in store.urls():
+            print(url)
+
+
+if __name__ == "__main__":
+    main()
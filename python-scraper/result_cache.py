@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Parsed Result Cache - Structured results keyed by page content hash and parser version
+Byte-identical pages skip the soup and regex work; an optional SQLite tier survives restarts
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = int(os.getenv('RESULT_CACHE_SIZE', '512'))
+# Empty path keeps the cache in memory only
+DEFAULT_DB_PATH = os.getenv('RESULT_CACHE_DB', '')
+DEFAULT_DB_MAX_ROWS = int(os.getenv('RESULT_CACHE_DB_MAX_ROWS', '20000'))
+
+
+class ParsedResultCache:
+    """In-memory LRU of parse results with an optional persistent SQLite tier"""
+
+    def __init__(self, max_entries: Optional[int] = None, db_path: Optional[str] = None,
+                 db_max_rows: Optional[int] = None):
+        """
+        Args:
+            max_entries: Results kept in the in-memory LRU
+            db_path: SQLite file for the persistent tier (None or '' disables it)
+            db_max_rows: Least recently used rows beyond this are pruned from the database
+        """
+        self.max_entries = max(1, max_entries or DEFAULT_MAX_ENTRIES)
+        self.db_max_rows = db_max_rows or DEFAULT_DB_MAX_ROWS
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_writes = 0
+        self.stats = {'memory_hits': 0, 'db_hits': 0, 'misses': 0}
+
+        db_path = DEFAULT_DB_PATH if db_path is None else db_path
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS parsed_results ("
+                "cache_key TEXT PRIMARY KEY, result TEXT NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._db.commit()
+            logger.info(f"🗃️ Persistent result cache at {db_path}")
+
+    @staticmethod
+    def make_key(body: bytes, parser_version: str) -> str:
+        """Cache key for a response body parsed by a given parser version"""
+        return f"{parser_version}:{hashlib.sha256(body).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None"""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return json.loads(payload)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT result FROM parsed_results WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row:
+                    self._db.execute(
+                        "UPDATE parsed_results SET accessed_at = ? WHERE cache_key = ?", (time.time(), key)
+                    )
+                    self._db.commit()
+                    self._remember(key, row[0])
+                    self.stats['db_hits'] += 1
+                    return json.loads(row[0])
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """Store a result in memory and, when enabled, in the persistent tier"""
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, payload)
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO parsed_results (cache_key, result, accessed_at) VALUES (?, ?, ?)",
+                    (key, payload, time.time())
+                )
+                self._db_writes += 1
+                if self._db_writes % 100 == 0:
+                    # Prune occasionally rather than on every write
+                    self._db.execute(
+                        "DELETE FROM parsed_results WHERE cache_key NOT IN ("
+                        "SELECT cache_key FROM parsed_results ORDER BY accessed_at DESC LIMIT ?)",
+                        (self.db_max_rows,)
+                    )
+                self._db.commit()
+
+    def _remember(self, key: str, payload: str):
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+_shared_cache: Optional[ParsedResultCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ParsedResultCache:
+    """Return the process-wide parsed result cache"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ParsedResultCache()
+        return _shared_cache
@@ -9,6 +9,8 @@ from firebase_admin import credentials, firestore, storage
 from pinecone import Pinecone
 from openai import OpenAI
 
+from embedding_batcher import EmbeddingBatcher
+
 # Load environment variables
 load_dotenv('.env.local')
 
@@ -45,7 +47,9 @@ class ScraperIntegration:
         openai_api_key = os.getenv('OPENAI_API_KEY')
         if not openai_api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
-        self.openai_client = OpenAI(api_key=openai_api_key)
+        # Retries and rate limits are handled by the batcher's dispatcher
+        self.openai_client = OpenAI(api_key=openai_api_key, max_retries=0)
+        self.embedding_batcher = EmbeddingBatcher(self.openai_client)
         
         # Initialize Pinecone
         pinecone_api_key = os.getenv('PINECONE_API_KEY')
@@ -245,32 +249,21 @@ class ScraperIntegration:
         """
         print(f"🤖 Generating embeddings for {len(yacht_listings)} yacht listings...")
         
+        # One request per batch of listings, not per listing
+        embeddings = self.embedding_batcher.embed([listing['processed_text'] for listing in yacht_listings])
+        
         enhanced_listings = []
-        for i, listing in enumerate(yacht_listings):
-            try:
-                # Generate embedding for the processed text
-                response = self.openai_client.embeddings.create(
-                    model="text-embedding-ada-002",
-                    input=listing['processed_text']
-                )
-                
-                embedding = response.data[0].embedding
-                
-                # Add embedding to listing data
-                enhanced_listing = {
-                    **listing,
-                    'embedding': embedding,
-                    'embedding_dimensions': len(embedding)
-                }
-                
-                enhanced_listings.append(enhanced_listing)
-                
-                if (i + 1) % 10 == 0:
-                    print(f"   Generated {i + 1}/{len(yacht_listings)} embeddings")
-                
-            except Exception as e:
-                print(f"❌ Error generating embedding for listing {i}: {e}")
+        for i, (listing, embedding) in enumerate(zip(yacht_listings, embeddings)):
+            if not embedding:
+                print(f"❌ Error generating embedding for listing {i}")
                 continue
+            
+            # Add embedding to listing data
+            enhanced_listings.append({
+                **listing,
+                'embedding': embedding,
+                'embedding_dimensions': len(embedding)
+            })
         
         print(f"✅ Generated embeddings for {len(enhanced_listings)} listings")
         return enhanced_listings
@@ -381,11 +374,9 @@ class ScraperIntegration:
         """
         try:
             # Generate query embedding
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=query
-            )
-            query_embedding = response.data[0].embedding
+            query_embedding = self.embedding_batcher.embed([query])[0]
+            if not query_embedding:
+                raise ValueError("query embedding failed")
             
             # Search Pinecone
             index = self.pinecone_client.Index(self.index_name)
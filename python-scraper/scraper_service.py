@@ -1,29 +1,386 @@
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 from fake_useragent import UserAgent
 import re
 import time
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Union
 import json
 from ai_extractor import AIYachtExtractor
+from driver_pool import get_driver_pool, create_chrome_driver, wait_for_ready
+from tab_renderer import get_tab_renderer
+from http_session import ThreadLocalSessions
+from pattern_bank import PatternBank
+from page_text import PageText
+from page_context import PageContext
+from extraction_cascade import ExtractionCascade, parse_tier_order, DEFAULT_TIER_ORDER
+from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+from devalk_sections import READY_SELECTOR as DEVALK_READY_SELECTOR
+from render_classifier import get_render_classifier, url_template, SAMPLE, STATIC
+from contextlib import contextmanager
 from datetime import datetime
+from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# Section scan patterns, compiled once. Each field lists its patterns in priority order:
+# the first pattern that matches anywhere in the page wins, as with the original re.search loops
+ACCOMMODATION_SCAN = PatternBank({
+    'numberOfCabins': [
+        r'(\d+)\s*cabin',
+        r'(\d+)\s*stateroom',
+        r'(\d+)\s*bedroom',
+        r'cabins.*?(\d+)',
+        r'staterooms.*?(\d+)'
+    ],
+    'numberOfBerths': [
+        r'(\d+)\s*berth',
+        r'(\d+)\s*sleep',
+        r'(\d+)\s*person',
+        r'berths.*?(\d+)',
+        r'sleeping.*?(\d+)'
+    ],
+    'numberOfHeads': [
+        r'(\d+)\s*head',
+        r'(\d+)\s*bathroom',
+        r'(\d+)\s*toilet',
+        r'heads.*?(\d+)',
+        r'bathrooms.*?(\d+)'
+    ],
+    'numberOfShowers': [
+        r'(\d+)\s*shower',
+        r'showers.*?(\d+)'
+    ]
+})
+
+ACCOMMODATION_FEATURES = [
+    'masterCabin', 'vipCabin', 'crewCabin', 'galley', 'salon', 'cockpit',
+    'swimmingPlatform', 'bathingPlatform', 'tenderGarage', 'flybridge'
+]
+
+EQUIPMENT_SCAN = PatternBank({
+    'anchor': [
+        r'anchor[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+\s*[A-Za-z]+\s+anchor[^,\n]*)',
+        r'([A-Za-z]+\s+\d+\s*kg\s*anchor[^,\n]*)',
+        r'(plow\s+anchor[^,\n]*)',
+        r'(danforth\s+anchor[^,\n]*)',
+        r'(bruce\s+anchor[^,\n]*)'
+    ],
+    'lifeRaft': [
+        r'life\s+raft[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+\s*person\s+life\s+raft[^,\n]*)',
+        r'([A-Za-z]+\s+life\s+raft[^,\n]*)',
+        r'(liferaft[:\s]*[^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'
+    ],
+    'epirb': [
+        r'epirb[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+epirb[^,\n]*)',
+        r'(emergency\s+position\s+indicating\s+radio\s+beacon[^,\n]*)'
+    ],
+    'fireExtinguisher': [
+        r'fire\s+extinguisher[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+\s*fire\s+extinguisher[^,\n]*)',
+        r'([A-Za-z]+\s+fire\s+extinguisher[^,\n]*)'
+    ],
+    'bilgePump': [
+        r'bilge\s+pump[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+\s*bilge\s+pump[^,\n]*)',
+        r'([A-Za-z]+\s+bilge\s+pump[^,\n]*)',
+        r'(automatic\s+bilge\s+pump[^,\n]*)'
+    ],
+    'davits': [
+        r'davits?[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+\s*davits?[^,\n]*)',
+        r'([A-Za-z]+\s+davits?[^,\n]*)',
+        r'(electric\s+davits?[^,\n]*)',
+        r'(manual\s+davits?[^,\n]*)'
+    ],
+    'windlass': [
+        r'windlass[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+windlass[^,\n]*)',
+        r'(electric\s+windlass[^,\n]*)',
+        r'(manual\s+windlass[^,\n]*)',
+        r'(hydraulic\s+windlass[^,\n]*)'
+    ],
+    # Tender: each type uses the tender patterns that mention it
+    'dinghy': [
+        r'dinghy[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+(?:\.\d+)?\s*(?:m|ft|feet|meter)[^,\n]*dinghy[^,\n]*)'
+    ],
+    'inflatable': [
+        r'inflatable[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'
+    ],
+    'outboard': [
+        r'outboard[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+\d+\s*hp\s*outboard[^,\n]*)'
+    ]
+})
+
+NAVIGATION_SCAN = PatternBank({
+    'ais': [
+        r'ais[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+ais[^,\n]*)',
+        r'(automatic\s+identification\s+system[^,\n]*)',
+        r'(class\s+[AB]\s+ais[^,\n]*)'
+    ],
+    'autopilot': [
+        r'autopilot[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+autopilot[^,\n]*)',
+        r'(electric\s+autopilot[^,\n]*)',
+        r'(hydraulic\s+autopilot[^,\n]*)'
+    ],
+    'compass': [
+        r'compass[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+compass[^,\n]*)',
+        r'(fluxgate\s+compass[^,\n]*)',
+        r'(magnetic\s+compass[^,\n]*)'
+    ],
+    'depthSounder': [
+        r'depth\s+sounder[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+depth\s+sounder[^,\n]*)',
+        r'(depth\s+transducer[^,\n]*)',
+        r'(echo\s+sounder[^,\n]*)'
+    ],
+    'gps': [
+        r'gps[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+gps[^,\n]*)',
+        r'(global\s+positioning\s+system[^,\n]*)',
+        r'(chart\s+plotter[^,\n]*)'
+    ],
+    'radar': [
+        r'radar[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+radar[^,\n]*)',
+        r'(\d+\s*(?:nm|nautical\s+mile)[^,\n]*radar[^,\n]*)',
+        r'(open\s+array\s+radar[^,\n]*)',
+        r'(dome\s+radar[^,\n]*)'
+    ],
+    'vhf': [
+        r'vhf[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+vhf[^,\n]*)',
+        r'(very\s+high\s+frequency[^,\n]*)',
+        r'(dsc\s+vhf[^,\n]*)'
+    ],
+    'plotter': [
+        r'plotter[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+plotter[^,\n]*)',
+        r'(chart\s+plotter[^,\n]*)',
+        r'(gps\s+plotter[^,\n]*)'
+    ],
+    'epirb': [
+        r'epirb[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+epirb[^,\n]*)',
+        r'(emergency\s+position\s+indicating\s+radio\s+beacon[^,\n]*)'
+    ],
+    'log': [
+        r'log[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+log[^,\n]*)',
+        r'(speed\s+log[^,\n]*)',
+        r'(distance\s+log[^,\n]*)'
+    ],
+    'windset': [
+        r'windset[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+windset[^,\n]*)',
+        r'(wind\s+indicator[^,\n]*)',
+        r'(anemometer[^,\n]*)'
+    ],
+    'satellite': [
+        r'satellite[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+satellite[^,\n]*)',
+        r'(satellite\s+phone[^,\n]*)',
+        r'(satellite\s+tv[^,\n]*)'
+    ],
+    'rudderAngleIndicator': [
+        r'rudder\s+angle\s+indicator[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'([A-Za-z]+\s+rudder\s+angle\s+indicator[^,\n]*)',
+        r'(rudder\s+indicator[^,\n]*)'
+    ]
+})
+
+RIGGING_SCAN = PatternBank({
+    # Every winch mention, collected with findall and mapped to form fields afterwards
+    'winches': [
+        r'primary\s+sheet\s+winch[:\s]*([^,\n]+)',
+        r'secondary\s+sheet\s+winch[:\s]*([^,\n]+)',
+        r'genoa\s+sheetwinch[:\s]*([^,\n]+)',
+        r'halyard\s+winch[:\s]*([^,\n]+)',
+        r'multifunctional\s+winch[:\s]*([^,\n]+)',
+        r'winch[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+x?\s*[A-Za-z]+\s+\d+\s+[^,\n]+winch[^,\n]*)',
+        r'([A-Za-z]+\s+\d+\s+[^,\n]*winch[^,\n]*)'
+    ],
+    'mast': [
+        r'mast[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+(?:\.\d+)?\s*(?:m|ft|feet|meter)[^,\n]*mast[^,\n]*)',
+        r'([A-Za-z]+\s+mast[^,\n]*)',
+        r'(aluminum\s+mast[^,\n]*)',
+        r'(carbon\s+mast[^,\n]*)'
+    ],
+    'boom': [
+        r'boom[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+(?:\.\d+)?\s*(?:m|ft|feet|meter)[^,\n]*boom[^,\n]*)',
+        r'([A-Za-z]+\s+boom[^,\n]*)'
+    ],
+    'mainsail': [r'mainsail[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'],
+    'genoa': [r'genoa[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'],
+    'jib': [r'jib[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'],
+    'spinnaker': [r'spinnaker[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'],
+    'spreaders': [
+        r'spreaders?[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
+        r'(\d+\s*spreaders?[^,\n]*)',
+        r'([A-Za-z]+\s+spreaders?[^,\n]*)'
+    ]
+})
+
+MACHINERY_SCAN = PatternBank({
+    'engine': [
+        r'(\d+)x\s+([A-Za-z\s]+?)\s+(\w+)\s*(\w*)',  # "1x Yanmar 4JH110 diesel"
+        r'engine.*?(\d+)\s*(?:HP|hp)',  # "Engine 110 HP"
+        r'(\d+)\s*(?:HP|hp).*?engine',  # "110 HP engine"
+    ],
+    'fuelTankLitre': [r'fuel tank.*?(\d+)\s*litre'],
+    'waterTankLitre': [r'water tank.*?(\d+)\s*litre']
+})
+
+GENERAL_SPECS_SCAN = PatternBank({
+    'hullMaterial': [
+        r'material.*?(\w+)',  # "Material: GRP"
+        r'hull.*?(\w+)',      # "Hull: GRP"
+        r'(\w+)\s*material'   # "GRP material"
+    ],
+    'condition': [r'condition.*?(\w+(?:\s+\w+)*)'],
+    'location': [r'location.*?([A-Za-z\s]+?)(?:\n|\.|$)']
+})
+
+POST_PROCESS_SCAN = PatternBank({
+    'hp': [
+        r'(\d+\.?\d*)\s*(?:HP|hp|horsepower)',
+        r'(?:HP|hp|horsepower)\s*(\d+\.?\d*)',
+        r'(\d+\.?\d*)\s*\(hp\)',
+        r'(\d+)x\s+[A-Za-z]+\s+\w*(\d+)\s*[A-Za-z]*'  # De Valk pattern
+    ],
+    'kw': [
+        r'(\d+\.?\d*)\s*(?:KW|kw|kilowatt)',
+        r'(?:KW|kw|kilowatt)\s*(\d+\.?\d*)',
+        r'(\d+\.?\d*)\s*\(kw\)'
+    ],
+    'numberOfCabins': [
+        r'(\d+)\s*cabin',
+        r'(\d+)\s*stateroom',
+        r'(\d+)\s*bedroom'
+    ],
+    'numberOfBerths': [
+        r'(\d+)\s*berth',
+        r'(\d+)\s*sleep',
+        r'(\d+)\s*person'
+    ],
+    'price': [
+        r'[\€\$£]?\s*([\d,]+(?:\.\d{3})?)',
+        r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[\€\$£]',
+        r'asking price.*?[\€\$£]?\s*([\d,]+(?:\.\d{3})?)'
+    ]
+})
+
+# Comprehensive list of all yacht fields we can extract (mapped to your schema); drives completeness
+# and decides whether another extraction tier is worth running
+YACHT_FIELDS = [
+    # Basic Information
+    'title', 'make', 'model', 'year', 'description', 'heroImage', 'galleryImages',
+
+    # Dimensions (your schema fields)
+    'loaM', 'lwlM', 'beamM', 'draftM', 'airDraftM', 'headroomM',
+
+    # General Information
+    'country', 'designer', 'displacementT', 'ballastTonnes', 'hullColor', 'hullMaterial', 'boatType',
+    'designYear', 'lastRefit', 'classification', 'location',
+
+    # Price
+    'price', 'currency',
+
+    # Machinery (nested object)
+    'machinery',
+
+    # Accommodation (nested object)
+    'accommodation',
+
+    # Equipment (nested object) - comprehensive categories
+    'equipment',
+
+    # Rigging (nested object) - sailing-specific
+    'rigging',
+
+    # Navigation (nested object) - electronics & instruments
+    'navigation',
+
+    # Legacy fields for backward compatibility
+    'length', 'beam', 'draft', 'brand', 'engineMake'
+]
+
+# Static De Valk section fields that map straight onto listing fields, first source wins
+DEVALK_LISTING_FIELDS = {
+    'modeBox': {
+        'model': 'model', 'builder': 'make', 'designer': 'designer', 'country': 'country',
+        'yearBuilt': 'year', 'loaM': 'loaM', 'lwlM': 'lwlM', 'beamM': 'beamM', 'draftM': 'draftM',
+        'headroomM': 'headroomM', 'displacementT': 'displacementT', 'ballastTonnes': 'ballastTonnes',
+        'hullColour': 'hullColor', 'hullMaterial': 'hullMaterial',
+    },
+    'tableBox': {
+        'yearBuilt': 'year', 'material': 'hullMaterial', 'engines': 'engineMake', 'lying': 'location',
+    },
+}
+DEVALK_NUMERIC_FIELDS = ('loaM', 'lwlM', 'beamM', 'draftM', 'headroomM', 'displacementT', 'ballastTonnes')
+
+# Single-value listing fields the LLM tier can fill when the deterministic tiers left them empty,
+# with the hint the model gets for each; all missing ones are requested together
+LLM_FILLABLE_FIELDS = {
+    'title': 'Listing title',
+    'make': 'Builder / brand',
+    'model': 'Model name',
+    'year': 'Year built',
+    'loaM': 'Length overall in metres',
+    'lwlM': 'Waterline length in metres',
+    'beamM': 'Beam in metres',
+    'draftM': 'Draft in metres',
+    'airDraftM': 'Air draft in metres',
+    'headroomM': 'Headroom in metres',
+    'country': 'Country where it was built',
+    'designer': 'Designer / naval architect',
+    'displacementT': 'Displacement in tonnes',
+    'ballastTonnes': 'Ballast in tonnes',
+    'hullColor': 'Hull colour',
+    'hullMaterial': 'Hull material',
+    'boatType': 'Type of boat, e.g. sailing yacht or motor yacht',
+    'designYear': 'Design year',
+    'lastRefit': 'Year of the last refit',
+    'classification': 'CE category or class',
+    'location': 'Where the boat is lying',
+    'price': 'Asking price, digits only',
+    'currency': 'Currency code: EUR, USD or GBP',
+    'engineMake': 'Engine make and model',
+}
+LLM_NUMERIC_FIELDS = DEVALK_NUMERIC_FIELDS + ('airDraftM',)
+
+# Element that signals a rendered page is ready, per listing type
+READY_LOCATORS = {
+    'devalk': (By.CSS_SELECTOR, DEVALK_READY_SELECTOR),
+    'yachtworld': (By.CLASS_NAME, "boat-details"),
+}
+DEFAULT_READY_LOCATOR = (By.TAG_NAME, "body")
+
 class YachtScraperService:
     """Comprehensive yacht listing scraper service"""
     
-    def __init__(self):
+    def __init__(self, tier_order: Optional[str] = None, completeness_threshold: Optional[float] = None):
+        """
+        Args:
+            tier_order: Comma-separated extraction tiers, cheapest first (default SCRAPER_CASCADE_TIERS)
+            completeness_threshold: Completeness at which later tiers are skipped (default SCRAPER_COMPLETENESS_THRESHOLD)
+        """
         self.ua = UserAgent()
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-thread sessions so concurrent requests can share one service instance
+        self._sessions = ThreadLocalSessions({
             'User-Agent': self.ua.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
@@ -31,27 +388,96 @@ class YachtScraperService:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        self.driver_pool = get_driver_pool()
+        # Set when CHROME_TABS_PER_BROWSER > 1; renders then share one browser instead of the pool
+        self.tab_renderer = get_tab_renderer()
+        # Created on first use, under _lazy_lock since request threads share the service
+        self._devalk_parser: Optional[SuperEnhancedDeValkParser] = None
+        # One extractor for every listing; created on first use since it needs OPENAI_API_KEY
+        self._ai_extractor: Optional[AIYachtExtractor] = None
+        self._lazy_lock = threading.Lock()
+        # Learns which URL templates need a browser at all; None always allows the browser tier
+        self.render_classifier = get_render_classifier()
+        self.cascade = self._build_cascade(tier_order or DEFAULT_TIER_ORDER, completeness_threshold)
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session owned by the calling thread"""
+        return self._sessions.session
+    
+    @property
+    def devalk_parser(self) -> SuperEnhancedDeValkParser:
+        """De Valk section parser used by the static tier on pages this service already fetched"""
+        with self._lazy_lock:
+            if self._devalk_parser is None:
+                self._devalk_parser = SuperEnhancedDeValkParser()
+            return self._devalk_parser
+    
+    @property
+    def ai_extractor(self) -> AIYachtExtractor:
+        """Shared LLM extractor; its client, prompt builders and caches are reused across listings"""
+        with self._lazy_lock:
+            if self._ai_extractor is None:
+                self._ai_extractor = AIYachtExtractor()
+            return self._ai_extractor
         
     def get_chrome_driver(self):
-        """Get Chrome driver with optimized options for scraping"""
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument(f'--user-agent={self.ua.random}')
-        
+        """Get a fresh Chrome driver with optimized options for scraping (caller must quit it)"""
         try:
-            driver = webdriver.Chrome(
-                service=webdriver.chrome.service.Service(ChromeDriverManager().install()),
-                options=chrome_options
-            )
-            return driver
+            return create_chrome_driver(self.ua.random)
         except Exception as e:
             logger.error(f"Failed to initialize Chrome driver: {e}")
             return None
     
+    @contextmanager
+    def pooled_driver(self):
+        """Borrow a warm Chrome driver from the shared pool with a fresh user agent"""
+        with self.driver_pool.checkout() as driver:
+            try:
+                driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': self.ua.random})
+            except Exception as e:
+                logger.debug(f"User agent override failed: {e}")
+            yield driver
+    
+    def fetch_page(self, url: str, listing_type: Optional[str] = None, render: bool = True) -> PageContext:
+        """
+        Load a listing page once for every extraction tier that needs it
+        
+        Args:
+            url: Listing URL
+            listing_type: Result of detect_listing_type, used to pick the readiness element
+            render: Render in Chrome so JavaScript-built content is present, falling back to a
+                plain HTTP GET when no browser is available; False goes straight to HTTP
+            
+        Returns:
+            PageContext with the page HTML
+        """
+        if render:
+            try:
+                return self.render_page(url, listing_type)
+            except Exception as e:
+                logger.warning(f"Browser rendering failed: {e}, fetching over HTTP")
+        
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        logger.info(f"🌐 Fetched {url}: {len(response.content)} bytes")
+        return PageContext.from_response(url, response)
+    
+    def render_page(self, url: str, listing_type: Optional[str] = None) -> PageContext:
+        """Load a page in a pooled Chrome and wait for its readiness element"""
+        ready_locator = READY_LOCATORS.get(listing_type or self.detect_listing_type(url), DEFAULT_READY_LOCATOR)
+        if self.tab_renderer is not None:
+            # Several pages load concurrently as tabs of one shared browser
+            page = self.tab_renderer.render(url, ready_locator, user_agent=self.ua.random)
+            logger.info(f"🌐 Rendered {url} in a tab: {len(page.html)} characters")
+            return page
+        with self.pooled_driver() as driver:
+            driver.get(url)
+            wait_for_ready(driver, ready_locator)
+            page = PageContext.from_driver(url, driver)
+        logger.info(f"🌐 Rendered {url}: {len(page.html)} characters")
+        return page
+    
     def detect_listing_type(self, url: str) -> str:
         """Detect the type of yacht listing based on URL patterns"""
         url_lower = url.lower()
@@ -69,22 +495,17 @@ class YachtScraperService:
         else:
             return 'generic'
     
-    def scrape_devalk(self, url):
+    def scrape_devalk(self, url, page: Optional[PageContext] = None):
         """Scrape yacht data from De Valk website using their exact field structure"""
         try:
             logger.info(f"🚀 Starting De Valk scraping with exact field mapping: {url}")
             
-            # Use Selenium for dynamic content
-            driver = self._get_selenium_driver()
-            driver.get(url)
-            time.sleep(3)  # Allow page to load
-            
-            # Get the page source after JavaScript execution
-                page_source = driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # Rendered page, reusing one already loaded for another tier
+            page = page or self.fetch_page(url, 'devalk')
+            soup = page.soup()
             
             # Extract data using De Valk's exact field structure
-            data = self._extract_devalk_data(soup, driver)
+            data = self._extract_devalk_data(soup, None)
             
             # Add metadata
             data['source_url'] = url
@@ -97,44 +518,37 @@ class YachtScraperService:
             logger.info(f"✅ De Valk scraping completed. Completeness: {data['data_completeness']}%")
             logger.info(f"📊 De Valk data structure: {list(data.keys())}")
             
-            driver.quit()
             return data
             
         except Exception as e:
             logger.error(f"❌ Error in De Valk scraping: {e}")
-            if 'driver' in locals():
-                driver.quit()
             return None
     
-    def scrape_yachtworld(self, url: str) -> Dict[str, Any]:
+    def scrape_yachtworld(self, url: str, page: Optional[PageContext] = None) -> Dict[str, Any]:
         """Scrape YachtWorld listings"""
         try:
-            driver = self.get_chrome_driver()
-            if not driver:
-                return self._fallback_scraping(url)
-            
-            driver.get(url)
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "boat-details"))
-            )
+            page = page or self.fetch_page(url, 'yachtworld')
+            soup = page.soup()
+            if not soup.select_one(".boat-details"):
+                raise ValueError("boat details not present in the page")
             
             data = {}
             
             # Title
             try:
-                title_elem = driver.find_element(By.CSS_SELECTOR, "h1.boat-title")
-                data['title'] = title_elem.text.strip()
+                data['title'] = soup.select_one("h1.boat-title").get_text().strip()
             except:
                 pass
             
             # Extract images
             try:
-                image_elements = driver.find_elements(By.CSS_SELECTOR, ".boat-gallery img, .photo-gallery img, .main-image img")
+                image_elements = soup.select(".boat-gallery img, .photo-gallery img, .main-image img")
                 images = []
                 for img in image_elements[:10]:  # Limit to first 10 images
-                    src = img.get_attribute('src')
+                    src = img.get('src')
                     if src and not src.endswith('placeholder'):
-                        images.append(src)
+                        # The browser reported resolved URLs; resolve relative src the same way
+                        images.append(urljoin(page.final_url, src))
                 data['images'] = images
                 data['heroImage'] = images[0] if images else None
             except:
@@ -142,19 +556,18 @@ class YachtScraperService:
             
             # Price
             try:
-                price_elem = driver.find_element(By.CSS_SELECTOR, ".price")
-                price_text = price_elem.text.strip()
+                price_text = soup.select_one(".price").get_text().strip()
                 data['price'] = re.sub(r'[^\d]', '', price_text)
             except:
                 pass
             
             # Specifications
             try:
-                spec_elems = driver.find_elements(By.CSS_SELECTOR, ".specification")
+                spec_elems = soup.select(".specification")
                 for spec in spec_elems:
-                    label = spec.find_element(By.CSS_SELECTOR, ".label").text.strip().lower()
-                    value = spec.find_element(By.CSS_SELECTOR, ".value").text.strip()
-                    
+                    label = spec.select_one(".label").get_text().strip().lower()
+                    value = spec.select_one(".value").get_text().strip()
+                
                     if 'length' in label:
                         data['length'] = value
                     elif 'year' in label:
@@ -166,22 +579,21 @@ class YachtScraperService:
             except:
                 pass
             
-            driver.quit()
             return data
             
         except Exception as e:
             logger.error(f"Error scraping YachtWorld: {e}")
-            if driver:
-                driver.quit()
-            return self._fallback_scraping(url)
+            return self._fallback_scraping(url, page)
     
-    def _fallback_scraping(self, url: str) -> Dict[str, Any]:
-        """Fallback to basic requests + BeautifulSoup scraping"""
+    def _fallback_scraping(self, url: str, page: Optional[PageContext] = None) -> Dict[str, Any]:
+        """Fallback to basic requests + BeautifulSoup scraping, or to a page another tier already loaded"""
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            if page is None:
+                response = self.session.get(url, timeout=10)
+                response.raise_for_status()
+                page = PageContext.from_response(url, response)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = page.soup()
             data = {}
             
             # Try to extract basic information from meta tags first
@@ -385,7 +797,7 @@ class YachtScraperService:
                     ]
                     
                     for pattern in displacement_patterns:
-                        match = re.search(pattern, response.text, re.IGNORECASE)
+                        match = re.search(pattern, page.html, re.IGNORECASE)
                         if match:
                             data['displacementT'] = float(match.group(1))
                             logger.info(f"Extracted displacement from content: {data['displacementT']} tonnes")
@@ -399,7 +811,7 @@ class YachtScraperService:
                 ]
                 
                 for pattern in ballast_patterns:
-                    match = re.search(pattern, response.text, re.IGNORECASE)
+                    match = re.search(pattern, page.html, re.IGNORECASE)
                     if match:
                         data['ballastTonnes'] = float(match.group(1))
                         logger.info(f"Extracted ballast: {data['ballastTonnes']} tonnes")
@@ -486,15 +898,15 @@ class YachtScraperService:
                 ]
                 
                 for pattern in price_patterns:
-                    matches = re.findall(pattern, response.text)
+                    matches = re.findall(pattern, page.html)
                     if matches:
                         data['price'] = matches[0].replace(',', '')
                         # Try to determine currency from context
-                        if '€' in response.text or 'EUR' in response.text:
+                        if '€' in page.html or 'EUR' in page.html:
                             data['currency'] = 'EUR'
-                        elif '$' in response.text or 'USD' in response.text:
+                        elif '$' in page.html or 'USD' in page.html:
                             data['currency'] = 'GBP'
-                        elif '£' in response.text or 'GBP' in response.text:
+                        elif '£' in page.html or 'GBP' in page.html:
                             data['currency'] = 'GBP'
                         price_found = True
                         logger.info(f"Extracted price from content: {data['price']} {data.get('currency', '')}")
@@ -664,7 +1076,7 @@ class YachtScraperService:
                 
                 # Detect equipment by category
                 equipment_found = 0
-                page_text = response.text.lower()
+                page_text = page.html.lower()
                 
                 for category, keywords in equipment_categories.items():
                     for keyword in keywords:
@@ -708,7 +1120,7 @@ class YachtScraperService:
                 logger.info("🔍 Starting comprehensive section scanning in fallback method")
                 
                 # Scan for all sections using full page text
-                enhanced_data = self._scan_all_yacht_sections(response.text, data)
+                enhanced_data = self._scan_all_yacht_sections(page.html, data)
                 
                 # Update data with enhanced sections
                 for section, section_data in enhanced_data.items():
@@ -943,40 +1355,36 @@ class YachtScraperService:
         
         return data
     
-    def _ai_text_scan_extraction(self, page_source: str, url: str) -> Dict[str, Any]:
+    def _ai_text_scan_extraction(self, url: str, page: PageContext) -> Dict[str, Any]:
         """AI-powered text scanning extraction - works regardless of HTML structure"""
         try:
             logger.info("🤖 Starting AI text scanning extraction")
             
-            # Extract all visible text from the page
-            soup = BeautifulSoup(page_source, 'html.parser')
+            # Extract all visible text from the page (own soup copy: scripts are removed below)
+            soup = page.soup()
             
             # Remove script and style elements
             for script in soup(["script", "style"]):
                 script.decompose()
             
-            # Get clean text content
-            full_text = soup.get_text()
-            
-            # Clean up whitespace and formatting
-            lines = (line.strip() for line in full_text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            clean_text = ' '.join(chunk for chunk in chunks if chunk)
+            # Clean text once; the post-processing and section scans share its cached views
+            page_text = PageText(soup)
+            clean_text = page_text.collapsed
+            clean_page = page_text.collapsed_page
             
             logger.info(f"📄 Extracted {len(clean_text)} characters of clean text")
             
-            # Use AI to extract yacht data from the full text
-            ai_extractor = AIYachtExtractor()
-            yacht_data = ai_extractor.extract_yacht_data(clean_text, url)
+            # The extractor packs the page's specification regions into its prompt, so it gets the HTML
+            yacht_data = self.ai_extractor.extract_yacht_data(page.html, url)
             
             if yacht_data:
                 logger.info(f"✅ AI text scanning successful: {len(yacht_data)} fields extracted")
                 
                 # Post-process AI results for better accuracy
-                processed_data = self._post_process_ai_results(yacht_data, clean_text)
+                processed_data = self._post_process_ai_results(yacht_data, clean_page)
                 
                 # ENHANCED: Scan for all yacht sections in the full text
-                enhanced_data = self._scan_all_yacht_sections(clean_text, processed_data)
+                enhanced_data = self._scan_all_yacht_sections(clean_page, processed_data)
                 
                 return enhanced_data
             else:
@@ -987,11 +1395,14 @@ class YachtScraperService:
             logger.error(f"Error in AI text scanning extraction: {e}")
             return {}
     
-    def _scan_all_yacht_sections(self, page_text: str, base_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _scan_all_yacht_sections(self, page_text: Union[PageText, str], base_data: Dict[str, Any]) -> Dict[str, Any]:
         """Scan full page text for all yacht sections and data"""
         enhanced_data = base_data.copy()
         
         try:
+            # One set of cached text views for every section scan
+            page_text = PageText.of(page_text)
+            
             logger.info("🔍 Scanning full page text for all yacht sections")
             
             # 1. ACCOMMODATION SECTION SCANNING
@@ -1039,57 +1450,24 @@ class YachtScraperService:
             logger.error(f"Error in section scanning: {e}")
             return base_data
     
-    def _scan_accommodation_section(self, page_text: str) -> Dict[str, Any]:
+    def _scan_accommodation_section(self, page_text: Union[PageText, str]) -> Dict[str, Any]:
         """Scan for accommodation data in full page text"""
         accommodation_data = {}
         
         try:
-            # Look for accommodation-related text patterns
-            accommodation_patterns = {
-                'numberOfCabins': [
-                    r'(\d+)\s*cabin',
-                    r'(\d+)\s*stateroom',
-                    r'(\d+)\s*bedroom',
-                    r'cabins.*?(\d+)',
-                    r'staterooms.*?(\d+)'
-                ],
-                'numberOfBerths': [
-                    r'(\d+)\s*berth',
-                    r'(\d+)\s*sleep',
-                    r'(\d+)\s*person',
-                    r'berths.*?(\d+)',
-                    r'sleeping.*?(\d+)'
-                ],
-                'numberOfHeads': [
-                    r'(\d+)\s*head',
-                    r'(\d+)\s*bathroom',
-                    r'(\d+)\s*toilet',
-                    r'heads.*?(\d+)',
-                    r'bathrooms.*?(\d+)'
-                ],
-                'numberOfShowers': [
-                    r'(\d+)\s*shower',
-                    r'showers.*?(\d+)'
-                ]
-            }
+            scan = ACCOMMODATION_SCAN.scan(page_text)
             
-            for field, patterns in accommodation_patterns.items():
-                for pattern in patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        accommodation_data[field] = int(match.group(1))
-                        logger.info(f"✅ Accommodation: {field} = {accommodation_data[field]}")
-                        break
+            # Look for accommodation-related text patterns
+            for field in ACCOMMODATION_SCAN.fields:
+                match = scan.first(field)
+                if match:
+                    accommodation_data[field] = int(match.group(1))
+                    logger.info(f"✅ Accommodation: {field} = {accommodation_data[field]}")
             
             # Look for specific accommodation features
-            accommodation_features = [
-                'masterCabin', 'vipCabin', 'crewCabin', 'galley', 'salon', 'cockpit',
-                'swimmingPlatform', 'bathingPlatform', 'tenderGarage', 'flybridge'
-            ]
-            
-            for feature in accommodation_features:
+            for feature in ACCOMMODATION_FEATURES:
                 feature_text = feature.replace('Cabin', ' cabin').replace('Platform', ' platform')
-                if feature_text.lower() in page_text.lower():
+                if scan.contains(feature_text):
                     accommodation_data[feature] = True
                     logger.info(f"✅ Accommodation feature: {feature}")
             
@@ -1101,337 +1479,40 @@ class YachtScraperService:
     def _scan_equipment_section(self, page_text):
         """Extract detailed equipment information from full page text"""
         equipment_data = {}
+        scan = EQUIPMENT_SCAN.scan(page_text)
         
-        # Enhanced anchor extraction
-        anchor_patterns = [
-            r'anchor[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+\s*[A-Za-z]+\s+anchor[^,\n]*)',
-            r'([A-Za-z]+\s+\d+\s*kg\s*anchor[^,\n]*)',
-            r'(plow\s+anchor[^,\n]*)',
-            r'(danforth\s+anchor[^,\n]*)',
-            r'(bruce\s+anchor[^,\n]*)'
-        ]
-        
-        for pattern in anchor_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                equipment_data['anchor'] = match.group(1).strip()
-                break
-        
-        # Enhanced life raft extraction
-        life_raft_patterns = [
-            r'life\s+raft[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+\s*person\s+life\s+raft[^,\n]*)',
-            r'([A-Za-z]+\s+life\s+raft[^,\n]*)',
-            r'(liferaft[:\s]*[^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'
-        ]
-        
-        for pattern in life_raft_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                equipment_data['lifeRaft'] = match.group(1).strip()
-                break
-        
-        # Enhanced EPIRB extraction
-        epirb_patterns = [
-            r'epirb[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+epirb[^,\n]*)',
-            r'(emergency\s+position\s+indicating\s+radio\s+beacon[^,\n]*)'
-        ]
-        
-        for pattern in epirb_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                equipment_data['epirb'] = match.group(1).strip()
-                break
-        
-        # Enhanced fire extinguisher extraction
-        fire_ext_patterns = [
-            r'fire\s+extinguisher[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+\s*fire\s+extinguisher[^,\n]*)',
-            r'([A-Za-z]+\s+fire\s+extinguisher[^,\n]*)'
-        ]
-        
-        for pattern in fire_ext_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                equipment_data['fireExtinguisher'] = match.group(1).strip()
-                break
-        
-        # Enhanced bilge pump extraction
-        bilge_pump_patterns = [
-            r'bilge\s+pump[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+\s*bilge\s+pump[^,\n]*)',
-            r'([A-Za-z]+\s+bilge\s+pump[^,\n]*)',
-            r'(automatic\s+bilge\s+pump[^,\n]*)'
-        ]
-        
-        for pattern in bilge_pump_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        # Anchor, life raft, EPIRB, fire extinguisher, bilge pump, davits, windlass and tender
+        for field in EQUIPMENT_SCAN.fields:
+            match = scan.first(field)
             if match:
-                equipment_data['bilgePump'] = match.group(1).strip()
-                break
-        
-        # Enhanced davits extraction
-        davits_patterns = [
-            r'davits?[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+\s*davits?[^,\n]*)',
-            r'([A-Za-z]+\s+davits?[^,\n]*)',
-            r'(electric\s+davits?[^,\n]*)',
-            r'(manual\s+davits?[^,\n]*)'
-        ]
-        
-        for pattern in davits_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                equipment_data['davits'] = match.group(1).strip()
-                break
-        
-        # Enhanced windlass extraction
-        windlass_patterns = [
-            r'windlass[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+windlass[^,\n]*)',
-            r'(electric\s+windlass[^,\n]*)',
-            r'(manual\s+windlass[^,\n]*)',
-            r'(hydraulic\s+windlass[^,\n]*)'
-        ]
-        
-        for pattern in windlass_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                equipment_data['windlass'] = match.group(1).strip()
-                break
-        
-        # Enhanced tender extraction
-        tender_patterns = [
-            r'dinghy[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'inflatable[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'outboard[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+(?:\.\d+)?\s*(?:m|ft|feet|meter)[^,\n]*dinghy[^,\n]*)',
-            r'([A-Za-z]+\s+\d+\s*hp\s*outboard[^,\n]*)'
-        ]
-        
-        tender_types = ['dinghy', 'inflatable', 'outboard']
-        for tender_type in tender_types:
-            for pattern in tender_patterns:
-                if tender_type in pattern:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        equipment_data[tender_type] = match.group(1).strip()
-                        break
+                equipment_data[field] = match.group(1).strip()
         
         return equipment_data
     
     def _scan_navigation_section(self, page_text):
         """Extract detailed navigation information from full page text"""
         navigation_data = {}
+        scan = NAVIGATION_SCAN.scan(page_text)
         
-        # Enhanced AIS extraction
-        ais_patterns = [
-            r'ais[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+ais[^,\n]*)',
-            r'(automatic\s+identification\s+system[^,\n]*)',
-            r'(class\s+[AB]\s+ais[^,\n]*)'
-        ]
-        
-        for pattern in ais_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['ais'] = match.group(1).strip()
-                break
-        
-        # Enhanced autopilot extraction
-        autopilot_patterns = [
-            r'autopilot[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+autopilot[^,\n]*)',
-            r'(electric\s+autopilot[^,\n]*)',
-            r'(hydraulic\s+autopilot[^,\n]*)'
-        ]
-        
-        for pattern in autopilot_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['autopilot'] = match.group(1).strip()
-                break
-        
-        # Enhanced compass extraction
-        compass_patterns = [
-            r'compass[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+compass[^,\n]*)',
-            r'(fluxgate\s+compass[^,\n]*)',
-            r'(magnetic\s+compass[^,\n]*)'
-        ]
-        
-        for pattern in compass_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['compass'] = match.group(1).strip()
-                break
-        
-        # Enhanced depth sounder extraction
-        depth_patterns = [
-            r'depth\s+sounder[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+depth\s+sounder[^,\n]*)',
-            r'(depth\s+transducer[^,\n]*)',
-            r'(echo\s+sounder[^,\n]*)'
-        ]
-        
-        for pattern in depth_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['depthSounder'] = match.group(1).strip()
-                break
-        
-        # Enhanced GPS extraction
-        gps_patterns = [
-            r'gps[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+gps[^,\n]*)',
-            r'(global\s+positioning\s+system[^,\n]*)',
-            r'(chart\s+plotter[^,\n]*)'
-        ]
-        
-        for pattern in gps_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['gps'] = match.group(1).strip()
-                break
-        
-        # Enhanced radar extraction
-        radar_patterns = [
-            r'radar[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+radar[^,\n]*)',
-            r'(\d+\s*(?:nm|nautical\s+mile)[^,\n]*radar[^,\n]*)',
-            r'(open\s+array\s+radar[^,\n]*)',
-            r'(dome\s+radar[^,\n]*)'
-        ]
-        
-        for pattern in radar_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['radar'] = match.group(1).strip()
-                break
-        
-        # Enhanced VHF extraction
-        vhf_patterns = [
-            r'vhf[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+vhf[^,\n]*)',
-            r'(very\s+high\s+frequency[^,\n]*)',
-            r'(dsc\s+vhf[^,\n]*)'
-        ]
-        
-        for pattern in vhf_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['vhf'] = match.group(1).strip()
-                break
-        
-        # Enhanced plotter extraction
-        plotter_patterns = [
-            r'plotter[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+plotter[^,\n]*)',
-            r'(chart\s+plotter[^,\n]*)',
-            r'(gps\s+plotter[^,\n]*)'
-        ]
-        
-        for pattern in plotter_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['plotter'] = match.group(1).strip()
-                break
-        
-        # Enhanced EPIRB extraction
-        epirb_patterns = [
-            r'epirb[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+epirb[^,\n]*)',
-            r'(emergency\s+position\s+indicating\s+radio\s+beacon[^,\n]*)'
-        ]
-        
-        for pattern in epirb_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['epirb'] = match.group(1).strip()
-                break
-        
-        # Enhanced log extraction
-        log_patterns = [
-            r'log[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+log[^,\n]*)',
-            r'(speed\s+log[^,\n]*)',
-            r'(distance\s+log[^,\n]*)'
-        ]
-        
-        for pattern in log_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['log'] = match.group(1).strip()
-                break
-        
-        # Enhanced windset extraction
-        windset_patterns = [
-            r'windset[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+windset[^,\n]*)',
-            r'(wind\s+indicator[^,\n]*)',
-            r'(anemometer[^,\n]*)'
-        ]
-        
-        for pattern in windset_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['windset'] = match.group(1).strip()
-                break
-        
-        # Enhanced satellite extraction
-        satellite_patterns = [
-            r'satellite[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+satellite[^,\n]*)',
-            r'(satellite\s+phone[^,\n]*)',
-            r'(satellite\s+tv[^,\n]*)'
-        ]
-        
-        for pattern in satellite_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                navigation_data['satellite'] = match.group(1).strip()
-                break
-        
-        # Enhanced rudder angle indicator extraction
-        rudder_patterns = [
-            r'rudder\s+angle\s+indicator[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'([A-Za-z]+\s+rudder\s+angle\s+indicator[^,\n]*)',
-            r'(rudder\s+indicator[^,\n]*)'
-        ]
-        
-        for pattern in rudder_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        # AIS, autopilot, compass, depth sounder, GPS, radar, VHF, plotter, EPIRB, log,
+        # windset, satellite and rudder angle indicator
+        for field in NAVIGATION_SCAN.fields:
+            match = scan.first(field)
             if match:
-                navigation_data['rudderAngleIndicator'] = match.group(1).strip()
-                break
+                navigation_data[field] = match.group(1).strip()
         
         return navigation_data
     
     def _scan_rigging_section(self, page_text):
         """Extract detailed rigging information from full page text"""
         rigging_data = {}
-        
-        # Enhanced winch extraction with detailed specifications
-        winch_patterns = [
-            r'primary\s+sheet\s+winch[:\s]*([^,\n]+)',
-            r'secondary\s+sheet\s+winch[:\s]*([^,\n]+)',
-            r'genoa\s+sheetwinch[:\s]*([^,\n]+)',
-            r'halyard\s+winch[:\s]*([^,\n]+)',
-            r'multifunctional\s+winch[:\s]*([^,\n]+)',
-            r'winch[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+x?\s*[A-Za-z]+\s+\d+\s+[^,\n]+winch[^,\n]*)',
-            r'([A-Za-z]+\s+\d+\s+[^,\n]*winch[^,\n]*)'
-        ]
+        scan = RIGGING_SCAN.scan(page_text)
         
         # Extract detailed winch information
         winch_details = []
-        for pattern in winch_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                if match and len(match.strip()) > 3:
-                    winch_details.append(match.strip())
+        for match in scan.findall('winches'):
+            if match and len(match.strip()) > 3:
+                winch_details.append(match.strip())
         
         # Map winch details to specific form fields
         if winch_details:
@@ -1471,103 +1552,44 @@ class YachtScraperService:
                 if not rigging_data.get('genoaSheetwinches') and len(remaining_winches) > 2:
                     rigging_data['genoaSheetwinches'] = remaining_winches[2]
         
-        # Enhanced mast extraction
-        mast_patterns = [
-            r'mast[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+(?:\.\d+)?\s*(?:m|ft|feet|meter)[^,\n]*mast[^,\n]*)',
-            r'([A-Za-z]+\s+mast[^,\n]*)',
-            r'(aluminum\s+mast[^,\n]*)',
-            r'(carbon\s+mast[^,\n]*)'
-        ]
-        
-        for pattern in mast_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                rigging_data['mast'] = match.group(1).strip()
-                break
-        
-        # Enhanced boom extraction
-        boom_patterns = [
-            r'boom[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+(?:\.\d+)?\s*(?:m|ft|feet|meter)[^,\n]*boom[^,\n]*)',
-            r'([A-Za-z]+\s+boom[^,\n]*)'
-        ]
-        
-        for pattern in boom_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                rigging_data['boom'] = match.group(1).strip()
-                break
-        
-        # Enhanced sail extraction
-        sail_patterns = [
-            r'mainsail[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'genoa[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'jib[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'spinnaker[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])'
-        ]
-        
-        sail_types = ['mainsail', 'genoa', 'jib', 'spinnaker']
-        for i, sail_type in enumerate(sail_types):
-            for pattern in sail_patterns:
-                if sail_type in pattern:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        rigging_data[sail_type] = match.group(1).strip()
-                        break
-        
-        # Enhanced spreaders extraction
-        spreader_patterns = [
-            r'spreaders?[:\s]*([^,\n]+?)(?=\s*[A-Z]|\s*$|\s*[,\n])',
-            r'(\d+\s*spreaders?[^,\n]*)',
-            r'([A-Za-z]+\s+spreaders?[^,\n]*)'
-        ]
-        
-        for pattern in spreader_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
+        # Mast, boom, sails and spreaders
+        for field in ('mast', 'boom', 'mainsail', 'genoa', 'jib', 'spinnaker', 'spreaders'):
+            match = scan.first(field)
             if match:
-                rigging_data['spreaders'] = match.group(1).strip()
-                break
+                rigging_data[field] = match.group(1).strip()
         
         return rigging_data
     
-    def _scan_machinery_section(self, page_text: str) -> Dict[str, Any]:
+    def _scan_machinery_section(self, page_text: Union[PageText, str]) -> Dict[str, Any]:
         """Scan for machinery data in full page text"""
         machinery_data = {}
         
         try:
-            # Engine patterns
-            engine_patterns = [
-                r'(\d+)x\s+([A-Za-z\s]+?)\s+(\w+)\s*(\w*)',  # "1x Yanmar 4JH110 diesel"
-                r'engine.*?(\d+)\s*(?:HP|hp)',  # "Engine 110 HP"
-                r'(\d+)\s*(?:HP|hp).*?engine',  # "110 HP engine"
-            ]
+            scan = MACHINERY_SCAN.scan(page_text)
             
-            for pattern in engine_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    if len(match.groups()) >= 3:  # De Valk pattern
-                        machinery_data['numberOfEngines'] = int(match.group(1))
-                        machinery_data['make'] = match.group(2).strip()
-                        machinery_data['type'] = match.group(3).strip()
-                        if len(match.groups()) >= 4:
-                            machinery_data['fuel'] = match.group(4).strip()
-                        logger.info(f"✅ Machinery: {machinery_data['numberOfEngines']}x {machinery_data['make']} {machinery_data['type']}")
-                        break
-                    elif len(match.groups()) >= 1:
-                        if 'HP' in pattern or 'hp' in pattern:
-                            machinery_data['hp'] = int(match.group(1))
-                            logger.info(f"✅ Machinery HP: {machinery_data['hp']}")
-                        break
+            # Engine patterns
+            match = scan.first('engine')
+            if match:
+                if len(match.groups()) >= 3:  # De Valk pattern
+                    machinery_data['numberOfEngines'] = int(match.group(1))
+                    machinery_data['make'] = match.group(2).strip()
+                    machinery_data['type'] = match.group(3).strip()
+                    if len(match.groups()) >= 4:
+                        machinery_data['fuel'] = match.group(4).strip()
+                    logger.info(f"✅ Machinery: {machinery_data['numberOfEngines']}x {machinery_data['make']} {machinery_data['type']}")
+                elif len(match.groups()) >= 1:
+                    if 'HP' in match.re.pattern or 'hp' in match.re.pattern:
+                        machinery_data['hp'] = int(match.group(1))
+                        logger.info(f"✅ Machinery HP: {machinery_data['hp']}")
             
             # Fuel tank patterns
-            fuel_match = re.search(r'fuel tank.*?(\d+)\s*litre', page_text, re.IGNORECASE)
+            fuel_match = scan.first('fuelTankLitre')
             if fuel_match:
                 machinery_data['fuelTankLitre'] = int(fuel_match.group(1))
                 logger.info(f"✅ Machinery: Fuel tank {machinery_data['fuelTankLitre']}L")
             
             # Water tank patterns
-            water_match = re.search(r'water tank.*?(\d+)\s*litre', page_text, re.IGNORECASE)
+            water_match = scan.first('waterTankLitre')
             if water_match:
                 machinery_data['waterTankLitre'] = int(water_match.group(1))
                 logger.info(f"✅ Machinery: Water tank {machinery_data['waterTankLitre']}L")
@@ -1577,35 +1599,29 @@ class YachtScraperService:
         
         return machinery_data
     
-    def _scan_general_specifications(self, page_text: str) -> Dict[str, Any]:
+    def _scan_general_specifications(self, page_text: Union[PageText, str]) -> Dict[str, Any]:
         """Scan for general specifications in full page text"""
         specs_data = {}
         
         try:
-            # Material patterns
-            material_patterns = [
-                r'material.*?(\w+)',  # "Material: GRP"
-                r'hull.*?(\w+)',      # "Hull: GRP"
-                r'(\w+)\s*material'   # "GRP material"
-            ]
+            scan = GENERAL_SPECS_SCAN.scan(page_text)
             
-            for pattern in material_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    material = match.group(1).strip()
-                    if material.lower() in ['grp', 'fiberglass', 'steel', 'aluminum', 'wood']:
-                        specs_data['hullMaterial'] = material
-                        logger.info(f"✅ General specs: Hull material = {material}")
-                        break
+            # Material patterns: the first match naming a known material wins
+            for match in scan.matches('hullMaterial'):
+                material = match.group(1).strip()
+                if material.lower() in ['grp', 'fiberglass', 'steel', 'aluminum', 'wood']:
+                    specs_data['hullMaterial'] = material
+                    logger.info(f"✅ General specs: Hull material = {material}")
+                    break
             
             # Condition patterns
-            condition_match = re.search(r'condition.*?(\w+(?:\s+\w+)*)', page_text, re.IGNORECASE)
+            condition_match = scan.first('condition')
             if condition_match:
                 specs_data['condition'] = condition_match.group(1).strip()
                 logger.info(f"✅ General specs: Condition = {specs_data['condition']}")
             
             # Location patterns
-            location_match = re.search(r'location.*?([A-Za-z\s]+?)(?:\n|\.|$)', page_text, re.IGNORECASE)
+            location_match = scan.first('location')
             if location_match:
                 specs_data['location'] = location_match.group(1).strip()
                 logger.info(f"✅ General specs: Location = {specs_data['location']}")
@@ -1615,49 +1631,33 @@ class YachtScraperService:
         
         return specs_data
     
-    def _post_process_ai_results(self, ai_data: Dict[str, Any], page_text: str) -> Dict[str, Any]:
+    def _post_process_ai_results(self, ai_data: Dict[str, Any], page_text: Union[PageText, str]) -> Dict[str, Any]:
         """Post-process AI results with additional pattern matching for accuracy"""
         processed = ai_data.copy()
         
         try:
+            scan = POST_PROCESS_SCAN.scan(page_text)
+            
             # Enhanced HP/KW extraction from full text
             if not processed.get('hp') and not processed.get('kw'):
                 logger.info("🔍 Post-processing: Looking for HP/KW patterns in full text")
                 
-                # Multiple HP/KW patterns
-                hp_patterns = [
-                    r'(\d+\.?\d*)\s*(?:HP|hp|horsepower)',
-                    r'(?:HP|hp|horsepower)\s*(\d+\.?\d*)',
-                    r'(\d+\.?\d*)\s*\(hp\)',
-                    r'(\d+)x\s+[A-Za-z]+\s+\w*(\d+)\s*[A-Za-z]*'  # De Valk pattern
-                ]
-                
-                kw_patterns = [
-                    r'(\d+\.?\d*)\s*(?:KW|kw|kilowatt)',
-                    r'(?:KW|kw|kilowatt)\s*(\d+\.?\d*)',
-                    r'(\d+\.?\d*)\s*\(kw\)'
-                ]
-                
                 # Try HP patterns
-                for pattern in hp_patterns:
-                    hp_match = re.search(pattern, page_text, re.IGNORECASE)
-                    if hp_match:
-                        if len(hp_match.groups()) == 2:  # De Valk pattern
-                            hp = int(hp_match.group(2))
-                        else:
-                            hp = int(float(hp_match.group(1)))
-                        processed['hp'] = hp
-                        logger.info(f"✅ Post-processing found HP: {hp}")
-                        break
+                hp_match = scan.first('hp')
+                if hp_match:
+                    if len(hp_match.groups()) == 2:  # De Valk pattern
+                        hp = int(hp_match.group(2))
+                    else:
+                        hp = int(float(hp_match.group(1)))
+                    processed['hp'] = hp
+                    logger.info(f"✅ Post-processing found HP: {hp}")
                 
                 # Try KW patterns
-                for pattern in kw_patterns:
-                    kw_match = re.search(pattern, page_text, re.IGNORECASE)
-                    if kw_match:
-                        kw = float(kw_match.group(1))
-                        processed['kw'] = kw
-                        logger.info(f"✅ Post-processing found KW: {kw}")
-                        break
+                kw_match = scan.first('kw')
+                if kw_match:
+                    kw = float(kw_match.group(1))
+                    processed['kw'] = kw
+                    logger.info(f"✅ Post-processing found KW: {kw}")
                 
                 # Calculate missing values
                 if processed.get('hp') and not processed.get('kw'):
@@ -1673,32 +1673,16 @@ class YachtScraperService:
                 accommodation_data = {}
                 
                 # Cabin patterns
-                cabin_patterns = [
-                    r'(\d+)\s*cabin',
-                    r'(\d+)\s*stateroom',
-                    r'(\d+)\s*bedroom'
-                ]
-                
-                for pattern in cabin_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        accommodation_data['numberOfCabins'] = int(match.group(1))
-                        logger.info(f"✅ Post-processing found cabins: {accommodation_data['numberOfCabins']}")
-                        break
+                match = scan.first('numberOfCabins')
+                if match:
+                    accommodation_data['numberOfCabins'] = int(match.group(1))
+                    logger.info(f"✅ Post-processing found cabins: {accommodation_data['numberOfCabins']}")
                 
                 # Berth patterns
-                berth_patterns = [
-                    r'(\d+)\s*berth',
-                    r'(\d+)\s*sleep',
-                    r'(\d+)\s*person'
-                ]
-                
-                for pattern in berth_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        accommodation_data['numberOfBerths'] = int(match.group(1))
-                        logger.info(f"✅ Post-processing found berths: {accommodation_data['numberOfBerths']}")
-                        break
+                match = scan.first('numberOfBerths')
+                if match:
+                    accommodation_data['numberOfBerths'] = int(match.group(1))
+                    logger.info(f"✅ Post-processing found berths: {accommodation_data['numberOfBerths']}")
                 
                 if accommodation_data:
                     processed['accommodation'] = accommodation_data
@@ -1706,19 +1690,11 @@ class YachtScraperService:
             # Enhanced price extraction
             if not processed.get('price'):
                 logger.info("🔍 Post-processing: Looking for price patterns")
-                price_patterns = [
-                    r'[\€\$£]?\s*([\d,]+(?:\.\d{3})?)',
-                    r'(\d+(?:,\d{3})*(?:\.\d{2})?)\s*[\€\$£]',
-                    r'asking price.*?[\€\$£]?\s*([\d,]+(?:\.\d{3})?)'
-                ]
-                
-                for pattern in price_patterns:
-                    match = re.search(pattern, page_text, re.IGNORECASE)
-                    if match:
-                        price_str = match.group(1).replace('.', '').replace(',', '')
-                        processed['price'] = price_str
-                        logger.info(f"✅ Post-processing found price: {price_str}")
-                        break
+                match = scan.first('price')
+                if match:
+                    price_str = match.group(1).replace('.', '').replace(',', '')
+                    processed['price'] = price_str
+                    logger.info(f"✅ Post-processing found price: {price_str}")
             
             logger.info(f"✅ Post-processing complete: {len(processed)} fields")
             return processed
@@ -1728,129 +1704,200 @@ class YachtScraperService:
             return ai_data
     
     def scrape_yacht_listing(self, url: str) -> Dict[str, Any]:
-        """Main scraping method that detects listing type and applies appropriate scraper"""
+        """Main scraping method: runs the extraction cascade, cheapest tier first"""
         logger.info(f"Starting to scrape yacht listing: {url}")
         
         listing_type = self.detect_listing_type(url)
         logger.info(f"Detected listing type: {listing_type}")
         
-        # PRIORITY 1: AI Text Scanning (HTML-structure independent)
-        logger.info("🤖 PRIORITY 1: Starting AI text scanning extraction")
-        try:
-            # Get page source with Selenium for JavaScript rendering
-            driver = self.get_chrome_driver()
-            if driver:
-                driver.get(url)
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                page_source = driver.page_source
-                driver.quit()
-                
-                # Extract data using AI text scanning
-                ai_text_data = self._ai_text_scan_extraction(page_source, url)
-                if ai_text_data:
-                    logger.info(f"✅ AI text scanning successful: {len(ai_text_data)} fields")
-                    
-                    # Calculate completeness and return
-                    ai_text_data['dataCompleteness'] = self._calculate_completeness(ai_text_data)
-                    ai_text_data['sourceUrl'] = url
-                    ai_text_data['scrapedAt'] = time.time()
-                    
-                    logger.info(f"🎯 AI text scanning complete: {len(ai_text_data)} fields, {ai_text_data['dataCompleteness']}% completeness")
-                    return ai_text_data
-                else:
-                    logger.warning("⚠️ AI text scanning failed, falling back to traditional methods")
-            else:
-                logger.warning("⚠️ Chrome driver failed, falling back to traditional methods")
-        except Exception as e:
-            logger.warning(f"AI text scanning failed: {e}, falling back to traditional methods")
-        
-        # PRIORITY 2: Traditional Selenium + Fallback (existing logic)
-        logger.info("🔄 PRIORITY 2: Using traditional Selenium + fallback methods")
-        
-        # Get data from both Selenium and fallback methods
-        selenium_data = {}
-        fallback_data = {}
-        
-        if listing_type == 'devalk':
-            try:
-                selenium_data = self.scrape_devalk(url)
-                logger.info(f"Selenium extracted {len(selenium_data)} fields")
-            except Exception as e:
-                logger.warning(f"Selenium failed, using fallback: {e}")
-                selenium_data = {}
-        elif listing_type == 'yachtworld':
-            try:
-                selenium_data = self.scrape_yachtworld(url)
-                logger.info(f"Selenium extracted {len(selenium_data)} fields")
-            except Exception as e:
-                logger.warning(f"Selenium failed, using fallback: {e}")
-                selenium_data = {}
-        
-        # Always get fallback data as backup
-        try:
-            fallback_data = self._fallback_scraping(url)
-            logger.info(f"Fallback extracted {len(fallback_data)} fields")
-        except Exception as e:
-            logger.warning(f"Fallback failed: {e}")
-            fallback_data = {}
-        
-        # Smart merge: prefer Selenium data, but keep fallback for missing fields
-        merged_data = {}
-        
-        # Start with fallback data (more reliable for basic fields)
-        merged_data.update(fallback_data)
-        
-        # Override with Selenium data (better for complex elements)
-        for key, value in selenium_data.items():
-            if value and value != "" and value != "None":
-                merged_data[key] = value
-                logger.info(f"Using Selenium data for {key}: {value}")
+        # Pages are loaded by the first tier that needs them and reused by the rest
+        merged_data, trace = self.cascade.run(url, {'listing_type': listing_type})
         
         # Calculate data completeness
         merged_data['dataCompleteness'] = self._calculate_completeness(merged_data)
+        merged_data['extractionTiers'] = trace
         merged_data['sourceUrl'] = url
         merged_data['scrapedAt'] = time.time()
         
         logger.info(f"Final merged data: {len(merged_data)} fields, {merged_data['dataCompleteness']}% completeness")
         return merged_data
     
+    def cascade_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tier latency and hit rate of the extraction cascade"""
+        return self.cascade.stats()
+    
+    def _build_cascade(self, tier_order: str, threshold: Optional[float]) -> ExtractionCascade:
+        available = {
+            'static': self._static_tier,
+            'browser': self._browser_tier,
+            'llm': self._llm_tier,
+        }
+        tiers = []
+        for name in parse_tier_order(tier_order):
+            if name in available:
+                tiers.append((name, available[name]))
+            else:
+                logger.warning(f"⚠️ Unknown extraction tier '{name}' ignored (known: {', '.join(available)})")
+        return ExtractionCascade(tiers, self._calculate_completeness, self._fill_missing, threshold)
+    
+    def _static_tier(self, url: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Plain HTTP fetch with the deterministic parsers; no browser, no LLM"""
+        page = state['static_page'] = self.fetch_page(url, render=False)
+        data = self._static_extraction(url, page, state['listing_type'])
+        
+        if self.render_classifier and self.render_classifier.decide(url) == SAMPLE:
+            # Still learning this URL template: extract from a rendered copy too and compare.
+            # The browser tier reuses the render if the cascade gets that far.
+            try:
+                rendered = state['rendered_page'] = self.render_page(url, state['listing_type'])
+                rendered_data = state['rendered_data'] = self._static_extraction(url, rendered, state['listing_type'])
+                self.render_classifier.record(url, self._filled_field_names(data),
+                                              self._filled_field_names(rendered_data))
+            except Exception as e:
+                logger.warning(f"⚠️ Render sample failed for {url}: {e}")
+        return data
+    
+    def _static_extraction(self, url: str, page: PageContext, listing_type: str) -> Dict[str, Any]:
+        data = {}
+        if listing_type == 'devalk':
+            data = self._devalk_static_scraping(page)
+        self._fill_missing(data, self._fallback_scraping(url, page))
+        return data
+    
+    def _filled_field_names(self, data: Dict[str, Any]) -> List[str]:
+        """Filled completeness fields, with nested sections expanded to section.key"""
+        names = []
+        for field in YACHT_FIELDS:
+            value = data.get(field)
+            if not self._is_filled(value):
+                continue
+            names.append(field)
+            if isinstance(value, dict):
+                names.extend(f"{field}.{key}" for key, sub_value in value.items() if self._is_filled(sub_value))
+        return names
+    
+    def _browser_tier(self, url: str, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Chrome-rendered page with the site-specific and generic scrapers"""
+        if 'rendered_page' not in state and self.render_classifier and self.render_classifier.decide(url) == STATIC:
+            logger.info(f"⏭️ Static HTML is enough for {url_template(url)}, skipping the browser")
+            return None
+        page = state.get('rendered_page') or self.render_page(url, state['listing_type'])
+        state['rendered_page'] = page
+        data = {}
+        if state['listing_type'] == 'devalk':
+            data = self.scrape_devalk(url, page) or {}
+        elif state['listing_type'] == 'yachtworld':
+            data = self.scrape_yachtworld(url, page) or {}
+        # The deterministic parsers again, now over the rendered DOM (already run if this page was a sample)
+        rendered_data = state.get('rendered_data') or self._static_extraction(url, page, state['listing_type'])
+        self._fill_missing(data, rendered_data)
+        return data
+    
+    def _llm_tier(self, url: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """LLM extraction over the best page an earlier tier loaded"""
+        page = state.get('rendered_page') or state.get('static_page') or self.fetch_page(url, state['listing_type'])
+        merged = state.get('merged') or {}
+        if not any(self._is_filled(value) for value in merged.values()):
+            return self._ai_text_scan_extraction(url, page)
+        
+        # Deterministic tiers got part of the listing: ask only for the gaps, in a single request
+        missing = [field for field in LLM_FILLABLE_FIELDS if not self._is_filled(merged.get(field))]
+        if not missing:
+            return {}
+        logger.info(f"🤖 Requesting {len(missing)} missing fields from the LLM in one call")
+        values = self.ai_extractor.extract_fields(page.html, missing, {field: LLM_FILLABLE_FIELDS[field] for field in missing})
+        return self._normalize_llm_fields(values)
+    
+    def _normalize_llm_fields(self, values: Dict[str, Optional[str]]) -> Dict[str, Any]:
+        """Field values as the deterministic tiers produce them: metric numbers as floats, bare price digits"""
+        data = {}
+        for field, value in values.items():
+            if value is None:
+                continue
+            if field in LLM_NUMERIC_FIELDS:
+                numbers = re.findall(r'\d+(?:[.,]\d+)?', value)
+                if not numbers:
+                    continue
+                value = float(numbers[0].replace(',', '.'))
+            elif field == 'price':
+                # Drop cents (",00" / ".00") before keeping the digits of "€ 275.000,00"
+                value = re.sub(r'[^\d]', '', re.sub(r'[.,]\d{2}$', '', value.strip()))
+                if not value:
+                    continue
+            elif field == 'currency':
+                value = value.upper()
+                if value not in ('EUR', 'USD', 'GBP'):
+                    continue
+            data[field] = value
+        if data.get('make'):
+            data['brand'] = data['make']
+        for legacy, field in (('length', 'loaM'), ('beam', 'beamM'), ('draft', 'draftM')):
+            if field in data:
+                data[legacy] = str(data[field])
+        return data
+    
+    def _devalk_static_scraping(self, page: PageContext) -> Dict[str, Any]:
+        """De Valk sections from the static HTML, mapped onto the listing schema"""
+        sections = self.devalk_parser.extract_sections(page.html)
+        
+        data = {}
+        for section, field_map in DEVALK_LISTING_FIELDS.items():
+            for source_field, field in field_map.items():
+                value = sections.get(section, {}).get(source_field)
+                if value and field not in data:
+                    data[field] = value
+        for field in DEVALK_NUMERIC_FIELDS:
+            if field in data:
+                numbers = re.findall(r'\d+(?:[.,]\d+)?', data[field])
+                if numbers:
+                    data[field] = float(numbers[-1].replace(',', '.'))
+                else:
+                    del data[field]
+        
+        asking_price = sections.get('tableBox', {}).get('askingPrice', '')
+        price_match = re.search(r'[\d.,]+\d', asking_price)
+        if price_match:
+            data['price'] = re.sub(r'[^\d]', '', price_match.group(0))
+            if '€' in asking_price:
+                data['currency'] = 'EUR'
+        if data.get('make'):
+            data['brand'] = data['make']
+        for legacy, field in (('length', 'loaM'), ('beam', 'beamM'), ('draft', 'draftM')):
+            if field in data:
+                data[legacy] = str(data[field])
+        
+        for section in ('accommodation', 'machinery', 'equipment', 'rigging', 'navigation'):
+            if sections.get(section):
+                data[section] = dict(sections[section])
+        
+        logger.info(f"⚡ De Valk static parsing: {len(data)} fields")
+        return data
+    
+    @staticmethod
+    def _is_filled(value) -> bool:
+        """Same notion of a filled value as _calculate_completeness"""
+        return bool(value) and value != "None"
+    
+    def _missing_fields(self, data: Dict[str, Any]) -> List[str]:
+        """Completeness fields no tier has filled yet"""
+        return [field for field in YACHT_FIELDS if not self._is_filled(data.get(field))]
+    
+    def _fill_missing(self, merged: Dict[str, Any], tier_data: Dict[str, Any]):
+        """Copy values from a lower-priority tier only where merged has nothing yet"""
+        for key, value in tier_data.items():
+            if not self._is_filled(value):
+                continue
+            current = merged.get(key)
+            if not self._is_filled(current):
+                merged[key] = value
+            elif isinstance(current, dict) and isinstance(value, dict):
+                for sub_key, sub_value in value.items():
+                    if self._is_filled(sub_value) and not self._is_filled(current.get(sub_key)):
+                        current[sub_key] = sub_value
+    
     def _calculate_completeness(self, data: Dict[str, Any]) -> float:
         """Calculate the completeness percentage of scraped data"""
-        # Comprehensive list of all yacht fields we can extract (mapped to your schema)
-        yacht_fields = [
-            # Basic Information
-            'title', 'make', 'model', 'year', 'description', 'heroImage', 'galleryImages',
-            
-            # Dimensions (your schema fields)
-            'loaM', 'lwlM', 'beamM', 'draftM', 'airDraftM', 'headroomM',
-            
-            # General Information
-            'country', 'designer', 'displacementT', 'ballastTonnes', 'hullColor', 'hullMaterial', 'boatType',
-            'designYear', 'lastRefit', 'classification', 'location',
-            
-            # Price
-            'price', 'currency',
-            
-            # Machinery (nested object)
-            'machinery',
-            
-            # Accommodation (nested object)
-            'accommodation',
-            
-            # Equipment (nested object) - comprehensive categories
-            'equipment',
-            
-            # Rigging (nested object) - sailing-specific
-            'rigging',
-            
-            # Navigation (nested object) - electronics & instruments
-            'navigation',
-            
-            # Legacy fields for backward compatibility
-            'length', 'beam', 'draft', 'brand', 'engineMake'
-        ]
+        yacht_fields = YACHT_FIELDS
         
         # Count filled fields with detailed breakdown
         filled_fields = 0
@@ -2003,6 +2050,25 @@ class YachtScraperService:
         
         return data
     
+    def _extract_general_fields_from_content(self, content, general):
+        """Fill the General Information fields found in a section (or the whole page)"""
+        general_fields = [
+            'MODEL', 'TYPE', 'LOA (M)', 'LWL (M)', 'BEAM (M)', 'DRAFT (M)',
+            'AIR DRAFT (M)', 'HEADROOM (M)', 'YEAR BUILT', 'BUILDER',
+            'COUNTRY', 'DESIGNER', 'DISPLACEMENT (T)', 'BALLAST (TONNES)',
+            'HULL MATERIAL', 'HULL COLOUR', 'HULL SHAPE', 'KEEL TYPE',
+            'DECK MATERIAL', 'DECK FINISH', 'FUEL TANK (LITRE)',
+            'FRESHWATER TANK (LITRE)', 'WHEEL STEERING', 'OUTSIDE HELM POSITION'
+        ]
+        
+        for field in general_fields:
+            value = self._extract_text(content, field)
+            if value:
+                # "LOA (M)" -> "loa_m", matching the fallback keys below
+                key = re.sub(r'[^a-z0-9]+', '_', field.lower()).strip('_')
+                general[key] = value
+                logger.debug(f"✅ General: {field} = {value}")
+    
     def _extract_text(self, soup, field_name):
         """Extract text value for a specific De Valk field name"""
         try:
@@ -10,6 +10,8 @@ import requests
 from datetime import datetime
 from typing import Dict, Any
 from bs4 import BeautifulSoup
+from http_session import ThreadLocalSessions
+from page_text import PageText
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,11 +22,16 @@ class SimpleDeValkParser:
     
     def __init__(self):
         """Initialize the simple parser"""
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-thread sessions over a shared connection pool so one instance is safe across threads
+        self._sessions = ThreadLocalSessions({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
     
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session owned by the calling thread"""
+        return self._sessions.session
+    
     def parse_yacht_listing(self, url: str) -> Dict[str, Any]:
         """
         Parse a De Valk yacht listing URL using simple HTTP requests
@@ -44,6 +51,7 @@ class SimpleDeValkParser:
             
             # Parse with BeautifulSoup
             soup = BeautifulSoup(response.content, 'html.parser')
+            page = PageText(soup)
             
             # Extract data
             data = {
@@ -54,14 +62,14 @@ class SimpleDeValkParser:
             }
             
             # Extract all sections in the format the frontend expects
-            data.update(self._extract_key_details(soup))
-            data.update(self._extract_general_info(soup))
-            data.update(self._extract_accommodation(soup))
-            data.update(self._extract_machinery(soup))
-            data.update(self._extract_navigation(soup))
-            data.update(self._extract_equipment(soup))
-            data.update(self._extract_rigging(soup))
-            data.update(self._extract_indication_ratios(soup))
+            data.update(self._extract_key_details(page))
+            data.update(self._extract_general_info(page))
+            data.update(self._extract_accommodation(page))
+            data.update(self._extract_machinery(page))
+            data.update(self._extract_navigation(page))
+            data.update(self._extract_equipment(page))
+            data.update(self._extract_rigging(page))
+            data.update(self._extract_indication_ratios(page))
             
             logger.info(f"✅ Simple De Valk parsing completed")
             return data
@@ -70,13 +78,13 @@ class SimpleDeValkParser:
             logger.error(f"❌ Error in simple De Valk parsing: {e}")
             return {'error': str(e), 'source_url': url}
     
-    def _extract_basic_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_basic_info(self, page: PageText) -> Dict[str, Any]:
         """Extract basic yacht information"""
         basic_info = {}
         
         try:
             # Try to get yacht name from title
-            title = soup.find('title')
+            title = page.soup.find('title')
             if title:
                 title_text = title.get_text().strip()
                 if 'De Valk' in title_text:
@@ -93,7 +101,7 @@ class SimpleDeValkParser:
                 r'Asking[:\s]*€?\s*([\d,]+)'
             ]
             
-            page_text = soup.get_text()
+            page_text = page.raw
             for pattern in price_patterns:
                 match = re.search(pattern, page_text, re.IGNORECASE)
                 if match:
@@ -107,13 +115,13 @@ class SimpleDeValkParser:
         
         return {'basic_info': basic_info}
     
-    def _extract_key_details(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_key_details(self, page: PageText) -> Dict[str, Any]:
         """Extract key details from the page"""
         key_details = {}
         
         try:
             # Look for common yacht specifications
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Dimensions pattern
             dim_pattern = r'(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*x\s*(\d+\.?\d*)\s*\(m\)'
@@ -169,15 +177,15 @@ class SimpleDeValkParser:
         
         return {'keyDetails': key_details}
     
-    def _extract_general_info(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_general_info(self, page: PageText) -> Dict[str, Any]:
         """Extract general yacht information"""
         general_info = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Model pattern - extract from title or page content
-            title = soup.find('title')
+            title = page.soup.find('title')
             if title:
                 title_text = title.get_text().strip()
                 if 'De Valk' in title_text:
@@ -265,12 +273,12 @@ class SimpleDeValkParser:
         
         return {'generalInfo': general_info}
     
-    def _extract_accommodation(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_accommodation(self, page: PageText) -> Dict[str, Any]:
         """Extract accommodation information"""
         accommodation = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Extract actual values from the page content
             # Cabins
@@ -286,71 +294,71 @@ class SimpleDeValkParser:
                 logger.info(f"✅ Berths: {accommodation['berths']}")
             
             # Interior
-            if 'teak' in page_text.lower():
+            if 'teak' in page.lower:
                 accommodation['interior'] = 'Teak'
                 logger.info(f"✅ Interior: Teak")
-            elif 'mahogany' in page_text.lower():
+            elif 'mahogany' in page.lower:
                 accommodation['interior'] = 'Mahogany'
                 logger.info(f"✅ Interior: Mahogany")
             
             # Layout
-            if 'classic' in page_text.lower():
+            if 'classic' in page.lower:
                 accommodation['layout'] = 'Classic'
-            elif 'modern' in page_text.lower():
+            elif 'modern' in page.lower:
                 accommodation['layout'] = 'Modern'
             
             # Floor
-            if 'teak and holly' in page_text.lower():
+            if 'teak and holly' in page.lower:
                 accommodation['floor'] = 'Teak and holly'
-            elif 'teak' in page_text.lower():
+            elif 'teak' in page.lower:
                 accommodation['floor'] = 'Teak'
             
             # Additional accommodation features
-            if 'open cockpit' in page_text.lower():
+            if 'open cockpit' in page.lower:
                 accommodation['openCockpit'] = 'Yes'
                 logger.info(f"✅ Open cockpit: Yes")
             
-            if 'aft deck' in page_text.lower():
+            if 'aft deck' in page.lower:
                 accommodation['aftDeck'] = 'Yes'
                 logger.info(f"✅ Aft deck: Yes")
             
-            if 'saloon' in page_text.lower() or 'salon' in page_text.lower():
+            if 'saloon' in page.lower or 'salon' in page.lower:
                 accommodation['saloon'] = 'Yes'
                 logger.info(f"✅ Saloon: Yes")
             
             # Heating
-            if 'webasto' in page_text.lower():
+            if 'webasto' in page.lower:
                 accommodation['heating'] = 'Webasto diesel heater'
                 logger.info(f"✅ Heating: Webasto diesel heater")
-            elif 'heating' in page_text.lower():
+            elif 'heating' in page.lower:
                 accommodation['heating'] = 'Yes'
                 logger.info(f"✅ Heating: Yes")
             
             # Navigation center
-            if 'navigation center' in page_text.lower():
+            if 'navigation center' in page.lower:
                 accommodation['navigationCenter'] = 'Yes'
                 logger.info(f"✅ Navigation center: Yes")
             
             # Chart table
-            if 'chart table' in page_text.lower():
+            if 'chart table' in page.lower:
                 accommodation['chartTable'] = 'Yes'
                 logger.info(f"✅ Chart table: Yes")
             
             # Galley
-            if 'galley' in page_text.lower():
+            if 'galley' in page.lower:
                 accommodation['galley'] = 'Yes'
                 logger.info(f"✅ Galley: Yes")
             
             # Appliances
-            if 'microwave' in page_text.lower():
+            if 'microwave' in page.lower:
                 accommodation['microwave'] = 'Yes'
                 logger.info(f"✅ Microwave: Yes")
             
-            if 'fridge' in page_text.lower():
+            if 'fridge' in page.lower:
                 accommodation['fridge'] = 'Yes'
                 logger.info(f"✅ Fridge: Yes")
             
-            if 'freezer' in page_text.lower():
+            if 'freezer' in page.lower:
                 accommodation['freezer'] = 'Yes'
                 logger.info(f"✅ Freezer: Yes")
             
@@ -359,12 +367,12 @@ class SimpleDeValkParser:
         
         return {'accommodation': accommodation}
     
-    def _extract_machinery(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_machinery(self, page: PageText) -> Dict[str, Any]:
         """Extract machinery information"""
         machinery = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Enhanced engine extraction
             engine_match = re.search(r'(\d+x\s+[A-Za-z\s]+)', page_text)
@@ -374,10 +382,10 @@ class SimpleDeValkParser:
                 logger.info(f"✅ Engine: {engine_match.group(1)}")
             
             # Engine make
-            if 'volvo' in page_text.lower():
+            if 'volvo' in page.lower:
                 machinery['make'] = 'Volvo Penta'
                 logger.info(f"✅ Engine make: Volvo Penta")
-            elif 'yanmar' in page_text.lower():
+            elif 'yanmar' in page.lower:
                 machinery['make'] = 'Yanmar'
                 logger.info(f"✅ Engine make: Yanmar")
             
@@ -394,10 +402,10 @@ class SimpleDeValkParser:
                     logger.info(f"✅ KW: {value}")
             
             # Fuel type
-            if 'diesel' in page_text.lower():
+            if 'diesel' in page.lower:
                 machinery['fuel'] = 'Diesel'
                 logger.info(f"✅ Fuel: Diesel")
-            elif 'petrol' in page_text.lower():
+            elif 'petrol' in page.lower:
                 machinery['fuel'] = 'Petrol'
                 logger.info(f"✅ Fuel: Petrol")
             
@@ -416,10 +424,10 @@ class SimpleDeValkParser:
                 logger.info(f"✅ Max speed: {speed_match.group(1)} kn")
             
             # Drive type
-            if 'shaft' in page_text.lower():
+            if 'shaft' in page.lower:
                 machinery['drive'] = 'Shaft'
                 logger.info(f"✅ Drive: Shaft")
-            elif 'sail drive' in page_text.lower():
+            elif 'sail drive' in page.lower:
                 machinery['drive'] = 'Sail drive'
                 logger.info(f"✅ Drive: Sail drive")
             
@@ -428,17 +436,17 @@ class SimpleDeValkParser:
         
         return {'machinery': machinery}
     
-    def _extract_navigation(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_navigation(self, page: PageText) -> Dict[str, Any]:
         """Extract navigation information"""
         navigation = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Look for navigation equipment patterns
-            if 'compass' in page_text.lower():
+            if 'compass' in page.lower:
                 navigation['compass'] = 'Yes'
-            if 'gps' in page_text.lower():
+            if 'gps' in page.lower:
                 navigation['plotterGps'] = 'Yes'
             
         except Exception as e:
@@ -446,17 +454,17 @@ class SimpleDeValkParser:
         
         return {'navigation': navigation}
     
-    def _extract_equipment(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_equipment(self, page: PageText) -> Dict[str, Any]:
         """Extract equipment information"""
         equipment = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Look for equipment patterns
-            if 'anchor' in page_text.lower():
+            if 'anchor' in page.lower:
                 equipment['anchor'] = 'Yes'
-            if 'windlass' in page_text.lower():
+            if 'windlass' in page.lower:
                 equipment['windlass'] = 'Yes'
             
         except Exception as e:
@@ -464,17 +472,17 @@ class SimpleDeValkParser:
         
         return {'equipment': equipment}
     
-    def _extract_rigging(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_rigging(self, page: PageText) -> Dict[str, Any]:
         """Extract rigging information"""
         rigging = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Look for rigging patterns
-            if 'mainsail' in page_text.lower():
+            if 'mainsail' in page.lower:
                 rigging['mainsail'] = 'Yes'
-            if 'genoa' in page_text.lower():
+            if 'genoa' in page.lower:
                 rigging['genoa'] = 'Yes'
             
         except Exception as e:
@@ -482,15 +490,15 @@ class SimpleDeValkParser:
         
         return {'rigging': rigging}
     
-    def _extract_indication_ratios(self, soup: BeautifulSoup) -> Dict[str, Any]:
+    def _extract_indication_ratios(self, page: PageText) -> Dict[str, Any]:
         """Extract indication ratios"""
         ratios = {}
         
         try:
-            page_text = soup.get_text()
+            page_text = page.raw
             
             # Look for ratio patterns
-            if 'comfort' in page_text.lower():
+            if 'comfort' in page.lower:
                 ratios['comfortRatio'] = '35.33'  # Default value for now
             
         except Exception as e:
@@ -1,9 +1,16 @@
+import os
 import requests
 import re
 import logging
 from bs4 import BeautifulSoup
 from typing import Dict, Any, Optional
 import math
+from http_session import ThreadLocalSessions
+from http_cache import get_http_cache
+from result_cache import get_result_cache
+from devalk_sections import DeValkSectionExtractor
+from field_normalizer import normalize_table_box_label, normalize_specification_label
+from page_text import PageText
 
 class SuperEnhancedDeValkParser:
     """
@@ -12,19 +19,35 @@ class SuperEnhancedDeValkParser:
     Strategy: Multi-pattern extraction + context-aware parsing
     """
     
+    PARSER_VERSION = '5.0.0 - ULTIMATE UNIFIED'
+    
+    # 'lxml' walks the section nodes once; 'bs4' keeps the original BeautifulSoup extraction
+    PARSE_ENGINE = os.getenv('DEVALK_PARSE_ENGINE', 'lxml')
+    
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-thread sessions over a shared connection pool so one instance is safe across threads
+        self._sessions = ThreadLocalSessions({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         
+        # Conditional-GET cache so unchanged pages skip download and re-parse
+        self.http_cache = get_http_cache()
+        # Content-hash cache so byte-identical pages skip the re-parse
+        self.result_cache = get_result_cache()
+        
         # Pre-compile all regex patterns for performance
         self._compile_patterns()
+        self.section_extractor = DeValkSectionExtractor()
         
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session owned by the calling thread"""
+        return self._sessions.session
+    
     def _compile_patterns(self):
         """Pre-compile all regex patterns for maximum performance"""
         # Key Details patterns with enhanced dimension extraction
@@ -353,19 +376,19 @@ class SuperEnhancedDeValkParser:
         self.logger.info("🎯 Defaulting to traditional layout")
         return 'traditional'
 
-    def _extract_section_text_dual_layout(self, soup: BeautifulSoup, section_name: str, layout_type: str) -> str:
+    def _extract_section_text_dual_layout(self, page: PageText, section_name: str, layout_type: str) -> str:
         """Extract text from a specific section using dual-layout strategy"""
         if layout_type == 'accordion':
-            return self._extract_section_text_accordion(soup, section_name)
+            return self._extract_section_text_accordion(page, section_name)
         else:
-            return self._extract_section_text_traditional(soup, section_name)
+            return self._extract_section_text_traditional(page, section_name)
 
-    def _extract_section_text_accordion(self, soup: BeautifulSoup, section_name: str) -> str:
+    def _extract_section_text_accordion(self, page: PageText, section_name: str) -> str:
         """Extract text from Bootstrap accordion layout"""
         section_text = ""
         
         # Find accordion items
-        accordion_items = soup.find_all('div', class_='accordion-item')
+        accordion_items = page.soup.find_all('div', class_='accordion-item')
         
         for item in accordion_items:
             # Look for section button
@@ -381,12 +404,12 @@ class SuperEnhancedDeValkParser:
         
         return section_text
 
-    def _extract_section_text_traditional(self, soup: BeautifulSoup, section_name: str) -> str:
+    def _extract_section_text_traditional(self, page: PageText, section_name: str) -> str:
         """Extract text from traditional layout (existing method)"""
         section_text = ""
         
         # Strategy 1: Look for section headers
-        section_headers = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b'])
+        section_headers = page.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'strong', 'b'])
         for header in section_headers:
             if section_name.lower() in header.get_text().lower():
                 # Get all text until next header or end
@@ -398,7 +421,7 @@ class SuperEnhancedDeValkParser:
         
         # Strategy 2: Look for specific text patterns
         if not section_text:
-            text_content = soup.get_text()
+            text_content = page.raw
             # Find section boundaries
             section_pattern = re.compile(f'{section_name}.*?(?=\n[A-Z]|$)', re.IGNORECASE | re.DOTALL)
             match = section_pattern.search(text_content)
@@ -417,17 +440,27 @@ class SuperEnhancedDeValkParser:
             if not response:
                 return {'error': 'Failed to fetch page after multiple attempts'}
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Reuse a stored result when the page is unchanged (304) or byte-identical to one already parsed
+            cache_key = self.result_cache.make_key(response.content, self.PARSER_VERSION)
+            cached_result = self.http_cache.get_parsed(response, self.PARSER_VERSION) if self.http_cache else None
+            if cached_result is None:
+                cached_result = self.result_cache.get(cache_key)
+                if cached_result and self.http_cache:
+                    self.http_cache.store(url, response, cached_result, self.PARSER_VERSION)
+            if cached_result:
+                cached_result['url'] = url
+                cached_result['scraped_at'] = response.headers.get('date', '')
+                return cached_result
             
             # Use the UNIFIED parsing approach for 100% completion
-            all_data = self._extract_all_sections_unified(soup)
+            all_data = self.extract_sections(response.text)
             
             # Calculate total fields for completion tracking
             total_fields = sum(len(section) for section in all_data.values())
             
             result = {
                 'data': all_data,
-                'parser_version': '5.0.0 - ULTIMATE UNIFIED',
+                'parser_version': self.PARSER_VERSION,
                 'scraped_at': response.headers.get('date', ''),
                 'source': 'devalk_ultimate_unified_100_percent',
                 'url': url,
@@ -455,6 +488,10 @@ class SuperEnhancedDeValkParser:
             self.logger.info(f"   ⛵ Rigging: {len(all_data['rigging'])} fields")
             self.logger.info(f"   📊 Indication Ratios: {len(all_data['indicationRatios'])} fields")
             
+            self.result_cache.put(cache_key, result)
+            if self.http_cache:
+                self.http_cache.store(url, response, result, self.PARSER_VERSION)
+            
             return result
             
         except Exception as e:
@@ -465,7 +502,10 @@ class SuperEnhancedDeValkParser:
         """Fetch page with retry logic and exponential backoff"""
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, timeout=30)
+                if self.http_cache:
+                    response = self.http_cache.get(self.session, url, timeout=30)
+                else:
+                    response = self.session.get(url, timeout=30)
                 if response.status_code == 200:
                     return response
                 self.logger.warning(f"Attempt {attempt + 1}: Status {response.status_code}")
@@ -478,9 +518,9 @@ class SuperEnhancedDeValkParser:
         
         return None
     
-    def _extract_key_details_enhanced(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_key_details_enhanced(self, page: PageText) -> Dict[str, str]:
         """Enhanced key details extraction with multi-pattern strategy"""
-        text_content = soup.get_text()
+        text_content = page.raw
         results = self._extract_with_patterns(text_content, self.patterns_key_details)
         
         # Enhanced extraction for missing engines information
@@ -560,9 +600,9 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"🔑 Enhanced Key Details extracted: {len(results)} fields")
         return results
     
-    def _extract_general_info_enhanced(self, soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_general_info_enhanced(self, page: PageText) -> Dict[str, str]:
         """Enhanced general info extraction with context-aware parsing"""
-        text_content = soup.get_text()
+        text_content = page.raw
         results = self._extract_with_patterns(text_content, self.patterns_general_info)
         
         # Enhanced extraction for missing critical fields
@@ -709,14 +749,14 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"📋 Enhanced General Info extracted: {len(results)} fields")
         return results
     
-    def _extract_accommodation_enhanced(self, soup: BeautifulSoup, layout_type: str) -> Dict[str, str]:
+    def _extract_accommodation_enhanced(self, page: PageText, layout_type: str) -> Dict[str, str]:
         """Enhanced accommodation extraction with dual-layout support"""
         # Use dual-layout extraction strategy
-        section_text = self._extract_section_text_dual_layout(soup, 'Accommodation', layout_type)
+        section_text = self._extract_section_text_dual_layout(page, 'Accommodation', layout_type)
         
         if not section_text:
             # Fallback to full page text if section extraction fails
-            section_text = soup.get_text()
+            section_text = page.raw
         
         results = self._extract_with_patterns(section_text, self.patterns_accommodation)
         
@@ -766,14 +806,14 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"🏠 Enhanced Accommodation extracted: {len(results)} fields (Layout: {layout_type})")
         return results
     
-    def _extract_machinery_enhanced(self, soup: BeautifulSoup, layout_type: str) -> Dict[str, str]:
+    def _extract_machinery_enhanced(self, page: PageText, layout_type: str) -> Dict[str, str]:
         """Enhanced machinery extraction with dual-layout support"""
         # Use dual-layout extraction strategy
-        section_text = self._extract_section_text_dual_layout(soup, 'Machinery', layout_type)
+        section_text = self._extract_section_text_dual_layout(page, 'Machinery', layout_type)
         
         if not section_text:
             # Fallback to full page text if section extraction fails
-            section_text = soup.get_text()
+            section_text = page.raw
         
         results = self._extract_with_patterns(section_text, self.patterns_machinery)
         
@@ -830,14 +870,14 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"⚙️ Enhanced Machinery extracted: {len(results)} fields (Layout: {layout_type})")
         return results
     
-    def _extract_navigation_enhanced(self, soup: BeautifulSoup, layout_type: str) -> Dict[str, str]:
+    def _extract_navigation_enhanced(self, page: PageText, layout_type: str) -> Dict[str, str]:
         """Enhanced navigation extraction with dual-layout support"""
         # Use dual-layout extraction strategy
-        section_text = self._extract_section_text_dual_layout(soup, 'Navigation', layout_type)
+        section_text = self._extract_section_text_dual_layout(page, 'Navigation', layout_type)
         
         if not section_text:
             # Fallback to full page text if section extraction fails
-            section_text = soup.get_text()
+            section_text = page.raw
         
         results = self._extract_with_patterns(section_text, self.patterns_navigation)
         
@@ -889,14 +929,14 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"🧭 Enhanced Navigation extracted: {len(results)} fields (Layout: {layout_type})")
         return results
     
-    def _extract_equipment_enhanced(self, soup: BeautifulSoup, layout_type: str) -> Dict[str, str]:
+    def _extract_equipment_enhanced(self, page: PageText, layout_type: str) -> Dict[str, str]:
         """Enhanced equipment extraction with dual-layout support"""
         # Use dual-layout extraction strategy
-        section_text = self._extract_section_text_dual_layout(soup, 'Equipment', layout_type)
+        section_text = self._extract_section_text_dual_layout(page, 'Equipment', layout_type)
         
         if not section_text:
             # Fallback to full page text if section extraction fails
-            section_text = soup.get_text()
+            section_text = page.raw
         
         results = self._extract_with_patterns(section_text, self.patterns_equipment)
         
@@ -953,14 +993,14 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"🛠️ Enhanced Equipment extracted: {len(results)} fields (Layout: {layout_type})")
         return results
     
-    def _extract_rigging_enhanced(self, soup: BeautifulSoup, layout_type: str) -> Dict[str, str]:
+    def _extract_rigging_enhanced(self, page: PageText, layout_type: str) -> Dict[str, str]:
         """Enhanced rigging extraction with dual-layout support"""
         # Use dual-layout extraction strategy
-        section_text = self._extract_section_text_dual_layout(soup, 'Rigging', layout_type)
+        section_text = self._extract_section_text_dual_layout(page, 'Rigging', layout_type)
         
         if not section_text:
             # Fallback to full page text if section extraction fails
-            section_text = soup.get_text()
+            section_text = page.raw
         
         results = self._extract_with_patterns(section_text, self.patterns_rigging)
         
@@ -1019,11 +1059,11 @@ class SuperEnhancedDeValkParser:
         self.logger.info(f"⛵ Enhanced Rigging extracted: {len(results)} fields (Layout: {layout_type})")
         return results
     
-    def _extract_indication_ratios_enhanced(self, soup: BeautifulSoup, layout_type: str) -> Dict[str, str]:
+    def _extract_indication_ratios_enhanced(self, page: PageText, layout_type: str) -> Dict[str, str]:
         """Enhanced indication ratios extraction with dual-layout support"""
         # Use dual-layout extraction strategy for general info and rigging
-        general_info = self._extract_general_info_enhanced(soup)
-        rigging_info = self._extract_rigging_enhanced(soup, layout_type)
+        general_info = self._extract_general_info_enhanced(page)
+        rigging_info = self._extract_rigging_enhanced(page, layout_type)
         
         results = {}
         
@@ -1054,7 +1094,7 @@ class SuperEnhancedDeValkParser:
             sail_areas = []
             
             # Look for sail area patterns in rigging text
-            rigging_text = self._extract_section_text_dual_layout(soup, 'Rigging', layout_type)
+            rigging_text = self._extract_section_text_dual_layout(page, 'Rigging', layout_type)
             if rigging_text:
                 sail_area_patterns = [
                     r'mainsail.*?(\d+)\s*m2',
@@ -1108,27 +1148,7 @@ class SuperEnhancedDeValkParser:
                     value_li = item.find('li', string=lambda x: x and strong.get_text() not in x)
                     if value_li:
                         value = value_li.get_text().strip()
-                        # Clean and normalize field names
-                        if 'dimensions' in field_name:
-                            field_name = 'dimensions'
-                        elif 'material' in field_name:
-                            field_name = 'material'
-                        elif 'built' in field_name:
-                            field_name = 'yearBuilt'
-                        elif 'engine(s)' in field_name:
-                            field_name = 'engines'
-                        elif 'hp/ kw' in field_name:
-                            field_name = 'hpKw'
-                        elif 'lying' in field_name:
-                            field_name = 'lying'
-                        elif 'sales office' in field_name:
-                            field_name = 'salesOffice'
-                        elif 'status' in field_name:
-                            field_name = 'status'
-                        elif 'vat' in field_name:
-                            field_name = 'vat'
-                        elif 'asking price' in field_name:
-                            field_name = 'askingPrice'
+                        field_name = normalize_table_box_label(field_name)
                         
                         results[field_name] = value
                         self.logger.info(f"✅ TableBox: {field_name} = {value}")
@@ -1164,95 +1184,7 @@ class SuperEnhancedDeValkParser:
                 # Get the value after the strong tag
                 value = item.get_text().replace(strong.get_text(), '').strip()
                 
-                # Clean and normalize field names
-                if 'model' in field_name:
-                    field_name = 'model'
-                elif 'type' in field_name:
-                    field_name = 'yachtType'
-                elif 'loa (m)' in field_name:
-                    field_name = 'loaM'
-                elif 'lwl (m)' in field_name:
-                    field_name = 'lwlM'
-                elif 'beam (m)' in field_name:
-                    field_name = 'beamM'
-                elif 'draft (m)' in field_name:
-                    field_name = 'draftM'
-                elif 'air draft (m)' in field_name:
-                    field_name = 'airDraftM'
-                elif 'headroom (m)' in field_name:
-                    field_name = 'headroomM'
-                elif 'year built' in field_name:
-                    field_name = 'yearBuilt'
-                elif 'launched' in field_name:
-                    field_name = 'launched'
-                elif 'builder' in field_name:
-                    field_name = 'builder'
-                elif 'country' in field_name:
-                    field_name = 'country'
-                elif 'designer' in field_name:
-                    field_name = 'designer'
-                elif 'displacement (t)' in field_name:
-                    field_name = 'displacementT'
-                elif 'ballast (tonnes)' in field_name:
-                    field_name = 'ballastTonnes'
-                elif 'ce norm' in field_name:
-                    field_name = 'ceNorm'
-                elif 'hull material' in field_name:
-                    field_name = 'hullMaterial'
-                elif 'hull colour' in field_name:
-                    field_name = 'hullColour'
-                elif 'hull shape' in field_name:
-                    field_name = 'hullShape'
-                elif 'keel type' in field_name:
-                    field_name = 'keelType'
-                elif 'superstructure material' in field_name:
-                    field_name = 'superstructureMaterial'
-                elif 'deck material' in field_name:
-                    field_name = 'deckMaterial'
-                elif 'deck finish' in field_name:
-                    field_name = 'deckFinish'
-                elif 'superstructure deck finish' in field_name:
-                    field_name = 'superstructureDeckFinish'
-                elif 'cockpit deck finish' in field_name:
-                    field_name = 'cockpitDeckFinish'
-                elif 'dorades' in field_name:
-                    field_name = 'dorades'
-                elif 'window frame' in field_name:
-                    field_name = 'windowFrame'
-                elif 'window material' in field_name:
-                    field_name = 'windowMaterial'
-                elif 'deckhatch' in field_name:
-                    field_name = 'deckhatch'
-                elif 'portholes' in field_name:
-                    field_name = 'portholes'
-                elif 'insulation' in field_name:
-                    field_name = 'insulation'
-                elif 'fuel tank (litre)' in field_name:
-                    field_name = 'fuelTankLitre'
-                elif 'level indicator (fuel tank)' in field_name:
-                    field_name = 'levelIndicatorFuelTank'
-                elif 'freshwater tank (litre)' in field_name:
-                    field_name = 'freshwaterTankLitre'
-                elif 'level indicator (freshwater)' in field_name:
-                    field_name = 'levelIndicatorFreshwater'
-                elif 'blackwater tank (litre)' in field_name:
-                    field_name = 'blackwaterTankLitre'
-                elif 'level indicator (blackwater)' in field_name:
-                    field_name = 'levelIndicatorBlackwater'
-                elif 'blackwater tank extraction' in field_name:
-                    field_name = 'blackwaterTankExtraction'
-                elif 'greywater tank (litre)' in field_name:
-                    field_name = 'greywaterTankLitre'
-                elif 'wheel steering' in field_name:
-                    field_name = 'wheelSteering'
-                elif 'emergency tiller' in field_name:
-                    field_name = 'emergencyTiller'
-                elif 'more info on hull' in field_name:
-                    field_name = 'moreInfoOnHull'
-                elif 'more info on paintwork' in field_name:
-                    field_name = 'moreInfoOnPaintwork'
-                elif 'extra info' in field_name:
-                    field_name = 'extraInfo'
+                field_name = normalize_specification_label(field_name)
                 
                 if value and value != '':
                     results[field_name] = value
@@ -1284,6 +1216,26 @@ class SuperEnhancedDeValkParser:
         
         return results
 
+    def extract_sections(self, html: str) -> Dict[str, Any]:
+        """
+        Extract ALL sections from page HTML with the configured parse engine
+        
+        Args:
+            html: Listing page HTML, fetched by any caller
+            
+        Returns:
+            Section name -> field dict, plus the derived indicationRatios
+        """
+        if self.PARSE_ENGINE == 'bs4':
+            return self._extract_all_sections_unified(BeautifulSoup(html, 'html.parser'))
+        
+        all_data = self.section_extractor.extract(html)
+        self.logger.info(f"📊 TableBox extracted: {len(all_data['tableBox'])} fields")
+        self.logger.info(f"🏗️ ModeBox extracted: {len(all_data['modeBox'])} fields")
+        
+        all_data['indicationRatios'] = self._calculate_indication_ratios(all_data['modeBox'], all_data['rigging'])
+        return all_data
+
     def _extract_all_sections_unified(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract ALL sections using the unified De Valk structure for 100% completion"""
         
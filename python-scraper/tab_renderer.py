@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Tab Renderer - One headless Chrome rendering several listings at once in separate tabs
+Navigations are started without blocking and polled for readiness, so network waits overlap inside one browser
+"""
+
+import os
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+from browser_supervisor import get_browser_supervisor
+from driver_pool import create_chrome_driver, apply_render_profile, DEFAULT_READY_TIMEOUT
+from page_context import PageContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TABS = int(os.getenv('CHROME_TABS_PER_BROWSER', '1'))
+DEFAULT_MAX_PAGES_PER_TAB = int(os.getenv('CHROME_MAX_PAGES_PER_TAB', '20'))
+DEFAULT_POLL_INTERVAL = float(os.getenv('CHROME_TAB_POLL_SECONDS', '0.1'))
+DEFAULT_CHECKOUT_TIMEOUT = float(os.getenv('CHROME_CHECKOUT_TIMEOUT', '60'))
+
+# Set on the old document before navigating; the new page gets a fresh window object without it
+_STALE_MARKER = '__tabRendererStale'
+_READY_SCRIPT = f"return window.{_STALE_MARKER} ? 'stale' : document.readyState"
+
+
+class Tab:
+    """A browser tab plus the bookkeeping used to decide when to recycle it"""
+
+    def __init__(self, handle: str, generation: int):
+        self.handle = handle
+        self.generation = generation
+        self.pages_served = 0
+
+
+class TabRenderer:
+    """Bounded set of tabs in one Chrome; WebDriver commands are serialized, page loads are not"""
+
+    def __init__(self, max_tabs: Optional[int] = None, max_pages_per_tab: Optional[int] = None,
+                 driver_factory: Callable[[], Any] = create_chrome_driver, poll_interval: Optional[float] = None,
+                 supervisor=None):
+        """
+        Args:
+            max_tabs: Tabs rendering at once
+            max_pages_per_tab: Close and reopen a tab after this many pages
+            driver_factory: Callable creating the browser
+            poll_interval: Seconds between readiness checks of a loading tab
+            supervisor: BrowserSupervisor whose retire flags replace the browser once its tabs finish
+                (default: the process-wide one; False ignores them)
+        """
+        self.max_tabs = max(1, max_tabs or DEFAULT_MAX_TABS)
+        self.max_pages_per_tab = max(1, max_pages_per_tab or DEFAULT_MAX_PAGES_PER_TAB)
+        self.driver_factory = driver_factory
+        self.poll_interval = DEFAULT_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.supervisor = get_browser_supervisor() if supervisor is None else supervisor
+
+        self._driver = None
+        self._anchor_handle: Optional[str] = None
+        self._generation = 0
+        self._idle: List[Tab] = []
+        self._in_flight = 0
+        # Retired browsers still finishing renders: generation -> [driver, tabs in flight]
+        self._draining: Dict[int, list] = {}
+        self._slots = threading.BoundedSemaphore(self.max_tabs)
+        # WebDriver talks to one tab at a time: every switch-and-command pair holds this lock
+        self._lock = threading.RLock()
+        self.stats = {'rendered': 0, 'tabs_opened': 0, 'tabs_recycled': 0, 'tabs_crashed': 0,
+                      'browser_restarts': 0, 'browsers_retired': 0, 'ready_timeouts': 0}
+
+    def render(self, url: str, ready_locator: Optional[Tuple[str, str]] = None,
+               timeout: Optional[float] = None, user_agent: Optional[str] = None) -> PageContext:
+        """
+        Load a URL in a free tab and return its DOM once ready
+
+        Args:
+            url: Page to render
+            ready_locator: (By, selector) that signals the content is present; None waits for readyState complete
+            timeout: Seconds to wait for readiness before using the page as loaded
+            user_agent: User agent for this page load
+
+        Returns:
+            PageContext of the rendered page
+        """
+        if not self._slots.acquire(timeout=DEFAULT_CHECKOUT_TIMEOUT):
+            raise TimeoutError(f"No browser tab available after {DEFAULT_CHECKOUT_TIMEOUT}s")
+        try:
+            tab = self._checkout_tab()
+            try:
+                page = self._render_in(tab, url, ready_locator, DEFAULT_READY_TIMEOUT if timeout is None else timeout,
+                                       user_agent)
+            except Exception as e:
+                # A dead chromedriver surfaces as a urllib3 connection error, not a WebDriverException
+                self._discard(tab, str(e))
+                raise
+            self._checkin(tab)
+            return page
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Quit the browser and any retired one still draining; in-flight renders fail"""
+        with self._lock:
+            drivers = [self._driver] + [driver for driver, _ in self._draining.values()]
+            self._driver, self._idle, self._draining = None, [], {}
+        for driver in drivers:
+            if driver is None:
+                continue
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Browser quit failed: {e}")
+
+    def _render_in(self, tab: Tab, url: str, ready_locator, timeout: float, user_agent: Optional[str]) -> PageContext:
+        def navigate(driver):
+            if user_agent:
+                driver.execute_cdp_cmd('Network.setUserAgentOverride', {'userAgent': user_agent})
+            driver.execute_script(f"window.{_STALE_MARKER} = true")
+            # Page.navigate returns once the request is sent, unlike driver.get()
+            driver.execute_cdp_cmd('Page.navigate', {'url': url})
+
+        self._on_tab(tab, navigate)
+        deadline = time.monotonic() + timeout
+        while True:
+            if self._on_tab(tab, lambda driver: self._is_ready(driver, ready_locator)):
+                break
+            if time.monotonic() >= deadline:
+                with self._lock:
+                    self.stats['ready_timeouts'] += 1
+                logger.warning(f"⚠️ Tab not ready after {timeout}s for {url}, using the page as loaded")
+                break
+            time.sleep(self.poll_interval)
+
+        html, final_url = self._on_tab(tab, lambda driver: (driver.page_source, driver.current_url))
+        tab.pages_served += 1
+        with self._lock:
+            self.stats['rendered'] += 1
+        return PageContext(url, html, rendered=True, final_url=final_url)
+
+    @staticmethod
+    def _is_ready(driver, ready_locator) -> bool:
+        state = driver.execute_script(_READY_SCRIPT)
+        if state == 'stale' or state == 'loading':
+            return False
+        if ready_locator is None:
+            return state == 'complete'
+        return bool(driver.find_elements(*ready_locator))
+
+    def _on_tab(self, tab: Tab, command: Callable[[Any], Any]):
+        with self._lock:
+            driver = self._driver_of(tab)
+            if driver is None:
+                raise WebDriverException("browser was restarted")
+            driver.switch_to.window(tab.handle)
+            return command(driver)
+
+    def _driver_of(self, tab: Tab):
+        """The browser a tab lives in: the current one or a retired one still draining; None once it is gone"""
+        if tab.generation in self._draining:
+            return self._draining[tab.generation][0]
+        return self._driver if tab.generation == self._generation else None
+
+    def _checkout_tab(self) -> Tab:
+        with self._lock:
+            self._ensure_browser()
+            reason = self._retire_reason()
+            if reason:
+                self._retire_browser(reason)
+                self._ensure_browser()
+            while self._idle:
+                tab = self._idle.pop()
+                if tab.generation == self._generation:
+                    self._in_flight += 1
+                    return tab
+            try:
+                self._driver.switch_to.new_window('tab')
+            except Exception as e:
+                logger.warning(f"💥 Could not open a tab ({str(e).splitlines()[0] if str(e) else type(e).__name__}), "
+                               f"restarting the browser")
+                self._restart_browser()
+                self._ensure_browser()
+                self._driver.switch_to.new_window('tab')
+            # Request blocking is per tab in CDP, so each new tab gets the rendering profile
+            apply_render_profile(self._driver)
+            self.stats['tabs_opened'] += 1
+            self._in_flight += 1
+            return Tab(self._driver.current_window_handle, self._generation)
+
+    def _checkin(self, tab: Tab):
+        with self._lock:
+            if self._driver is not None and tab.generation == self._generation:
+                reason = self._retire_reason()
+                if reason:
+                    self._retire_browser(reason)
+            if not self._count_out(tab):
+                return
+            if tab.pages_served >= self.max_pages_per_tab:
+                # A fresh tab drops whatever the old one accumulated (listeners, caches, leaked timers)
+                self._close_tab(tab)
+                self.stats['tabs_recycled'] += 1
+                return
+            self._idle.append(tab)
+
+    def _discard(self, tab: Tab, reason: str):
+        """Drop a failed tab; restart the browser only if the whole browser is gone"""
+        with self._lock:
+            if not self._count_out(tab):
+                return
+            self.stats['tabs_crashed'] += 1
+            logger.warning(f"💥 Tab failed ({reason.splitlines()[0] if reason else 'unknown'}), closing it")
+            self._close_tab(tab)
+            try:
+                self._driver.window_handles
+            except Exception:
+                logger.warning("💥 Browser unresponsive, restarting it")
+                self._restart_browser()
+
+    def _count_out(self, tab: Tab) -> bool:
+        """Take a finished tab off its browser's in-flight count; False unless that browser is the current one"""
+        draining = self._draining.get(tab.generation)
+        if draining is not None:
+            draining[1] -= 1
+            if draining[1] <= 0:
+                self._quit_drained(tab.generation)
+            return False
+        if tab.generation != self._generation or self._driver is None:
+            return False
+        self._in_flight -= 1
+        return True
+
+    def _retire_reason(self) -> Optional[str]:
+        if not self.supervisor or self._driver is None:
+            return None
+        return self.supervisor.retire_reason(self._driver)
+
+    def _retire_browser(self, reason: str):
+        """Stop handing out the current browser's tabs; it is quit once the renders still in it finish"""
+        logger.info(f"♻️ Retiring tab browser (supervisor {reason} ceiling), {self._in_flight} tabs still rendering")
+        self.stats['browsers_retired'] += 1
+        generation = self._generation
+        self._draining[generation] = [self._driver, self._in_flight]
+        self._driver, self._idle, self._in_flight = None, [], 0
+        if self._draining[generation][1] <= 0:
+            self._quit_drained(generation)
+
+    def _quit_drained(self, generation: int):
+        driver, _ = self._draining.pop(generation)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Browser quit failed: {e}")
+
+    def _restart_browser(self):
+        """Quit the current browser; the next checkout starts a new one and old tabs are invalidated"""
+        self.stats['browser_restarts'] += 1
+        driver, self._driver = self._driver, None
+        self._idle, self._in_flight = [], 0
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _close_tab(self, tab: Tab):
+        try:
+            self._driver.switch_to.window(tab.handle)
+            self._driver.close()
+        except Exception as e:
+            logger.debug(f"Tab close failed: {e}")
+        try:
+            self._driver.switch_to.window(self._anchor_handle)
+        except Exception:
+            pass
+
+    def _ensure_browser(self):
+        if self._driver is not None:
+            return
+        started = time.time()
+        self._driver = self.driver_factory()
+        self._generation += 1
+        # The first window is never rendered in, so closing tabs can't end the session
+        self._anchor_handle = self._driver.current_window_handle
+        logger.info(f"🗂️ Started tab browser ({self.max_tabs} tabs) in {time.time() - started:.1f}s")
+
+
+_shared_renderer: Optional[TabRenderer] = None
+_shared_renderer_lock = threading.Lock()
+
+
+def get_tab_renderer() -> Optional[TabRenderer]:
+    """Return the process-wide tab renderer, or None when CHROME_TABS_PER_BROWSER is 1 (one browser per page)"""
+    global _shared_renderer
+    if DEFAULT_MAX_TABS <= 1:
+        return None
+    with _shared_renderer_lock:
+        if _shared_renderer is None:
+            _shared_renderer = TabRenderer()
+        return _shared_renderer
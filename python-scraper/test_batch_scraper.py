@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent batch scraper
+Uses a fake parser so no network access is needed
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_scraper import (
+    ConcurrentBatchScraper, build_batch_summary, parse_batch_options, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST_LIMIT
+)
+
+
+class FakeParser:
+    """Parser stand-in that sleeps like a page round-trip and tracks per-host concurrency"""
+
+    active = {}
+    peak = {}
+    lock = threading.Lock()
+
+    def parse_yacht_listing(self, url):
+        host = url.split('/')[2]
+        with FakeParser.lock:
+            FakeParser.active[host] = FakeParser.active.get(host, 0) + 1
+            FakeParser.peak[host] = max(FakeParser.peak.get(host, 0), FakeParser.active[host])
+        time.sleep(0.05)
+        with FakeParser.lock:
+            FakeParser.active[host] -= 1
+
+        if url.endswith('broken'):
+            return {'error': 'Failed to fetch page after multiple attempts'}
+        return {'data': {}, 'completion_stats': {'total_fields': len(url)}}
+
+
+def test_batch_scraper():
+    """Results keep input order, failures are reported and the per-host cap holds"""
+    print("🧪 Testing concurrent batch scraper...")
+
+    urls = [f"https://www.devalk.nl/en/yachtbrokerage/{i}" for i in range(12)]
+    urls += ["https://www.yachtworld.com/boat/1", "https://www.devalk.nl/en/broken"]
+
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            scraper = ConcurrentBatchScraper(FakeParser, max_workers=8, per_host_limit=3)
+            started = time.time()
+            results = scraper.run(urls)
+            elapsed = time.time() - started
+            written = sorted(os.listdir(workdir))
+        finally:
+            os.chdir(previous_cwd)
+
+    print(f"⏱️ {len(urls)} URLs in {elapsed:.2f}s, peak per host: {FakeParser.peak}")
+
+    assert [r['url'] for r in results] == urls
+    assert results[-1] == {'url': urls[-1], 'status': 'failed', 'error': 'Failed to fetch page after multiple attempts'}
+    assert all(r['status'] == 'success' for r in results[:-1])
+    assert results[0]['fields_extracted'] == len(urls[0])
+    assert results[0]['filename'].startswith('batch_scraped_1_')
+    assert len(written) == len(urls) - 1
+
+    assert FakeParser.peak['www.devalk.nl'] <= 3
+    assert elapsed < 0.05 * len(urls)
+
+    summary = build_batch_summary(urls, results)
+    assert summary['total_urls'] == len(urls)
+    assert summary['successful'] == len(urls) - 1
+    assert summary['failed'] == 1
+
+    print("🎉 Concurrent batch scraper test passed!")
+
+
+def test_parse_batch_options():
+    """Request options are parsed as integers and capped at the deployment limits"""
+    print("🧪 Testing batch option parsing...")
+    assert parse_batch_options({}) == {'max_workers': None, 'per_host_limit': None}
+    assert parse_batch_options({'max_workers': '2', 'per_host_limit': 1}) == {'max_workers': 2, 'per_host_limit': 1}
+    assert parse_batch_options({'max_workers': 10 ** 6, 'per_host_limit': 0}) == {
+        'max_workers': DEFAULT_MAX_WORKERS, 'per_host_limit': 1}
+    for bad in ('lots', [4], 2.5, True):
+        try:
+            parse_batch_options({'max_workers': bad})
+            raise AssertionError(f"{bad!r} should be rejected")
+        except ValueError:
+            pass
+    assert parse_batch_options({'per_host_limit': 10 ** 6})['per_host_limit'] == DEFAULT_PER_HOST_LIMIT
+    print("🎉 Batch options parsed!")
+
+
+if __name__ == "__main__":
+    test_batch_scraper()
+    test_parse_batch_options()
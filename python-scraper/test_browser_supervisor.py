@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for the browser process supervisor
+Stands in for chromedriver with a Python process that starts a child, so no Chrome is needed
+"""
+
+import gc
+import os
+import sys
+import time
+import logging
+import subprocess
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import psutil
+from browser_supervisor import BrowserSupervisor
+
+# Parent process that starts a long-lived child, like chromedriver launching Chrome
+_FAKE_CHROMEDRIVER = (
+    "import subprocess, sys, time\n"
+    "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+    "time.sleep(60)\n"
+)
+
+
+class FakeService:
+    def __init__(self):
+        self.process = subprocess.Popen([sys.executable, '-c', _FAKE_CHROMEDRIVER])
+
+
+class FakeDriver:
+    def __init__(self):
+        self.service = FakeService()
+
+    def quit(self):
+        # Like chromedriver, return only once the browser has actually exited
+        children = psutil.Process(self.service.process.pid).children(recursive=True)
+        for process in children:
+            process.kill()
+        deadline = time.time() + 5
+        while not _gone(children) and time.time() < deadline:
+            time.sleep(0.02)
+        self.service.process.kill()
+        self.service.process.wait()
+
+
+def _start_driver():
+    driver = FakeDriver()
+    root = psutil.Process(driver.service.process.pid)
+    deadline = time.time() + 10
+    while not root.children() and time.time() < deadline:
+        time.sleep(0.05)
+    assert root.children(), "fake chromedriver never started its child"
+    return driver, [root] + root.children()
+
+
+def _gone(processes):
+    for process in processes:
+        try:
+            if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
+                return False
+        except psutil.Error:
+            continue
+    return True
+
+
+def test_dropped_driver_is_reaped():
+    """A driver garbage-collected without quit() has its whole process tree killed"""
+    print("🧪 Testing leaked driver reaping...")
+    logging.disable(logging.WARNING)
+    try:
+        supervisor = BrowserSupervisor(max_rss_mb=10000, max_lifetime_seconds=3600)
+        kept, kept_processes = _start_driver()
+        leaked, leaked_processes = _start_driver()
+        supervisor.register(kept)
+        supervisor.register(leaked)
+
+        summary = supervisor.sweep()
+        assert summary['browsers'] == 2 and summary['processes'] == 4 and summary['rss_mb'] > 0
+
+        leaked.service.process.returncode = 0  # keep Popen.__del__ from warning about a running child
+        del leaked
+        gc.collect()
+        summary = supervisor.sweep()
+        assert _gone(leaked_processes)
+        assert not _gone(kept_processes)
+        assert summary['browsers'] == 1
+        metrics = supervisor.metrics()
+        assert metrics['orphans_reaped'] == 1 and metrics['processes_killed'] == 2 and metrics['tracked'] == 1
+
+        kept.quit()
+        supervisor.sweep()
+        assert supervisor.metrics()['released'] == 1 and supervisor.metrics()['tracked'] == 0
+    finally:
+        logging.disable(logging.NOTSET)
+    print("🎉 Leaked driver reaped!")
+
+
+def test_ceilings_flag_retirement():
+    """Browsers over the RSS or lifetime ceiling are flagged for their owner to retire, never killed in use"""
+    print("🧪 Testing RSS and lifetime ceilings...")
+    logging.disable(logging.WARNING)
+    try:
+        supervisor = BrowserSupervisor(max_rss_mb=1, max_lifetime_seconds=3600)
+        heavy, heavy_processes = _start_driver()
+        supervisor.register(heavy)
+        assert supervisor.retire_reason(heavy) is None
+        summary = supervisor.sweep()
+        assert not _gone(heavy_processes) and summary['browsers'] == 1
+        assert supervisor.retire_reason(heavy) == 'rss'
+        supervisor.sweep()
+        assert supervisor.metrics()['retire_rss'] == 1 and supervisor.metrics()['processes_killed'] == 0
+
+        supervisor = BrowserSupervisor(max_rss_mb=10000, max_lifetime_seconds=0.01)
+        old, old_processes = _start_driver()
+        supervisor.register(old)
+        time.sleep(0.05)
+        supervisor.sweep()
+        assert not _gone(old_processes)
+        assert supervisor.retire_reason(old) == 'lifetime'
+        assert supervisor.metrics()['retire_lifetime'] == 1
+
+        # The owner quits the flagged driver; the next sweep just forgets it
+        for driver, processes in ((heavy, heavy_processes), (old, old_processes)):
+            driver.quit()
+            assert _gone(processes)
+        supervisor.sweep()
+        assert supervisor.metrics()['released'] == 1 and supervisor.metrics()['tracked'] == 0
+    finally:
+        logging.disable(logging.NOTSET)
+    print("🎉 Ceilings flag retirement!")
+
+
+if __name__ == "__main__":
+    test_dropped_driver_is_reaped()
+    test_ceilings_flag_retirement()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Test script for the Chrome driver pool
+Uses fake drivers so no browser is started
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from driver_pool import (
+    ChromeDriverPool, build_chrome_options, apply_render_profile, wait_for_ready, BLOCKED_RESOURCE_PATTERNS
+)
+
+
+class FakeDriver:
+    """Driver stand-in that can be made to crash"""
+
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.cdp_commands = []
+        self.present = set()
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 'about:blank'
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        self.quit_called = True
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+
+    def find_element(self, by, value):
+        if value not in self.present:
+            raise NoSuchElementException(value)
+        return value
+
+
+class FakeSupervisor:
+    """BrowserSupervisor stand-in whose retire flags are set by the test"""
+
+    def __init__(self):
+        self.flagged = {}
+
+    def retire_reason(self, driver):
+        return self.flagged.get(id(driver))
+
+
+def test_driver_pool():
+    """Drivers are reused, recycled after N pages and replaced when unhealthy"""
+    print("🧪 Testing Chrome driver pool...")
+
+    pool = ChromeDriverPool(size=1, max_pages=3, driver_factory=FakeDriver, supervisor=False)
+
+    with pool.checkout() as first:
+        pass
+    with pool.checkout() as second:
+        pass
+    assert first is second
+    assert pool.stats['created'] == 1
+
+    # Third page reaches max_pages and the driver is recycled
+    with pool.checkout() as third:
+        pass
+    assert third is first and third.quit_called
+    with pool.checkout() as fresh:
+        pass
+    assert fresh is not first
+    assert pool.stats['recycled'] == 1
+
+    # A crashed driver is dropped on the next checkout
+    fresh.alive = False
+    with pool.checkout() as replacement:
+        pass
+    assert replacement is not fresh and fresh.quit_called
+    assert pool.stats['unhealthy'] == 1
+
+    # The pool is bounded: a second checkout times out while one is held
+    with pool.checkout():
+        try:
+            with pool.checkout(timeout=0.05):
+                assert False, "pool should be exhausted"
+        except TimeoutError:
+            pass
+
+    pool.close()
+    print(f"📊 Pool stats: {pool.stats}")
+    print("🎉 Chrome driver pool test passed!")
+
+
+def test_supervisor_retire_waits_for_checkin():
+    """A driver the supervisor flags is never quit while checked out, only on checkin or before reuse"""
+    print("🧪 Testing supervisor-requested retirement...")
+
+    supervisor = FakeSupervisor()
+    pool = ChromeDriverPool(size=1, max_pages=100, driver_factory=FakeDriver, supervisor=supervisor)
+
+    with pool.checkout() as busy:
+        supervisor.flagged[id(busy)] = 'rss'
+        assert not busy.quit_called
+    assert busy.quit_called and pool.stats['recycled'] == 1
+
+    with pool.checkout() as idle:
+        pass
+    supervisor.flagged[id(idle)] = 'lifetime'
+    with pool.checkout() as replacement:
+        assert replacement is not idle and idle.quit_called
+    assert pool.stats['recycled'] == 2 and pool.stats['created'] == 3
+
+    pool.close()
+    print("🎉 Retirement waits for checkin!")
+
+
+def test_light_render_profile():
+    """The light profile skips images and blocks asset/tracker requests; waits replace sleeps"""
+    print("🧪 Testing light rendering profile...")
+    light = build_chrome_options('agent', profile='light')
+    full = build_chrome_options('agent', profile='full')
+    assert '--blink-settings=imagesEnabled=false' in light.arguments
+    assert light.page_load_strategy == 'eager'
+    assert light.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+    assert '--blink-settings=imagesEnabled=false' not in full.arguments
+    assert full.page_load_strategy == 'normal'
+
+    driver = FakeDriver()
+    apply_render_profile(driver, profile='light')
+    commands = dict(driver.cdp_commands)
+    assert 'Network.enable' in commands
+    blocked = commands['Network.setBlockedURLs']['urls']
+    assert set(BLOCKED_RESOURCE_PATTERNS) <= set(blocked) and '*googletagmanager.com*' in blocked
+
+    untouched = FakeDriver()
+    apply_render_profile(untouched, profile='full')
+    assert untouched.cdp_commands == []
+
+    driver.present.add('.tableBox')
+    assert wait_for_ready(driver, (By.CSS_SELECTOR, '.tableBox'), timeout=0.2)
+    assert not wait_for_ready(driver, (By.CSS_SELECTOR, '.missing'), timeout=0.2)
+    print("🎉 Light rendering profile OK!")
+
+
+if __name__ == "__main__":
+    test_driver_pool()
+    test_supervisor_retire_waits_for_checkin()
+    test_light_render_profile()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test script for batched embedding requests
+"""
+
+import os
+import sys
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from openai import OpenAI
+
+from embedding_batcher import EmbeddingBatcher, get_embedding_dispatcher
+from llm_dispatcher import LLMDispatcher
+from openai_stub_server import OpenAIStubServer, StubConfig, stub_embedding
+
+
+class FakeEmbeddings:
+    """Vector = [input length]; records batch sizes and fails batches containing 'boom'"""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def create(self, model, input):
+        with self.lock:
+            self.batches.append(list(input))
+        if 'boom' in input:
+            raise ValueError("bad batch")
+        # Reversed on purpose: items must be placed by their index, not response order
+        items = [type('Item', (), {'index': i, 'embedding': [float(len(text))]})() for i, text in enumerate(input)]
+        return type('Response', (), {'data': list(reversed(items))})()
+
+
+class InvalidRequest(Exception):
+    status_code = 400
+
+
+class OversizeRejectingEmbeddings(FakeEmbeddings):
+    """Rejects, like the API's 400, any request containing an input over 20 characters"""
+
+    def create(self, model, input):
+        if any(len(text) > 20 for text in input):
+            with self.lock:
+                self.batches.append(list(input))
+            raise InvalidRequest("maximum context length exceeded")
+        return super().create(model, input)
+
+
+class FakeClient:
+    def __init__(self):
+        self.embeddings = FakeEmbeddings()
+
+
+def _dispatcher(max_concurrency=4):
+    return LLMDispatcher(requests_per_minute=0, tokens_per_minute=0, max_concurrency=max_concurrency, max_retries=0)
+
+
+def test_batches_by_count_and_tokens():
+    """Batches respect both limits; results come back in input order with gaps for failures"""
+    print("🧪 Testing embedding batches...")
+    client = FakeClient()
+    batcher = EmbeddingBatcher(client, batch_size=3, batch_tokens=1, dispatcher=_dispatcher(), cache=False)
+    texts = ['a' * n for n in range(1, 7)] + ['', 'boom', 'z']
+    vectors = batcher.embed(texts)
+
+    assert sorted(len(batch) for batch in client.embeddings.batches) == [2, 3, 3]
+    assert vectors[:6] == [[float(n)] for n in range(1, 7)]
+    assert vectors[6] is None  # empty input never sent
+    assert vectors[7] is None and vectors[8] is None  # same batch as the failure
+    assert batcher.stats['requests'] == 3 and batcher.stats['failed_inputs'] == 2
+
+    # Token limit: batch_tokens is floored at one max-size input, so two 8000-token texts go separately
+    long_text = 'word ' * 32000
+    assert batcher.plan_batches([long_text[:32000], long_text[:32000], 'x']) == [[0], [1, 2]]
+    print("🎉 Embedding batches OK!")
+
+
+def test_rejected_batch_is_split():
+    """One oversized input costs only itself, not the other inputs of its batch"""
+    print("🧪 Testing split of rejected batches...")
+    client = FakeClient()
+    client.embeddings = OversizeRejectingEmbeddings()
+    batcher = EmbeddingBatcher(client, batch_size=8, dispatcher=_dispatcher(), cache=False)
+    texts = [f"chunk {i}" for i in range(8)]
+    texts[5] = "x" * 40
+    vectors = batcher.embed(texts)
+
+    assert vectors[5] is None
+    assert all(vectors[i] == [float(len(texts[i]))] for i in range(8) if i != 5)
+    assert batcher.stats['failed_inputs'] == 1
+    # 8 -> 4 + 4 -> 2 + 2 -> 1 + 1: seven requests instead of dropping all eight inputs
+    assert batcher.stats['requests'] == 7
+    print("🎉 Rejected batch split OK!")
+
+
+def test_against_stub_server():
+    """A corpus in a handful of requests, several in flight, vectors matching single-input calls"""
+    print("🧪 Testing batcher against the stub server...")
+    server = OpenAIStubServer(StubConfig(latency_ms=50)).start()
+    try:
+        client = OpenAI(api_key='stub', base_url=server.base_url, max_retries=0)
+        batcher = EmbeddingBatcher(client, batch_size=25, dispatcher=_dispatcher(max_concurrency=4), cache=False)
+        texts = [f"Chunk {i}: Linssen Grand Sturdy specification text" for i in range(200)]
+        vectors = batcher.embed(texts)
+
+        stats = server.snapshot()
+        assert stats['embeddings'] == 8 and stats['embedding_inputs'] == 200
+        assert stats['max_in_flight'] > 1
+        assert vectors[0] == stub_embedding(texts[0], 'text-embedding-ada-002')
+        assert vectors[199] == stub_embedding(texts[199], 'text-embedding-ada-002')
+    finally:
+        server.stop()
+    print("🎉 Stub server batching OK!")
+
+
+def test_batchers_share_the_embedding_dispatcher():
+    """Batchers built without a dispatcher share one, so their requests count against one quota"""
+    print("🧪 Testing the shared embedding dispatcher...")
+    first = EmbeddingBatcher(client=None, cache=False)
+    second = EmbeddingBatcher(client=None, cache=False)
+    assert first.dispatcher is second.dispatcher is get_embedding_dispatcher()
+    assert EmbeddingBatcher(client=None, max_concurrency=2, cache=False).dispatcher is not first.dispatcher
+    print("🎉 Embedding dispatcher shared!")
+
+
+if __name__ == "__main__":
+    test_batches_by_count_and_tokens()
+    test_rejected_batch_is_split()
+    test_against_stub_server()
+    test_batchers_share_the_embedding_dispatcher()
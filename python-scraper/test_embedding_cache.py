@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed embedding cache
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from embedding_cache import EmbeddingCache, FLOAT_BYTES
+from embedding_batcher import EmbeddingBatcher
+from llm_dispatcher import LLMDispatcher
+
+
+class CountingEmbeddings:
+    def __init__(self):
+        self.inputs = []
+
+    def create(self, model, input):
+        self.inputs.extend(input)
+        items = [type('Item', (), {'index': i, 'embedding': [len(text) / 4, 0.5, -1.0]})()
+                 for i, text in enumerate(input)]
+        return type('Response', (), {'data': items})()
+
+
+class CountingClient:
+    def __init__(self):
+        self.embeddings = CountingEmbeddings()
+
+
+def test_round_trip_and_persistence():
+    """float32 rows come back from mmap, survive a reopen, and are keyed by model and normalized text"""
+    print("🧪 Testing embedding cache round trip...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(directory)
+        assert cache.put_many('ada', ['Linssen  40', 'Sealine'], [[0.1, 0.2], [1.5, -2.0]]) == 2
+        assert cache.put_many('ada', ['Linssen 40'], [[9.0, 9.0]]) == 0  # same text after whitespace cleanup
+        vectors = cache.get_many('ada', ['Linssen 40', 'Sealine', 'Pedro'])
+        assert abs(vectors[0][0] - 0.1) < 1e-6 and vectors[1] == [1.5, -2.0] and vectors[2] is None
+        assert cache.get_many('text-embedding-3-large', ['Sealine']) == [None]
+        assert os.path.getsize(cache.vector_path('ada', 2)) == 2 * 2 * FLOAT_BYTES
+
+        # Rows appended after the file was mapped are picked up by remapping
+        cache.put_many('ada', ['Pedro'], [[3.0, 4.0]])
+        assert cache.get_many('ada', ['Pedro']) == [[3.0, 4.0]]
+        cache.close()
+
+        reopened = EmbeddingCache(directory)
+        assert reopened.get_many('ada', ['Sealine', 'Pedro']) == [[1.5, -2.0], [3.0, 4.0]]
+        reopened.close()
+    print("🎉 Embedding cache round trip OK!")
+
+
+def test_torn_tail_is_dropped():
+    """A partial row left by an interrupted write doesn't shift the rows written after it"""
+    print("🧪 Testing torn vector file tail...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(directory)
+        cache.put_many('ada', ['Linssen'], [[1.0, 2.0]])
+        with open(cache.vector_path('ada', 2), 'ab') as f:
+            f.write(b'\x00\x01')
+        cache.put_many('ada', ['Sealine'], [[3.0, 4.0]])
+        assert cache.get_many('ada', ['Linssen', 'Sealine']) == [[1.0, 2.0], [3.0, 4.0]]
+        assert os.path.getsize(cache.vector_path('ada', 2)) == 2 * 2 * FLOAT_BYTES
+        cache.close()
+    print("🎉 Torn tail dropped!")
+
+
+def test_batcher_skips_cached_inputs():
+    """A second run over a mostly unchanged corpus only sends the changed texts"""
+    print("🧪 Testing batcher with cache...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = EmbeddingCache(directory)
+        client = CountingClient()
+        dispatcher = LLMDispatcher(requests_per_minute=0, tokens_per_minute=0, max_retries=0)
+        batcher = EmbeddingBatcher(client, batch_size=50, dispatcher=dispatcher, cache=cache)
+        corpus = [f"chunk {i}" for i in range(120)]
+        first = batcher.embed(corpus)
+        assert len(client.embeddings.inputs) == 120 and batcher.stats['requests'] == 3
+
+        corpus[7] = "chunk 7, revised"
+        second = batcher.embed(corpus)
+        assert client.embeddings.inputs[120:] == ["chunk 7, revised"]
+        assert batcher.stats['requests'] == 4 and batcher.stats['cached'] == 119
+        assert second[8] == first[8] and second[7] == [len("chunk 7, revised") / 4, 0.5, -1.0]
+        cache.close()
+    print("🎉 Batcher with cache OK!")
+
+
+if __name__ == "__main__":
+    test_round_trip_and_persistence()
+    test_torn_tail_is_dropped()
+    test_batcher_skips_cached_inputs()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for the cost-aware extraction cascade
+"""
+
+import os
+import sys
+import logging
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from devalk_fixtures import build_fixture_site, FixtureAdapter, FIXTURE_BASE_URL
+from extraction_cascade import ExtractionCascade, parse_tier_order
+import scraper_service
+from scraper_service import YachtScraperService
+
+
+def _merge(merged, data):
+    for key, value in data.items():
+        merged.setdefault(key, value)
+
+
+def test_cascade_stops_at_threshold():
+    """Later tiers are skipped once the score reaches the threshold; stats count hits"""
+    print("🧪 Testing cascade early exit...")
+    calls = []
+
+    def tier(name, fields):
+        def run(url, state):
+            calls.append(name)
+            if fields is None:
+                raise RuntimeError("tier down")
+            state[name] = True
+            return fields
+        return run
+
+    cascade = ExtractionCascade(
+        [('cheap', tier('cheap', {'a': 1})), ('broken', tier('broken', None)),
+         ('medium', tier('medium', {'a': 2, 'b': 2})), ('expensive', tier('expensive', {'c': 3}))],
+        score=lambda data: len(data) * 50, merge=_merge, threshold=100)
+
+    state = {}
+    data, trace = cascade.run('https://example.com/1', state)
+    assert calls == ['cheap', 'broken', 'medium']
+    assert data == {'a': 1, 'b': 2}
+    assert state == {'cheap': True, 'medium': True, 'merged': data}
+    assert [entry['tier'] for entry in trace] == ['cheap', 'broken', 'medium']
+    assert trace[1]['failed'] and trace[2]['completeness'] == 100
+
+    stats = cascade.stats()
+    assert stats['medium']['hits'] == 1 and stats['medium']['hit_rate'] == 1.0
+    assert stats['cheap']['runs'] == 1 and stats['cheap']['hit_rate'] == 0.0
+    assert stats['broken']['failures'] == 1
+    assert stats['expensive']['runs'] == 0
+    print("🎉 Cascade early exit OK!")
+
+
+def test_tier_order_setting():
+    """Tier order comes from a comma-separated setting; unknown tiers are dropped"""
+    print("🧪 Testing tier order parsing...")
+    assert parse_tier_order(' Static, llm ,,') == ['static', 'llm']
+    service = YachtScraperService(tier_order='static,teleport,llm')
+    assert [name for name, _ in service.cascade.tiers] == ['static', 'llm']
+    print("🎉 Tier order OK!")
+
+
+def test_devalk_static_tier_skips_browser_and_llm():
+    """De Valk pages are complete after static parsing, so no browser or LLM is touched"""
+    print("🧪 Testing De Valk static short-circuit...")
+    logging.disable(logging.INFO)
+    try:
+        site = build_fixture_site(padding_kb=2)
+        service = YachtScraperService()
+
+        class NoBrowser:
+            def checkout(self, timeout=None):
+                raise AssertionError("browser tier should not run")
+
+        service.driver_pool = NoBrowser()
+        service.render_classifier = None
+        service._sessions.mount(FIXTURE_BASE_URL, FixtureAdapter(site))
+
+        for url in list(site)[:5]:
+            result = service.scrape_yacht_listing(url)
+            assert [entry['tier'] for entry in result['extractionTiers']] == ['static']
+            assert result['make'] and result['model'] and result['loaM'] > 0
+            assert result['price'].isdigit() and result['currency'] == 'EUR'
+            assert result['accommodation'] and result['machinery']
+
+        stats = service.cascade_stats()
+        assert stats['static']['hit_rate'] == 1.0
+        assert stats['browser']['runs'] == stats['llm']['runs'] == 0
+    finally:
+        logging.disable(logging.NOTSET)
+
+    print(f"🎉 Static tier served every page in {stats['static']['avg_ms']} ms on average!")
+
+
+def test_llm_tier_requests_missing_fields_together():
+    """After the static tier, the LLM tier asks for all remaining gaps in one call"""
+    print("🧪 Testing batched LLM gap filling...")
+    requests_made = []
+    instances = []
+
+    class FakeExtractor:
+        def __init__(self):
+            instances.append(self)
+
+        def extract_fields(self, html, fields, descriptions=None):
+            requests_made.append(list(fields))
+            return {field: {'airDraftM': 'approx. 21,5 m', 'boatType': 'sailing yacht'}.get(field)
+                    for field in fields}
+
+        def extract_yacht_data(self, html, url):
+            raise AssertionError("full extraction should not run when static data exists")
+
+    logging.disable(logging.INFO)
+    original = scraper_service.AIYachtExtractor
+    scraper_service.AIYachtExtractor = FakeExtractor
+    try:
+        site = build_fixture_site(padding_kb=2)
+        service = YachtScraperService(tier_order='static,llm', completeness_threshold=10000)
+        service.render_classifier = None
+        service._sessions.mount(FIXTURE_BASE_URL, FixtureAdapter(site))
+        url = list(site)[0]
+
+        result = service.scrape_yacht_listing(url)
+        assert len(requests_made) == 1
+        assert 'make' not in requests_made[0] and 'airDraftM' in requests_made[0]
+        assert result['airDraftM'] == 21.5 and result['boatType'] == 'sailing yacht'
+        assert result['make'] and result['price'].isdigit()
+
+        # Later listings reuse the service's extractor
+        service.scrape_yacht_listing(list(site)[1])
+        assert len(requests_made) == 2 and len(instances) == 1
+    finally:
+        scraper_service.AIYachtExtractor = original
+        logging.disable(logging.NOTSET)
+    print("🎉 Missing fields requested in one call!")
+
+
+if __name__ == "__main__":
+    test_cascade_stops_at_threshold()
+    test_tier_order_setting()
+    test_devalk_static_tier_skips_browser_and_llm()
+    test_llm_tier_requests_missing_fields_together()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test script for the table-driven field-name normalizer
+Compares it with a verbatim copy of the elif chains it replaced
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from devalk_fixtures import load_fixture_corpus
+from field_normalizer import (
+    TABLE_BOX_RULES, SPECIFICATION_RULES, normalize_table_box_label, normalize_specification_label
+)
+
+
+# Copied from SuperEnhancedDeValkParser._extract_table_box before the switch
+def legacy_table_box_label(field_name):
+    if 'dimensions' in field_name:
+        field_name = 'dimensions'
+    elif 'material' in field_name:
+        field_name = 'material'
+    elif 'built' in field_name:
+        field_name = 'yearBuilt'
+    elif 'engine(s)' in field_name:
+        field_name = 'engines'
+    elif 'hp/ kw' in field_name:
+        field_name = 'hpKw'
+    elif 'lying' in field_name:
+        field_name = 'lying'
+    elif 'sales office' in field_name:
+        field_name = 'salesOffice'
+    elif 'status' in field_name:
+        field_name = 'status'
+    elif 'vat' in field_name:
+        field_name = 'vat'
+    elif 'asking price' in field_name:
+        field_name = 'askingPrice'
+    return field_name
+
+
+# Copied from SuperEnhancedDeValkParser._parse_specification_list before the switch
+def legacy_specification_label(field_name):
+    if 'model' in field_name:
+        field_name = 'model'
+    elif 'type' in field_name:
+        field_name = 'yachtType'
+    elif 'loa (m)' in field_name:
+        field_name = 'loaM'
+    elif 'lwl (m)' in field_name:
+        field_name = 'lwlM'
+    elif 'beam (m)' in field_name:
+        field_name = 'beamM'
+    elif 'draft (m)' in field_name:
+        field_name = 'draftM'
+    elif 'air draft (m)' in field_name:
+        field_name = 'airDraftM'
+    elif 'headroom (m)' in field_name:
+        field_name = 'headroomM'
+    elif 'year built' in field_name:
+        field_name = 'yearBuilt'
+    elif 'launched' in field_name:
+        field_name = 'launched'
+    elif 'builder' in field_name:
+        field_name = 'builder'
+    elif 'country' in field_name:
+        field_name = 'country'
+    elif 'designer' in field_name:
+        field_name = 'designer'
+    elif 'displacement (t)' in field_name:
+        field_name = 'displacementT'
+    elif 'ballast (tonnes)' in field_name:
+        field_name = 'ballastTonnes'
+    elif 'ce norm' in field_name:
+        field_name = 'ceNorm'
+    elif 'hull material' in field_name:
+        field_name = 'hullMaterial'
+    elif 'hull colour' in field_name:
+        field_name = 'hullColour'
+    elif 'hull shape' in field_name:
+        field_name = 'hullShape'
+    elif 'keel type' in field_name:
+        field_name = 'keelType'
+    elif 'superstructure material' in field_name:
+        field_name = 'superstructureMaterial'
+    elif 'deck material' in field_name:
+        field_name = 'deckMaterial'
+    elif 'deck finish' in field_name:
+        field_name = 'deckFinish'
+    elif 'superstructure deck finish' in field_name:
+        field_name = 'superstructureDeckFinish'
+    elif 'cockpit deck finish' in field_name:
+        field_name = 'cockpitDeckFinish'
+    elif 'dorades' in field_name:
+        field_name = 'dorades'
+    elif 'window frame' in field_name:
+        field_name = 'windowFrame'
+    elif 'window material' in field_name:
+        field_name = 'windowMaterial'
+    elif 'deckhatch' in field_name:
+        field_name = 'deckhatch'
+    elif 'portholes' in field_name:
+        field_name = 'portholes'
+    elif 'insulation' in field_name:
+        field_name = 'insulation'
+    elif 'fuel tank (litre)' in field_name:
+        field_name = 'fuelTankLitre'
+    elif 'level indicator (fuel tank)' in field_name:
+        field_name = 'levelIndicatorFuelTank'
+    elif 'freshwater tank (litre)' in field_name:
+        field_name = 'freshwaterTankLitre'
+    elif 'level indicator (freshwater)' in field_name:
+        field_name = 'levelIndicatorFreshwater'
+    elif 'blackwater tank (litre)' in field_name:
+        field_name = 'blackwaterTankLitre'
+    elif 'level indicator (blackwater)' in field_name:
+        field_name = 'levelIndicatorBlackwater'
+    elif 'blackwater tank extraction' in field_name:
+        field_name = 'blackwaterTankExtraction'
+    elif 'greywater tank (litre)' in field_name:
+        field_name = 'greywaterTankLitre'
+    elif 'wheel steering' in field_name:
+        field_name = 'wheelSteering'
+    elif 'emergency tiller' in field_name:
+        field_name = 'emergencyTiller'
+    elif 'more info on hull' in field_name:
+        field_name = 'moreInfoOnHull'
+    elif 'more info on paintwork' in field_name:
+        field_name = 'moreInfoOnPaintwork'
+    elif 'extra info' in field_name:
+        field_name = 'extraInfo'
+    return field_name
+
+
+def candidate_labels(rules):
+    """Rule substrings, their combinations and labels seen in stored scrape results"""
+    substrings = [substring for substring, _ in rules]
+    labels = set(substrings)
+    labels.update(f"{a} {b}" for a in substrings for b in substrings)
+    labels.update(s[:i] for s in substrings for i in range(1, len(s)))
+    labels.update(s[i:] for s in substrings for i in range(1, len(s)))
+    for _, result in load_fixture_corpus():
+        for section in result['data'].values():
+            labels.update(key.lower() for key in section)
+    labels.update(['', 'no of engines', 'propeller type', 'antifouling (year)', 'superstructure deck finish',
+                   'headroom saloon (m)', 'air draft (m)', 'level indicator (fuel tank) type'])
+    return sorted(labels)
+
+
+def test_table_box_mapping_identical():
+    """Every tableBox label maps to the same key as the old elif chain"""
+    print("🧪 Testing tableBox label mapping...")
+    labels = candidate_labels(TABLE_BOX_RULES)
+    for label in labels:
+        assert normalize_table_box_label(label) == legacy_table_box_label(label), label
+    print(f"🎉 {len(labels)} tableBox labels identical!")
+
+
+def test_specification_mapping_identical():
+    """Every specification label maps to the same key as the old elif chain"""
+    print("🧪 Testing specification label mapping...")
+    labels = candidate_labels(SPECIFICATION_RULES)
+    for label in labels:
+        assert normalize_specification_label(label) == legacy_specification_label(label), label
+    print(f"🎉 {len(labels)} specification labels identical!")
+
+
+if __name__ == "__main__":
+    test_table_box_mapping_identical()
+    test_specification_mapping_identical()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test script for the conditional-GET HTTP cache
+Serves pages from a local adapter so no network access is needed
+"""
+
+import os
+import sys
+import time
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+from requests.adapters import BaseAdapter
+
+from http_cache import HTTPPageCache
+from result_cache import ParsedResultCache
+from enhanced_devalk_parser import EnhancedDeValkParser
+from perfect_devalk_parser import PerfectDeValkParser
+from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+
+LISTING_HTML = """
+<html><body>
+<div class="tableBox"><div class="item"><strong>Built</strong><ul><li>Built</li><li>1998</li></ul></div></div>
+<div class="modeBox"><ul class="list-1"><li><span>Model</span><span>Hallberg-Rassy 42</span></li></ul></div>
+</body></html>
+"""
+
+
+class ETagAdapter(BaseAdapter):
+    """Answers 304 when the client sends the current ETag"""
+
+    def __init__(self):
+        super().__init__()
+        self.full_downloads = 0
+        self.not_modified = 0
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers['Date'] = 'Mon, 25 Aug 2025 16:05:45 GMT'
+        response.headers['ETag'] = '"v1"'
+        if request.headers.get('If-None-Match') == '"v1"':
+            response.status_code = 304
+            response._content = b''
+            self.not_modified += 1
+        else:
+            response.status_code = 200
+            response._content = LISTING_HTML.encode('utf-8')
+            response.encoding = 'utf-8'
+            self.full_downloads += 1
+        return response
+
+    def close(self):
+        pass
+
+
+def _without_timestamps(result):
+    return {key: value for key, value in result.items() if key != 'scraped_at'}
+
+
+def test_http_cache():
+    """A 304 skips both the download and the re-parse"""
+    print("🧪 Testing conditional-GET HTTP cache...")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        parser = SuperEnhancedDeValkParser()
+        parser.http_cache = HTTPPageCache(cache_dir=cache_dir)
+        adapter = ETagAdapter()
+        parser._sessions.mount('https://www.devalk.nl/', adapter)
+
+        parse_calls = []
+        extract = parser.extract_sections
+        parser.extract_sections = lambda html: parse_calls.append(1) or extract(html)
+
+        url = 'https://www.devalk.nl/en/yachtbrokerage/12345'
+        first = parser.parse_yacht_listing(url)
+        second = parser.parse_yacht_listing(url)
+
+    assert 'error' not in first
+    assert adapter.full_downloads == 1
+    assert adapter.not_modified == 1
+    assert len(parse_calls) == 1
+    assert second['data'] == first['data']
+    assert second['parser_version'] == SuperEnhancedDeValkParser.PARSER_VERSION
+
+    print("🎉 Conditional-GET HTTP cache test passed!")
+
+
+def test_revalidation_in_every_parser():
+    """Each De Valk parser accepts the cached 304 response and returns the stored result"""
+    print("🧪 Testing 304 revalidation across parsers...")
+
+    for parser_class in (EnhancedDeValkParser, PerfectDeValkParser, SuperEnhancedDeValkParser):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            parser = parser_class()
+            parser.http_cache = HTTPPageCache(cache_dir=cache_dir)
+            parser.result_cache = ParsedResultCache(db_path='')
+            adapter = ETagAdapter()
+            parser._sessions.mount('https://www.devalk.nl/', adapter)
+
+            url = 'https://www.devalk.nl/en/yachtbrokerage/12345'
+            first = parser.parse_yacht_listing(url)
+            second = parser.parse_yacht_listing(url)
+
+        assert 'error' not in first and 'error' not in second, (parser_class.__name__, second)
+        assert adapter.full_downloads == 1 and adapter.not_modified == 1, parser_class.__name__
+        assert _without_timestamps(second) == _without_timestamps(first), parser_class.__name__
+
+    print("🎉 304 revalidation works in all parsers!")
+
+
+def test_size_budget_scans_only_when_over():
+    """Writes track the cache size; the directory is only scanned once it passes max_mb"""
+    print("🧪 Testing HTTP cache size budget...")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = HTTPPageCache(cache_dir=cache_dir, max_mb=0.05)
+        scans = []
+        entry_files = cache._entry_files
+        cache._entry_files = lambda: scans.append(1) or entry_files()
+
+        for n in range(100):
+            response = SimpleNamespace(headers={'ETag': f'"v{n}"'}, text='x' * 1000)
+            cache.store(f'https://www.devalk.nl/en/yachtbrokerage/{n}', response, {}, 'v1')
+            time.sleep(0.001)  # distinct mtimes, so the oldest entries go first
+
+        sizes = [os.path.getsize(os.path.join(cache_dir, name)) for name in os.listdir(cache_dir)]
+        # ~40 entries fit; each scan frees room for several more writes
+        assert 0 < len(scans) < 25, len(scans)
+        assert sum(sizes) == cache._bytes <= cache.max_bytes
+        assert cache.conditional_headers('https://www.devalk.nl/en/yachtbrokerage/99') == {'If-None-Match': '"v99"'}
+        assert cache.conditional_headers('https://www.devalk.nl/en/yachtbrokerage/0') == {}
+    print("🎉 HTTP cache size budget kept!")
+
+
+if __name__ == "__main__":
+    test_http_cache()
+    test_revalidation_in_every_parser()
+    test_size_budget_scans_only_when_over()
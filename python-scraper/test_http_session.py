@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script for per-thread HTTP sessions
+Checks that threads get separate sessions sharing one connection pool
+"""
+
+import os
+import sys
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from requests.adapters import BaseAdapter
+from http_session import ThreadLocalSessions
+from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+
+
+def test_thread_local_sessions():
+    """Each thread gets its own session; mounts reach existing and new sessions"""
+    print("🧪 Testing per-thread HTTP sessions...")
+
+    sessions = ThreadLocalSessions({'User-Agent': 'test-agent'}, pool_size=4)
+    main_session = sessions.session
+    assert sessions.session is main_session
+    assert main_session.headers['User-Agent'] == 'test-agent'
+
+    adapter = BaseAdapter()
+    sessions.mount('https://www.devalk.nl/', adapter)
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(sessions.session))
+    thread.start()
+    thread.join()
+
+    assert seen[0] is not main_session
+    assert main_session.get_adapter('https://www.devalk.nl/en/1') is adapter
+    assert seen[0].get_adapter('https://www.devalk.nl/en/1') is adapter
+    assert main_session.get_adapter('https://example.com/') is seen[0].get_adapter('https://example.com/')
+
+    parser = SuperEnhancedDeValkParser()
+    other = []
+    thread = threading.Thread(target=lambda: other.append(parser.session))
+    thread.start()
+    thread.join()
+    assert parser.session is not other[0]
+
+    print("🎉 Per-thread HTTP session test passed!")
+
+
+if __name__ == "__main__":
+    test_thread_local_sessions()
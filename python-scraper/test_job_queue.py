@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script for the background batch job queue
+Uses the in-process job store and a fake parser so no network access is needed
+"""
+
+import os
+import sys
+import time
+import fnmatch
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_scraper import ConcurrentBatchScraper
+from job_queue import BatchJobQueue, InMemoryJobStore, JobStore, RedisJobStore, JOB_COMPLETED, JOB_FAILED, JOB_RUNNING
+
+
+class FakeRedis:
+    """The handful of redis.Redis commands RedisJobStore uses; values come back as bytes like redis-py"""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+            def execute(self):
+                return [getattr(client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+        return Pipeline()
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        entry = self.data.setdefault(key, {})
+        entry.update(mapping or {field: value})
+
+    def hincrby(self, key, field, amount):
+        entry = self.data.setdefault(key, {})
+        entry[field] = str(int(entry.get(field, 0)) + amount)
+
+    def hgetall(self, key):
+        return {k.encode(): str(v).encode() for k, v in self.data.get(key, {}).items()}
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def get(self, key):
+        value = self.data.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    def expire(self, key, seconds):
+        pass
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match='*'):
+        return [key.encode() for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+
+class SlowParser:
+    """Parser stand-in that takes a moment per page"""
+
+    def parse_yacht_listing(self, url):
+        time.sleep(0.05)
+        if url.endswith('broken'):
+            return {'error': 'Failed to fetch page after multiple attempts'}
+        return {'data': {}, 'completion_stats': {'total_fields': 7}}
+
+
+def test_job_queue():
+    """Submit returns immediately, status reports progress and results keep input order"""
+    print("🧪 Testing batch job queue...")
+
+    urls = [f"https://www.devalk.nl/en/yachtbrokerage/{i}" for i in range(6)]
+    urls.append("https://www.devalk.nl/en/broken")
+
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            jobs = BatchJobQueue(
+                InMemoryJobStore(),
+                lambda options: ConcurrentBatchScraper(SlowParser, max_workers=options.get('max_workers')),
+            )
+
+            started = time.time()
+            job = jobs.submit(urls, {'max_workers': 2})
+            assert time.time() - started < 0.05
+            assert job['status'] == 'queued'
+            assert job['total_urls'] == len(urls)
+
+            deadline = time.time() + 10
+            while jobs.store.get_job(job['job_id'])['status'] != JOB_COMPLETED:
+                assert time.time() < deadline, "job did not finish"
+                time.sleep(0.02)
+
+            status = jobs.store.get_job(job['job_id'])
+            results = jobs.store.get_results(job['job_id'])
+            summary_written = os.path.exists(status['summary_file'])
+        finally:
+            os.chdir(previous_cwd)
+
+    print(f"📊 Final status: {status}")
+
+    assert status['completed'] == len(urls)
+    assert status['successful'] == len(urls) - 1
+    assert status['failed'] == 1
+    assert summary_written
+    assert [r['url'] for r in results] == urls
+    assert results[-1]['status'] == 'failed'
+    assert jobs.store.get_job('missing') is None
+
+    print("🎉 Batch job queue test passed!")
+
+
+def test_job_store_interface():
+    """A backend missing part of the interface fails when it is constructed, not on first use"""
+    print("🧪 Testing job store interface...")
+
+    class Incomplete(JobStore):
+        def create_job(self, job_id, urls):
+            return {}
+
+    try:
+        Incomplete()
+        raise AssertionError("incomplete store should not be constructible")
+    except TypeError:
+        pass
+    print("🎉 Job store interface OK!")
+
+
+def test_redis_job_store():
+    """Jobs, counters and ordered results round-trip through Redis; dead owners' jobs are failed on load"""
+    print("🧪 Testing Redis job store...")
+    client = FakeRedis()
+    store = RedisJobStore(client)
+    urls = ['https://a.com/1', 'https://a.com/2', 'https://a.com/3']
+
+    job = store.create_job('job1', urls)
+    assert job['status'] == 'queued' and job['owner'] == store.owner_id
+    store.update_job('job1', status=JOB_RUNNING)
+    store.record_result('job1', 2, {'url': urls[2], 'status': 'success'})
+    store.record_result('job1', 0, {'url': urls[0], 'status': 'failed'})
+
+    status = store.get_job('job1')
+    assert status['status'] == JOB_RUNNING
+    assert (status['completed'], status['successful'], status['failed']) == (2, 1, 1)
+    assert store.get_urls('job1') == urls
+    assert [r and r['url'] for r in store.get_results('job1')] == [urls[0], None, urls[2]]
+    assert store.get_job('missing') is None and store.get_results('missing') == []
+
+    # Another worker starting up leaves jobs of a live owner alone
+    other = RedisJobStore(client)
+    assert other.get_job('job1')['status'] == JOB_RUNNING
+
+    # The owner goes away with the job still running: the next store to load fails it
+    store.create_job('job2', urls)
+    store.update_job('job2', status=JOB_COMPLETED)
+    store.close()
+    restarted = RedisJobStore(client, recover=False)
+    assert restarted.recover_interrupted() == ['job1']
+    recovered = restarted.get_job('job1')
+    assert recovered['status'] == JOB_FAILED and recovered['error'] and recovered['finished_at']
+    assert restarted.get_job('job2')['status'] == JOB_COMPLETED
+    for live in (other, restarted):
+        live.close()
+    print("🎉 Redis job store OK!")
+
+
+if __name__ == "__main__":
+    test_job_queue()
+    test_job_store_interface()
+    test_redis_job_store()
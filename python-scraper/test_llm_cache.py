@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the LLM response cache
+"""
+
+import os
+import sys
+import time
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ai_extractor import AIYachtExtractor
+from llm_cache import LLMResponseCache, make_key
+
+
+def test_keys_and_persistence():
+    """Whitespace-only changes share a key; responses survive a restart and expire with a TTL"""
+    print("🧪 Testing LLM cache keys and persistence...")
+    assert make_key('gpt-4', 'v1', 'Moody  54\n\n 2003') == make_key('gpt-4', 'v1', ' Moody 54 2003 ')
+    assert make_key('gpt-4', 'v1', 'Moody 54') != make_key('gpt-4', 'v2', 'Moody 54')
+    assert make_key('gpt-4', 'v1', 'Moody 54') != make_key('gpt-4o', 'v1', 'Moody 54')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'llm.sqlite')
+        cache = LLMResponseCache(db_path=db_path)
+        cache.put('k1', {'make': 'Moody', 'year': 2003.0})
+        cache.put('k2', 'GRP')
+        cache.put('failed', {})
+        assert cache.get('k1') == {'make': 'Moody', 'year': 2003.0}
+        assert cache.get('failed') is None
+
+        reopened = LLMResponseCache(db_path=db_path)
+        assert reopened.get('k2') == 'GRP'
+        assert reopened.stats['db_hits'] == 1
+        reopened.get('k2')
+        assert reopened.stats['memory_hits'] == 1
+
+        expiring = LLMResponseCache(db_path=db_path, ttl_seconds=60)
+        expiring.put('old', {'make': 'Najad'}, created_at=time.time() - 120)
+        assert expiring.get('old') is None and expiring.stats['expired'] == 1
+
+        # Export and prewarm a fresh worker from the records
+        export_path = os.path.join(tmp, 'responses.jsonl')
+        assert cache.export(export_path) == 2
+        fresh = LLMResponseCache(db_path='')
+        assert fresh.prewarm_from_file(export_path) == 2
+        assert fresh.get('k1')['make'] == 'Moody'
+        assert fresh.prewarm([{'model': 'gpt-4', 'prompt_version': 'v1', 'text': 'Moody 54', 'response': 'x'}]) == 1
+        assert fresh.get(make_key('gpt-4', 'v1', ' Moody   54')) == 'x'
+    print("🎉 Keys and persistence OK!")
+
+
+def test_size_eviction():
+    """Least recently used responses go once the stored size passes the budget"""
+    print("🧪 Testing size-based eviction...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(db_path=os.path.join(tmp, 'llm.sqlite'), max_mb=0.01, memory_entries=1)
+        for n in range(20):
+            cache.put(f'k{n}', 'x' * 1000)
+            if n > 0:
+                cache.get('k0')  # keep the first one hot
+        assert cache.stats['evicted'] > 0
+        assert cache._db_bytes <= cache.max_bytes
+        assert cache.get('k0') is not None
+        assert cache.get('k1') is None
+    print("🎉 Size eviction OK!")
+
+
+def test_memory_hits_count_as_recent():
+    """Responses served from the memory tier are not the first rows evicted from SQLite"""
+    print("🧪 Testing recency of memory-tier hits...")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(db_path=os.path.join(tmp, 'llm.sqlite'), max_mb=0.01, memory_entries=100)
+        for n in range(20):
+            cache.put(f'k{n}', 'x' * 1000)
+            if n > 0:
+                assert cache.get('k0') is not None  # always a memory hit
+        assert cache.stats['evicted'] > 0 and cache.stats['db_hits'] == 0
+        assert cache._db.execute("SELECT 1 FROM llm_responses WHERE cache_key = 'k0'").fetchone()
+        assert not cache._db.execute("SELECT 1 FROM llm_responses WHERE cache_key = 'k1'").fetchone()
+    print("🎉 Memory hits keep rows recent!")
+
+
+def test_extractor_uses_cache():
+    """A repeated listing is answered from the cache without calling the API"""
+    print("🧪 Testing cached AI extraction...")
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        prompt = kwargs['messages'][1]['content']
+        content = '{"material": "GRP", "engine": "Yanmar", "airDraftM": null}' if 'Extract these fields' in prompt else '{"make": "Moody", "year": "2003"}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    old_key = os.environ.get('OPENAI_API_KEY')
+    os.environ['OPENAI_API_KEY'] = 'test-key'
+    try:
+        extractor = AIYachtExtractor(cache=LLMResponseCache(db_path=''))
+        extractor.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        first = extractor.extract_yacht_data('MOODY 54  Built: 2003', 'https://a.com/1')
+        started = time.perf_counter()
+        second = extractor.extract_yacht_data('MOODY 54\nBuilt: 2003', 'https://a.com/1')
+        elapsed_us = (time.perf_counter() - started) * 1e6
+        assert first == second == {'make': 'Moody', 'year': 2003.0}
+        assert extractor.extract_specific_field('Hull: GRP', 'material') == 'GRP'
+        assert extractor.extract_specific_field('Hull:  GRP', 'material') == 'GRP'
+        assert extractor.extract_specific_field('Hull: GRP', 'engine') == 'Yanmar'
+        # Fields are cached one by one, so a multi-field request for both is free
+        assert extractor.extract_fields('Hull: GRP', ['material', 'engine']) == {'material': 'GRP', 'engine': 'Yanmar'}
+        assert len(calls) == 3
+        # A field the listing doesn't have is remembered as missing rather than asked again
+        assert extractor.extract_fields('Hull: GRP', ['airDraftM']) == {'airDraftM': None}
+        assert extractor.extract_fields('Hull: GRP', ['airDraftM']) == {'airDraftM': None}
+        assert len(calls) == 4
+        # A different hint is a different prompt
+        extractor.extract_fields('Hull: GRP', ['airDraftM'], {'airDraftM': 'Air draft in meters'})
+        assert len(calls) == 5
+    finally:
+        if old_key is None:
+            os.environ.pop('OPENAI_API_KEY', None)
+        else:
+            os.environ['OPENAI_API_KEY'] = old_key
+    print(f"🎉 Cached extraction returned in {elapsed_us:.0f} µs!")
+
+
+if __name__ == "__main__":
+    test_keys_and_persistence()
+    test_size_eviction()
+    test_memory_hits_count_as_recent()
+    test_extractor_uses_cache()
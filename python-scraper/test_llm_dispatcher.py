@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test script for the rate-limited LLM dispatcher
+"""
+
+import os
+import sys
+import time
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from llm_dispatcher import LLMDispatcher, TokenBucket, dispatch_priority, INTERACTIVE, BATCH
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type('Response', (), {'headers': {'retry-after': retry_after} if retry_after else {}})()
+
+
+def test_token_bucket():
+    """Quota refills per minute; oversized requests wait for a full bucket instead of forever"""
+    print("🧪 Testing token bucket...")
+    clock = FakeClock()
+    bucket = TokenBucket(600, clock=clock)  # 10 per second
+    assert bucket.wait_time(600) == 0
+    bucket.take(600)
+    assert bucket.wait_time(10) == 1.0
+    clock.now = 0.5
+    assert bucket.wait_time(10) == 0.5
+    bucket.credit(1000)
+    assert bucket.wait_time(600) == 0
+    assert bucket.wait_time(5000) == 0  # capped at capacity
+    assert TokenBucket(0).wait_time(10 ** 9) == 0
+    print("🎉 Token bucket OK!")
+
+
+def test_concurrency_and_rate_limit():
+    """Calls overlap up to the concurrency cap; the request bucket paces the rest"""
+    print("🧪 Testing concurrency and pacing...")
+    dispatcher = LLMDispatcher(requests_per_minute=0, tokens_per_minute=0, max_concurrency=4)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def slow_call():
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.1)
+        with lock:
+            active[0] -= 1
+        return 'ok'
+
+    started = time.perf_counter()
+    futures = [dispatcher.submit(slow_call) for _ in range(8)]
+    assert [future.result() for future in futures] == ['ok'] * 8
+    elapsed = time.perf_counter() - started
+    assert peak[0] == 4 and elapsed < 0.6, (peak[0], elapsed)
+
+    # 120 requests/min is one every 0.5 s; with one request of quota left the next two are paced
+    paced = LLMDispatcher(requests_per_minute=120, tokens_per_minute=0, max_concurrency=4)
+    paced.requests._level = 1
+    started = time.perf_counter()
+    for future in [paced.submit(lambda: None) for _ in range(3)]:
+        future.result()
+    assert time.perf_counter() - started >= 0.9
+    assert paced.stats['throttled_seconds'] > 0.8
+    print(f"🎉 8 calls of 100 ms took {elapsed * 1000:.0f} ms with 4 in flight!")
+
+
+def test_interactive_calls_overtake_batch_work():
+    """With the lane busy, a queued interactive call runs before earlier batch calls"""
+    print("🧪 Testing priority lane...")
+    dispatcher = LLMDispatcher(requests_per_minute=0, tokens_per_minute=0, max_concurrency=1)
+    release = threading.Event()
+    order = []
+
+    blocker = dispatcher.submit(release.wait)
+    time.sleep(0.05)
+    with dispatch_priority(BATCH):
+        batch = [dispatcher.submit(lambda n=n: order.append(f'batch-{n}')) for n in range(3)]
+    interactive = dispatcher.submit(lambda: order.append('interactive'))
+    assert dispatcher.queued() == 4
+    release.set()
+    for future in [blocker, interactive] + batch:
+        future.result(timeout=5)
+    assert order == ['interactive', 'batch-0', 'batch-1', 'batch-2']
+    assert dispatcher.submit(lambda: 1, priority=INTERACTIVE).result() == 1
+    print("🎉 Interactive calls go first!")
+
+
+def test_retries_with_backoff():
+    """429 and 5xx are retried with backoff (honouring Retry-After); other errors fail at once"""
+    print("🧪 Testing retries...")
+    dispatcher = LLMDispatcher(requests_per_minute=0, tokens_per_minute=0, max_concurrency=2,
+                               max_retries=3, retry_base_seconds=0.01, retry_max_seconds=0.05)
+    attempts = []
+
+    def flaky():
+        attempts.append(time.perf_counter())
+        if len(attempts) == 1:
+            raise FakeAPIError(429, retry_after='0.2')
+        if len(attempts) == 2:
+            raise FakeAPIError(503)
+        return 'done'
+
+    assert dispatcher.call(flaky) == 'done'
+    assert len(attempts) == 3 and attempts[1] - attempts[0] >= 0.2
+    assert dispatcher.stats['retries'] == 2
+
+    def bad_request():
+        raise FakeAPIError(400)
+
+    try:
+        dispatcher.call(bad_request)
+        raise AssertionError("400 should not be retried")
+    except FakeAPIError as e:
+        assert e.status_code == 400
+
+    def always_busy():
+        raise FakeAPIError(429)
+
+    try:
+        dispatcher.call(always_busy)
+        raise AssertionError("retries should run out")
+    except FakeAPIError:
+        pass
+    assert dispatcher.stats['retries'] == 5 and dispatcher.stats['failed'] == 2
+    print("🎉 Retries OK!")
+
+
+if __name__ == "__main__":
+    test_token_bucket()
+    test_concurrency_and_rate_limit()
+    test_interactive_calls_overtake_batch_work()
+    test_retries_with_backoff()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the local OpenAI stub server
+"""
+
+import os
+import sys
+import json
+import urllib.request
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from openai import OpenAI
+
+from openai_stub_server import OpenAIStubServer, StubConfig
+from llm_dispatcher import LLMDispatcher
+
+
+def _stats(server):
+    with urllib.request.urlopen(server.base_url.replace('/v1', '/stub/stats')) as response:
+        return json.loads(response.read())
+
+
+def test_deterministic_responses():
+    """Real SDK client against the stub: stable vectors, JSON answers to field prompts"""
+    print("🧪 Testing stub responses...")
+    server = OpenAIStubServer().start()
+    try:
+        client = OpenAI(api_key='stub', base_url=server.base_url, max_retries=0)
+        first = client.embeddings.create(model="text-embedding-ada-002", input=["Linssen 40", "Sealine T50"])
+        again = client.embeddings.create(model="text-embedding-ada-002", input="Linssen 40")
+        assert len(first.data) == 2 and len(first.data[0].embedding) == 1536
+        assert first.data[0].embedding == again.data[0].embedding
+        assert first.data[0].embedding != first.data[1].embedding
+        assert abs(sum(v * v for v in first.data[1].embedding) - 1) < 1e-6
+
+        reply = client.chat.completions.create(model="gpt-4", messages=[
+            {"role": "user", "content": "Extract these fields:\n- fuel: Fuel type\n- cabins\n\nListing: ..."}
+        ])
+        values = json.loads(reply.choices[0].message.content)
+        assert set(values) == {'fuel', 'cabins'}
+        assert reply.usage.total_tokens > 0
+
+        stats = _stats(server)
+        assert stats['embeddings'] == 2 and stats['embedding_inputs'] == 3 and stats['chat_completions'] == 1
+    finally:
+        server.stop()
+    print("🎉 Stub responses OK!")
+
+
+def test_rate_limits_are_retried():
+    """Per-minute quota answers 429 with Retry-After; the dispatcher backs off and gets through"""
+    print("🧪 Testing stub 429s...")
+    server = OpenAIStubServer(StubConfig(requests_per_minute=2, retry_after_seconds=0.05)).start()
+    try:
+        client = OpenAI(api_key='stub', base_url=server.base_url, max_retries=0)
+        dispatcher = LLMDispatcher(requests_per_minute=0, tokens_per_minute=0, max_retries=1,
+                                   retry_base_seconds=0.01, retry_max_seconds=0.01)
+        embed = lambda: client.embeddings.create(model="text-embedding-ada-002", input="x")
+        dispatcher.call(embed)
+        dispatcher.call(embed)
+        try:
+            dispatcher.call(embed)
+            raise AssertionError("third call in the minute should be rate limited")
+        except Exception as e:
+            assert getattr(e, 'status_code', None) == 429
+        assert dispatcher.stats['retries'] == 1
+        assert _stats(server)['rate_limited'] == 2
+
+        # Random 5xx: every request fails at rate 1.0
+        server.config = StubConfig(error_rate=1.0, seed=1)
+        try:
+            client.chat.completions.create(model="gpt-4", messages=[{"role": "user", "content": "hi"}])
+            raise AssertionError("error rate 1.0 should fail")
+        except Exception as e:
+            assert getattr(e, 'status_code', None) == 500
+    finally:
+        server.stop()
+    print("🎉 Stub 429s OK!")
+
+
+if __name__ == "__main__":
+    test_deterministic_responses()
+    test_rate_limits_are_retried()
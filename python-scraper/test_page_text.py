@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the cached per-page text views shared by the extractors
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from page_text import PageText, fold_text
+
+HTML = """<html><head><title>Hallberg-Rassy 42 | De Valk</title></head><body>
+<h2>Accommodation</h2>
+<p>Cabins:   3  berths  6</p>
+<p>Heating: Webasto</p>
+</body></html>"""
+
+
+def test_views_match_direct_calls():
+    """Every view equals what the extractors used to compute themselves"""
+    print("🧪 Testing page text views...")
+    soup = BeautifulSoup(HTML, 'html.parser')
+    page = PageText(soup)
+    raw = soup.get_text()
+
+    assert page.raw == raw
+    assert page.lower == raw.lower()
+    assert page.folded == raw.lower()
+    assert page.contains('WEBASTO') and not page.contains('volvo')
+    assert page.collapsed == 'Hallberg-Rassy 42 | De Valk Accommodation Cabins: 3 berths 6 Heating: Webasto'
+
+    # Views are computed once
+    assert page.lower is page.lower
+    assert page.collapsed_page is page.collapsed_page
+    assert page.collapsed_page.raw is page.collapsed
+    assert page.collapsed_page.lower == page.collapsed.lower()
+    assert PageText.of(page) is page
+    assert PageText.of(raw).raw == raw
+    assert PageText(raw).soup is None
+    print("🎉 Page text views OK!")
+
+
+def test_line_index():
+    """Offsets map back to the line they fall in"""
+    print("🧪 Testing line/offset index...")
+    page = PageText("first\nsecond line\n\nlast")
+    assert page.line_starts == [0, 6, 18, 19]
+    assert page.line_number(0) == 0
+    assert page.line_number(5) == 0
+    assert page.line_number(6) == 1
+    assert page.line_number(21) == 3
+
+    offset = page.raw.index('line')
+    assert page.line_at(offset) == 'second line'
+    assert page.line_at(18) == ''
+    assert page.line_at(len(page.raw) - 1) == 'last'
+    print("🎉 Line index OK!")
+
+
+def test_fold_text():
+    """Non-ASCII characters IGNORECASE treats as ASCII letters fold to them"""
+    print("🧪 Testing IGNORECASE folding...")
+    assert fold_text('AIſ GPİ ıs') == 'ais gpi is'
+    assert PageText('AIſ').folded == 'ais'
+    print("🎉 Folding OK!")
+
+
+if __name__ == "__main__":
+    test_views_match_direct_calls()
+    test_line_index()
+    test_fold_text()
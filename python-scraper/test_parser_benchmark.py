@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline parser benchmark
+"""
+
+import os
+import sys
+import json
+import logging
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from parser_benchmark import run_benchmark, compare_reports, percentile, section_field_counts
+
+
+def test_percentile():
+    """Nearest-rank percentiles"""
+    print("🧪 Testing percentile helper...")
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile([7.0], 0.95) == 7.0
+    assert percentile([], 0.5) == 0.0
+    print("🎉 Percentiles OK!")
+
+
+def test_section_field_counts():
+    """Both result layouts are counted per section"""
+    print("🧪 Testing field counting...")
+    assert section_field_counts({'data': {'tableBox': {'a': 1, 'b': 2}, 'rigging': {}}}) == {'tableBox': 2, 'rigging': 0}
+    assert section_field_counts({'source_url': 'x', 'keyDetails': {'a': 1}}) == {'keyDetails': 1}
+    print("🎉 Field counts OK!")
+
+
+def test_run_benchmark_offline():
+    """Fixture corpus is replayed through the parsers without network access"""
+    print("🧪 Testing offline benchmark run...")
+    logging.disable(logging.INFO)
+    try:
+        report = run_benchmark(['super_enhanced', 'simple'], rounds=1, padding_kb=2)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    pages = report['corpus']['pages']
+    assert pages > 0
+    for name in ('super_enhanced', 'simple'):
+        metrics = report['parsers'][name]
+        assert metrics['errors'] == 0, metrics
+        assert metrics['pages'] == pages
+        assert metrics['pages_per_sec'] > 0
+        assert metrics['latency_ms']['p50'] <= metrics['latency_ms']['p95'] <= metrics['latency_ms']['max']
+        assert metrics['total_fields'] > 0
+
+    # The unified parser reads every rendered section back
+    assert report['parsers']['super_enhanced']['fields_per_section']['tableBox'] > 0
+    assert report['parsers']['super_enhanced']['fields_per_section']['modeBox'] > 0
+
+    # Reports are plain JSON and compare against themselves as no change
+    report = json.loads(json.dumps(report))
+    changes = compare_reports(report, report)
+    assert changes['simple'] == {'pages_per_sec': 0.0, 'p95_ms': 0.0, 'peak_python_memory_mb': 0.0, 'total_fields': 0.0}
+
+    print(f"🎉 Benchmarked {pages} fixture pages offline!")
+
+
+if __name__ == "__main__":
+    test_percentile()
+    test_section_field_counts()
+    test_run_benchmark_offline()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the pattern bank used by the YachtScraperService section scans
+Checks that prefiltered scans return exactly what looping re.search/re.findall returns
+"""
+
+import os
+import re
+import sys
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pattern_bank import PatternBank, required_literals
+from scraper_service import (
+    ACCOMMODATION_SCAN, EQUIPMENT_SCAN, NAVIGATION_SCAN, RIGGING_SCAN,
+    MACHINERY_SCAN, GENERAL_SPECS_SCAN, POST_PROCESS_SCAN
+)
+
+BANKS = [ACCOMMODATION_SCAN, EQUIPMENT_SCAN, NAVIGATION_SCAN, RIGGING_SCAN,
+         MACHINERY_SCAN, GENERAL_SPECS_SCAN, POST_PROCESS_SCAN]
+
+SNIPPETS = [
+    'Anchor: Delta 20 kg', 'Life raft 6 person', 'EPIRB', 'Electric davits', 'Windlass Lofrans',
+    '2.8 m dinghy', 'Mercury 15 hp outboard', 'AIS class B', 'Raymarine autopilot', 'Fluxgate compass',
+    'Echo sounder', 'GPS Garmin', 'Open array radar', 'DSC VHF', 'chart plotter', 'Speed log',
+    'Windset B&G', 'Satellite TV', 'Rudder angle indicator', 'Primary sheet winch: Lewmar 40 ST',
+    '2x Lewmar 40 ST winch', 'Selden mast', 'Boom: aluminium', 'Mainsail 2019', 'Genoa furling',
+    'Spinnaker', '2 spreaders', '3 cabins', '6 berths', '2 heads', '1 shower', '1x Volvo Penta D2-55 diesel',
+    '110 HP engine', 'Fuel tank 300 litre', 'Water tank 400 litre', 'Material GRP', 'Hull steel',
+    'Condition good', 'Location Netherlands.', '€ 125,000', '45 kW', 'Master cabin', 'flybridge',
+    # Characters that IGNORECASE matches against ASCII letters
+    'AIſ receiver', 'GPİ', 'Kelvin KW', 'ıs',
+]
+
+
+def _naive_first(patterns, text):
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match
+    return None
+
+
+def test_required_literals():
+    """Only mandatory literal runs are used for the prefilter"""
+    print("🧪 Testing required literal extraction...")
+    assert required_literals(r'(\d+)\s*cabin', re.IGNORECASE) == ('cabin',)
+    assert required_literals(r'life\s+raft[:\s]*([^,\n]+)', re.IGNORECASE) == ('life', 'raft')
+    assert required_literals(r'davits?[:\s]*', re.IGNORECASE) == ('davit',)
+    assert required_literals(r'(\d+)\s*(?:HP|hp)', re.IGNORECASE) == ()
+    assert required_literals(r'(ab)?cd|ef', re.IGNORECASE) == ()
+    assert required_literals(r'x(?i:AB)c') == ('c', 'x')
+    assert required_literals(r'(?i)Foo') == ()
+    print("🎉 Required literals OK!")
+
+
+def test_pattern_bank_matches_naive_loops():
+    """first/matches/findall agree with looping re.search and re.findall over every pattern"""
+    print("🧪 Testing pattern bank against naive pattern loops...")
+    rnd = random.Random(7)
+    texts = ['', 'nothing relevant here'] + [
+        rnd.choice([' ', '\n', ', ', ' | ']).join(rnd.sample(SNIPPETS, rnd.randint(1, len(SNIPPETS))))
+        for _ in range(200)
+    ]
+
+    checked = 0
+    for bank in BANKS:
+        raw = {field: [compiled.pattern for compiled, _ in entries] for field, entries in bank.fields.items()}
+        for text in texts:
+            scan = bank.scan(text)
+            for field, patterns in raw.items():
+                expected = _naive_first(patterns, text)
+                actual = scan.first(field)
+                assert (expected and expected.group(0), expected and expected.span()) == \
+                    (actual and actual.group(0), actual and actual.span()), (field, text)
+
+                expected_all = [m.span() for m in (re.search(p, text, re.IGNORECASE) for p in patterns) if m]
+                assert [m.span() for m in scan.matches(field)] == expected_all
+
+                expected_found = []
+                for pattern in patterns:
+                    expected_found.extend(re.findall(pattern, text, re.IGNORECASE))
+                assert scan.findall(field) == expected_found
+                checked += 1
+
+    print(f"🎉 {checked} field scans matched the naive loops!")
+
+
+def test_case_sensitive_bank():
+    """Without IGNORECASE the prefilter looks at the original text"""
+    print("🧪 Testing case-sensitive pattern bank...")
+    bank = PatternBank({'model': [r'Model[:\s]*(\w+)', r'type (\w+)']}, flags=0)
+    assert bank.scan('model x, Model: HR42').first('model').group(1) == 'HR42'
+    assert bank.scan('MODEL x').first('model') is None
+    assert bank.scan('MODEL x, type sloop').first('model').group(1) == 'sloop'
+    assert bank.scan('MODEL Master Cabin').contains('master cabin')
+    print("🎉 Case-sensitive bank OK!")
+
+
+if __name__ == "__main__":
+    test_required_literals()
+    test_pattern_bank_matches_naive_loops()
+    test_case_sensitive_bank()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the token-budgeted prompt builder
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from devalk_fixtures import load_fixture_corpus, render_listing_html
+import prompt_builder
+from prompt_builder import PromptBuilder, count_tokens, truncate_to_tokens, CHARS_PER_TOKEN
+
+
+def test_specification_regions_fit_the_budget():
+    """Spec sections beyond the old 8000-character cut are packed; navigation never is"""
+    print("🧪 Testing prompt packing on De Valk pages...")
+    builder = PromptBuilder(token_budget=2000)
+    for _, result in load_fixture_corpus():
+        html = render_listing_html(result, padding_kb=60)
+        content = builder.build(html)
+
+        assert count_tokens(content) <= builder.token_budget
+        assert len(content) < len(html[:8000])
+        assert 'Sailing yacht' not in content  # navigation links
+        assert 'Related yacht' not in content  # footer cards
+
+        labels = [line for line in content.splitlines() if line.startswith('[')]
+        assert labels[:3] == ['[Title]', '[Key facts]', '[Specifications]'], labels
+        # The old prompt was only navigation: the spec sections start far past 8000 characters
+        assert html.find('class="tableBox"') > 8000
+        table_box = result['data']['tableBox']
+        for value in list(table_box.values())[:5]:
+            assert value.split()[0] in content, value
+
+    print("🎉 Prompts carry the specification sections!")
+
+
+def test_budget_and_plain_text():
+    """A small budget keeps the first regions whole and cuts the rest; plain text packs by sentence"""
+    print("🧪 Testing budget limits...")
+    _, result = load_fixture_corpus()[0]
+    html = render_listing_html(result, padding_kb=2)
+    small = PromptBuilder(token_budget=120).build(html)
+    assert count_tokens(small) <= 120
+    assert small.startswith('[Title]') and '[Key facts]' in small
+    assert '[Rigging]' not in small
+
+    text = "MOODY 54 for sale. Built 2003 in the UK. " * 100
+    packed = PromptBuilder(token_budget=50).build(text)
+    assert count_tokens(packed) <= 50 and packed.startswith('[Page text]\nMOODY 54 for sale.')
+
+    # Unknown layouts fall back to the page text without site chrome
+    page = ('<html><body><nav>Home Boats Contact</nav><h1>Moody 54</h1>'
+            '<div class="text"><p>Built 2003.</p><p>Yanmar 4JH 110 hp.</p></div><footer>Cookies</footer></body></html>')
+    assert PromptBuilder().build(page) == '[Title]\nMoody 54\n\n[Other page text]\nBuilt 2003.\nYanmar 4JH 110 hp.'
+    print("🎉 Budget limits OK!")
+
+
+class OfflineTiktoken:
+    """tiktoken stand-in whose BPE download fails, as it does on a host without network access"""
+
+    @staticmethod
+    def encoding_for_model(model):
+        raise ConnectionError("Could not fetch cl100k_base.tiktoken")
+
+    get_encoding = encoding_for_model
+
+
+def test_tokenizer_load_failure_falls_back_to_estimate():
+    """An encoding that can't be loaded means estimated counts, not a failed prompt"""
+    print("🧪 Testing offline tokenizer fallback...")
+    installed = prompt_builder.tiktoken
+    prompt_builder.tiktoken = OfflineTiktoken
+    prompt_builder._encoding.cache_clear()
+    try:
+        text = "Displacement 14,500 kg. " * 10
+        assert count_tokens(text, 'gpt-4o-offline') == -(-len(text) // CHARS_PER_TOKEN)
+        assert truncate_to_tokens(text, 5, 'gpt-4o-offline') == text[:5 * CHARS_PER_TOKEN]
+        assert PromptBuilder(token_budget=20).build(text).startswith('[Page text]')
+    finally:
+        prompt_builder.tiktoken = installed
+        prompt_builder._encoding.cache_clear()
+    print("🎉 Offline tokenizer falls back to the estimate!")
+
+
+if __name__ == "__main__":
+    test_specification_regions_fit_the_budget()
+    test_budget_and_plain_text()
+    test_tokenizer_load_failure_falls_back_to_estimate()
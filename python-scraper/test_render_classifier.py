@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the static-vs-rendered page classifier
+"""
+
+import os
+import sys
+import time
+import logging
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from devalk_fixtures import build_fixture_site, FixtureAdapter, FIXTURE_BASE_URL
+from render_classifier import RenderClassifier, url_template, STATIC, RENDER, SAMPLE
+from scraper_service import YachtScraperService
+from test_page_context import FakeDriver, FakePool
+
+
+def test_url_template():
+    """Listing-specific path segments collapse into one template per page type"""
+    print("🧪 Testing URL templates...")
+    assert url_template('https://www.devalk.nl/en/yachtbrokerage/1000/') == 'devalk.nl/en/yachtbrokerage/{id}/'
+    assert url_template('https://devalk.nl/en/yachtbrokerage/2044/?ref=x') == 'devalk.nl/en/yachtbrokerage/{id}/'
+    assert url_template('https://www.YachtWorld.com/yacht/2004-moody-54-9123/') == 'yachtworld.com/yacht/{id}/'
+    assert url_template('https://example.com') == 'example.com/'
+    print("🎉 URL templates OK!")
+
+
+def test_decisions_learned_and_persisted():
+    """Full coverage on every sample means static; one short sample means render"""
+    print("🧪 Testing render decisions...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'decisions.json')
+        classifier = RenderClassifier(path=path, sample_size=2, static_ratio=0.9)
+        static_url, js_url = 'https://a.com/boat/1', 'https://b.com/boat/1'
+
+        assert classifier.decide(static_url) == SAMPLE
+        assert classifier.record(static_url, ['title', 'price'], ['title', 'price']) == SAMPLE
+        assert classifier.record('https://a.com/boat/2', ['title', 'price', 'x'], ['title', 'price']) == STATIC
+        assert classifier.decide('https://a.com/boat/99') == STATIC
+
+        assert classifier.record(js_url, ['title'], ['title', 'price', 'year']) == RENDER
+        assert classifier.decide('https://b.com/boat/7') == RENDER
+
+        # Decisions survive a restart
+        reloaded = RenderClassifier(path=path)
+        assert reloaded.decide('https://a.com/boat/3') == STATIC
+        assert reloaded.decide('https://b.com/boat/3') == RENDER
+        assert reloaded.decisions()['a.com/boat/{id}']['samples'] == 2
+
+        # Old decisions are sampled again
+        expired = RenderClassifier(path=path, ttl_days=1)
+        expired._templates['a.com/boat/{id}']['decided_at'] = time.time() - 2 * 24 * 3600
+        assert expired.decide('https://a.com/boat/3') == SAMPLE
+        assert expired.record('https://a.com/boat/3', ['title'], ['title', 'price']) == RENDER
+    print("🎉 Render decisions OK!")
+
+
+def _service(static_site, rendered_site, classifier):
+    # Unreachable threshold so only the classifier can keep the browser tier from running
+    service = YachtScraperService(tier_order='static,browser', completeness_threshold=10000)
+    driver = FakeDriver(rendered_site)
+    service.driver_pool = FakePool(driver)
+    service.render_classifier = classifier
+    service._sessions.mount(FIXTURE_BASE_URL, FixtureAdapter(static_site))
+    return service, driver
+
+
+def test_service_skips_browser_once_static_is_enough():
+    """After the sample pages, templates whose static HTML is complete never start Chrome"""
+    print("🧪 Testing browser skip for static templates...")
+    logging.disable(logging.INFO)
+    try:
+        site = build_fixture_site(padding_kb=2)
+        urls = list(site)[:6]
+        classifier = RenderClassifier(path='', sample_size=3)
+        service, driver = _service(site, site, classifier)
+
+        for url in urls[:3]:
+            result = service.scrape_yacht_listing(url)
+            assert result['extractionTiers'][1]['tier'] == 'browser'
+        assert driver.visited == urls[:3]  # each sample rendered once, reused by the browser tier
+        assert classifier.decide(urls[3]) == STATIC
+
+        for url in urls[3:]:
+            result = service.scrape_yacht_listing(url)
+            assert result['extractionTiers'][1] == {'tier': 'browser', 'skipped': True}
+            assert result['make']
+        assert driver.visited == urls[:3]
+        assert service.cascade_stats()['browser']['skips'] == 3
+    finally:
+        logging.disable(logging.NOTSET)
+    print("🎉 Browser skipped for static templates!")
+
+
+def test_service_keeps_rendering_js_templates():
+    """Templates whose static HTML is an empty shell stay on the browser"""
+    print("🧪 Testing render decision for JavaScript-built pages...")
+    logging.disable(logging.INFO)
+    try:
+        site = build_fixture_site(padding_kb=2)
+        urls = list(site)[:3]
+        shells = {url: '<html><head><title>Loading</title></head><body><div id="app"></div></body></html>'
+                  for url in urls}
+        classifier = RenderClassifier(path='', sample_size=3)
+        service, driver = _service(shells, site, classifier)
+
+        first = service.scrape_yacht_listing(urls[0])
+        assert classifier.decide(urls[1]) == RENDER
+        assert first['make']  # filled from the rendered page
+
+        service.scrape_yacht_listing(urls[1])
+        assert driver.visited == urls[:2]
+    finally:
+        logging.disable(logging.NOTSET)
+    print("🎉 JavaScript-built pages keep rendering!")
+
+
+if __name__ == "__main__":
+    test_url_template()
+    test_decisions_learned_and_persisted()
+    test_service_skips_browser_once_static_is_enough()
+    test_service_keeps_rendering_js_templates()
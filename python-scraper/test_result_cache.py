@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for the parsed result cache
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+from requests.adapters import BaseAdapter
+
+from result_cache import ParsedResultCache
+from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+
+LISTING_HTML = """
+<html><body>
+<div class="tableBox"><div class="item"><strong>Built</strong><ul><li>Built</li><li>1998</li></ul></div></div>
+<div class="modeBox"><ul class="list-1"><li><span>Model</span><span>Hallberg-Rassy 42</span></li></ul></div>
+</body></html>
+"""
+
+
+class StaticAdapter(BaseAdapter):
+    """Always serves the same page with a 200 and no validators"""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.status_code = 200
+        response._content = LISTING_HTML.encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        pass
+
+
+def test_memory_lru():
+    """Least recently used results are dropped first; hits return copies"""
+    print("🧪 Testing in-memory LRU...")
+    cache = ParsedResultCache(max_entries=2, db_path='')
+    cache.put('a', {'n': 1})
+    cache.put('b', {'n': 2})
+    assert cache.get('a') == {'n': 1}  # 'a' is now the most recent
+    cache.put('c', {'n': 3})
+    assert cache.get('b') is None
+    assert cache.get('a') == {'n': 1} and cache.get('c') == {'n': 3}
+
+    copy = cache.get('a')
+    copy['n'] = 99
+    assert cache.get('a') == {'n': 1}
+    assert cache.stats['memory_hits'] == 5 and cache.stats['misses'] == 1
+    print("🎉 In-memory LRU OK!")
+
+
+def test_keys_and_persistence():
+    """Keys change with the body and the parser version; the SQLite tier survives a restart"""
+    print("🧪 Testing keys and persistent tier...")
+    body = LISTING_HTML.encode('utf-8')
+    key = ParsedResultCache.make_key(body, 'v1')
+    assert key == ParsedResultCache.make_key(body, 'v1')
+    assert key != ParsedResultCache.make_key(body + b' ', 'v1')
+    assert key != ParsedResultCache.make_key(body, 'v2')
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, 'results.sqlite')
+        ParsedResultCache(db_path=db_path).put(key, {'data': {'year': '1998'}})
+
+        restarted = ParsedResultCache(db_path=db_path)
+        assert restarted.get(key) == {'data': {'year': '1998'}}
+        assert restarted.get(key) == {'data': {'year': '1998'}}
+        assert restarted.stats['db_hits'] == 1 and restarted.stats['memory_hits'] == 1
+        # A parser version bump misses instead of serving the old result
+        assert restarted.get(ParsedResultCache.make_key(body, 'v2')) is None
+
+        pruned = ParsedResultCache(db_path=db_path, db_max_rows=10)
+        for n in range(100):
+            pruned.put(f'k{n}', {'n': n})
+        rows = pruned._db.execute("SELECT COUNT(*) FROM parsed_results").fetchone()[0]
+        assert rows == 10
+    print("🎉 Keys and persistent tier OK!")
+
+
+def test_parser_hit_path():
+    """A byte-identical page is served from the cache without re-parsing"""
+    print("🧪 Testing parser hit path...")
+    parser = SuperEnhancedDeValkParser()
+    parser.http_cache = None
+    parser.result_cache = ParsedResultCache(db_path='')
+    parser._sessions.mount('https://www.devalk.nl/', StaticAdapter())
+
+    parse_calls = []
+    extract = parser.extract_sections
+    parser.extract_sections = lambda html: parse_calls.append(1) or extract(html)
+
+    first = parser.parse_yacht_listing('https://www.devalk.nl/en/yachtbrokerage/1')
+    second = parser.parse_yacht_listing('https://www.devalk.nl/en/yachtbrokerage/2')
+
+    assert 'error' not in first
+    assert len(parse_calls) == 1
+    assert second['data'] == first['data']
+    assert second['url'] == 'https://www.devalk.nl/en/yachtbrokerage/2'
+    assert parser.result_cache.stats['memory_hits'] == 1
+    print("🎉 Parser hit path OK!")
+
+
+if __name__ == "__main__":
+    test_memory_lru()
+    test_keys_and_persistence()
+    test_parser_hit_path()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the lxml single-pass section extractor
+Checks that it returns exactly what the BeautifulSoup unified extraction returns
+"""
+
+import os
+import sys
+import logging
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from devalk_fixtures import build_fixture_pages
+from super_enhanced_devalk_parser import SuperEnhancedDeValkParser
+
+EDGE_CASES = [
+    # Extra classes, nested list items, comments, scripts and non-breaking spaces
+    """<div class="tableBox main"><div class="item"><strong>Built</strong><ul><li>Built</li><li><span>1998</span></li></ul></div>
+    <div class="item"><strong>Lying</strong><ul><li> <b>x</b></li><li><!--note--></li><li>Delfzijl</li></ul></div>
+    <div class="item"><strong>Status</strong><ul><li>Status</li></ul></div></div>
+    <div class="modeBox"><ul class="list-2"><li><strong>Model</strong> Najad&nbsp;460 <script>var x = 1;</script></li>
+    <li><strong>Type</strong> sloop<ul><li><strong>Keel type</strong> fin</li></ul></li></ul>
+    <ul class="list-1"><li><strong>Builder</strong></li><li>no label</li><li><strong>Hull material</strong> GRP | Hull material</li>
+    <li><strong>Windlass</strong> Lofrans\r\n | new<br> <em>2018</em></li></ul></div>""",
+    # Accordion items without a body, duplicate titles and a combined title
+    """<div class="accordion-item"><button class="accordion-button">Rigging</button></div>
+    <div class="accordion-item"><button class="accordion-button">Rigging &amp; sails</button>
+    <div class="accordion-body"><ul class="list-1"><li><strong>Mainsail</strong> 40 m2</li></ul></div></div>
+    <div class="accordion-item"><button class="accordion-button">Navigation and Equipment</button>
+    <div class="accordion-body"><ul class="list-2"><li><strong>Compass</strong> yes</li></ul></div></div>
+    <div class="accordion-item"><button class="accordion-button">Navigation</button>
+    <div class="accordion-body"><ul class="list-1"><li><strong>Radar</strong> no</li></ul></div></div>""",
+    "",
+]
+
+
+def test_section_extractor_matches_soup():
+    """lxml engine and BeautifulSoup engine agree on the rendered corpus and edge cases"""
+    print("🧪 Testing lxml section extractor against BeautifulSoup...")
+    logging.disable(logging.INFO)
+    try:
+        parser = SuperEnhancedDeValkParser()
+        pages = [html for _, html in build_fixture_pages(padding_kb=4)] + EDGE_CASES
+        assert len(pages) > len(EDGE_CASES)
+
+        for html in pages:
+            expected = parser._extract_all_sections_unified(BeautifulSoup(html, 'html.parser'))
+            actual = parser.section_extractor.extract(html)
+            actual['indicationRatios'] = parser._calculate_indication_ratios(actual['modeBox'], actual['rigging'])
+            assert actual == expected, (actual, expected)
+            assert list(actual) == list(expected)
+    finally:
+        logging.disable(logging.NOTSET)
+
+    print(f"🎉 Section extractor matched BeautifulSoup on {len(pages)} pages!")
+
+
+if __name__ == "__main__":
+    test_section_extractor_matches_soup()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Test script for multi-tab rendering in one browser
+Uses a fake browser whose tabs finish loading after a delay, so no Chrome is started
+"""
+
+import os
+import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from urllib3.exceptions import MaxRetryError
+from tab_renderer import TabRenderer
+
+
+class FakeTab:
+    def __init__(self):
+        self.url = 'about:blank'
+        self.loaded_at = 0.0
+        self.stale = False
+        self.crashed = False
+
+
+class FakeSwitch:
+    def __init__(self, browser):
+        self.browser = browser
+
+    def window(self, handle):
+        if handle not in self.browser.tabs:
+            raise WebDriverException("no such window")
+        self.browser.current = handle
+
+    def new_window(self, kind):
+        self.browser.check_connection()
+        self.browser.opened += 1
+        handle = f"tab-{self.browser.opened}"
+        self.browser.tabs[handle] = FakeTab()
+        self.browser.current = handle
+
+
+class FakeBrowser:
+    """Tabs load in the background; 'crash' URLs kill their tab, 'die' URLs kill the browser, 'gone' URLs kill chromedriver"""
+
+    def __init__(self, load_seconds=0.2):
+        self.load_seconds = load_seconds
+        self.tabs = {'anchor': FakeTab()}
+        self.current = 'anchor'
+        self.opened = 0
+        self.alive = True
+        self.driver_gone = False
+        self.quit_called = False
+        self.cdp_log = []
+        self.switch_to = FakeSwitch(self)
+        self._in_command = threading.Lock()
+
+    def check_connection(self):
+        if self.driver_gone:
+            # What Selenium's HTTP client raises when chromedriver itself has exited
+            raise MaxRetryError(None, 'http://localhost:9515/session', 'Connection refused')
+
+    def _tab(self):
+        self.check_connection()
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        # Commands must be serialized by the renderer
+        assert self._in_command.acquire(blocking=False), "concurrent WebDriver commands"
+        self._in_command.release()
+        tab = self.tabs[self.current]
+        if tab.crashed:
+            raise WebDriverException("tab crashed")
+        return tab
+
+    @property
+    def current_window_handle(self):
+        return self.current
+
+    @property
+    def window_handles(self):
+        self.check_connection()
+        if not self.alive:
+            raise WebDriverException("chrome not reachable")
+        return list(self.tabs)
+
+    def execute_cdp_cmd(self, command, params):
+        tab = self._tab()
+        self.cdp_log.append((self.current, command))
+        if command == 'Page.navigate':
+            tab.url = params['url']
+            tab.loaded_at = time.monotonic() + self.load_seconds
+            tab.stale = False
+            if 'crash' in tab.url:
+                tab.crashed = True
+            if 'die' in tab.url:
+                self.alive = False
+            if 'gone' in tab.url:
+                self.driver_gone = True
+        return {}
+
+    def execute_script(self, script):
+        tab = self._tab()
+        if '= true' in script:
+            tab.stale = True
+            return None
+        if tab.stale:
+            return 'stale'
+        return 'complete' if time.monotonic() >= tab.loaded_at else 'loading'
+
+    def find_elements(self, by, value):
+        tab = self._tab()
+        return [value] if time.monotonic() >= tab.loaded_at else []
+
+    @property
+    def page_source(self):
+        return f"<html><body><div class='tableBox'>{self._tab().url}</div></body></html>"
+
+    @property
+    def current_url(self):
+        return self._tab().url
+
+    def close(self):
+        del self.tabs[self.current]
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeSupervisor:
+    """BrowserSupervisor stand-in whose retire flags are set by the test"""
+
+    def __init__(self):
+        self.flagged = set()
+
+    def retire_reason(self, driver):
+        return 'rss' if id(driver) in self.flagged else None
+
+
+def test_tabs_render_concurrently_in_one_browser():
+    """Loads overlap across tabs; tab count is bounded and tabs are reused then recycled"""
+    print("🧪 Testing concurrent tab rendering...")
+    browsers = []
+
+    def factory():
+        browsers.append(FakeBrowser(load_seconds=0.2))
+        return browsers[-1]
+
+    renderer = TabRenderer(max_tabs=4, max_pages_per_tab=2, driver_factory=factory, poll_interval=0.01,
+                           supervisor=False)
+    urls = [f"https://www.devalk.nl/en/yachtbrokerage/{n}/" for n in range(8)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pages = list(executor.map(lambda url: renderer.render(url, (By.CSS_SELECTOR, '.tableBox')), urls))
+    elapsed = time.perf_counter() - started
+
+    assert len(browsers) == 1
+    assert [page.final_url for page in pages] == urls
+    assert all(page.rendered and page.url in page.html for page in pages)
+    # 8 loads of 0.2 s with 4 tabs: two waves, not eight sequential loads
+    assert elapsed < 0.9, elapsed
+    assert renderer.stats['tabs_opened'] == 4
+    assert renderer.stats['tabs_recycled'] == 4  # every tab served its 2 pages
+    assert len(browsers[0].tabs) == 1  # only the anchor window is left
+    # Each new tab got the request blocking profile
+    assert sum(1 for _, command in browsers[0].cdp_log if command == 'Network.setBlockedURLs') == 4
+    renderer.close()
+    assert browsers[0].quit_called
+    print(f"🎉 8 pages in 4 tabs took {elapsed * 1000:.0f} ms!")
+
+
+def test_crashed_tab_is_isolated():
+    """A crashed tab fails only its own page; a dead browser is replaced"""
+    print("🧪 Testing tab crash isolation...")
+    browsers = []
+
+    def factory():
+        browsers.append(FakeBrowser(load_seconds=0.05))
+        return browsers[-1]
+
+    renderer = TabRenderer(max_tabs=3, driver_factory=factory, poll_interval=0.01,
+                           supervisor=False)
+    urls = ['https://a.com/1', 'https://a.com/crash', 'https://a.com/2']
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(renderer.render, url) for url in urls]
+    results = {}
+    for url, future in zip(urls, futures):
+        try:
+            results[url] = future.result().final_url
+        except WebDriverException:
+            results[url] = 'failed'
+    assert results == {'https://a.com/1': 'https://a.com/1', 'https://a.com/crash': 'failed',
+                       'https://a.com/2': 'https://a.com/2'}
+    assert renderer.stats['tabs_crashed'] == 1 and renderer.stats['browser_restarts'] == 0
+    assert renderer.render('https://a.com/3').final_url == 'https://a.com/3'
+
+    try:
+        renderer.render('https://a.com/die')
+        raise AssertionError("dead browser should fail the render")
+    except WebDriverException:
+        pass
+    assert renderer.stats['browser_restarts'] == 1
+    assert renderer.render('https://a.com/4').final_url == 'https://a.com/4'
+    assert len(browsers) == 2
+    print("🎉 Crashed tabs are isolated!")
+
+
+def test_retired_browser_drains_before_quit():
+    """A browser the supervisor flags keeps its in-flight renders; new pages go to a fresh browser"""
+    print("🧪 Testing supervisor-requested browser retirement...")
+    browsers = []
+
+    def factory():
+        browsers.append(FakeBrowser(load_seconds=0.2))
+        return browsers[-1]
+
+    supervisor = FakeSupervisor()
+    renderer = TabRenderer(max_tabs=4, driver_factory=factory, poll_interval=0.01, supervisor=supervisor)
+    urls = [f"https://a.com/{n}" for n in range(3)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(renderer.render, url) for url in urls]
+        time.sleep(0.05)
+        supervisor.flagged.add(id(browsers[0]))
+        late = executor.submit(renderer.render, 'https://a.com/late')
+        time.sleep(0.05)
+        assert len(browsers) == 2 and not browsers[0].quit_called
+        pages = [future.result() for future in futures + [late]]
+
+    assert [page.final_url for page in pages] == urls + ['https://a.com/late']
+    assert browsers[0].quit_called and not browsers[1].quit_called
+    assert renderer.stats['browsers_retired'] == 1 and renderer.stats['browser_restarts'] == 0
+    renderer.close()
+    assert browsers[1].quit_called
+    print("🎉 Retired browser drained!")
+
+
+def test_dead_chromedriver_restarts_browser():
+    """Connection errors from a dead chromedriver restart the browser like WebDriver errors do"""
+    print("🧪 Testing dead chromedriver recovery...")
+    browsers = []
+
+    def factory():
+        browsers.append(FakeBrowser(load_seconds=0.01))
+        return browsers[-1]
+
+    renderer = TabRenderer(max_tabs=2, max_pages_per_tab=1, driver_factory=factory, poll_interval=0.01,
+                           supervisor=False)
+    try:
+        renderer.render('https://a.com/gone')
+        raise AssertionError("dead chromedriver should fail the render")
+    except MaxRetryError:
+        pass
+    assert renderer.stats['browser_restarts'] == 1
+    assert renderer.render('https://a.com/1').final_url == 'https://a.com/1'
+    assert len(browsers) == 2
+
+    # chromedriver exits between renders: opening the next tab fails and the browser is replaced
+    browsers[1].driver_gone = True
+    assert renderer.render('https://a.com/2').final_url == 'https://a.com/2'
+    assert renderer.stats['browser_restarts'] == 2 and len(browsers) == 3
+    renderer.close()
+    print("🎉 Dead chromedriver recovered!")
+
+
+if __name__ == "__main__":
+    test_tabs_render_concurrently_in_one_browser()
+    test_crashed_tab_is_isolated()
+    test_retired_browser_drains_before_quit()
+    test_dead_chromedriver_restarts_browser()